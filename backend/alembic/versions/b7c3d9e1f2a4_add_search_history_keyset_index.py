@@ -0,0 +1,34 @@
+"""add_search_history_keyset_index
+
+Revision ID: b7c3d9e1f2a4
+Revises: ae10ee2e618d
+Create Date: 2026-10-18 10:12:40.512331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c3d9e1f2a4'
+down_revision: Union[str, Sequence[str], None] = 'ae10ee2e618d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Composite index for keyset pagination of user search history
+    # (WHERE user_id = ? AND (timestamp, id) < (?, ?) ORDER BY timestamp DESC, id DESC)
+    op.create_index(
+        'ix_search_queries_user_id_timestamp',
+        'search_queries',
+        ['user_id', 'timestamp', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_search_queries_user_id_timestamp', table_name='search_queries')
@@ -34,8 +34,64 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     OLLAMA_MODEL: str = "llama3.2:1b"
 
+    # 검색 서비스 컨테이너 설정
+    LLM_PROVIDER: str = "ollama"  # ollama, openai
+    SERVICE_WARMUP_ENABLED: bool = True  # 시작 시 Milvus/Ollama 워밍업 여부
+
+    # 일괄 검색 설정 (search_many: 임베딩 배치 + Milvus search 1회당 쿼리 수)
+    VECTOR_SEARCH_BATCH_SIZE: int = 64
+
+    # 하이브리드 검색 설정 (BM25 역색인 + 벡터 검색, reciprocal rank fusion)
+    LEXICAL_INDEX_ENABLED: bool = True
+    LEXICAL_INDEX_PATH: str = "/var/lib/rag-platform/index/lexical_index.npz"
+    LEXICAL_INDEX_SAVE_INTERVAL_SECONDS: float = 300.0  # 증분 갱신 후 디스크 저장 최소 간격
+    HYBRID_SEARCH_CANDIDATES: int = 50  # 검색기별 후보 수 (top_k보다 작으면 top_k)
+    HYBRID_SEARCH_RRF_K: int = 60  # RRF 순위 상수 (클수록 하위 순위 영향 증가)
+    HYBRID_SEARCH_VECTOR_WEIGHT: float = 1.0
+    HYBRID_SEARCH_LEXICAL_WEIGHT: float = 1.0
+
+    # 쿼리 임베딩 캐시 설정
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10000  # 메모리 계층 LRU 크기 (768차원 float32 기준 약 30MB)
+    EMBEDDING_CACHE_TTL_SECONDS: int = 86400  # 24시간
+    EMBEDDING_CACHE_DISK_PATH: Optional[str] = None  # 워커 간 공유 SQLite 파일 (예: /var/lib/rag-platform/cache/embeddings.db)
+
+    # 의미 기반 답변 캐시 설정 (유사 질문의 RAG 답변 재사용)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_SIMILARITY_THRESHOLD: float = 0.95  # 쿼리 임베딩 코사인 유사도 최소값
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 2000
+    SEMANTIC_CACHE_TTL_SECONDS: int = 3600  # 1시간
+
+    # 검색 응답 캐시 설정 (같은 쿼리/limit/권한 범위 요청의 응답 재사용)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1000
+    RESPONSE_CACHE_TTL_SECONDS: int = 600  # 10분 (문서 변경 시 컬렉션 버전으로 즉시 무효화)
+    RESPONSE_CACHE_SHARED_PATH: Optional[str] = None  # 워커 간 공유 SQLite 파일 (예: /var/lib/rag-platform/cache/responses.db)
+
+    # 청크 임베딩 캐시 설정 (재인덱싱 시 변경되지 않은 청크 재사용)
+    CHUNK_EMBEDDING_CACHE_ENABLED: bool = True
+    CHUNK_EMBEDDING_CACHE_PATH: str = "/var/lib/rag-platform/cache/chunk_embeddings.db"
+
+    # Milvus 쓰기 버퍼 설정 (인덱싱 시 배치 insert, flush는 작업 종료/타이머)
+    MILVUS_WRITE_BUFFER_MAX_ROWS: int = 5000
+    MILVUS_WRITE_BUFFER_MAX_BYTES: int = 32 * 1024 * 1024  # 32MB
+    MILVUS_FLUSH_INTERVAL_SECONDS: float = 300.0
+
+    # 검색 히스토리 write-behind 설정 (요청 경로 밖에서 배치 저장)
+    HISTORY_SINK_MAX_PENDING: int = 10000  # 대기 레코드 상한 (초과 시 버리고 dropped 집계)
+    HISTORY_SINK_BATCH_SIZE: int = 500  # 이 개수가 쌓이면 즉시 저장
+    HISTORY_SINK_FLUSH_INTERVAL_SECONDS: float = 1.0  # 최대 저장 지연
+
+    # 문서 파싱 프로세스 풀 설정 (파일 단위 격리)
+    PARSING_CPU_TIME_LIMIT_SECONDS: int = 120  # 파일당 CPU 시간 제한 (0이면 제한 없음)
+    PARSING_MEMORY_LIMIT_MB: int = 2048  # 워커 프로세스 주소 공간 제한 (0이면 제한 없음)
+    PARSING_TIMEOUT_SECONDS: float = 300.0  # 파일당 처리 시간 제한 (I/O 대기 등 CPU 외 정지 대비)
+    PARSING_MAX_TASKS_PER_CHILD: int = 50  # 이 개수를 처리한 워커는 새 프로세스로 교체
+
     # 문서 저장소 설정 (Task 4.1)
     DOCUMENT_STORAGE_PATH: str = "/var/lib/rag-platform/documents"
+    SCAN_MAX_DELETE_RATIO: float = 0.3  # 스캔 1회에 삭제할 수 있는 기존 문서 경로 비율 (초과 시 삭제 중단)
+    SCAN_DELETE_GUARD_MIN_COUNT: int = 10  # 삭제 경로가 이 개수 이하이면 비율 검사 생략
 
     # 보안 설정 [HARD RULE]
     SECRET_KEY: str  # 필수! .env에서 로드
@@ -45,6 +101,7 @@ class Settings(BaseSettings):
 
     # 타임아웃 설정
     REQUEST_TIMEOUT_SECONDS: int = 30
+    SEARCH_TIMEOUT_SECONDS: float = 75.0  # 검색 요청 1건의 시간 예산 (임베딩 + Milvus + LLM)
 
     # 로깅 설정 (Task 4.2)
     LOG_LEVEL: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
@@ -132,8 +132,8 @@ class MilvusClient:
             if collection is None:
                 raise ValueError("Collection not found")
 
+            # No flush here: each flush seals a segment. Callers flush at job boundaries.
             result = collection.insert(data)
-            collection.flush()  # Ensure data is persisted
 
             return {
                 "success": True,
@@ -147,6 +147,26 @@ class MilvusClient:
                 "error": str(e)
             }
 
+    def flush(self) -> bool:
+        """
+        Flush the collection (seal growing segments).
+
+        Call once at the end of a bulk write job rather than after every insert.
+
+        Returns:
+            bool: True if flush succeeded
+        """
+        try:
+            collection = self.get_collection()
+            if collection is None:
+                raise ValueError("Collection not found")
+
+            collection.flush()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to flush collection: {e}")
+            return False
+
     def search(
         self,
         query_vectors: List[List[float]],
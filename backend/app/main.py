@@ -15,6 +15,10 @@ from app.utils.logger import configure_logging, get_logger
 from app.utils.file_handler import setup_file_handlers
 from app.scheduler.config import create_scheduler
 from app.scheduler.jobs import register_jobs
+from app.services.history_sink import history_sink
+from app.services.lexical_index import get_lexical_index
+from app.services.service_container import service_container
+import asyncio
 
 logger = logging.getLogger(__name__)
 struct_logger = get_logger(__name__)
@@ -38,6 +42,12 @@ async def lifespan(app: FastAPI):
     logger.info("FastAPI 서버 시작")
     struct_logger.info("server_startup", version="1.0.0", environment=settings.ENVIRONMENT if hasattr(settings, 'ENVIRONMENT') else "development")
 
+    # 검색 서비스 컨테이너 초기화 + 워밍업 (블로킹 호출이므로 스레드에서 실행)
+    await asyncio.to_thread(service_container.startup)
+
+    # 검색 히스토리 write-behind 싱크 시작
+    history_sink.start()
+
     # Task 4.1: 스케줄러 시작
     scheduler = create_scheduler()
     register_jobs(scheduler)
@@ -50,6 +60,13 @@ async def lifespan(app: FastAPI):
     if scheduler:
         scheduler.shutdown()
         logger.info("APScheduler 종료됨")
+    # 대기 중인 검색 히스토리를 모두 저장한 뒤 종료
+    await history_sink.stop()
+    # 마지막 저장 이후 증분 갱신된 BM25 색인 저장
+    lexical_index = get_lexical_index()
+    if lexical_index is not None:
+        await asyncio.to_thread(lexical_index.maybe_save, True)
+    await service_container.shutdown()
     logger.info("FastAPI 서버 종료")
     struct_logger.info("server_shutdown")
 
@@ -7,7 +7,7 @@ corresponding responses generated by the RAG system.
 
 import uuid
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -35,6 +35,10 @@ class SearchQuery(Base):
     """
 
     __tablename__ = "search_queries"
+    __table_args__ = (
+        # 히스토리 keyset 페이지네이션 (역방향 인덱스 스캔으로 최신순 조회)
+        Index("ix_search_queries_user_id_timestamp", "user_id", "timestamp", "id"),
+    )
 
     id = Column(
         UUID(as_uuid=True),
@@ -4,17 +4,84 @@
 Task 2.7: 검색 쿼리 및 응답 저장, 히스토리 조회
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime
 from uuid import UUID
+import base64
+import json
 import uuid
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func
+from sqlalchemy import select, desc, func, insert, case, text, tuple_
 from app.models.search import SearchQuery, SearchResponse
 from app.schemas.search import SearchQueryResponse
 
 logger = logging.getLogger(__name__)
 
+# 인증 연동 전(Task 3.x) user_id가 없는 요청에 사용하는 임시 사용자 ID
+DEFAULT_USER_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+# get_user_history total_mode 값
+HISTORY_TOTAL_MODES = ("exact", "approximate", "none")
+
+
+def encode_history_cursor(timestamp: datetime, query_id: UUID) -> str:
+    """
+    히스토리 keyset 커서 생성 (마지막 항목의 timestamp, id)
+
+    Args:
+        timestamp: 마지막 항목의 검색 시각
+        query_id: 마지막 항목의 쿼리 ID
+
+    Returns:
+        str: URL-safe base64 커서
+    """
+    raw = f"{timestamp.isoformat()}|{query_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_history_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    히스토리 keyset 커서 해석
+
+    Args:
+        cursor: encode_history_cursor가 만든 커서
+
+    Returns:
+        Tuple[datetime, UUID]: (timestamp, query_id)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않을 때
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        timestamp, query_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), UUID(query_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 히스토리 커서: {cursor}") from e
+
+
+def build_response_row(query_id: UUID, response: SearchQueryResponse) -> Dict[str, Any]:
+    """
+    search_responses 테이블 행 구성
+
+    Args:
+        query_id: 쿼리 ID
+        response: 검색 응답 스키마 (SearchQueryResponse)
+
+    Returns:
+        dict: SearchResponse 컬럼명 → 값
+    """
+    return {
+        "query_id": query_id,
+        "answer": response.answer,
+        "sources": [s.model_dump() for s in response.sources],
+        "performance": response.performance.model_dump(),
+        "response_metadata": response.metadata.model_dump(),
+        "response_time_ms": response.performance.total_time_ms
+    }
+
 
 class SearchRepository:
     """검색 히스토리 저장 및 조회 Repository"""
@@ -52,7 +119,7 @@ class SearchRepository:
             # user_id가 None이면 임시 사용자 ID 사용 (Task 3.x에서 해결)
             if user_id is None:
                 # 임시로 고정된 UUID 사용 (실제로는 JWT에서 추출)
-                user_id = UUID("00000000-0000-0000-0000-000000000001")
+                user_id = DEFAULT_USER_ID
 
             search_query = SearchQuery(
                 user_id=user_id,
@@ -92,14 +159,7 @@ class SearchRepository:
             Exception: DB 저장 실패 시 (단, 이 경우에도 검색은 성공으로 처리)
         """
         try:
-            search_response = SearchResponse(
-                query_id=query_id,
-                answer=response.answer,
-                sources=[s.model_dump() for s in response.sources],
-                performance=response.performance.model_dump(),
-                response_metadata=response.metadata.model_dump(),
-                response_time_ms=response.performance.total_time_ms
-            )
+            search_response = SearchResponse(**build_response_row(query_id, response))
 
             self.db.add(search_response)
             await self.db.commit()
@@ -117,80 +177,150 @@ class SearchRepository:
             logger.warning("응답 저장 실패했지만 검색은 계속 진행합니다")
             # Exception을 다시 raise하지 않음
 
+    async def save_history_batch(
+        self,
+        queries: List[Dict[str, Any]],
+        responses: List[Dict[str, Any]]
+    ) -> None:
+        """
+        검색 쿼리/응답 일괄 저장 (히스토리 write-behind 싱크용)
+
+        ORM 객체를 만들지 않고 테이블별 INSERT 1회(executemany)로 저장하며,
+        응답의 FK를 위해 쿼리를 먼저 넣고 한 트랜잭션으로 커밋합니다.
+
+        Args:
+            queries: search_queries 행 목록 (id 포함, 클라이언트에서 생성)
+            responses: search_responses 행 목록 (build_response_row 형식)
+
+        Raises:
+            Exception: DB 저장 실패 시 (롤백 후 재발생)
+        """
+        try:
+            if queries:
+                await self.db.execute(insert(SearchQuery), queries)
+            if responses:
+                await self.db.execute(insert(SearchResponse), responses)
+            await self.db.commit()
+
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(
+                f"검색 히스토리 일괄 저장 실패: queries={len(queries)}, "
+                f"responses={len(responses)}, error={e}"
+            )
+            raise
+
     async def get_user_history(
         self,
         user_id: UUID,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        cursor: Optional[str] = None,
+        total_mode: str = "exact"
     ) -> Dict[str, Any]:
         """
         사용자 검색 히스토리 조회 (페이지네이션)
 
+        쿼리/응답을 한 번의 LEFT JOIN으로 조회하고 출처 개수는 SQL에서
+        jsonb_array_length로 계산합니다 (sources JSONB를 로드하지 않음).
+        cursor가 있으면 (timestamp, id) 기준 keyset 페이지네이션으로
+        ix_search_queries_user_id_timestamp 인덱스 범위만 읽으므로, 기록이 많은
+        사용자도 페이지 위치와 무관하게 일정한 시간에 조회됩니다.
+        cursor 없이 page > 1이면 기존 클라이언트 호환을 위해 OFFSET을 사용합니다.
+
         Args:
             user_id: 사용자 ID
-            page: 페이지 번호 (1부터 시작)
+            page: 페이지 번호 (1부터 시작, cursor가 없을 때만 사용)
             page_size: 페이지 크기
+            cursor: 이전 응답의 next_cursor (선택적)
+            total_mode: 전체 개수 계산 방식
+                - "exact": COUNT(*)
+                - "approximate": 실행 계획의 예상 행 수 (인덱스 통계 기반)
+                - "none": 계산하지 않음 (total/total_pages는 None)
 
         Returns:
             dict: {
                 "items": List[dict],
-                "total": int,
+                "total": Optional[int],
                 "page": int,
                 "page_size": int,
-                "total_pages": int
+                "total_pages": Optional[int],
+                "next_cursor": Optional[str]
             }
 
         Raises:
+            ValueError: cursor 형식 또는 total_mode가 올바르지 않을 때
             Exception: DB 조회 실패 시
         """
+        if total_mode not in HISTORY_TOTAL_MODES:
+            raise ValueError(f"지원하지 않는 total_mode: {total_mode}")
+
         try:
-            # 전체 개수 조회
-            count_stmt = select(func.count()).select_from(SearchQuery).where(
-                SearchQuery.user_id == user_id
+            # sources가 배열이 아닌 경우(NULL 등)는 0개로 처리
+            sources_count = case(
+                (
+                    func.jsonb_typeof(SearchResponse.sources) == "array",
+                    func.jsonb_array_length(SearchResponse.sources)
+                ),
+                else_=0
             )
-            count_result = await self.db.execute(count_stmt)
-            total = count_result.scalar()
-
-            # 페이지네이션 쿼리
-            offset = (page - 1) * page_size
 
-            # 검색 쿼리 조회 (최신순 정렬)
             query_stmt = (
-                select(SearchQuery)
+                select(
+                    SearchQuery.id,
+                    SearchQuery.query,
+                    SearchQuery.timestamp,
+                    SearchResponse.answer,
+                    sources_count.label("sources_count"),
+                    SearchResponse.response_time_ms
+                )
+                .outerjoin(SearchResponse, SearchResponse.query_id == SearchQuery.id)
                 .where(SearchQuery.user_id == user_id)
-                .order_by(desc(SearchQuery.timestamp))
-                .offset(offset)
-                .limit(page_size)
+                .order_by(desc(SearchQuery.timestamp), desc(SearchQuery.id))
+                .limit(page_size + 1)  # 다음 페이지 존재 여부 확인용 1건 추가
             )
-            query_result = await self.db.execute(query_stmt)
-            queries = query_result.scalars().all()
-
-            # 응답 데이터 구성
-            items = []
-            for query in queries:
-                # 관련 응답 조회
-                response_stmt = select(SearchResponse).where(
-                    SearchResponse.query_id == query.id
+
+            if cursor is not None:
+                cursor_timestamp, cursor_id = decode_history_cursor(cursor)
+                query_stmt = query_stmt.where(
+                    tuple_(SearchQuery.timestamp, SearchQuery.id)
+                    < tuple_(cursor_timestamp, cursor_id)
                 )
-                response_result = await self.db.execute(response_stmt)
-                response = response_result.scalar_one_or_none()
-
-                item = {
-                    "query_id": str(query.id),
-                    "query": query.query,
-                    "answer": response.answer if response else None,
-                    "sources_count": len(response.sources) if response else 0,
-                    "response_time_ms": response.response_time_ms if response else None,
-                    "created_at": query.timestamp.isoformat()
-                }
+            elif page > 1:
+                query_stmt = query_stmt.offset((page - 1) * page_size)
 
-                items.append(item)
+            query_result = await self.db.execute(query_stmt)
+            rows = query_result.all()
+
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+
+            items = [
+                {
+                    "query_id": str(row.id),
+                    "query": row.query,
+                    "answer": row.answer,
+                    "sources_count": row.sources_count or 0,
+                    "response_time_ms": row.response_time_ms,
+                    "created_at": row.timestamp.isoformat()
+                }
+                for row in rows
+            ]
+            next_cursor = (
+                encode_history_cursor(rows[-1].timestamp, rows[-1].id)
+                if has_more else None
+            )
 
-            total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+            total = await self._count_user_queries(user_id, total_mode)
+            if total is None:
+                total_pages = None
+            else:
+                total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
             logger.info(
                 f"히스토리 조회 완료: user_id={user_id}, "
-                f"page={page}, total={total}, items={len(items)}"
+                f"page={page}, cursor={'yes' if cursor else 'no'}, "
+                f"total={total}, items={len(items)}"
             )
 
             return {
@@ -198,9 +328,44 @@ class SearchRepository:
                 "total": total,
                 "page": page,
                 "page_size": page_size,
-                "total_pages": total_pages
+                "total_pages": total_pages,
+                "next_cursor": next_cursor
             }
 
         except Exception as e:
             logger.error(f"히스토리 조회 실패: {e}")
             raise
+
+    async def _count_user_queries(self, user_id: UUID, total_mode: str) -> Optional[int]:
+        """
+        사용자 검색 쿼리 개수 (total_mode에 따라 정확/근사/생략)
+
+        Args:
+            user_id: 사용자 ID
+            total_mode: "exact", "approximate", "none"
+
+        Returns:
+            Optional[int]: 개수 ("none"이면 None)
+        """
+        if total_mode == "none":
+            return None
+
+        if total_mode == "approximate":
+            # 플래너의 예상 행 수 (실제 행을 읽지 않음)
+            result = await self.db.execute(
+                text(
+                    "EXPLAIN (FORMAT JSON) "
+                    "SELECT 1 FROM search_queries WHERE user_id = :user_id"
+                ),
+                {"user_id": user_id}
+            )
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+        count_stmt = select(func.count()).select_from(SearchQuery).where(
+            SearchQuery.user_id == user_id
+        )
+        count_result = await self.db.execute(count_stmt)
+        return count_result.scalar()
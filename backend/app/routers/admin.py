@@ -3,12 +3,16 @@
 """
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import asyncio
 from app.scheduler.file_scanner import FileScanner
 from app.scheduler.indexing_queue import IndexingQueue
+from app.scheduler.manifest import TouchedFile
 from app.db.base import AsyncSessionLocal
 from app.core.config import settings
 from app.routers.auth import get_current_user
+from app.services.history_sink import history_sink
+from app.services.service_container import service_container
 import logging
 import uuid
 
@@ -22,6 +26,33 @@ class IndexTriggerResponse(BaseModel):
     job_id: str
 
 
+class ServiceReloadRequest(BaseModel):
+    """서비스 리로드 요청 (지정하지 않은 항목은 현재 설정 유지)"""
+    collection_name: Optional[str] = None
+    llm_provider: Optional[str] = None
+
+
+class ServiceReloadResponse(BaseModel):
+    """서비스 리로드 응답"""
+    message: str
+    generation: int
+
+
+class CacheStatsResponse(BaseModel):
+    """캐시 통계 응답"""
+    caches: Dict[str, Dict[str, float]]
+
+
+class HistorySinkStatsResponse(BaseModel):
+    """검색 히스토리 싱크 통계 응답"""
+    pending: int
+    enqueued: int
+    written: int
+    dropped: int
+    batches: int
+    failed_batches: int
+
+
 async def verify_admin_user(
     user: Dict[str, Any] = Depends(get_current_user)
 ) -> Dict[str, Any]:
@@ -97,22 +128,107 @@ async def run_manual_indexing(job_id: str, user_email: str):
         scanner = FileScanner(settings.DOCUMENT_STORAGE_PATH)
         queue = IndexingQueue(max_concurrent=5)
 
-        async with AsyncSessionLocal() as db:
-            new_docs = await scanner.scan_for_new_documents(db)
-
-            if not new_docs:
-                logger.info(f"No new documents: job_id={job_id}")
-                return
+        touched: List[TouchedFile] = []
 
-            results = await queue.process_documents(new_docs)
-
-            logger.info(
-                f"Manual indexing completed: job_id={job_id}, "
-                f"success={results['success']}, failed={results['failed']}"
+        async with AsyncSessionLocal() as db:
+            results = await queue.process_change_stream(
+                scanner.stream_changes(db),
+                touched=touched
             )
+            await scanner.refresh_manifest(db, touched)
+
+        logger.info(
+            f"Manual indexing completed: job_id={job_id}, "
+            f"success={results['success']}, failed={results['failed']}, "
+            f"deleted={results['deleted']}"
+        )
 
     except Exception as e:
         logger.error(
             f"Manual indexing failed: job_id={job_id}, error={e}",
             exc_info=True
         )
+
+
+@router.post("/services/reload", response_model=ServiceReloadResponse)
+async def reload_services(
+    request: ServiceReloadRequest,
+    user: Dict[str, Any] = Depends(verify_admin_user)
+) -> ServiceReloadResponse:
+    """
+    검색 서비스 핫 리로드
+
+    새 서비스를 생성/워밍업한 뒤 교체하므로 처리 중인 검색은 영향받지 않습니다.
+    관리자만 실행 가능
+
+    Args:
+        request: 변경할 설정
+        user: 현재 사용자 (관리자)
+
+    Returns:
+        ServiceReloadResponse: 새 generation 번호
+
+    Raises:
+        HTTPException 500: 새 서비스 생성 실패 (기존 서비스는 유지)
+    """
+    config = service_container.config.model_copy(
+        update=request.model_dump(exclude_none=True)
+    )
+
+    logger.info(
+        f"Service reload triggered: user={user['email']}, "
+        f"collection={config.collection_name}, llm_provider={config.llm_provider}"
+    )
+
+    try:
+        # 이전 서비스의 비동기 클라이언트는 이 루프에서 정리해야 하므로 함께 전달
+        generation = await asyncio.to_thread(
+            service_container.reload, config, asyncio.get_running_loop()
+        )
+    except Exception as e:
+        logger.error(f"Service reload failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서비스 리로드에 실패했습니다 (기존 서비스 유지)"
+        )
+
+    return ServiceReloadResponse(
+        message="서비스가 리로드되었습니다",
+        generation=generation
+    )
+
+
+@router.get("/cache/stats", response_model=CacheStatsResponse)
+async def get_cache_stats(
+    user: Dict[str, Any] = Depends(verify_admin_user)
+) -> CacheStatsResponse:
+    """
+    캐시 히트/미스 통계 조회
+
+    관리자만 실행 가능
+
+    Args:
+        user: 현재 사용자 (관리자)
+
+    Returns:
+        CacheStatsResponse: 캐시별 통계
+    """
+    return CacheStatsResponse(caches=service_container.cache_stats())
+
+
+@router.get("/history-sink/stats", response_model=HistorySinkStatsResponse)
+async def get_history_sink_stats(
+    user: Dict[str, Any] = Depends(verify_admin_user)
+) -> HistorySinkStatsResponse:
+    """
+    검색 히스토리 write-behind 싱크 통계 조회 (버려진 레코드 수 포함)
+
+    관리자만 실행 가능
+
+    Args:
+        user: 현재 사용자 (관리자)
+
+    Returns:
+        HistorySinkStatsResponse: 대기/저장/버림 레코드 수
+    """
+    return HistorySinkStatsResponse(**history_sink.stats())
@@ -1,12 +1,22 @@
+from typing import AsyncIterator
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.schemas.search import SearchQueryRequest, SearchQueryResponse
-from app.services.search_service import SearchService
+from app.schemas.search import (
+    BatchSearchRequest,
+    BatchSearchResponse,
+    BatchSearchResult,
+    SearchQueryRequest,
+    SearchQueryResponse
+)
+from app.services.response_builder import ResponseBuilder
+from app.services.history_sink import history_sink
+from app.services.service_container import ServiceContainer, get_service_container
+from app.utils.deadline import DeadlineExceeded
+from app.utils.sse import format_sse
 from app.utils.timer import PerformanceTimer
-from app.db.base import get_db
-from app.repositories.search_repository import SearchRepository
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -18,21 +28,25 @@ router = APIRouter()
     status_code=status.HTTP_200_OK,
     responses={
         422: {"description": "잘못된 검색어 (유효성 검증 실패)"},
-        500: {"description": "서버 내부 오류"}
+        500: {"description": "서버 내부 오류"},
+        504: {"description": "검색 시간 예산 초과"}
     },
     summary="검색 실행",
     description="자연어 질문에 대한 답변 및 출처 반환 (Task 2.7: 히스토리 저장 추가)"
 )
 async def search(
     request: SearchQueryRequest,
-    db: AsyncSession = Depends(get_db)
+    services: ServiceContainer = Depends(get_service_container)
 ):
     """
     검색 API (Task 2.7: 히스토리 저장 추가)
 
+    히스토리(쿼리/응답)는 history_sink에 기록만 하고 DB 저장은 백그라운드에서
+    배치로 수행하므로 검색 응답 시간에 포함되지 않습니다.
+
     Args:
         request: 검색 요청 (query, limit, user_id, session_id)
-        db: DB 세션
+        services: 프로세스 전역 서비스 컨테이너
 
     Returns:
         SearchQueryResponse: 답변, 출처, 성능 데이터
@@ -40,41 +54,32 @@ async def search(
     Raises:
         HTTPException 422: 검색어 유효성 검증 실패
         HTTPException 500: 서버 내부 오류
+        HTTPException 504: 검색 시간 예산(SEARCH_TIMEOUT_SECONDS) 초과
     """
     timer = PerformanceTimer()
 
     try:
         logger.info(f"검색 API 요청: query='{request.query}', limit={request.limit}")
 
-        # Step 1: 쿼리 저장 (히스토리 추적)
-        repository = SearchRepository(db)
-        query_id = await repository.save_query(
+        # Step 1: 쿼리 기록 (히스토리 추적, write-behind)
+        query_id = history_sink.record_query(
             user_id=None,  # TODO: Task 3.x에서 JWT로 user_id 추출
             query=request.query,
             session_id=request.session_id
         )
 
-        # Step 2: SearchService 초기화 및 검색 수행
-        search_service = SearchService()
-
-        # 전체 검색 수행 (성능 측정 포함)
+        # Step 2: 전체 검색 수행 (공유 SearchService, 성능 측정 포함)
+        search_service = services.search_service
         with timer.measure("total"):
-            response = search_service.search(
+            response = await search_service.asearch(
                 query=request.query,
                 limit=request.limit,
                 user=None,  # TODO: Task 3.x에서 JWT 기반 UserContext 추출
                 timer=timer
             )
 
-        # Step 3: 응답 저장 (실패해도 검색은 성공)
-        try:
-            await repository.save_response(query_id, response)
-        except Exception as save_error:
-            logger.error(
-                f"응답 저장 실패 (검색은 성공): {save_error}",
-                exc_info=True
-            )
-            # 응답 저장 실패해도 검색 결과는 반환
+        # Step 3: 응답 기록 (저장 실패해도 검색은 성공)
+        history_sink.record_response(query_id, response)
 
         logger.info(
             f"검색 API 완료: query_id={response.query_id}, "
@@ -88,6 +93,16 @@ async def search(
         logger.warning(f"검색 요청 검증 실패: {e}")
         raise
 
+    except DeadlineExceeded as e:
+        logger.error(f"검색 API 시간 예산 초과: phase={e.phase}")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail={
+                "error": "GatewayTimeout",
+                "message": "검색 처리 시간이 초과되었습니다."
+            }
+        )
+
     except Exception as e:
         # [HARD RULE] 에러 메시지에 민감 정보 포함 금지
         logger.error(f"검색 API 실패: {e}", exc_info=True)
@@ -98,3 +113,171 @@ async def search(
                 "message": "검색 처리 중 오류가 발생했습니다."
             }
         )
+
+
+@router.post(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "content": {"text/event-stream": {}},
+            "description": (
+                "SSE 스트림: sources → token... → done "
+                "(timing/citation 이벤트 포함, 실패 시 error)"
+            )
+        },
+        422: {"description": "잘못된 검색어 (유효성 검증 실패)"}
+    },
+    summary="검색 실행 (스트리밍)",
+    description="검색 출처를 먼저 보내고 답변을 토큰 단위로 스트리밍 (Server-Sent Events)"
+)
+async def search_stream(
+    request: SearchQueryRequest,
+    services: ServiceContainer = Depends(get_service_container)
+):
+    """
+    스트리밍 검색 API
+
+    이벤트 순서:
+        timing(embedding) → timing(search) → sources → timing(first_token)
+        → token... (citation은 출처 확인 시 1회) → done
+
+    done 이벤트는 /search 응답과 같은 SearchQueryResponse이며, 출처 검증에 실패하면
+    answer가 Fallback 문구로 바뀌므로 클라이언트는 스트리밍된 텍스트를 done.answer로
+    교체해야 합니다. 요청 본문이 필요하므로 EventSource 대신 fetch 스트림으로 구독합니다.
+
+    Args:
+        request: 검색 요청 (query, limit, user_id, session_id)
+        services: 프로세스 전역 서비스 컨테이너
+
+    Returns:
+        StreamingResponse: text/event-stream 응답
+
+    Raises:
+        HTTPException 500: 서비스 초기화 실패 (스트리밍 시작 전)
+    """
+    logger.info(f"스트리밍 검색 API 요청: query='{request.query}', limit={request.limit}")
+
+    try:
+        query_id = history_sink.record_query(
+            user_id=None,  # TODO: Task 3.x에서 JWT로 user_id 추출
+            query=request.query,
+            session_id=request.session_id
+        )
+        search_service = services.search_service
+
+    except Exception as e:
+        # [HARD RULE] 에러 메시지에 민감 정보 포함 금지
+        logger.error(f"스트리밍 검색 API 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "InternalServerError",
+                "message": "검색 처리 중 오류가 발생했습니다."
+            }
+        )
+
+    async def event_stream() -> AsyncIterator[str]:
+        timer = PerformanceTimer()
+        try:
+            async for event, data in search_service.astream_search(
+                query=request.query,
+                limit=request.limit,
+                user=None,  # TODO: Task 3.x에서 JWT 기반 UserContext 추출
+                timer=timer
+            ):
+                yield format_sse(event, data)
+
+                if event == "done":
+                    history_sink.record_response(query_id, data)
+
+        except DeadlineExceeded as e:
+            logger.error(f"스트리밍 검색 API 시간 예산 초과: phase={e.phase}")
+            yield format_sse("error", {
+                "error": "GatewayTimeout",
+                "message": "검색 처리 시간이 초과되었습니다."
+            })
+
+        except Exception as e:
+            # [HARD RULE] 에러 메시지에 민감 정보 포함 금지
+            logger.error(f"스트리밍 검색 API 실패: {e}", exc_info=True)
+            yield format_sse("error", {
+                "error": "InternalServerError",
+                "message": "검색 처리 중 오류가 발생했습니다."
+            })
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # nginx 프록시 버퍼링 비활성화
+        }
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=BatchSearchResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        422: {"description": "잘못된 검색어 (유효성 검증 실패)"},
+        500: {"description": "서버 내부 오류"}
+    },
+    summary="일괄 검색 (출처만)",
+    description="여러 검색어의 관련 문서를 한 번에 조회 (평가 작업/대량 Q&A 도구용, 답변 생성 없음)"
+)
+async def search_batch(
+    request: BatchSearchRequest,
+    services: ServiceContainer = Depends(get_service_container)
+):
+    """
+    일괄 검색 API
+
+    검색어를 배치로 임베딩하고 권한 범위별로 Milvus 검색 1회에 묶어 처리합니다.
+    LLM 답변은 생성하지 않으며 히스토리도 기록하지 않습니다.
+
+    Args:
+        request: 일괄 검색 요청 (queries, limit)
+        services: 프로세스 전역 서비스 컨테이너
+
+    Returns:
+        BatchSearchResponse: 검색어별 출처 리스트 (요청 순서)
+
+    Raises:
+        HTTPException 422: 검색어 유효성 검증 실패
+        HTTPException 500: 서버 내부 오류
+    """
+    start = time.perf_counter()
+    logger.info(f"일괄 검색 API 요청: queries={len(request.queries)}, limit={request.limit}")
+
+    try:
+        results = await services.vector_search.asearch_many(
+            request.queries,
+            top_k=request.limit,
+            users=None  # TODO: Task 3.x에서 JWT 기반 UserContext 추출
+        )
+
+    except Exception as e:
+        # [HARD RULE] 에러 메시지에 민감 정보 포함 금지
+        logger.error(f"일괄 검색 API 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "InternalServerError",
+                "message": "검색 처리 중 오류가 발생했습니다."
+            }
+        )
+
+    total_time_ms = int((time.perf_counter() - start) * 1000)
+    logger.info(
+        f"일괄 검색 API 완료: queries={len(request.queries)}, total_time={total_time_ms}ms"
+    )
+
+    return BatchSearchResponse(
+        results=[
+            BatchSearchResult(query=query, sources=ResponseBuilder.build_sources(hits))
+            for query, hits in zip(request.queries, results)
+        ],
+        total_time_ms=total_time_ms
+    )
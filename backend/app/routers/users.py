@@ -4,6 +4,7 @@
 Task 2.7: 검색 히스토리 조회
 """
 
+from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,6 +20,7 @@ router = APIRouter()
     "/me/history",
     status_code=status.HTTP_200_OK,
     responses={
+        400: {"description": "잘못된 커서"},
         500: {"description": "서버 내부 오류"}
     },
     summary="검색 히스토리 조회",
@@ -27,26 +29,39 @@ router = APIRouter()
 async def get_my_history(
     page: int = Query(1, ge=1, description="페이지 번호 (1부터 시작)"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기 (1-100)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (keyset 페이지네이션)"),
+    total: str = Query(
+        "exact",
+        pattern="^(exact|approximate|none)$",
+        description="전체 개수 계산 방식 (exact, approximate, none)"
+    ),
     db: AsyncSession = Depends(get_db)
 ):
     """
     검색 히스토리 조회 API
 
+    다음 페이지는 page 대신 next_cursor를 cursor로 전달하면 OFFSET 없이
+    조회됩니다. 기록이 많은 사용자는 total=approximate 또는 none을 권장합니다.
+
     Args:
-        page: 페이지 번호 (1부터 시작)
+        page: 페이지 번호 (1부터 시작, cursor가 없을 때만 사용)
         page_size: 페이지 크기 (1-100)
+        cursor: 이전 응답의 next_cursor
+        total: 전체 개수 계산 방식
         db: DB 세션
 
     Returns:
         dict: {
             "items": List[dict],  # 검색 기록 리스트
-            "total": int,  # 전체 개수
+            "total": Optional[int],  # 전체 개수 (total=none이면 None)
             "page": int,  # 현재 페이지
             "page_size": int,  # 페이지 크기
-            "total_pages": int  # 전체 페이지 수
+            "total_pages": Optional[int],  # 전체 페이지 수
+            "next_cursor": Optional[str]  # 다음 페이지 커서 (마지막 페이지면 None)
         }
 
     Raises:
+        HTTPException 400: 커서 형식 오류
         HTTPException 500: 히스토리 조회 실패
     """
     try:
@@ -63,7 +78,9 @@ async def get_my_history(
         result = await repository.get_user_history(
             user_id=user_id,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
+            total_mode=total
         )
 
         logger.info(
@@ -73,6 +90,16 @@ async def get_my_history(
 
         return result
 
+    except ValueError as e:
+        logger.warning(f"히스토리 조회 요청 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "BadRequest",
+                "message": "잘못된 페이지 커서입니다."
+            }
+        )
+
     except Exception as e:
         logger.error(f"히스토리 조회 API 실패: {e}", exc_info=True)
         raise HTTPException(
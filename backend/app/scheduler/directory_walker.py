@@ -0,0 +1,153 @@
+"""
+병렬 디렉토리 순회
+
+os.scandir로 디렉토리를 읽고(DirEntry의 파일 유형 정보를 재사용하여 추가 stat
+호출을 줄임), 하위 디렉토리는 스레드 풀에서 병렬로 읽습니다.
+찾은 파일은 순회가 끝나기를 기다리지 않고 비동기 이터레이터로 바로 내보냅니다.
+
+소비자가 다음 항목을 가져가지 않으면 새 디렉토리 읽기를 시작하지 않으므로
+(최대 max_workers개 디렉토리만 진행 중) 메모리 사용량이 코퍼스 크기에 비례하지 않습니다.
+
+읽지 못한 디렉토리/항목은 건너뛰되 failed_paths에 기록합니다. 호출자는 그 하위
+경로를 "없어진 파일"로 판단하면 안 됩니다 (권한 오류, 일시적 마운트 장애 등).
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, List, NamedTuple, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class WalkedFile(NamedTuple):
+    """순회 중 발견한 파일 (순회 시 읽은 stat 정보 포함)"""
+    path: str
+    name: str
+    size: int
+    mtime: float
+
+
+class DirectoryWalker:
+    """os.scandir 기반 병렬 디렉토리 순회기"""
+
+    def __init__(
+        self,
+        root: str,
+        extensions: Optional[Iterable[str]] = None,
+        max_workers: int = 8
+    ):
+        """
+        Args:
+            root: 순회할 루트 디렉토리
+            extensions: 포함할 확장자 (소문자, 점 포함, None이면 전체)
+            max_workers: 동시에 읽는 디렉토리 수
+        """
+        self.root = os.path.abspath(root)
+        self.extensions: Optional[Set[str]] = (
+            {ext.lower() for ext in extensions} if extensions is not None else None
+        )
+        self.max_workers = max_workers
+        self.failed_paths: List[str] = []  # 마지막 순회에서 읽지 못한 디렉토리/항목 경로
+
+    def _matches(self, name: str) -> bool:
+        """확장자 필터"""
+        if self.extensions is None:
+            return True
+        return os.path.splitext(name)[1].lower() in self.extensions
+
+    def scan_directory(self, path: str) -> Tuple[List[WalkedFile], List[str]]:
+        """
+        디렉토리 하나 읽기 (스레드에서 실행)
+
+        심볼릭 링크는 파일/디렉토리 모두 따라가지 않습니다 (보안).
+        is_symlink/is_dir/is_file은 DirEntry에 캐시된 유형 정보를 사용하므로
+        확장자가 맞는 파일에 대해서만 stat을 호출합니다.
+
+        Args:
+            path: 디렉토리 경로
+
+        Returns:
+            Tuple[List[WalkedFile], List[str]]: (파일 리스트, 하위 디렉토리 리스트)
+        """
+        files: List[WalkedFile] = []
+        subdirs: List[str] = []
+
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_symlink():
+                            logger.warning(f"Skipping symlink: {entry.path}")
+                            continue
+
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and self._matches(entry.name):
+                            stat = entry.stat(follow_symlinks=False)
+                            files.append(
+                                WalkedFile(entry.path, entry.name, stat.st_size, stat.st_mtime)
+                            )
+                    except OSError as e:
+                        self.failed_paths.append(entry.path)
+                        logger.warning(f"Failed to read entry, skipping: {entry.path}, error={e}")
+        except OSError as e:
+            self.failed_paths.append(path)
+            logger.warning(f"Failed to read directory, skipping: {path}, error={e}")
+
+        return files, subdirs
+
+    async def walk(self) -> AsyncIterator[WalkedFile]:
+        """
+        파일을 찾는 즉시 내보내는 비동기 순회
+
+        Yields:
+            WalkedFile: 발견한 파일 (순서 보장 없음)
+        """
+        self.failed_paths = []
+        loop = asyncio.get_running_loop()
+        pending_dirs = [self.root]
+        in_flight: Set[asyncio.Future] = set()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="dir-walker"
+        ) as executor:
+            try:
+                while pending_dirs or in_flight:
+                    while pending_dirs and len(in_flight) < self.max_workers:
+                        in_flight.add(
+                            loop.run_in_executor(
+                                executor, self.scan_directory, pending_dirs.pop()
+                            )
+                        )
+
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+
+                    for future in done:
+                        files, subdirs = future.result()
+                        pending_dirs.extend(subdirs)
+                        for walked in files:
+                            yield walked
+            finally:
+                # 소비자가 중간에 멈춘 경우 남은 작업 정리
+                for future in in_flight:
+                    future.cancel()
+
+    def walk_sync(self) -> List[WalkedFile]:
+        """
+        전체 순회 결과를 리스트로 반환 (동기 호출자용, 단일 스레드)
+
+        Returns:
+            List[WalkedFile]: 발견한 파일 리스트
+        """
+        self.failed_paths = []
+        found: List[WalkedFile] = []
+        pending_dirs = [self.root]
+        while pending_dirs:
+            files, subdirs = self.scan_directory(pending_dirs.pop())
+            found.extend(files)
+            pending_dirs.extend(subdirs)
+        return found
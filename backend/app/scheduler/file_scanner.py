@@ -1,10 +1,26 @@
 """
-문서 저장소 스캔 및 신규 문서 감지
+문서 저장소 스캔 및 신규/변경 문서 감지
 """
+import asyncio
+import os
 from pathlib import Path
-from typing import List, Dict
+from typing import AsyncIterator, Dict, List, Optional, Set
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
 from app.models.document import Document
+from app.scheduler.directory_walker import DirectoryWalker, WalkedFile
+from app.scheduler.manifest import (
+    ChangeType,
+    FileChange,
+    FileManifestEntry,
+    KnownDocument,
+    ManifestDiff,
+    TouchedFile,
+    classify_with_hash,
+    deleted_changes,
+    quick_classify,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,83 +30,314 @@ class FileScanner:
     """문서 저장소 스캐너"""
 
     SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.txt', '.md'}
+    STREAM_BATCH_SIZE = 5000  # 기존 문서 조회 시 서버 측 커서 fetch 단위
 
-    def __init__(self, watch_dir: str):
+    def __init__(
+        self,
+        watch_dir: str,
+        max_workers: int = 8,
+        max_delete_ratio: Optional[float] = None,
+        delete_guard_min_count: Optional[int] = None
+    ):
         """
         Args:
             watch_dir: 모니터링할 디렉토리 경로
+            max_workers: 디렉토리 병렬 순회 스레드 수
+            max_delete_ratio: 스캔 1회에 삭제할 수 있는 기존 경로 비율 (None이면 설정값)
+            delete_guard_min_count: 삭제 경로가 이 개수 이하이면 비율 검사 생략 (None이면 설정값)
         """
+        self.max_delete_ratio = (
+            max_delete_ratio if max_delete_ratio is not None else settings.SCAN_MAX_DELETE_RATIO
+        )
+        self.delete_guard_min_count = (
+            delete_guard_min_count if delete_guard_min_count is not None
+            else settings.SCAN_DELETE_GUARD_MIN_COUNT
+        )
         self.watch_dir = Path(watch_dir)
         if not self.watch_dir.exists():
             logger.warning(f"Directory not found: {watch_dir}, creating it...")
             self.watch_dir.mkdir(parents=True, exist_ok=True)
 
-    async def scan_for_new_documents(
+        self.walker = DirectoryWalker(
+            str(self.watch_dir),
+            extensions=self.SUPPORTED_EXTENSIONS,
+            max_workers=max_workers
+        )
+
+    async def stream_new_documents(
         self,
         db: AsyncSession
-    ) -> List[Dict[str, str]]:
+    ) -> AsyncIterator[Dict[str, str]]:
         """
-        신규 문서 스캔
+        신규 문서 스트리밍 스캔
+
+        기존 문서 경로를 스트리밍 쿼리 1회로 읽은 뒤, 병렬 순회 중 발견한
+        신규 파일을 즉시 내보냅니다 (순회 완료를 기다리지 않음).
 
         Args:
             db: DB 세션
 
-        Returns:
-            List[Dict]: 신규 문서 리스트
+        Yields:
+            Dict: 신규 문서
                 - file_path: 파일 경로
                 - file_name: 파일명
                 - file_type: 파일 타입
         """
-        new_docs = []
+        known_sources = await self._load_known_sources(db)
+        # 읽기 트랜잭션 종료 (순회/인덱싱 동안 커넥션을 점유하지 않도록)
+        await db.rollback()
 
-        # 저장소 전체 스캔
-        for file_path in self.watch_dir.rglob('*'):
-            if not file_path.is_file():
+        scanned = 0
+        found = 0
+        async for walked in self.walker.walk():
+            scanned += 1
+            if walked.path in known_sources:
                 continue
 
-            # 심볼릭 링크 차단 (보안)
-            if file_path.is_symlink():
-                logger.warning(f"Skipping symlink: {file_path}")
-                continue
+            found += 1
+            yield {
+                'file_path': walked.path,
+                'file_name': walked.name,
+                'file_type': os.path.splitext(walked.name)[1].lower()[1:]  # .pdf -> pdf
+            }
 
-            if file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
-                continue
+        logger.info(
+            f"Found {found} new documents "
+            f"(scanned {scanned}, known {len(known_sources)})"
+        )
+
+    async def scan_for_new_documents(
+        self,
+        db: AsyncSession
+    ) -> List[Dict[str, str]]:
+        """
+        신규 문서 스캔 (전체 결과 리스트)
+
+        Args:
+            db: DB 세션
+
+        Returns:
+            List[Dict]: 신규 문서 리스트 (stream_new_documents 참고)
+        """
+        return [doc async for doc in self.stream_new_documents(db)]
+
+    async def stream_changes(
+        self,
+        db: AsyncSession,
+        include_unchanged: bool = False
+    ) -> AsyncIterator[FileChange]:
+        """
+        변경 문서 스트리밍 스캔 (증분 재인덱싱용)
+
+        매니페스트를 스트리밍 쿼리 1회로 읽은 뒤, 병렬 순회 중 파일별로
+        신규/수정/변경 없음을 판정하여 바로 내보냅니다. 크기와 mtime이 기록과
+        같은 파일은 해시를 계산하지 않고 건너뜁니다. 삭제는 순회가 끝난 뒤
+        판정할 수 있으므로 마지막에 내보냅니다 (안전 조건은 _safe_deletions 참고).
+
+        Args:
+            db: DB 세션
+            include_unchanged: 변경 없는 파일도 모두 내보낼지 여부
+
+        Yields:
+            FileChange: 신규/수정/삭제 변경, 매니페스트 갱신이 필요한 변경 없음 항목
+        """
+        known = await self._load_known_documents(db)
+        # 읽기 트랜잭션 종료 (순회/인덱싱 동안 커넥션을 점유하지 않도록)
+        await db.rollback()
+        seen_paths: Set[str] = set()
+
+        async for walked in self.walker.walk():
+            seen_paths.add(walked.path)
+            entry = self._to_manifest_entry(walked)
+            documents = known.get(walked.path)
 
-            # DB에 이미 존재하는지 확인
-            exists = await self._check_document_exists(
-                db,
-                str(file_path.absolute())
+            change = quick_classify(entry, documents)
+            if change is None:
+                # 해시 계산은 블로킹 I/O이므로 스레드에서 실행
+                change = await asyncio.to_thread(classify_with_hash, entry, documents)
+
+            if (
+                include_unchanged
+                or change.change_type != ChangeType.UNCHANGED
+                or change.refresh_manifest
+            ):
+                yield change
+
+        for change in self._safe_deletions(known, seen_paths):
+            yield change
+
+    def _safe_deletions(
+        self,
+        known: Dict[str, List[KnownDocument]],
+        seen_paths: Set[str]
+    ) -> List[FileChange]:
+        """
+        순회에서 보이지 않은 문서 중 삭제해도 안전한 것만 반환
+
+        순회에서 보이지 않았다는 것만으로는 파일이 없어졌다고 단정할 수 없으므로
+        (마운트 해제, 권한 오류 등) 다음 경우 삭제하지 않습니다.
+        - 저장소 루트가 없거나 지원 파일이 하나도 보이지 않음: 삭제 전체 거부
+        - 읽지 못한 디렉토리/항목 하위 경로: 해당 경로만 제외
+        - 삭제 경로 비율이 max_delete_ratio 초과: 삭제 전체 중단
+
+        Args:
+            known: 경로 → 기록된 문서 리스트
+            seen_paths: 순회에서 발견한 경로 집합
+
+        Returns:
+            List[FileChange]: 삭제 변경 리스트
+        """
+        missing = len(known) - sum(1 for path in seen_paths if path in known)
+        if missing == 0:
+            return []
+
+        if not self.watch_dir.is_dir() or not seen_paths:
+            logger.error(
+                f"Refusing to delete {missing} documents: "
+                f"storage root missing or empty ({self.watch_dir})"
+            )
+            return []
+
+        failed_paths = self.walker.failed_paths
+        changes = deleted_changes(known, seen_paths, failed_paths)
+        if len(changes) < missing:
+            logger.warning(
+                f"Skipped deleting {missing - len(changes)} documents "
+                f"under {len(failed_paths)} unreadable paths"
             )
 
-            if not exists:
-                new_docs.append({
-                    'file_path': str(file_path.absolute()),
-                    'file_name': file_path.name,
-                    'file_type': file_path.suffix.lower()[1:]  # .pdf -> pdf
-                })
+        ratio = len(changes) / len(known)
+        if len(changes) > self.delete_guard_min_count and ratio > self.max_delete_ratio:
+            logger.error(
+                f"Aborting deletion of {len(changes)}/{len(known)} documents: "
+                f"ratio {ratio:.1%} exceeds max_delete_ratio {self.max_delete_ratio:.1%}"
+            )
+            return []
 
-        logger.info(f"Found {len(new_docs)} new documents")
-        return new_docs
+        return changes
 
-    async def _check_document_exists(
+    async def scan_for_changes(
+        self,
+        db: AsyncSession
+    ) -> ManifestDiff:
+        """
+        변경 문서 스캔 (전체 결과)
+
+        현재 파일 상태(크기, mtime)와 DB 매니페스트를 비교하여
+        신규/수정/변경 없음/삭제로 분류합니다.
+
+        Args:
+            db: DB 세션
+
+        Returns:
+            ManifestDiff: 변경 분류 결과
+        """
+        diff = ManifestDiff()
+        async for change in self.stream_changes(db, include_unchanged=True):
+            diff.add(change)
+
+        logger.info(f"Manifest diff: {diff.summary()}")
+        return diff
+
+    async def refresh_manifest(
         self,
         db: AsyncSession,
-        file_path: str
-    ) -> bool:
+        touched: List[TouchedFile]
+    ) -> None:
         """
-        문서가 DB에 존재하는지 확인
+        내용이 같고 mtime만 바뀐 문서의 매니페스트 갱신 (재인덱싱 없이)
+
+        Args:
+            db: DB 세션
+            touched: 갱신할 파일 리스트
+        """
+        if not touched:
+            return
+
+        ids = {
+            document_id: item.entry
+            for item in touched
+            for document_id in item.document_ids
+        }
+        result = await db.execute(
+            select(Document).where(Document.id.in_(list(ids)))
+        )
+        for document in result.scalars():
+            entry = ids[str(document.id)]
+            # JSONB는 새 dict를 대입해야 변경이 감지됨
+            document.doc_metadata = {
+                **(document.doc_metadata or {}),
+                **entry.to_metadata()
+            }
+
+        await db.commit()
+        logger.info(f"Manifest refreshed: {len(ids)} documents")
+
+    @staticmethod
+    def _to_manifest_entry(walked: WalkedFile) -> FileManifestEntry:
+        """순회 중 읽은 stat 정보로 매니페스트 항목 생성 (추가 stat 없음)"""
+        return FileManifestEntry(
+            file_path=walked.path,
+            file_size_bytes=walked.size,
+            file_mtime=walked.mtime
+        )
+
+    def _source_prefix(self) -> str:
+        """
+        저장소 경로 접두사 (다른 디렉토리 문서는 비교 대상에서 제외)
+
+        경로의 "_", "%"가 LIKE 와일드카드로 해석되지 않도록 startswith(autoescape=True)로 사용
+        """
+        return os.path.join(str(self.watch_dir.absolute()), "")
+
+    async def _load_known_sources(self, db: AsyncSession) -> Set[str]:
+        """
+        저장소 경로 하위 문서의 source 일괄 조회 (스트리밍 쿼리 1회)
 
         Args:
             db: DB 세션
-            file_path: 파일 경로
 
         Returns:
-            bool: 존재 여부
+            Set[str]: 기존 문서 경로 집합
+        """
+        stmt = (
+            select(Document.source)
+            .where(Document.source.startswith(self._source_prefix(), autoescape=True))
+            .execution_options(yield_per=self.STREAM_BATCH_SIZE)
+        )
+
+        known: Set[str] = set()
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            known.update(source for (source,) in partition)
+
+        return known
+
+    async def _load_known_documents(
+        self,
+        db: AsyncSession
+    ) -> Dict[str, List[KnownDocument]]:
         """
-        from sqlalchemy import select
+        저장소 경로 하위 문서의 매니페스트 일괄 조회 (스트리밍 쿼리 1회)
 
-        stmt = select(Document).where(
-            Document.source == file_path
+        Args:
+            db: DB 세션
+
+        Returns:
+            Dict[str, List[KnownDocument]]: 경로 → 기록된 문서 리스트
+        """
+        stmt = (
+            select(Document.id, Document.source, Document.doc_metadata)
+            .where(Document.source.startswith(self._source_prefix(), autoescape=True))
+            .execution_options(yield_per=self.STREAM_BATCH_SIZE)
         )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none() is not None
+
+        known: Dict[str, List[KnownDocument]] = {}
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            for document_id, source, doc_metadata in partition:
+                known.setdefault(source, []).append(
+                    KnownDocument.from_row(document_id, source, doc_metadata)
+                )
+
+        return known
@@ -1,10 +1,12 @@
 """
 인덱싱 작업 큐 관리
 """
-from typing import List, Dict
+from typing import Any, AsyncIterable, AsyncIterator, List, Dict, Optional
 import asyncio
 from sqlalchemy.orm import Session
 from app.services.document_indexer import DocumentIndexer
+from app.services.indexing_pipeline import IndexingPipeline, PipelineConfig
+from app.scheduler.manifest import ChangeType, FileChange, ManifestDiff, TouchedFile
 from app.db.base import SessionLocal
 import logging
 
@@ -14,126 +16,178 @@ logger = logging.getLogger(__name__)
 class IndexingQueue:
     """인덱싱 작업 큐"""
 
-    def __init__(self, max_concurrent: int = 5):
+    def __init__(
+        self,
+        max_concurrent: int = 5,
+        pipeline_config: Optional[PipelineConfig] = None
+    ):
         """
         Args:
-            max_concurrent: 최대 동시 처리 수
+            max_concurrent: 최대 동시 파싱 수 (pipeline_config가 없을 때 parse_workers)
+            pipeline_config: 파이프라인 단계별 설정
         """
         self.max_concurrent = max_concurrent
+        self.pipeline_config = pipeline_config or PipelineConfig(parse_workers=max_concurrent)
 
     async def process_documents(
         self,
-        documents: List[Dict[str, str]]
+        documents: List[Dict[str, Any]]
     ) -> Dict[str, int]:
         """
         문서 배치 인덱싱
 
         Args:
             documents: 문서 리스트
+                - file_path: 파일 경로
+                - replace_document_ids: (선택) 인덱싱 성공 후 삭제할 기존 문서 ID
+
+        Returns:
+            Dict: 처리 결과 (process_stream 참고)
+        """
+        async def iterate() -> AsyncIterator[Dict[str, Any]]:
+            for doc in documents:
+                yield doc
+
+        return await self.process_stream(iterate())
+
+    async def process_stream(
+        self,
+        documents: AsyncIterable[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        문서 스트림 인덱싱
+
+        스캐너가 순회 중 내보내는 문서를 받는 즉시 파이프라인(파싱 → 임베딩 → 저장)에
+        넣습니다. 단계 사이 큐가 가득 차면 다음 문서를 가져오지 않으므로
+        스캔도 그만큼 대기합니다 (backpressure).
+
+        Args:
+            documents: 문서 비동기 이터러블 (process_documents 참고)
 
         Returns:
             Dict: 처리 결과
                 - success: 성공 개수
                 - failed: 실패 개수
                 - total: 전체 개수
+                - chunks: 인덱싱된 청크 수
+                - cache_hits: 청크 임베딩 캐시 히트 수
         """
-        if not documents:
-            return {'success': 0, 'failed': 0, 'total': 0}
+        pipeline = IndexingPipeline(config=self.pipeline_config)
+        report = await pipeline.run(documents)
 
+        succeeded = [result for result in report.results if result.success]
         results = {
-            'success': 0,
-            'failed': 0,
-            'total': len(documents)
+            'success': len(succeeded),
+            'failed': len(report.results) - len(succeeded),
+            'total': len(report.results),
+            'chunks': sum(result.total_chunks for result in succeeded),
+            'cache_hits': sum(result.cache_hits for result in succeeded)
         }
+        hit_rate = results['cache_hits'] / results['chunks'] if results['chunks'] else 0.0
 
-        # 세마포어로 동시 처리 수 제한
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        logger.info(
+            f"Indexing completed: {results['success']}/{results['total']} succeeded, "
+            f"chunk cache hit rate {hit_rate:.1%} "
+            f"({results['cache_hits']}/{results['chunks']})"
+        )
 
-        async def process_with_semaphore(doc: Dict[str, str]):
-            async with semaphore:
-                return await self._process_single_document(doc)
+        return results
 
-        # 병렬 처리
-        tasks = [
-            process_with_semaphore(doc)
-            for doc in documents
-        ]
+    async def process_change_stream(
+        self,
+        changes: AsyncIterable[FileChange],
+        touched: Optional[List[TouchedFile]] = None
+    ) -> Dict[str, int]:
+        """
+        변경 스트림 반영 (증분 재인덱싱, 스캔과 인덱싱 동시 진행)
 
-        completed = await asyncio.gather(*tasks, return_exceptions=True)
+        - 신규/수정: 받는 즉시 인덱싱 (수정은 성공 후 기존 문서 삭제)
+        - 삭제: 스트림이 끝난 뒤 일괄 삭제
+        - 매니페스트만 갱신할 항목: touched 리스트에 수집 (호출자가 DB 반영)
 
-        # 결과 집계
-        for result in completed:
-            if isinstance(result, Exception):
-                results['failed'] += 1
-                logger.error(f"Indexing failed: {result}")
-            elif result:
-                results['success'] += 1
-            else:
-                results['failed'] += 1
+        Args:
+            changes: FileScanner.stream_changes 결과
+            touched: 매니페스트 갱신 대상 수집 리스트 (None이면 무시)
 
-        logger.info(
-            f"Indexing completed: {results['success']}/{results['total']} succeeded"
-        )
+        Returns:
+            Dict: process_stream 결과 + deleted(삭제 문서 수)
+        """
+        deleted_ids: List[str] = []
+
+        async def documents() -> AsyncIterator[Dict[str, Any]]:
+            async for change in changes:
+                if change.change_type == ChangeType.NEW:
+                    yield {'file_path': change.file_path}
+                elif change.change_type == ChangeType.MODIFIED:
+                    yield {
+                        'file_path': change.file_path,
+                        'replace_document_ids': change.document_ids
+                    }
+                elif change.change_type == ChangeType.DELETED:
+                    deleted_ids.extend(change.document_ids)
+                elif change.refresh_manifest and touched is not None:
+                    touched.append(
+                        TouchedFile(entry=change.entry, document_ids=change.document_ids)
+                    )
+
+        results = await self.process_stream(documents())
+        results['deleted'] = await self.delete_documents(deleted_ids)
 
         return results
 
-    async def _process_single_document(
-        self,
-        doc: Dict[str, str]
-    ) -> bool:
+    async def process_changes(self, diff: ManifestDiff) -> Dict[str, int]:
         """
-        단일 문서 인덱싱 (재시도 포함)
+        매니페스트 변경분 반영 (증분 재인덱싱)
+
+        - 신규: 인덱싱
+        - 수정: 새로 인덱싱 후 기존 문서 삭제 (실패 시 기존 문서 유지)
+        - 삭제: PostgreSQL + Milvus에서 삭제
 
         Args:
-            doc: 문서 정보
+            diff: 매니페스트 비교 결과
 
         Returns:
-            bool: 성공 여부
+            Dict: process_documents 결과 + deleted(삭제 문서 수)
         """
-        max_retries = 3
-        retry_count = 0
-
-        while retry_count < max_retries:
-            try:
-                # 동기 작업을 비동기로 래핑
-                result = await asyncio.to_thread(
-                    self._index_document_sync,
-                    doc['file_path']
-                )
-                return result
-
-            except Exception as e:
-                retry_count += 1
-                logger.warning(
-                    f"Indexing retry {retry_count}/{max_retries}: {e}"
-                )
-
-                if retry_count >= max_retries:
-                    logger.error(
-                        f"Indexing failed after {max_retries} retries: "
-                        f"{doc['file_path']}"
-                    )
-                    return False
+        documents: List[Dict[str, Any]] = [
+            {'file_path': entry.file_path} for entry in diff.new
+        ]
+        documents.extend(
+            {
+                'file_path': item.entry.file_path,
+                'replace_document_ids': item.replace_document_ids
+            }
+            for item in diff.modified
+        )
 
-                # Exponential backoff
-                await asyncio.sleep(2 ** retry_count)
+        results = await self.process_documents(documents)
+        results['deleted'] = await self.delete_documents(
+            [doc.document_id for doc in diff.deleted]
+        )
 
-        return False
+        return results
 
-    def _index_document_sync(self, file_path: str) -> bool:
+    async def delete_documents(self, document_ids: List[str]) -> int:
         """
-        동기 방식으로 문서 인덱싱 (실제 처리)
+        원본 파일이 삭제된 문서 정리
 
         Args:
-            file_path: 파일 경로
+            document_ids: 문서 ID 리스트
 
         Returns:
-            bool: 성공 여부
+            int: 삭제된 문서 수
         """
-        db: Session = SessionLocal()
-        try:
-            indexer = DocumentIndexer(db_session=db)
-            result = indexer.index_document(file_path)
-            return result.success
-        finally:
-            db.close()
+        if not document_ids:
+            return 0
+
+        def delete_sync() -> int:
+            db: Session = SessionLocal()
+            try:
+                indexer = DocumentIndexer(db_session=db)
+                return indexer.delete_documents(document_ids)
+            finally:
+                db.close()
+
+        deleted = await asyncio.to_thread(delete_sync)
+        logger.info(f"Deleted {deleted}/{len(document_ids)} documents")
+        return deleted
@@ -5,8 +5,10 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from app.scheduler.file_scanner import FileScanner
 from app.scheduler.indexing_queue import IndexingQueue
+from app.scheduler.manifest import TouchedFile
 from app.db.base import AsyncSessionLocal
 from app.core.config import settings
+from typing import List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,9 +16,9 @@ logger = logging.getLogger(__name__)
 
 async def auto_index_new_documents():
     """
-    신규 문서 자동 인덱싱 작업
+    문서 자동 인덱싱 작업 (증분)
 
-    매일 새벽 2시 실행
+    매일 새벽 2시 실행. 신규/수정 문서만 인덱싱하고 삭제된 문서는 정리합니다.
     """
     logger.info("Starting auto-indexing job")
 
@@ -24,22 +26,21 @@ async def auto_index_new_documents():
         scanner = FileScanner(settings.DOCUMENT_STORAGE_PATH)
         queue = IndexingQueue(max_concurrent=5)
 
-        async with AsyncSessionLocal() as db:
-            # 신규 문서 스캔
-            new_docs = await scanner.scan_for_new_documents(db)
-
-            if not new_docs:
-                logger.info("No new documents found")
-                return
-
-            # 인덱싱 실행
-            results = await queue.process_documents(new_docs)
+        touched: List[TouchedFile] = []
 
-            logger.info(
-                f"Auto-indexing completed: "
-                f"{results['success']}/{results['total']} succeeded, "
-                f"{results['failed']} failed"
+        async with AsyncSessionLocal() as db:
+            # 변경 문서 스캔과 인덱싱을 동시에 진행 (변경분만 인덱싱/삭제)
+            results = await queue.process_change_stream(
+                scanner.stream_changes(db),
+                touched=touched
             )
+            await scanner.refresh_manifest(db, touched)
+
+        logger.info(
+            f"Auto-indexing completed: "
+            f"{results['success']}/{results['total']} succeeded, "
+            f"{results['failed']} failed, {results['deleted']} deleted"
+        )
 
     except Exception as e:
         logger.error(f"Auto-indexing job failed: {e}", exc_info=True)
@@ -0,0 +1,367 @@
+"""
+문서 저장소 매니페스트 및 변경 감지 (증분 재인덱싱)
+
+각 문서의 파일 크기, 수정 시각(mtime), 내용 해시(SHA-256)를
+Document.doc_metadata에 기록해 두고, 스캔 시 현재 파일 상태와 비교하여
+신규/수정/변경 없음/삭제로 분류합니다.
+
+비교 순서:
+1. 크기 + mtime이 기록과 같으면 변경 없음 (해시 계산 생략)
+2. 다르면 내용 해시 계산 후 비교
+   - 해시가 같으면 변경 없음 (touch 등으로 mtime만 바뀐 경우, 매니페스트만 갱신)
+   - 해시가 다르면 수정
+3. 매니페스트가 없는 기존 문서(해시 미기록)는 수정으로 분류하여 한 번 재인덱싱
+4. Milvus 반영 전(index_status=pending)에 중단된 문서는 수정으로 분류하여 재인덱싱
+"""
+import hashlib
+import os
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from pydantic import BaseModel, Field
+import logging
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+class ChangeType(str, Enum):
+    """파일 변경 유형"""
+    NEW = "new"
+    MODIFIED = "modified"
+    UNCHANGED = "unchanged"
+    DELETED = "deleted"
+
+
+class IndexStatus(str, Enum):
+    """문서의 Milvus 반영 상태 (doc_metadata.index_status)"""
+    PENDING = "pending"
+    INDEXED = "indexed"
+
+
+class FileManifestEntry(BaseModel):
+    """현재 파일 상태"""
+
+    file_path: str = Field(..., description="절대 경로")
+    file_size_bytes: int = Field(..., description="파일 크기")
+    file_mtime: float = Field(..., description="수정 시각 (epoch seconds)")
+    content_hash: Optional[str] = Field(None, description="SHA-256 (필요할 때만 계산)")
+
+    def to_metadata(self) -> Dict[str, object]:
+        """doc_metadata에 기록할 매니페스트 필드"""
+        return {
+            "file_size_bytes": self.file_size_bytes,
+            "file_mtime": self.file_mtime,
+            "content_hash": self.content_hash,
+        }
+
+
+class KnownDocument(BaseModel):
+    """DB에 기록된 문서의 매니페스트"""
+
+    document_id: str = Field(..., description="문서 ID")
+    file_path: str = Field(..., description="원본 파일 경로 (Document.source)")
+    file_size_bytes: Optional[int] = Field(None, description="기록된 파일 크기")
+    file_mtime: Optional[float] = Field(None, description="기록된 수정 시각")
+    content_hash: Optional[str] = Field(None, description="기록된 내용 해시")
+    index_status: Optional[IndexStatus] = Field(
+        None, description="Milvus 반영 상태 (미기록 문서는 반영 완료로 간주)"
+    )
+
+    @property
+    def is_pending(self) -> bool:
+        """PostgreSQL에만 커밋되고 Milvus 반영이 끝나지 않은 문서인지"""
+        return self.index_status == IndexStatus.PENDING
+
+    @classmethod
+    def from_row(
+        cls,
+        document_id: object,
+        source: str,
+        doc_metadata: Optional[dict]
+    ) -> "KnownDocument":
+        """(id, source, doc_metadata) 조회 결과로 생성"""
+        metadata = doc_metadata or {}
+        return cls(
+            document_id=str(document_id),
+            file_path=source,
+            file_size_bytes=metadata.get("file_size_bytes"),
+            file_mtime=metadata.get("file_mtime"),
+            content_hash=metadata.get("content_hash"),
+            index_status=metadata.get("index_status"),
+        )
+
+
+class ModifiedFile(BaseModel):
+    """수정된 파일 (새로 인덱싱 후 기존 문서 삭제)"""
+
+    entry: FileManifestEntry
+    replace_document_ids: List[str] = Field(..., description="교체될 기존 문서 ID")
+
+
+class TouchedFile(BaseModel):
+    """내용은 같고 mtime만 바뀐 파일 (매니페스트만 갱신)"""
+
+    entry: FileManifestEntry
+    document_ids: List[str]
+
+
+class FileChange(BaseModel):
+    """스캔 중 감지된 파일 변경 (스트리밍 단위)"""
+
+    change_type: ChangeType
+    file_path: str = Field(..., description="파일 경로")
+    entry: Optional[FileManifestEntry] = Field(None, description="현재 파일 상태 (삭제 시 None)")
+    document_ids: List[str] = Field(default_factory=list, description="관련 기존 문서 ID")
+    refresh_manifest: bool = Field(
+        default=False,
+        description="내용은 같고 mtime만 바뀌어 매니페스트만 갱신해야 하는 경우 True"
+    )
+
+
+class ManifestDiff(BaseModel):
+    """매니페스트 비교 결과"""
+
+    new: List[FileManifestEntry] = Field(default_factory=list)
+    modified: List[ModifiedFile] = Field(default_factory=list)
+    unchanged: int = Field(default=0, description="변경 없는 파일 수")
+    touched: List[TouchedFile] = Field(default_factory=list)
+    deleted: List[KnownDocument] = Field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """인덱싱/삭제할 변경이 있는지"""
+        return bool(self.new or self.modified or self.deleted)
+
+    def add(self, change: FileChange) -> None:
+        """변경 하나를 유형별 목록에 추가"""
+        if change.change_type == ChangeType.NEW:
+            self.new.append(change.entry)
+        elif change.change_type == ChangeType.MODIFIED:
+            self.modified.append(
+                ModifiedFile(entry=change.entry, replace_document_ids=change.document_ids)
+            )
+        elif change.change_type == ChangeType.DELETED:
+            self.deleted.extend(
+                KnownDocument(document_id=document_id, file_path=change.file_path)
+                for document_id in change.document_ids
+            )
+        else:
+            self.unchanged += 1
+            if change.refresh_manifest:
+                self.touched.append(
+                    TouchedFile(entry=change.entry, document_ids=change.document_ids)
+                )
+
+    def summary(self) -> Dict[str, int]:
+        """유형별 개수"""
+        return {
+            ChangeType.NEW.value: len(self.new),
+            ChangeType.MODIFIED.value: len(self.modified),
+            ChangeType.UNCHANGED.value: self.unchanged,
+            ChangeType.DELETED.value: len(self.deleted),
+        }
+
+
+def compute_content_hash(file_path: str) -> str:
+    """
+    파일 내용 SHA-256 계산 (1MB 단위 스트리밍)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        str: hex digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def build_manifest_entry(file_path: str, with_hash: bool = False) -> FileManifestEntry:
+    """
+    현재 파일 상태로 매니페스트 항목 생성
+
+    Args:
+        file_path: 파일 경로
+        with_hash: 내용 해시 계산 여부
+
+    Returns:
+        FileManifestEntry: 매니페스트 항목
+    """
+    stat = os.stat(file_path)
+    return FileManifestEntry(
+        file_path=file_path,
+        file_size_bytes=stat.st_size,
+        file_mtime=stat.st_mtime,
+        content_hash=compute_content_hash(file_path) if with_hash else None,
+    )
+
+
+def quick_classify(
+    entry: FileManifestEntry,
+    documents: Optional[List[KnownDocument]]
+) -> Optional[FileChange]:
+    """
+    해시 계산 없이 분류 가능한 경우 분류 (신규, 크기/mtime 동일)
+
+    Args:
+        entry: 현재 파일 상태
+        documents: 같은 경로의 기록된 문서 리스트
+
+    Returns:
+        Optional[FileChange]: 분류 결과 (해시 비교가 필요하면 None)
+    """
+    if not documents:
+        return FileChange(change_type=ChangeType.NEW, file_path=entry.file_path, entry=entry)
+
+    recorded = documents[0]
+    if (
+        len(documents) == 1
+        and recorded.content_hash is not None
+        and not recorded.is_pending
+        and recorded.file_size_bytes == entry.file_size_bytes
+        and recorded.file_mtime == entry.file_mtime
+    ):
+        return FileChange(
+            change_type=ChangeType.UNCHANGED,
+            file_path=entry.file_path,
+            entry=entry,
+            document_ids=[recorded.document_id]
+        )
+
+    return None
+
+
+def classify_with_hash(
+    entry: FileManifestEntry,
+    documents: List[KnownDocument],
+    hasher: Callable[[str], str] = compute_content_hash
+) -> FileChange:
+    """
+    내용 해시로 분류 (quick_classify가 None인 경우)
+
+    - 해시가 같으면 변경 없음 (매니페스트만 갱신)
+    - 해시가 다르거나, 해시 미기록/중복/Milvus 미반영 문서면 수정
+
+    Args:
+        entry: 현재 파일 상태 (content_hash가 채워짐)
+        documents: 같은 경로의 기록된 문서 리스트
+        hasher: 내용 해시 함수 (테스트 주입용)
+
+    Returns:
+        FileChange: 분류 결과
+    """
+    document_ids = [doc.document_id for doc in documents]
+
+    try:
+        entry.content_hash = hasher(entry.file_path)
+    except OSError as e:
+        # 스캔 이후 삭제/권한 변경된 파일은 다음 스캔에서 처리
+        logger.warning(f"Failed to hash file, skipping: {entry.file_path}, error={e}")
+        return FileChange(
+            change_type=ChangeType.UNCHANGED,
+            file_path=entry.file_path,
+            document_ids=document_ids
+        )
+
+    # 같은 경로가 중복 인덱싱된 경우 다시 인덱싱하여 하나로 정리
+    if (
+        len(documents) == 1
+        and not documents[0].is_pending
+        and entry.content_hash == documents[0].content_hash
+    ):
+        return FileChange(
+            change_type=ChangeType.UNCHANGED,
+            file_path=entry.file_path,
+            entry=entry,
+            document_ids=document_ids,
+            refresh_manifest=True
+        )
+
+    return FileChange(
+        change_type=ChangeType.MODIFIED,
+        file_path=entry.file_path,
+        entry=entry,
+        document_ids=document_ids
+    )
+
+
+def is_under(path: str, prefixes: Iterable[str]) -> bool:
+    """
+    경로가 접두사 경로 중 하나와 같거나 그 하위인지 여부
+
+    Args:
+        path: 검사할 경로
+        prefixes: 디렉토리/파일 경로들
+
+    Returns:
+        bool: 하위 경로 여부
+    """
+    return any(
+        path == prefix or path.startswith(os.path.join(prefix, ""))
+        for prefix in prefixes
+    )
+
+
+def deleted_changes(
+    known: Dict[str, List[KnownDocument]],
+    seen_paths: Set[str],
+    unreadable_paths: Iterable[str] = ()
+) -> List[FileChange]:
+    """
+    순회에서 발견되지 않은 경로의 문서를 삭제로 분류
+
+    읽지 못한 디렉토리/항목 하위의 문서는 파일이 남아 있을 수 있으므로 제외합니다.
+
+    Args:
+        known: 경로 → 기록된 문서 리스트
+        seen_paths: 순회에서 발견한 경로 집합
+        unreadable_paths: 순회 중 읽지 못한 디렉토리/항목 경로
+
+    Returns:
+        List[FileChange]: 삭제 변경 리스트 (경로당 1개)
+    """
+    unreadable = list(unreadable_paths)
+    return [
+        FileChange(
+            change_type=ChangeType.DELETED,
+            file_path=path,
+            document_ids=[doc.document_id for doc in documents]
+        )
+        for path, documents in known.items()
+        if path not in seen_paths and not (unreadable and is_under(path, unreadable))
+    ]
+
+
+def diff_manifest(
+    current: Dict[str, FileManifestEntry],
+    known: Dict[str, List[KnownDocument]],
+    hasher: Callable[[str], str] = compute_content_hash
+) -> ManifestDiff:
+    """
+    현재 파일 상태와 DB 매니페스트 비교
+
+    Args:
+        current: 경로 → 현재 파일 상태 (해시 없이 stat만)
+        known: 경로 → 기록된 문서 리스트 (같은 경로가 중복 인덱싱된 경우 여러 개)
+        hasher: 내용 해시 함수 (테스트 주입용)
+
+    Returns:
+        ManifestDiff: 분류 결과
+    """
+    diff = ManifestDiff()
+
+    for path, entry in current.items():
+        documents = known.get(path)
+        change = quick_classify(entry, documents)
+        if change is None:
+            change = classify_with_hash(entry, documents, hasher)
+        diff.add(change)
+
+    for change in deleted_changes(known, set(current)):
+        diff.add(change)
+
+    return diff
@@ -136,3 +136,32 @@ class SearchQueryResponse(BaseModel):
                 "timestamp": "2026-01-03T12:00:00Z"
             }
         }
+
+
+class BatchSearchRequest(BaseModel):
+    """일괄 검색 요청 스키마 (답변 생성 없이 출처만 반환)"""
+    queries: List[str] = Field(..., min_length=1, max_length=100, description="검색어 리스트 (1-100개)")
+    limit: int = Field(default=5, ge=1, le=20, description="검색어별 결과 개수 (1-20)")
+
+    @field_validator('queries')
+    @classmethod
+    def validate_queries(cls, v: List[str]) -> List[str]:
+        """각 검색어에 단건 검색과 같은 길이/보안 검증 적용"""
+        validated = []
+        for query in v:
+            if not 5 <= len(query) <= 200:
+                raise ValueError("검색어는 5-200자여야 합니다.")
+            validated.append(SearchQueryRequest.validate_query(query))
+        return validated
+
+
+class BatchSearchResult(BaseModel):
+    """일괄 검색 결과 (검색어 1개)"""
+    query: str = Field(..., description="검색어")
+    sources: List[DocumentSource] = Field(default_factory=list, description="문서 출처 리스트")
+
+
+class BatchSearchResponse(BaseModel):
+    """일괄 검색 응답 스키마"""
+    results: List[BatchSearchResult] = Field(..., description="요청 순서의 검색어별 결과")
+    total_time_ms: int = Field(..., ge=0, description="전체 처리 시간 (ms)")
@@ -3,13 +3,228 @@
 
 사용자의 access_level과 부서 정보를 기반으로
 Milvus 필터 표현식을 생성하고 문서 접근 권한을 검증합니다.
+
+같은 (access_level, department) 조합의 사용자는 같은 문서를 보므로, 필터 표현식과
+접근 판정 규칙을 AccessScope로 한 번만 만들어 재사용합니다 (get_access_scope).
 """
 
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
 from app.schemas.user import UserContext
 
 logger = logging.getLogger(__name__)
 
+# Milvus 스칼라 권한 필드 (access_scope는 partition key)
+ACCESS_SCOPE_FIELDS = ("access_level", "department", "access_scope")
+
+# Public 문서(L1)는 부서와 무관하게 하나의 범위로 모음
+PUBLIC_SCOPE = "public"
+# 부서가 지정되지 않은 Internal/Confidential 문서 (Management만 접근)
+UNASSIGNED_SCOPE = "unassigned"
+
+
+def collection_has_scope_fields(collection: Any) -> bool:
+    """
+    Collection이 스칼라 권한 필드(access_level, department, access_scope)를 갖는지 확인
+
+    scripts/migrate_milvus_access_scope.py로 마이그레이션하기 전의 Collection은
+    권한 정보가 metadata JSON에만 있으므로 기존 JSON 경로 필터를 사용해야 합니다.
+
+    Args:
+        collection: Milvus Collection
+
+    Returns:
+        bool: 스칼라 권한 필드 존재 여부
+    """
+    try:
+        names = {field.name for field in collection.schema.fields}
+    except Exception:
+        return False
+    return all(name in names for name in ACCESS_SCOPE_FIELDS)
+
+
+def _quote(value: str) -> str:
+    """Milvus 표현식 문자열 리터럴 (따옴표/역슬래시 이스케이프)"""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _legacy_filter_expression(access_level: int, department: str) -> str:
+    """
+    metadata JSON 경로 기반 필터 표현식 (권한 필드 마이그레이션 전 Collection용)
+
+    권한 규칙:
+    - Management: 모든 문서 접근 (L1, L2, L3)
+    - L1 사용자: Public 문서만 (L1)
+    - L2 사용자: Public + 자부서 Internal (L1 + 자부서 L2)
+    - L3 사용자 (비Management): Public + 자부서 모든 문서 (L1 + 자부서 L2/L3)
+    """
+    # Case 1: Management는 모든 문서 접근
+    if department == "Management":
+        return 'metadata["access_level"] >= 1'
+
+    # Case 2: L1 사용자는 Public만
+    if access_level == 1:
+        return 'metadata["access_level"] == 1'
+
+    # Case 3: L2 사용자는 Public + 자부서 Internal
+    if access_level == 2:
+        return (
+            f'(metadata["access_level"] == 1) or '
+            f'(metadata["access_level"] == 2 and metadata["department"] == "{department}")'
+        )
+
+    # Case 4: L3 사용자 (Management 제외)는 Public + 자부서 모든 문서
+    if access_level == 3:
+        return (
+            f'(metadata["access_level"] == 1) or '
+            f'(metadata["department"] == "{department}")'
+        )
+
+    # 기본값: Public만 (안전한 기본값)
+    logger.warning(f"알 수 없는 access_level={access_level}, Public만 허용")
+    return 'metadata["access_level"] == 1'
+
+
+def _partition_filter_expression(access_level: int, department: str) -> str:
+    """
+    스칼라 권한 필드 기반 필터 표현식 (partition key 프루닝)
+
+    _legacy_filter_expression과 같은 권한 규칙을 스칼라 필드로 표현합니다.
+    access_scope 조건이 있으면 Milvus가 해당 파티션만 검색하므로,
+    작은 부서 사용자의 필터 검색에서 전체 후보를 평가하지 않습니다.
+    """
+    public = _quote(PUBLIC_SCOPE)
+
+    # Management는 모든 문서 접근 (전체 파티션)
+    if department == "Management":
+        return "access_level >= 1"
+
+    if access_level in (2, 3) and department:
+        scopes = f"access_scope in [{public}, {_quote(department)}]"
+
+        # L2: Public + 자부서 Internal (자부서 Confidential 제외)
+        if access_level == 2:
+            return f"{scopes} and access_level <= 2"
+
+        # L3: Public + 자부서 모든 문서
+        return scopes
+
+    # L1 또는 부서 정보가 없는 사용자: Public만 (안전한 기본값)
+    return f"access_scope == {public}"
+
+
+@dataclass(frozen=True)
+class AccessScope:
+    """
+    사용자 권한 범위 ((access_level, department) 조합당 1개, get_access_scope로 생성)
+
+    Milvus 필터 표현식(검증 완료)과 같은 규칙의 Python 판정(allows)을 함께 보관하여
+    검색 필터, 결과 후처리, 캐시 키가 항상 같은 규칙을 쓰도록 합니다.
+
+    [HARD RULE] 권한 없는 문서는 절대 노출 금지
+    """
+
+    access_level: int
+    department: str
+    legacy_expression: str  # metadata JSON 경로 필터
+    milvus_expression: str  # 스칼라 필드 + partition key 필터
+
+    @property
+    def is_management(self) -> bool:
+        """Management 부서 여부 (모든 문서 접근)"""
+        return self.department == "Management"
+
+    @property
+    def cache_key(self) -> str:
+        """캐시 범위 키 (같은 문서 집합을 보는 범위끼리 같은 값)"""
+        return self.milvus_expression
+
+    def expression(self, scope_fields: bool) -> str:
+        """
+        Collection 스키마에 맞는 필터 표현식
+
+        Args:
+            scope_fields: Collection에 스칼라 권한 필드가 있는지 여부
+
+        Returns:
+            str: Milvus filter expression
+        """
+        return self.milvus_expression if scope_fields else self.legacy_expression
+
+    def allows(self, document_access_level: int, document_department: Optional[str]) -> bool:
+        """
+        문서 접근 가능 여부 (필터 표현식과 같은 규칙의 Python 판정)
+
+        Args:
+            document_access_level: 문서 접근 레벨 (1-3)
+            document_department: 문서 부서
+
+        Returns:
+            bool: 접근 가능 여부
+        """
+        # Public 문서는 모두 접근 가능
+        if document_access_level == 1:
+            return True
+
+        # Management는 모두 접근 가능
+        if self.is_management:
+            return True
+
+        # Internal 문서는 같은 부서 + access_level >= 2
+        if document_access_level == 2:
+            return self.access_level >= 2 and self.department == document_department
+
+        # Confidential 문서는 같은 부서 + access_level >= 3
+        if document_access_level == 3:
+            return self.access_level >= 3 and self.department == document_department
+
+        # 기본값: 거부 (안전한 기본값)
+        logger.warning(
+            f"알 수 없는 document_access_level={document_access_level} → 접근 거부"
+        )
+        return False
+
+
+@lru_cache(maxsize=1024)
+def get_access_scope(access_level: int, department: str) -> AccessScope:
+    """
+    (access_level, department) 조합의 AccessScope (프로세스 내 메모이즈)
+
+    표현식은 생성 시 한 번만 검증하며, 이후 같은 조합의 요청은 같은 객체를 공유합니다.
+
+    Args:
+        access_level: 사용자 접근 레벨
+        department: 사용자 부서
+
+    Returns:
+        AccessScope: 권한 범위
+
+    Raises:
+        ValueError: 필터 표현식 검증 실패 (예: 부서명에 위험한 키워드 포함)
+    """
+    scope = AccessScope(
+        access_level=access_level,
+        department=department,
+        legacy_expression=_legacy_filter_expression(access_level, department),
+        milvus_expression=_partition_filter_expression(access_level, department)
+    )
+
+    for filter_expr in (scope.legacy_expression, scope.milvus_expression):
+        if not AccessControlService.validate_filter_expression(filter_expr):
+            raise ValueError(
+                f"권한 필터 표현식 검증 실패: access_level={access_level}, "
+                f"department={department}"
+            )
+
+    logger.info(
+        f"권한 범위 생성: access_level={access_level}, department={department}, "
+        f"filter='{scope.milvus_expression}'"
+    )
+    return scope
+
 
 class AccessControlService:
     """
@@ -18,64 +233,66 @@ class AccessControlService:
     [HARD RULE] 권한 없는 문서는 절대 노출 금지
     """
 
+    @staticmethod
+    def scope_for(user: UserContext) -> AccessScope:
+        """
+        사용자의 AccessScope (같은 레벨/부서 사용자끼리 공유)
+
+        Args:
+            user: 사용자 컨텍스트
+
+        Returns:
+            AccessScope: 권한 범위
+
+        Raises:
+            ValueError: 필터 표현식 검증 실패
+        """
+        return get_access_scope(user.access_level, user.department)
+
     @staticmethod
     def build_filter_expression(user: UserContext) -> str:
         """
-        사용자 권한 기반 Milvus 필터 표현식 생성
+        사용자 권한 기반 Milvus 필터 표현식 생성 (metadata JSON 경로)
 
         Args:
             user: 사용자 컨텍스트
 
         Returns:
             str: Milvus filter expression
+        """
+        return AccessControlService.scope_for(user).legacy_expression
 
-        권한 규칙:
-        - Management: 모든 문서 접근 (L1, L2, L3)
-        - L1 사용자: Public 문서만 (L1)
-        - L2 사용자: Public + 자부서 Internal (L1 + 자부서 L2)
-        - L3 사용자 (비Management): Public + 자부서 모든 문서 (L1 + 자부서 L2/L3)
+    @staticmethod
+    def access_scope(access_level: int, department: Optional[str]) -> str:
         """
-        logger.info(
-            f"필터 표현식 생성: user_id={user.user_id}, "
-            f"access_level={user.access_level}, "
-            f"department={user.department}"
-        )
+        문서의 Milvus partition key 값 (access_scope)
 
-        # Case 1: Management는 모든 문서 접근
-        if user.department == "Management":
-            filter_expr = 'metadata["access_level"] >= 1'
-            logger.debug(f"Management 전체 접근: {filter_expr}")
-            return filter_expr
-
-        # Case 2: L1 사용자는 Public만
-        if user.access_level == 1:
-            filter_expr = 'metadata["access_level"] == 1'
-            logger.debug(f"L1 Public 접근: {filter_expr}")
-            return filter_expr
-
-        # Case 3: L2 사용자는 Public + 자부서 Internal
-        if user.access_level == 2:
-            filter_expr = (
-                f'(metadata["access_level"] == 1) or '
-                f'(metadata["access_level"] == 2 and metadata["department"] == "{user.department}")'
-            )
-            logger.debug(f"L2 부서별 접근: {filter_expr}")
-            return filter_expr
-
-        # Case 4: L3 사용자 (Management 제외)는 Public + 자부서 모든 문서
-        if user.access_level == 3:
-            filter_expr = (
-                f'(metadata["access_level"] == 1) or '
-                f'(metadata["department"] == "{user.department}")'
-            )
-            logger.debug(f"L3 부서별 전체 접근: {filter_expr}")
-            return filter_expr
+        Public 문서는 모두 PUBLIC_SCOPE, 그 외는 문서 부서로 묶어서
+        사용자별로 읽을 파티션이 Public + 자부서로 한정되도록 합니다.
 
-        # 기본값: Public만 (안전한 기본값)
-        logger.warning(
-            f"알 수 없는 access_level={user.access_level}, Public만 허용"
-        )
-        return 'metadata["access_level"] == 1'
+        Args:
+            access_level: 문서 접근 레벨 (1-3)
+            department: 문서 부서 (없으면 None)
+
+        Returns:
+            str: access_scope 값
+        """
+        if access_level == 1:
+            return PUBLIC_SCOPE
+        return department or UNASSIGNED_SCOPE
+
+    @staticmethod
+    def build_partition_filter_expression(user: UserContext) -> str:
+        """
+        스칼라 권한 필드 기반 Milvus 필터 표현식 생성 (partition key 프루닝)
+
+        Args:
+            user: 사용자 컨텍스트
+
+        Returns:
+            str: Milvus filter expression
+        """
+        return AccessControlService.scope_for(user).milvus_expression
 
     @staticmethod
     def can_access_document(
@@ -96,51 +313,9 @@ class AccessControlService:
 
         [HARD RULE] 권한 없는 문서는 절대 노출 금지
         """
-        logger.debug(
-            f"문서 접근 검증: user={user.user_id}, "
-            f"doc_level={document_access_level}, "
-            f"doc_dept={document_department}"
-        )
-
-        # Public 문서는 모두 접근 가능
-        if document_access_level == 1:
-            logger.debug("Public 문서 → 접근 허용")
-            return True
-
-        # Management는 모두 접근 가능
-        if user.department == "Management":
-            logger.debug("Management 사용자 → 접근 허용")
-            return True
-
-        # Internal 문서는 같은 부서 + access_level >= 2
-        if document_access_level == 2:
-            can_access = (
-                user.access_level >= 2 and
-                user.department == document_department
-            )
-            logger.debug(
-                f"Internal 문서 → "
-                f"{'접근 허용' if can_access else '접근 거부'}"
-            )
-            return can_access
-
-        # Confidential 문서는 같은 부서 + access_level >= 3
-        if document_access_level == 3:
-            can_access = (
-                user.access_level >= 3 and
-                user.department == document_department
-            )
-            logger.debug(
-                f"Confidential 문서 → "
-                f"{'접근 허용' if can_access else '접근 거부'}"
-            )
-            return can_access
-
-        # 기본값: 거부 (안전한 기본값)
-        logger.warning(
-            f"알 수 없는 document_access_level={document_access_level} → 접근 거부"
+        return AccessControlService.scope_for(user).allows(
+            document_access_level, document_department
         )
-        return False
 
     @staticmethod
     def validate_filter_expression(filter_expr: str) -> bool:
@@ -159,7 +334,7 @@ class AccessControlService:
             return False
 
         # 필수 키워드 포함 검증
-        required_keywords = ["access_level"]
+        required_keywords = ["access_level", "access_scope"]
         if not any(keyword in filter_expr for keyword in required_keywords):
             logger.error(f"필수 키워드 누락: {required_keywords}")
             return False
@@ -4,10 +4,11 @@
 파싱 → 청킹 → 임베딩 → 저장 전체 파이프라인을 오케스트레이션합니다.
 """
 
+import asyncio
 import logging
 import os
 import time
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from pydantic import BaseModel, Field
@@ -16,10 +17,21 @@ from pymilvus import Collection
 
 from app.services.document_parser.factory import DocumentParserFactory
 from app.services.text_chunker import DocumentChunker, TextChunk
-from app.services.embedding_service import OllamaEmbeddingService
+from app.services.embedding_service import (
+    OllamaEmbeddingService,
+    AsyncOllamaEmbeddingService
+)
+from app.services.embedding_cache import (
+    ChunkEmbeddingCache,
+    get_chunk_embedding_cache
+)
+from app.services.access_control import AccessControlService, collection_has_scope_fields
+from app.services.index_events import IndexEventType, index_events
+from app.services.lexical_index import LexicalIndex, get_lexical_index
 from app.db.milvus_client import get_milvus_collection
 from app.models.document import Document
-from app.services.document_parser.base_parser import ParsedDocument
+from app.services.document_parser.base_parser import ParsedDocument, ParserConfig
+from app.scheduler.manifest import IndexStatus, build_manifest_entry
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +44,8 @@ class IndexingResult(BaseModel):
     file_path: str = Field(..., description="파일 경로")
     total_chunks: int = Field(default=0, description="생성된 청크 수")
     indexed_chunks: int = Field(default=0, description="인덱싱된 청크 수")
+    cache_hits: int = Field(default=0, description="청크 임베딩 캐시 히트 수")
+    cache_hit_rate: float = Field(default=0.0, description="청크 임베딩 캐시 히트율 (0~1)")
     error_message: Optional[str] = Field(None, description="에러 메시지 (실패 시)")
     processing_time_ms: int = Field(..., description="처리 시간 (밀리초)")
 
@@ -43,11 +57,52 @@ class IndexingResult(BaseModel):
                 "file_path": "/path/to/document.pdf",
                 "total_chunks": 10,
                 "indexed_chunks": 10,
+                "cache_hits": 8,
+                "cache_hit_rate": 0.8,
                 "processing_time_ms": 1500
             }
         }
 
 
+def parse_and_chunk(
+    file_path: str,
+    chunker: Optional[DocumentChunker] = None,
+    parser_config: Optional[ParserConfig] = None
+) -> Tuple[ParsedDocument, List[TextChunk]]:
+    """
+    문서 파싱 + 청킹
+
+    모듈 수준 함수이므로 프로세스 풀에서도 실행할 수 있습니다.
+
+    Args:
+        file_path: 문서 파일 경로
+        chunker: 청커 (기본값: DocumentChunker())
+        parser_config: 파서 설정 (기본값: ParserConfig())
+
+    Returns:
+        Tuple[ParsedDocument, List[TextChunk]]: 파싱 결과와 청크 리스트
+
+    Raises:
+        ValueError: 청크가 생성되지 않은 경우 (빈 문서)
+    """
+    parser = DocumentParserFactory.get_parser(file_path, config=parser_config)
+    parsed_doc = parser.parse(file_path)
+
+    logger.info(
+        f"파싱 완료: {parsed_doc.total_pages}페이지, "
+        f"{parsed_doc.total_characters}자"
+    )
+
+    chunks = (chunker or DocumentChunker()).chunk_document(parsed_doc, document_id=file_path)
+
+    logger.info(f"청킹 완료: {len(chunks)}개 청크")
+
+    if not chunks:
+        raise ValueError("청크가 생성되지 않았습니다 (빈 문서)")
+
+    return parsed_doc, chunks
+
+
 class DocumentIndexerConfig(BaseModel):
     """문서 인덱서 설정"""
 
@@ -68,39 +123,70 @@ class DocumentIndexer:
     3. 임베딩 생성 (nomic-embed-text, 768차원)
     4. PostgreSQL에 메타데이터 저장
     5. Milvus에 벡터 저장
+    6. BM25 역색인 갱신 (하이브리드 검색용)
     """
 
     def __init__(
         self,
         db_session: Session,
-        config: Optional[DocumentIndexerConfig] = None
+        config: Optional[DocumentIndexerConfig] = None,
+        embedding_service: Optional[OllamaEmbeddingService] = None,
+        async_embedding_service: Optional[AsyncOllamaEmbeddingService] = None,
+        chunk_cache: Optional[ChunkEmbeddingCache] = None,
+        collection: Optional[Collection] = None,
+        lexical_index: Optional[LexicalIndex] = None
     ):
         """
         Args:
             db_session: SQLAlchemy 세션
             config: 인덱서 설정
+            embedding_service: 임베딩 서비스 (기본값: 필요 시 OllamaEmbeddingService 생성)
+            async_embedding_service: 비동기 임베딩 서비스 (aindex_document에서 사용)
+            chunk_cache: 청크 임베딩 캐시 (기본값: 프로세스 공유 캐시, 비활성화 시 None)
+            collection: Milvus Collection (기본값: config.collection_name으로 로드)
+            lexical_index: BM25 역색인 (기본값: 프로세스 공유 색인, 비활성화 시 None)
         """
         self.db = db_session
         self.config = config or DocumentIndexerConfig()
 
         # 서비스 초기화
         self.chunker = DocumentChunker()
-        self.embedding_service = OllamaEmbeddingService()
+        self._embedding_service = embedding_service
+        self.async_embedding_service = async_embedding_service
+        self.chunk_cache = chunk_cache if chunk_cache is not None else get_chunk_embedding_cache()
+        self.lexical_index = lexical_index if lexical_index is not None else get_lexical_index()
 
         # Milvus Collection
-        self.collection = get_milvus_collection(self.config.collection_name)
+        self.collection = collection or get_milvus_collection(self.config.collection_name)
+        # 스칼라 권한 필드(access_level, department, access_scope)가 있는 스키마인지
+        self.scope_fields_enabled = collection_has_scope_fields(self.collection)
 
         logger.info(
             f"DocumentIndexer 초기화: batch_size={self.config.batch_size}, "
             f"collection={self.config.collection_name}"
         )
 
-    def index_document(self, file_path: str) -> IndexingResult:
+    @property
+    def embedding_service(self) -> OllamaEmbeddingService:
+        """동기 임베딩 서비스 (비동기 경로만 쓰는 경우 생성하지 않음)"""
+        if self._embedding_service is None:
+            self._embedding_service = OllamaEmbeddingService()
+        return self._embedding_service
+
+    def index_document(
+        self,
+        file_path: str,
+        replace_document_ids: Optional[List[str]] = None
+    ) -> IndexingResult:
         """
         단일 문서 인덱싱 (전체 파이프라인)
 
+        replace_document_ids가 주어지면 새 문서 인덱싱이 성공한 뒤 기존 문서를
+        삭제합니다 (수정된 파일의 upsert). 실패 시 기존 문서는 그대로 남습니다.
+
         Args:
             file_path: 문서 파일 경로
+            replace_document_ids: 교체할 기존 문서 ID 리스트
 
         Returns:
             IndexingResult: 인덱싱 결과
@@ -110,104 +196,262 @@ class DocumentIndexer:
         logger.info(f"문서 인덱싱 시작: {file_path}")
 
         try:
-            # Step 1: 문서 파싱
-            parser = DocumentParserFactory.get_parser(file_path)
-            parsed_doc = parser.parse(file_path)
-
-            logger.info(
-                f"파싱 완료: {parsed_doc.total_pages}페이지, "
-                f"{parsed_doc.total_characters}자"
-            )
-
-            # Step 2: 청킹
-            chunks = self.chunker.chunk_document(parsed_doc, document_id=file_path)
-
-            logger.info(f"청킹 완료: {len(chunks)}개 청크")
-
-            if not chunks:
-                raise ValueError("청크가 생성되지 않았습니다 (빈 문서)")
+            # Step 1-2: 문서 파싱 + 청킹
+            parsed_doc, chunks = self._parse_and_chunk(file_path)
 
             # Step 3: PostgreSQL에 문서 메타데이터 저장
             document = self._save_document_metadata(file_path, parsed_doc, len(chunks))
 
             logger.info(f"문서 메타데이터 저장 완료: document_id={document.id}")
 
-            # Step 4: 임베딩 생성
+            # Step 4: 임베딩 생성 (캐시 미스만 Ollama 호출)
             chunk_texts = [chunk.content for chunk in chunks]
-            embeddings = self.embedding_service.embed_batch(chunk_texts)
+            model_name = self.embedding_service.config.model_name
+            embeddings, misses = self._lookup_chunk_cache(chunk_texts, model_name)
+            if misses:
+                miss_texts = [chunk_texts[idx] for idx in misses]
+                vectors = self.embedding_service.embed_batch(miss_texts)
+                self._fill_misses(embeddings, misses, vectors)
+                self._store_chunk_cache(miss_texts, model_name, vectors)
+            cache_hits = len(chunk_texts) - len(misses)
 
-            logger.info(f"임베딩 생성 완료: {len(embeddings)}개")
+            logger.info(
+                f"임베딩 생성 완료: {len(embeddings)}개 (캐시 히트 {cache_hits}개)"
+            )
 
             # Step 5: Milvus에 저장
             indexed_count = self._save_to_milvus(
                 document_id=str(document.id),
                 chunks=chunks,
-                embeddings=embeddings
+                embeddings=embeddings,
+                **self.milvus_scope_fields(document)
             )
 
             logger.info(f"Milvus 저장 완료: {indexed_count}개 청크")
 
-            # Step 6: 커밋
+            # Step 6: 커밋 + BM25 역색인 갱신
             self.db.commit()
+            self.index_lexical(str(document.id), chunks, document.access_level, document.department)
+            index_events.publish(IndexEventType.INDEXED, [str(document.id)])
 
-            # 결과 반환
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            # Step 7: 기존 문서 교체 (수정된 파일)
+            if replace_document_ids:
+                self.delete_documents(replace_document_ids)
 
-            return IndexingResult(
-                success=True,
-                document_id=str(document.id),
-                file_path=file_path,
-                total_chunks=len(chunks),
-                indexed_chunks=indexed_count,
-                processing_time_ms=processing_time_ms
+            return self._success_result(
+                file_path, str(document.id), len(chunks), indexed_count,
+                cache_hits, start_time
             )
 
         except Exception as e:
             logger.error(f"문서 인덱싱 실패: {e}", exc_info=True)
             self.db.rollback()
+            return self._failure_result(file_path, e, start_time)
 
-            processing_time_ms = int((time.time() - start_time) * 1000)
+    async def aindex_document(
+        self,
+        file_path: str,
+        replace_document_ids: Optional[List[str]] = None
+    ) -> IndexingResult:
+        """
+        단일 문서 인덱싱 (비동기 버전)
 
-            return IndexingResult(
-                success=False,
-                file_path=file_path,
-                error_message=str(e),
-                processing_time_ms=processing_time_ms
+        임베딩은 비동기 임베딩 서비스를 직접 await 하고(동시 요청 수는 서비스의
+        세마포어가 제한), 파싱/DB/Milvus 같은 블로킹 단계만 스레드로 위임합니다.
+
+        Args:
+            file_path: 문서 파일 경로
+            replace_document_ids: 교체할 기존 문서 ID 리스트
+
+        Returns:
+            IndexingResult: 인덱싱 결과
+        """
+        if self.async_embedding_service is None:
+            return await asyncio.to_thread(
+                self.index_document, file_path, replace_document_ids
             )
 
+        start_time = time.time()
+
+        logger.info(f"문서 인덱싱 시작 (async): {file_path}")
+
+        try:
+            # Step 1-2: 문서 파싱 + 청킹 (CPU 작업)
+            parsed_doc, chunks = await asyncio.to_thread(
+                self._parse_and_chunk, file_path
+            )
+
+            # Step 3: PostgreSQL에 문서 메타데이터 저장
+            document = await asyncio.to_thread(
+                self._save_document_metadata, file_path, parsed_doc, len(chunks)
+            )
+
+            # Step 4: 임베딩 생성 (비동기, 배치 파이프라이닝, 캐시 미스만 Ollama 호출)
+            chunk_texts = [chunk.content for chunk in chunks]
+            model_name = self.async_embedding_service.config.model_name
+            embeddings, misses = await asyncio.to_thread(
+                self._lookup_chunk_cache, chunk_texts, model_name
+            )
+            if misses:
+                miss_texts = [chunk_texts[idx] for idx in misses]
+                vectors = await self.async_embedding_service.embed_batch(miss_texts)
+                self._fill_misses(embeddings, misses, vectors)
+                await asyncio.to_thread(
+                    self._store_chunk_cache, miss_texts, model_name, vectors
+                )
+            cache_hits = len(chunk_texts) - len(misses)
+
+            logger.info(
+                f"임베딩 생성 완료: {len(embeddings)}개 (캐시 히트 {cache_hits}개)"
+            )
+
+            # Step 5: Milvus에 저장
+            indexed_count = await asyncio.to_thread(
+                self._save_to_milvus, str(document.id), chunks, embeddings,
+                **self.milvus_scope_fields(document)
+            )
+
+            # Step 6: 커밋 + BM25 역색인 갱신
+            await asyncio.to_thread(self.db.commit)
+            await asyncio.to_thread(
+                self.index_lexical, str(document.id), chunks,
+                document.access_level, document.department
+            )
+            index_events.publish(IndexEventType.INDEXED, [str(document.id)])
+
+            # Step 7: 기존 문서 교체 (수정된 파일)
+            if replace_document_ids:
+                await asyncio.to_thread(self.delete_documents, replace_document_ids)
+
+            return self._success_result(
+                file_path, str(document.id), len(chunks), indexed_count,
+                cache_hits, start_time
+            )
+
+        except Exception as e:
+            logger.error(f"문서 인덱싱 실패: {e}", exc_info=True)
+            await asyncio.to_thread(self.db.rollback)
+            return self._failure_result(file_path, e, start_time)
+
+    def _parse_and_chunk(self, file_path: str) -> Tuple[ParsedDocument, List[TextChunk]]:
+        """문서 파싱 + 청킹 (parse_and_chunk 참고)"""
+        return parse_and_chunk(file_path, self.chunker)
+
+    def _lookup_chunk_cache(
+        self,
+        texts: List[str],
+        model_name: str
+    ) -> Tuple[List[Optional[List[float]]], List[int]]:
+        """
+        청크 임베딩 캐시 조회
+
+        Args:
+            texts: 청크 원문 리스트
+            model_name: 임베딩 모델명
+
+        Returns:
+            Tuple: (입력 순서대로의 벡터 리스트(미스는 None), 미스 인덱스 리스트)
+        """
+        if self.chunk_cache is None:
+            return [None] * len(texts), list(range(len(texts)))
+
+        embeddings = self.chunk_cache.get_many(texts, model_name)
+        misses = [idx for idx, vector in enumerate(embeddings) if vector is None]
+        return embeddings, misses
+
+    @staticmethod
+    def _fill_misses(
+        embeddings: List[Optional[List[float]]],
+        misses: List[int],
+        vectors: List[List[float]]
+    ) -> None:
+        """캐시 미스 위치에 새로 생성한 임베딩 채우기"""
+        for idx, vector in zip(misses, vectors):
+            embeddings[idx] = vector
+
+    def _store_chunk_cache(
+        self,
+        texts: List[str],
+        model_name: str,
+        vectors: List[List[float]]
+    ) -> None:
+        """새로 생성한 청크 임베딩을 캐시에 저장"""
+        if self.chunk_cache is not None:
+            self.chunk_cache.put_many(texts, model_name, vectors)
+
+    def _success_result(
+        self,
+        file_path: str,
+        document_id: str,
+        total_chunks: int,
+        indexed_chunks: int,
+        cache_hits: int,
+        start_time: float
+    ) -> IndexingResult:
+        """성공 결과 생성"""
+        return IndexingResult(
+            success=True,
+            document_id=document_id,
+            file_path=file_path,
+            total_chunks=total_chunks,
+            indexed_chunks=indexed_chunks,
+            cache_hits=cache_hits,
+            cache_hit_rate=round(cache_hits / total_chunks, 4) if total_chunks else 0.0,
+            processing_time_ms=int((time.time() - start_time) * 1000)
+        )
+
+    def _failure_result(
+        self,
+        file_path: str,
+        error: Exception,
+        start_time: float
+    ) -> IndexingResult:
+        """실패 결과 생성"""
+        return IndexingResult(
+            success=False,
+            file_path=file_path,
+            error_message=str(error),
+            processing_time_ms=int((time.time() - start_time) * 1000)
+        )
+
     def index_batch(self, file_paths: List[str]) -> List[IndexingResult]:
         """
         배치 문서 인덱싱
 
+        IndexingPipeline으로 파싱/임베딩/저장을 겹쳐 실행합니다.
+        저장은 이 인덱서의 DB 세션과 Milvus Collection을 사용합니다.
+
         Args:
             file_paths: 파일 경로 리스트
 
         Returns:
-            List[IndexingResult]: 인덱싱 결과 리스트
+            List[IndexingResult]: 인덱싱 결과 리스트 (입력 순서)
         """
-        logger.info(f"배치 인덱싱 시작: {len(file_paths)}개 문서")
-
-        results = []
-
-        # 배치 크기로 분할
-        for i in range(0, len(file_paths), self.config.batch_size):
-            batch = file_paths[i:i + self.config.batch_size]
+        # 순환 import 방지 (indexing_pipeline이 이 모듈을 import)
+        from app.services.indexing_pipeline import IndexingPipeline, PipelineConfig
 
-            logger.info(
-                f"배치 {i // self.config.batch_size + 1} 처리 중 "
-                f"({len(batch)}개 문서)..."
-            )
+        logger.info(f"배치 인덱싱 시작: {len(file_paths)}개 문서")
 
-            for file_path in batch:
-                result = self.index_document(file_path)
-                results.append(result)
+        pipeline = IndexingPipeline(
+            config=PipelineConfig(queue_size=self.config.batch_size, store_concurrency=1),
+            chunk_cache=self.chunk_cache,
+            collection=self.collection,
+            session_factory=lambda: self.db,
+            indexer_config=self.config
+        )
+        report = asyncio.run(pipeline.run(file_paths))
+        results = report.results
 
         # 통계
         success_count = sum(1 for r in results if r.success)
         fail_count = len(results) - success_count
+        total_chunks = sum(r.total_chunks for r in results if r.success)
+        cache_hits = sum(r.cache_hits for r in results if r.success)
+        hit_rate = cache_hits / total_chunks if total_chunks else 0.0
 
         logger.info(
-            f"배치 인덱싱 완료: 성공 {success_count}, 실패 {fail_count}"
+            f"배치 인덱싱 완료: 성공 {success_count}, 실패 {fail_count}, "
+            f"청크 캐시 히트율 {hit_rate:.1%} ({cache_hits}/{total_chunks})"
         )
 
         return results
@@ -216,7 +460,8 @@ class DocumentIndexer:
         self,
         file_path: str,
         parsed_doc: ParsedDocument,
-        chunk_count: int
+        chunk_count: int,
+        index_status: IndexStatus = IndexStatus.INDEXED
     ) -> Document:
         """
         PostgreSQL에 문서 메타데이터 저장
@@ -225,6 +470,7 @@ class DocumentIndexer:
             file_path: 파일 경로
             parsed_doc: 파싱된 문서
             chunk_count: 생성된 청크 수
+            index_status: Milvus 반영 상태 (쓰기 버퍼 사용 시 PENDING으로 먼저 커밋)
 
         Returns:
             Document: SQLAlchemy 모델
@@ -239,11 +485,18 @@ class DocumentIndexer:
         if file_type == "MD":
             file_type = "MARKDOWN"
 
+        # 매니페스트 (크기, mtime, 내용 해시) - 증분 재인덱싱 변경 감지용
+        if os.path.exists(file_path):
+            manifest = build_manifest_entry(file_path, with_hash=True).to_metadata()
+        else:
+            manifest = {"file_size_bytes": 0}
+
         # 메타데이터 구성
         doc_metadata = {
             "page_count": parsed_doc.total_pages,
-            "file_size_bytes": os.path.getsize(file_path) if os.path.exists(file_path) else 0,
+            **manifest,
             "chunk_count": chunk_count,
+            "index_status": index_status.value,
             "indexed_at": datetime.utcnow().isoformat(),
             **parsed_doc.metadata  # 파서에서 추출한 추가 메타데이터
         }
@@ -263,11 +516,28 @@ class DocumentIndexer:
 
         return document
 
+    def milvus_scope_fields(self, document: Document) -> Dict[str, Any]:
+        """
+        build_milvus_rows/_save_to_milvus에 넘길 권한 필드 값
+
+        Args:
+            document: 저장된 문서 (access_level, department)
+
+        Returns:
+            Dict: 스칼라 권한 필드가 있는 Collection이면 access_level/department,
+                마이그레이션 전 Collection이면 빈 dict
+        """
+        if not self.scope_fields_enabled:
+            return {}
+        return {"access_level": document.access_level, "department": document.department}
+
     def _save_to_milvus(
         self,
         document_id: str,
         chunks: List[TextChunk],
-        embeddings: List[List[float]]
+        embeddings: List[List[float]],
+        access_level: Optional[int] = None,
+        department: Optional[str] = None
     ) -> int:
         """
         Milvus에 벡터 + 메타데이터 저장
@@ -276,6 +546,8 @@ class DocumentIndexer:
             document_id: 문서 ID (UUID 문자열)
             chunks: TextChunk 리스트
             embeddings: 임베딩 벡터 리스트
+            access_level: 문서 접근 레벨 (None이면 권한 필드 없는 스키마)
+            department: 문서 부서
 
         Returns:
             int: 저장된 청크 수
@@ -289,24 +561,12 @@ class DocumentIndexer:
             )
 
         try:
-            # Collection에 맞는 형식으로 데이터 구성
-            # Schema: document_id, content, embedding, chunk_index, metadata
-            insert_data = [
-                [document_id] * len(chunks),  # document_id (repeated)
-                [chunk.content for chunk in chunks],  # content
-                embeddings,                    # embedding (List[List[float]])
-                list(range(len(chunks))),      # chunk_index
-                [{
-                    "document_title": chunk.document_title or "",
-                    "chunk_length": len(chunk.content),
-                    "total_chunks": len(chunks),
-                    "page_number": chunk.page_number or 1
-                } for chunk in chunks]  # metadata
-            ]
-
-            # Milvus에 삽입
+            insert_data = self.build_milvus_rows(
+                document_id, chunks, embeddings, access_level, department
+            )
+
+            # Milvus에 삽입 (flush는 segment를 봉인하므로 문서마다 호출하지 않음)
             self.collection.insert(insert_data)
-            self.collection.flush()
 
             logger.info(f"Milvus에 {len(chunks)}개 엔티티 저장 완료")
 
@@ -316,6 +576,115 @@ class DocumentIndexer:
             logger.error(f"Milvus 저장 실패: {e}")
             raise
 
+    @staticmethod
+    def build_milvus_rows(
+        document_id: str,
+        chunks: List[TextChunk],
+        embeddings: List[List[float]],
+        access_level: Optional[int] = None,
+        department: Optional[str] = None
+    ) -> List[list]:
+        """
+        Collection 스키마에 맞는 컬럼 단위 insert 데이터 구성
+
+        Schema: document_id, content, embedding, chunk_index, metadata
+                (+ access_level, department, access_scope)
+
+        Args:
+            document_id: 문서 ID (UUID 문자열)
+            chunks: TextChunk 리스트
+            embeddings: 임베딩 벡터 리스트
+            access_level: 문서 접근 레벨 (None이면 권한 컬럼 생략, 마이그레이션 전 스키마)
+            department: 문서 부서
+
+        Returns:
+            List[list]: 컬럼별 값 리스트
+        """
+        columns = [
+            [document_id] * len(chunks),  # document_id (repeated)
+            [chunk.content for chunk in chunks],  # content
+            embeddings,                    # embedding (List[List[float]])
+            list(range(len(chunks))),      # chunk_index
+            [{
+                "document_title": chunk.document_title or "",
+                "chunk_length": len(chunk.content),
+                "total_chunks": len(chunks),
+                "page_number": chunk.page_number or 1,
+                "start_char": chunk.start_char,
+                "end_char": chunk.end_char
+            } for chunk in chunks]  # metadata
+        ]
+
+        if access_level is not None:
+            scope = AccessControlService.access_scope(access_level, department)
+            columns.extend([
+                [access_level] * len(chunks),     # access_level
+                [department or ""] * len(chunks),  # department
+                [scope] * len(chunks),             # access_scope (partition key)
+            ])
+
+        return columns
+
+    def index_lexical(
+        self,
+        document_id: str,
+        chunks: List[TextChunk],
+        access_level: int,
+        department: Optional[str] = None
+    ) -> None:
+        """
+        BM25 역색인에 문서 청크 추가 (Milvus 반영 후 호출)
+
+        역색인 갱신 실패는 인덱싱 실패로 처리하지 않습니다 (벡터 검색은 가능).
+
+        Args:
+            document_id: 문서 ID (UUID 문자열)
+            chunks: chunk_index 순서의 TextChunk 리스트
+            access_level: 문서 접근 레벨
+            department: 문서 부서
+        """
+        if self.lexical_index is None:
+            return
+
+        try:
+            self.lexical_index.add_document(
+                document_id, [chunk.content for chunk in chunks], access_level, department
+            )
+            self.lexical_index.maybe_save()
+        except Exception as e:
+            logger.warning(f"BM25 역색인 갱신 실패 (벡터 검색만 가능): document_id={document_id}, error={e}")
+
+    def _remove_lexical(self, document_ids: List[str]) -> None:
+        """BM25 역색인에서 문서 제거 (실패해도 계속 진행)"""
+        if self.lexical_index is None:
+            return
+
+        try:
+            self.lexical_index.remove_documents(document_ids)
+            self.lexical_index.maybe_save()
+        except Exception as e:
+            logger.warning(f"BM25 역색인 삭제 실패: document_ids={document_ids}, error={e}")
+
+    def mark_indexed(self, document_ids: List[str]) -> None:
+        """
+        Milvus insert가 끝난 문서를 INDEXED로 표시 (커밋 1회)
+
+        Args:
+            document_ids: 문서 ID (UUID 문자열) 리스트
+        """
+        if not document_ids:
+            return
+
+        documents = self.db.query(Document).filter(Document.id.in_(document_ids)).all()
+        for document in documents:
+            # JSONB는 새 dict를 대입해야 변경이 감지됨
+            document.doc_metadata = {
+                **(document.doc_metadata or {}),
+                "index_status": IndexStatus.INDEXED.value
+            }
+        self.db.commit()
+        index_events.publish(IndexEventType.INDEXED, document_ids)
+
     def delete_document(self, document_id: str) -> bool:
         """
         문서 삭제 (PostgreSQL + Milvus)
@@ -330,9 +699,10 @@ class DocumentIndexer:
             # Step 1: Milvus에서 삭제
             expr = f'document_id == "{document_id}"'
             self.collection.delete(expr)
-            self.collection.flush()
 
             logger.info(f"Milvus에서 document_id={document_id} 삭제 완료")
+            self._remove_lexical([document_id])
+            index_events.publish(IndexEventType.REMOVED, [document_id])
 
             # Step 2: PostgreSQL에서 삭제
             document = self.db.query(Document).filter(
@@ -351,3 +721,38 @@ class DocumentIndexer:
             logger.error(f"문서 삭제 실패: {e}")
             self.db.rollback()
             return False
+
+    def delete_documents(self, document_ids: List[str]) -> int:
+        """
+        여러 문서 일괄 삭제 (Milvus 삭제 1회 + PostgreSQL 커밋 1회)
+
+        Args:
+            document_ids: 문서 ID (UUID 문자열) 리스트
+
+        Returns:
+            int: PostgreSQL에서 삭제된 문서 수 (실패 시 0)
+        """
+        if not document_ids:
+            return 0
+
+        try:
+            # Step 1: Milvus에서 삭제
+            id_list = ", ".join(f'"{document_id}"' for document_id in document_ids)
+            self.collection.delete(f"document_id in [{id_list}]")
+            self._remove_lexical(document_ids)
+            index_events.publish(IndexEventType.REMOVED, document_ids)
+
+            # Step 2: PostgreSQL에서 삭제
+            deleted = self.db.query(Document).filter(
+                Document.id.in_(document_ids)
+            ).delete(synchronize_session=False)
+            self.db.commit()
+
+            logger.info(f"문서 {deleted}개 삭제 완료: {document_ids}")
+
+            return deleted
+
+        except Exception as e:
+            logger.error(f"문서 일괄 삭제 실패: {e}")
+            self.db.rollback()
+            return 0
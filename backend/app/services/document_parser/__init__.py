@@ -15,6 +15,10 @@ Usage:
     config = ParserConfig(max_file_size_mb=50, skip_empty_pages=True)
     parser = DocumentParserFactory.get_parser("document.docx", config=config)
     result = parser.parse("document.docx")
+
+    # 스트리밍 모드 (페이지를 하나씩 추출, DocumentChunker.iter_chunks와 함께 사용)
+    for page in parser.iter_pages("manual.pdf"):
+        ...
 """
 
 from app.services.document_parser.base_parser import (
@@ -28,6 +32,7 @@ from app.services.document_parser.base_parser import (
     EncryptedFileError,
     MaliciousFileError,
     UnsupportedFileTypeError,
+    ParsingLimitExceededError,
 )
 from app.services.document_parser.pdf_parser import PDFParser
 from app.services.document_parser.docx_parser import DOCXParser
@@ -48,6 +53,7 @@ __all__ = [
     "EncryptedFileError",
     "MaliciousFileError",
     "UnsupportedFileTypeError",
+    "ParsingLimitExceededError",
     # Parsers
     "PDFParser",
     "DOCXParser",
@@ -5,9 +5,10 @@
 공통 데이터 구조를 정의합니다.
 """
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from pydantic import BaseModel, Field
 import logging
 
@@ -34,6 +35,16 @@ class ParserConfig(BaseModel):
     max_file_size_mb: int = Field(default=100, ge=1, le=500, description="최대 파일 크기 (MB)")
     skip_empty_pages: bool = Field(default=True, description="빈 페이지 건너뛰기 여부")
     encoding: str = Field(default="utf-8", description="텍스트 인코딩")
+    parallel_page_threshold: int = Field(
+        default=200, ge=1, description="페이지 범위 병렬 추출을 시작하는 최소 페이지 수 (PDF)"
+    )
+    pages_per_range: int = Field(default=100, ge=1, description="병렬 추출 시 워커 1회 처리 페이지 수 (PDF)")
+    page_workers: int = Field(
+        default_factory=lambda: min(4, os.cpu_count() or 1),
+        ge=1,
+        le=32,
+        description="페이지 범위 추출 워커 프로세스 수 (1이면 순차 추출, PDF)"
+    )
 
 
 class DocumentParserError(Exception):
@@ -66,6 +77,11 @@ class UnsupportedFileTypeError(DocumentParserError):
     pass
 
 
+class ParsingLimitExceededError(DocumentParserError):
+    """파싱 자원 제한(CPU 시간, 메모리, 처리 시간) 초과 에러"""
+    pass
+
+
 class BaseDocumentParser(ABC):
     """문서 파서 추상 클래스"""
 
@@ -97,6 +113,24 @@ class BaseDocumentParser(ABC):
         """
         pass
 
+    def iter_pages(self, file_path: str) -> Iterator[ParsedPage]:
+        """
+        문서 페이지를 순서대로 반환 (스트리밍 모드)
+
+        기본 구현은 parse() 결과의 페이지를 반환합니다. 페이지 단위로 읽을 수 있는
+        형식(PDF)은 하위 클래스에서 오버라이드하여 페이지를 하나씩 추출합니다.
+
+        Args:
+            file_path: 파싱할 파일 경로
+
+        Yields:
+            ParsedPage: 페이지 순서대로
+
+        Raises:
+            parse()와 동일 (첫 페이지를 요청할 때 발생)
+        """
+        yield from self.parse(file_path).pages
+
     def _validate_file_exists(self, file_path: str) -> None:
         """
         파일 존재 여부 확인
@@ -3,11 +3,20 @@ PDF 문서 파서
 
 pypdf를 사용하여 PDF 파일에서 텍스트를 추출하고
 페이지 번호 및 메타데이터를 포함한 구조화된 데이터를 생성합니다.
+
+페이지 수가 parallel_page_threshold 이상인 문서는 parse()에서 페이지를 범위로 나눠
+spawn 워커 프로세스들이 파일을 각자 열어 추출하고, 페이지 순서대로 다시 합칩니다
+(pypdf의 extract_text는 순수 Python이라 스레드로는 병렬화되지 않음).
+ParsingExecutor 워커 안에서는 page_workers=1로 호출되어 순차 추출합니다 (중첩 프로세스 풀 방지).
 """
 
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import pypdf
 from pypdf import PdfReader
 from pypdf.errors import PdfReadError
@@ -25,6 +34,60 @@ from app.services.document_parser.base_parser import (
 
 logger = logging.getLogger(__name__)
 
+# (page_number, content, metadata) - 워커 프로세스에서 pydantic 모델 대신 전달
+PageRow = Tuple[int, str, Dict[str, Any]]
+
+
+def _extract_pages(
+    reader: PdfReader,
+    start: int,
+    stop: int,
+    skip_empty_pages: bool
+) -> Iterator[PageRow]:
+    """
+    [start, stop) 범위 페이지 텍스트 추출 (0부터 시작하는 인덱스)
+
+    Args:
+        reader: PDF 리더 객체
+        start: 시작 페이지 인덱스
+        stop: 끝 페이지 인덱스 (포함하지 않음)
+        skip_empty_pages: 빈 페이지 건너뛰기 여부
+
+    Yields:
+        PageRow: 빈 페이지/추출 실패 페이지를 제외한 페이지
+    """
+    for page_num in range(start + 1, stop + 1):
+        try:
+            page = reader.pages[page_num - 1]
+            text = page.extract_text()
+
+            # 빈 페이지 처리
+            if skip_empty_pages and not text.strip():
+                logger.debug(f"빈 페이지 건너뛰기: {page_num}")
+                continue
+
+            metadata = {
+                "rotation": page.get("/Rotate", 0),
+                "mediabox": str(page.mediabox) if hasattr(page, 'mediabox') else None,
+            }
+
+        except Exception as e:
+            logger.error(f"페이지 {page_num} 추출 실패: {e}")
+            # 페이지 추출 실패해도 계속 진행 (best effort)
+            continue
+
+        yield page_num, text, metadata
+
+
+def _extract_page_range(
+    file_path: str,
+    start: int,
+    stop: int,
+    skip_empty_pages: bool
+) -> List[PageRow]:
+    """워커 프로세스: 파일을 따로 열어 [start, stop) 범위 페이지 추출 (검증은 부모에서 완료)"""
+    return list(_extract_pages(PdfReader(file_path), start, stop, skip_empty_pages))
+
 
 class PDFParser(BaseDocumentParser):
     """PDF 문서 파서"""
@@ -53,6 +116,68 @@ class PDFParser(BaseDocumentParser):
         """
         logger.info(f"PDF 파싱 시작: {file_path}")
 
+        reader = self._open(file_path)
+
+        # Step 7: 페이지별 텍스트 추출 (큰 문서는 페이지 범위 병렬 추출)
+        total_pages = len(reader.pages)
+        pages = None
+        if self.config.page_workers > 1 and total_pages >= self.config.parallel_page_threshold:
+            pages = self._extract_parallel(file_path, total_pages)
+        if pages is None:
+            pages = list(self._iter_reader_pages(reader))
+        total_characters = sum(len(page.content) for page in pages)
+
+        # Step 8: 문서 메타데이터 추출
+        metadata = self._extract_metadata(reader)
+
+        # Step 9: 결과 반환
+        result = ParsedDocument(
+            pages=pages,
+            total_pages=total_pages,
+            total_characters=total_characters,
+            metadata=metadata,
+        )
+
+        logger.info(
+            f"PDF 파싱 완료: {file_path}, "
+            f"페이지 {total_pages}개, 문자 {total_characters}개"
+        )
+
+        return result
+
+    def iter_pages(self, file_path: str) -> Iterator[ParsedPage]:
+        """
+        PDF 페이지를 하나씩 추출하여 반환 (스트리밍 모드)
+
+        페이지 텍스트는 요청될 때 추출하므로, 소비자가 이전 페이지를 버리면
+        메모리에는 현재 페이지 하나만 남습니다. 파일 검증은 첫 페이지를 요청할 때 수행합니다.
+
+        Args:
+            file_path: PDF 파일 경로
+
+        Yields:
+            ParsedPage: 페이지 순서대로 (빈 페이지/추출 실패 페이지 제외)
+
+        Raises:
+            parse()와 동일
+        """
+        logger.info(f"PDF 스트리밍 파싱 시작: {file_path}")
+        reader = self._open(file_path)
+        yield from self._iter_reader_pages(reader)
+
+    def _open(self, file_path: str) -> PdfReader:
+        """
+        파일 검증 후 PDF 리더 생성 (parse/iter_pages 공통)
+
+        Args:
+            file_path: PDF 파일 경로
+
+        Returns:
+            PdfReader: 암호화/악성 콘텐츠 검사를 통과한 리더
+
+        Raises:
+            parse()와 동일
+        """
         # Step 1: 파일 존재 여부 확인
         self._validate_file_exists(file_path)
 
@@ -80,54 +205,73 @@ class PDFParser(BaseDocumentParser):
         # Step 6: 악성 코드 검사 (JavaScript 확인)
         self._check_malicious_content(reader)
 
-        # Step 7: 페이지별 텍스트 추출
-        pages = []
-        total_pages = len(reader.pages)
-        total_characters = 0
-
-        for page_num, page in enumerate(reader.pages, start=1):
-            try:
-                text = page.extract_text()
-
-                # 빈 페이지 처리
-                if self.config.skip_empty_pages and not text.strip():
-                    logger.debug(f"빈 페이지 건너뛰기: {page_num}")
-                    continue
-
-                # 페이지 데이터 생성
-                parsed_page = ParsedPage(
-                    page_number=page_num,
-                    content=text,
-                    metadata={
-                        "rotation": page.get("/Rotate", 0),
-                        "mediabox": str(page.mediabox) if hasattr(page, 'mediabox') else None,
-                    }
-                )
-                pages.append(parsed_page)
-                total_characters += len(text)
-
-            except Exception as e:
-                logger.error(f"페이지 {page_num} 추출 실패: {e}")
-                # 페이지 추출 실패해도 계속 진행 (best effort)
-                continue
+        return reader
 
-        # Step 8: 문서 메타데이터 추출
-        metadata = self._extract_metadata(reader)
+    def _iter_reader_pages(self, reader: PdfReader) -> Iterator[ParsedPage]:
+        """
+        페이지별 텍스트 추출 (순차)
 
-        # Step 9: 결과 반환
-        result = ParsedDocument(
-            pages=pages,
-            total_pages=total_pages,
-            total_characters=total_characters,
-            metadata=metadata,
-        )
+        Args:
+            reader: PDF 리더 객체
+
+        Yields:
+            ParsedPage: 빈 페이지/추출 실패 페이지를 제외한 페이지
+        """
+        for page_num, text, metadata in _extract_pages(
+            reader, 0, len(reader.pages), self.config.skip_empty_pages
+        ):
+            yield ParsedPage(page_number=page_num, content=text, metadata=metadata)
+
+    def _extract_parallel(self, file_path: str, total_pages: int) -> Optional[List[ParsedPage]]:
+        """
+        페이지 범위 병렬 추출
+
+        워커 프로세스는 파일을 각자 열어 pages_per_range개씩 추출하고, 결과는 범위 순서대로
+        합치므로 페이지 번호/순서는 순차 추출과 같습니다. 부모의 자원 제한(RLIMIT)은
+        워커에도 상속됩니다.
+
+        Args:
+            file_path: PDF 파일 경로 (검증 완료)
+            total_pages: 전체 페이지 수
+
+        Returns:
+            Optional[List[ParsedPage]]: 추출된 페이지 (워커를 만들 수 없거나
+                비정상 종료된 경우 None → 순차 추출로 대체)
+        """
+        size = self.config.pages_per_range
+        starts = range(0, total_pages, size)
+        workers = min(self.config.page_workers, len(starts))
 
         logger.info(
-            f"PDF 파싱 완료: {file_path}, "
-            f"페이지 {total_pages}개, 문자 {total_characters}개"
+            f"페이지 범위 병렬 추출: {total_pages}페이지, "
+            f"범위 {len(starts)}개, 워커 {workers}개"
         )
 
-        return result
+        pool = None
+        try:
+            # fork는 부모의 스레드/연결 상태를 복제하므로 spawn 사용
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            ranges = pool.map(
+                _extract_page_range,
+                repeat(file_path),
+                starts,
+                [min(start + size, total_pages) for start in starts],
+                repeat(self.config.skip_empty_pages)
+            )
+            return [
+                ParsedPage(page_number=page_num, content=text, metadata=metadata)
+                for rows in ranges
+                for page_num, text, metadata in rows
+            ]
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"페이지 범위 병렬 추출 실패, 순차 추출로 대체: {e}")
+            return None
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
 
     def _check_malicious_content(self, reader: PdfReader) -> None:
         """
@@ -0,0 +1,533 @@
+"""
+임베딩 캐시
+
+1. 쿼리 임베딩 캐시 (QueryEmbeddingCache)
+   동일한 검색어("연차 사용 방법", "급여 지급일" 등)가 반복될 때 Ollama 임베딩 호출을
+   생략합니다.
+   - 메모리 계층: OrderedDict 기반 LRU + TTL, 벡터는 float32 numpy 배열로 보관
+   - 디스크 계층 (선택): SQLite 파일, 여러 워커 프로세스가 같은 파일을 공유
+   - 키: 정규화된 쿼리(NFC, 공백 정리, 소문자) + 모델명의 SHA-256
+
+2. 청크 임베딩 캐시 (ChunkEmbeddingCache)
+   문서 재인덱싱 시 내용이 바뀌지 않은 청크의 임베딩을 재사용합니다.
+   - SQLite 영구 저장소 (내용 주소 방식이므로 만료 없음)
+   - 키: 청크 원문(정규화 없음) + 모델명의 SHA-256
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# SQLite 바인딩 변수 수 제한(999)을 넘지 않는 IN 조회 묶음 크기
+_SQLITE_IN_BATCH = 500
+
+
+def _select_vectors_sql(count: int) -> str:
+    """
+    키 count개를 조회하는 SELECT 문 생성
+
+    SQL에 끼워 넣는 것은 "?" 자리표시자뿐이고 키 값은 모두 바인딩 변수로 전달하므로
+    SQL 인젝션 경로가 없습니다.
+
+    Args:
+        count: 조회할 키 수 (1 이상, _SQLITE_IN_BATCH 이하)
+
+    Returns:
+        str: 바인딩 변수 count + 1개(키들, created_at 하한)를 받는 SELECT 문
+    """
+    placeholders = ",".join("?" * count)
+    return (
+        "SELECT key, vector FROM embeddings "  # nosec B608 - 자리표시자만 포함, 값은 바인딩
+        f"WHERE key IN ({placeholders}) AND created_at >= ?"
+    )
+
+
+def normalize_query(text: str) -> str:
+    """
+    캐시 키용 쿼리 정규화
+
+    - 유니코드 NFC 정규화 (한글 자모 분리 입력 통일)
+    - 연속 공백을 하나로, 앞뒤 공백 제거
+    - 소문자 변환
+
+    Args:
+        text: 원본 쿼리
+
+    Returns:
+        str: 정규화된 쿼리
+    """
+    normalized = unicodedata.normalize("NFC", text)
+    normalized = _WHITESPACE_PATTERN.sub(" ", normalized).strip()
+    return normalized.lower()
+
+
+def make_cache_key(text: str, model_name: str) -> str:
+    """
+    캐시 키 생성 (정규화 쿼리 + 모델명)
+
+    Args:
+        text: 원본 쿼리
+        model_name: 임베딩 모델명
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    payload = f"{model_name}\x00{normalize_query(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def make_content_key(content: str, model_name: str) -> str:
+    """
+    청크 캐시 키 생성 (원문 바이트 그대로 + 모델명)
+
+    Args:
+        content: 청크 원문
+        model_name: 임베딩 모델명
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    digest = hashlib.sha256(model_name.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EmbeddingCacheConfig(BaseModel):
+    """쿼리 임베딩 캐시 설정"""
+
+    max_entries: int = Field(
+        default_factory=lambda: settings.EMBEDDING_CACHE_MAX_ENTRIES,
+        ge=1,
+        description="메모리 계층 최대 항목 수 (LRU)"
+    )
+    ttl_seconds: float = Field(
+        default_factory=lambda: settings.EMBEDDING_CACHE_TTL_SECONDS,
+        gt=0,
+        description="항목 유효 시간 (초)"
+    )
+    disk_path: Optional[str] = Field(
+        default_factory=lambda: settings.EMBEDDING_CACHE_DISK_PATH,
+        description="공유 디스크 계층 SQLite 파일 경로 (None이면 비활성)"
+    )
+
+
+class SQLiteEmbeddingStore:
+    """
+    SQLite 기반 공유 임베딩 저장소
+
+    WAL 모드를 사용하여 여러 프로세스가 동시에 읽고 쓸 수 있습니다.
+    벡터는 float32 바이트(BLOB)로 저장합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 파일 경로 (상위 디렉토리가 없으면 생성)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "  key TEXT PRIMARY KEY,"
+            "  vector BLOB NOT NULL,"
+            "  created_at REAL NOT NULL"
+            ")"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, ttl_seconds: float) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        벡터 조회 (만료 항목은 None)
+
+        Args:
+            key: 캐시 키
+            ttl_seconds: 유효 시간
+
+        Returns:
+            Optional[Tuple[np.ndarray, float]]: (벡터, 저장 시각)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector, created_at FROM embeddings WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        blob, created_at = row
+        if time.time() - created_at > ttl_seconds:
+            return None
+
+        return np.frombuffer(blob, dtype=np.float32), created_at
+
+    def get_many(
+        self,
+        keys: List[str],
+        ttl_seconds: Optional[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        여러 벡터 일괄 조회
+
+        Args:
+            keys: 캐시 키 리스트
+            ttl_seconds: 유효 시간 (None이면 만료 없음)
+
+        Returns:
+            Dict[str, np.ndarray]: 키 → 벡터 (찾은 항목만)
+        """
+        found: Dict[str, np.ndarray] = {}
+        cutoff = time.time() - ttl_seconds if ttl_seconds is not None else 0.0
+
+        # SQLite 바인딩 변수 수 제한(999)을 넘지 않도록 나눠서 조회
+        for i in range(0, len(keys), _SQLITE_IN_BATCH):
+            part = keys[i:i + _SQLITE_IN_BATCH]
+            with self._lock:
+                rows = self._conn.execute(
+                    _select_vectors_sql(len(part)),
+                    (*part, cutoff)
+                ).fetchall()
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+
+        return found
+
+    def put_many(self, items: List[Tuple[str, np.ndarray]]) -> None:
+        """
+        벡터 일괄 저장 (같은 키는 덮어쓰기)
+
+        Args:
+            items: (키, float32 벡터) 리스트
+        """
+        if not items:
+            return
+
+        now = time.time()
+        rows = [(key, vector.tobytes(), now) for key, vector in items]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, created_at) "
+                "VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def put(self, key: str, vector: np.ndarray) -> None:
+        """벡터 저장 (같은 키는 덮어쓰기)"""
+        self.put_many([(key, vector)])
+
+    def purge_expired(self, ttl_seconds: float) -> int:
+        """
+        만료 항목 삭제
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        cutoff = time.time() - ttl_seconds
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM embeddings WHERE created_at < ?",
+                (cutoff,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+class QueryEmbeddingCache:
+    """
+    쿼리 임베딩 LRU + TTL 캐시 (스레드 안전)
+
+    메모리 계층에서 찾지 못하면 디스크 계층을 조회하고,
+    디스크에서 찾은 항목은 메모리 계층으로 승격합니다.
+    """
+
+    def __init__(
+        self,
+        config: Optional[EmbeddingCacheConfig] = None,
+        store: Optional[SQLiteEmbeddingStore] = None
+    ):
+        """
+        Args:
+            config: 캐시 설정
+            store: 디스크 계층 (None이면 config.disk_path로 생성, 경로도 없으면 비활성)
+        """
+        self.config = config or EmbeddingCacheConfig()
+        self._entries: "OrderedDict[str, Tuple[np.ndarray, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if store is None and self.config.disk_path:
+            try:
+                store = SQLiteEmbeddingStore(self.config.disk_path)
+            except Exception as e:
+                logger.warning(f"임베딩 디스크 캐시 비활성화 (열기 실패): {e}")
+                store = None
+        self.store = store
+
+        logger.info(
+            f"QueryEmbeddingCache 초기화: max_entries={self.config.max_entries}, "
+            f"ttl={self.config.ttl_seconds}s, disk={self.config.disk_path or '-'}"
+        )
+
+    def get(self, text: str, model_name: str) -> Optional[List[float]]:
+        """
+        캐시 조회
+
+        Args:
+            text: 쿼리
+            model_name: 임베딩 모델명
+
+        Returns:
+            Optional[List[float]]: 캐시된 벡터 (없거나 만료 시 None)
+        """
+        key = make_cache_key(text, model_name)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                vector, created_at = entry
+                if now - created_at <= self.config.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return vector.tolist()
+                del self._entries[key]
+
+        if self.store is not None:
+            try:
+                stored = self.store.get(key, self.config.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"임베딩 디스크 캐시 조회 실패: {e}")
+                stored = None
+
+            if stored is not None:
+                vector, created_at = stored
+                with self._lock:
+                    self._insert(key, vector, created_at)
+                    self.hits += 1
+                    self.disk_hits += 1
+                return vector.tolist()
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, text: str, model_name: str, vector: List[float]) -> None:
+        """
+        캐시 저장
+
+        Args:
+            text: 쿼리
+            model_name: 임베딩 모델명
+            vector: 임베딩 벡터
+        """
+        key = make_cache_key(text, model_name)
+        array = np.asarray(vector, dtype=np.float32)
+
+        with self._lock:
+            self._insert(key, array, time.time())
+
+        if self.store is not None:
+            try:
+                self.store.put(key, array)
+            except Exception as e:
+                logger.warning(f"임베딩 디스크 캐시 저장 실패: {e}")
+
+    def _insert(self, key: str, vector: np.ndarray, created_at: float) -> None:
+        """메모리 계층 저장 + LRU 제거 (lock 보유 상태에서 호출)"""
+        self._entries[key] = (vector, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """메모리 계층 비우기 (디스크 계층은 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: hits, misses, disk_hits, evictions, size, hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def close(self) -> None:
+        """디스크 계층 연결 종료"""
+        if self.store is not None:
+            self.store.close()
+
+
+class ChunkEmbeddingCache:
+    """
+    청크 임베딩 영구 캐시 (내용 주소 방식)
+
+    청크 원문 + 모델명으로 키를 만들기 때문에 내용이 한 글자라도 바뀌면
+    자동으로 미스가 되며, 별도의 무효화가 필요 없습니다.
+    """
+
+    def __init__(self, store: SQLiteEmbeddingStore):
+        """
+        Args:
+            store: SQLite 저장소
+        """
+        self.store = store
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(
+        self,
+        texts: List[str],
+        model_name: str
+    ) -> List[Optional[List[float]]]:
+        """
+        청크 임베딩 일괄 조회
+
+        Args:
+            texts: 청크 원문 리스트
+            model_name: 임베딩 모델명
+
+        Returns:
+            List[Optional[List[float]]]: 입력 순서대로 캐시된 벡터 (미스는 None)
+        """
+        keys = [make_content_key(text, model_name) for text in texts]
+
+        try:
+            found = self.store.get_many(list(set(keys)))
+        except Exception as e:
+            logger.warning(f"청크 임베딩 캐시 조회 실패 (전체 미스 처리): {e}")
+            found = {}
+
+        vectors = [
+            found[key].tolist() if key in found else None
+            for key in keys
+        ]
+
+        hit_count = sum(1 for vector in vectors if vector is not None)
+        with self._lock:
+            self.hits += hit_count
+            self.misses += len(vectors) - hit_count
+
+        return vectors
+
+    def put_many(
+        self,
+        texts: List[str],
+        model_name: str,
+        vectors: List[List[float]]
+    ) -> None:
+        """
+        청크 임베딩 일괄 저장
+
+        임베딩 실패로 대체된 0 벡터는 저장하지 않습니다 (다음 인덱싱에서 재시도).
+
+        Args:
+            texts: 청크 원문 리스트
+            model_name: 임베딩 모델명
+            vectors: 임베딩 벡터 리스트
+        """
+        items = []
+        for text, vector in zip(texts, vectors):
+            array = np.asarray(vector, dtype=np.float32)
+            if not array.any():
+                continue
+            items.append((make_content_key(text, model_name), array))
+
+        try:
+            self.store.put_many(items)
+        except Exception as e:
+            logger.warning(f"청크 임베딩 캐시 저장 실패: {e}")
+
+    def stats(self) -> Dict[str, float]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: hits, misses, hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+_chunk_cache: Optional[ChunkEmbeddingCache] = None
+_chunk_cache_unavailable = False
+_chunk_cache_lock = threading.Lock()
+
+
+def get_chunk_embedding_cache() -> Optional[ChunkEmbeddingCache]:
+    """
+    프로세스 공유 청크 임베딩 캐시 반환
+
+    Returns:
+        Optional[ChunkEmbeddingCache]: 비활성화되었거나 파일을 열 수 없으면 None
+    """
+    global _chunk_cache, _chunk_cache_unavailable
+
+    if not settings.CHUNK_EMBEDDING_CACHE_ENABLED or _chunk_cache_unavailable:
+        return None
+
+    with _chunk_cache_lock:
+        if _chunk_cache is None and not _chunk_cache_unavailable:
+            try:
+                _chunk_cache = ChunkEmbeddingCache(
+                    SQLiteEmbeddingStore(settings.CHUNK_EMBEDDING_CACHE_PATH)
+                )
+                logger.info(
+                    f"청크 임베딩 캐시 초기화: {settings.CHUNK_EMBEDDING_CACHE_PATH}"
+                )
+            except Exception as e:
+                logger.warning(f"청크 임베딩 캐시 비활성화 (열기 실패): {e}")
+                _chunk_cache_unavailable = True
+
+        return _chunk_cache
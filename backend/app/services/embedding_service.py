@@ -4,11 +4,22 @@
 Ollama nomic-embed-text 모델을 사용하여 텍스트 임베딩을 생성합니다.
 """
 
+import asyncio
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from pydantic import BaseModel, Field
+import httpx
 import ollama
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry,
+    stop_after_attempt,
+    wait_exponential
+)
+
+from app.services.embedding_cache import QueryEmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +29,24 @@ class EmbeddingConfig(BaseModel):
 
     model_name: str = Field(default="nomic-embed-text", description="임베딩 모델명")
     expected_dimension: int = Field(default=768, description="예상 임베딩 차원")
-    batch_size: int = Field(default=5, ge=1, le=20, description="배치 크기")
+    batch_size: int = Field(
+        default=32,
+        ge=1,
+        le=512,
+        description="배치 크기 (Ollama /api/embed 요청 1회당 입력 수)"
+    )
+    max_in_flight: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="동시에 전송하는 배치 요청 수"
+    )
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="비동기 클라이언트의 동시 요청 상한 (검색 + 인덱싱 공유)"
+    )
     max_retries: int = Field(default=3, ge=1, le=10, description="최대 재시도 횟수")
 
     class Config:
@@ -26,7 +54,9 @@ class EmbeddingConfig(BaseModel):
             "example": {
                 "model_name": "nomic-embed-text",
                 "expected_dimension": 768,
-                "batch_size": 5,
+                "batch_size": 32,
+                "max_in_flight": 2,
+                "max_concurrency": 8,
                 "max_retries": 3
             }
         }
@@ -42,6 +72,75 @@ class EmbeddingDimensionError(EmbeddingServiceError):
     pass
 
 
+def _validate_batch_embeddings(
+    embeddings: List[List[float]],
+    expected_count: int,
+    expected_dimension: int
+) -> None:
+    """
+    배치 응답 검증 (개수 + 차원)
+
+    Args:
+        embeddings: 응답 임베딩 리스트
+        expected_count: 요청한 텍스트 수
+        expected_dimension: 예상 임베딩 차원
+
+    Raises:
+        EmbeddingServiceError: 응답 개수 불일치
+        EmbeddingDimensionError: 차원 불일치
+    """
+    if len(embeddings) != expected_count:
+        raise EmbeddingServiceError(
+            f"배치 응답 개수 불일치: {len(embeddings)} "
+            f"(요청: {expected_count})"
+        )
+
+    invalid = [
+        idx for idx, embedding in enumerate(embeddings)
+        if len(embedding) != expected_dimension
+    ]
+    if invalid:
+        raise EmbeddingDimensionError(
+            f"임베딩 차원 불일치: {len(embeddings[invalid[0]])} "
+            f"(예상: {expected_dimension}), "
+            f"배치 내 {len(invalid)}개 항목"
+        )
+
+
+def _lookup_query_cache(
+    query_cache: Optional[QueryEmbeddingCache],
+    queries: List[str],
+    model_name: str
+) -> Tuple[List[Optional[List[float]]], List[int]]:
+    """
+    쿼리 임베딩 캐시 일괄 조회
+
+    Returns:
+        Tuple: (입력 순서의 벡터 리스트(미스는 None), 미스 인덱스 리스트)
+    """
+    if query_cache is None:
+        return [None] * len(queries), list(range(len(queries)))
+
+    embeddings = [query_cache.get(query, model_name) for query in queries]
+    misses = [idx for idx, vector in enumerate(embeddings) if vector is None]
+    return embeddings, misses
+
+
+def _fill_query_cache(
+    query_cache: Optional[QueryEmbeddingCache],
+    queries: List[str],
+    misses: List[int],
+    vectors: List[List[float]],
+    embeddings: List[Optional[List[float]]],
+    model_name: str
+) -> None:
+    """캐시 미스 위치에 새 벡터를 채우고 캐시에 저장 (실패한 0 벡터는 저장하지 않음)"""
+    for idx, vector in zip(misses, vectors):
+        embeddings[idx] = vector
+        if query_cache is not None and any(vector):
+            query_cache.put(queries[idx], model_name, vector)
+
+
 class OllamaEmbeddingService:
     """Ollama 임베딩 서비스
 
@@ -49,12 +148,18 @@ class OllamaEmbeddingService:
     재시도 로직과 에러 핸들링을 포함합니다.
     """
 
-    def __init__(self, config: Optional[EmbeddingConfig] = None):
+    def __init__(
+        self,
+        config: Optional[EmbeddingConfig] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None
+    ):
         """
         Args:
             config: 임베딩 설정 (기본값: nomic-embed-text, 768차원)
+            query_cache: 쿼리 임베딩 캐시 (None이면 캐시 미사용)
         """
         self.config = config or EmbeddingConfig()
+        self.query_cache = query_cache
         self.client = ollama.Client()
 
         logger.info(
@@ -154,6 +259,12 @@ class OllamaEmbeddingService:
         Raises:
             EmbeddingServiceError: 임베딩 생성 실패
         """
+        if self.query_cache is not None:
+            cached = self.query_cache.get(query, self.config.model_name)
+            if cached is not None:
+                logger.debug(f"쿼리 임베딩 캐시 히트: '{query[:50]}'")
+                return cached
+
         logger.info(f"검색 쿼리 임베딩 생성: '{query[:50]}...'")
 
         try:
@@ -164,52 +275,452 @@ class OllamaEmbeddingService:
                 f"query_length={len(query)}"
             )
 
+            if self.query_cache is not None:
+                self.query_cache.put(query, self.config.model_name, embedding)
+
             return embedding
 
         except Exception as e:
             logger.error(f"검색 쿼리 임베딩 실패: {e}")
             raise EmbeddingServiceError(f"검색 쿼리 임베딩 실패: {e}")
 
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        여러 검색 쿼리 임베딩 생성 (캐시 미스만 배치 요청)
+
+        Args:
+            queries: 검색어 리스트 (이미 검증 완료)
+
+        Returns:
+            List[List[float]]: 입력 순서의 임베딩 벡터 (실패 항목은 0 벡터)
+
+        Raises:
+            EmbeddingDimensionError: 배치 응답의 차원이 설정과 다를 때
+        """
+        embeddings, misses = _lookup_query_cache(self.query_cache, queries, self.config.model_name)
+        if misses:
+            vectors = self.embed_batch([queries[idx] for idx in misses])
+            _fill_query_cache(self.query_cache, queries, misses, vectors, embeddings, self.config.model_name)
+        return embeddings
+
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """
         배치 텍스트 임베딩 생성
 
+        텍스트를 batch_size 단위로 묶어 Ollama 다중 입력 엔드포인트(/api/embed)로
+        전송합니다. 최대 max_in_flight개의 배치 요청을 동시에 처리하며,
+        배치 요청이 실패하면 해당 배치만 개별 임베딩으로 재시도하여
+        실패를 항목 단위로 격리합니다.
+
         Args:
             texts: 텍스트 리스트
 
         Returns:
-            List[List[float]]: 임베딩 벡터 리스트
+            List[List[float]]: 임베딩 벡터 리스트 (입력 순서 유지, 실패 항목은 0 벡터)
 
         Raises:
-            EmbeddingServiceError: 모든 임베딩 생성 실패 시
+            EmbeddingDimensionError: 배치 응답의 차원이 설정과 다를 때
         """
         if not texts:
             return []
 
-        logger.info(f"배치 임베딩 생성 시작: {len(texts)}개 텍스트")
+        logger.info(
+            f"배치 임베딩 생성 시작: {len(texts)}개 텍스트, "
+            f"batch_size={self.config.batch_size}, "
+            f"max_in_flight={self.config.max_in_flight}"
+        )
 
-        embeddings = []
-        failed_indices = []
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
 
+        # 빈 텍스트는 요청하지 않고 0 벡터로 처리 (embed_text와 동일한 동작)
+        pending = []
         for idx, text in enumerate(texts):
+            if text and text.strip():
+                pending.append(idx)
+            else:
+                embeddings[idx] = [0.0] * self.config.expected_dimension
+
+        batches = [
+            pending[i:i + self.config.batch_size]
+            for i in range(0, len(pending), self.config.batch_size)
+        ]
+
+        def run_batch(indices: List[int]) -> List[Optional[List[float]]]:
+            return self._embed_batch_isolated([texts[idx] for idx in indices])
+
+        if len(batches) <= 1 or self.config.max_in_flight == 1:
+            batch_results = [run_batch(batch) for batch in batches]
+        else:
+            workers = min(self.config.max_in_flight, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_results = list(executor.map(run_batch, batches))
+
+        failed_indices = []
+        for indices, vectors in zip(batches, batch_results):
+            for idx, vector in zip(indices, vectors):
+                if vector is None:
+                    failed_indices.append(idx)
+                    # 실패한 경우 0 벡터로 대체
+                    vector = [0.0] * self.config.expected_dimension
+                embeddings[idx] = vector
+
+        if failed_indices:
+            logger.warning(
+                f"배치 임베딩 중 {len(failed_indices)}개 실패: {failed_indices}"
+            )
+
+        logger.info(
+            f"배치 임베딩 완료: {len(embeddings)}개 생성 "
+            f"(요청 {len(batches)}회)"
+        )
+
+        return embeddings
+
+    def _embed_batch_isolated(
+        self,
+        texts: List[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        배치 요청 1회 처리 (실패 시 항목별 재시도로 격리)
+
+        Args:
+            texts: 빈 텍스트가 제외된 텍스트 리스트
+
+        Returns:
+            List[Optional[List[float]]]: 임베딩 벡터 (실패한 항목은 None)
+
+        Raises:
+            EmbeddingDimensionError: 차원 불일치 (모델 설정 오류이므로 격리하지 않음)
+        """
+        try:
+            return self._embed_many(texts)
+        except EmbeddingDimensionError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"배치 요청 실패, 항목별 임베딩으로 재시도: "
+                f"{len(texts)}개 텍스트, error={e}"
+            )
+
+        vectors: List[Optional[List[float]]] = []
+        for text in texts:
             try:
-                embedding = self.embed_text(text)
-                embeddings.append(embedding)
+                vectors.append(self.embed_text(text))
+            except EmbeddingDimensionError:
+                raise
             except Exception as e:
-                logger.error(f"텍스트 {idx} 임베딩 실패: {e}")
-                failed_indices.append(idx)
-                # 실패한 경우 0 벡터로 대체
-                embeddings.append([0.0] * self.config.expected_dimension)
+                logger.error(f"텍스트 임베딩 실패: {e}")
+                vectors.append(None)
+
+        return vectors
+
+    def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        다중 입력 임베딩 요청 (배치 단위 재시도 포함)
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            List[List[float]]: 임베딩 벡터 리스트
+
+        Raises:
+            EmbeddingServiceError: 재시도 후에도 요청 실패
+            EmbeddingDimensionError: 차원 불일치
+        """
+        for attempt in Retrying(
+            stop=stop_after_attempt(self.config.max_retries),
+            wait=wait_exponential(multiplier=1, min=1, max=10),
+            reraise=True
+        ):
+            with attempt:
+                response = self.client.embed(
+                    model=self.config.model_name,
+                    input=texts
+                )
+
+        embeddings = list(response["embeddings"])
+        _validate_batch_embeddings(
+            embeddings,
+            expected_count=len(texts),
+            expected_dimension=self.config.expected_dimension
+        )
+
+        return embeddings
+
+    def get_embedding_dimension(self) -> int:
+        """임베딩 차원 반환"""
+        return self.config.expected_dimension
+
+    def close(self) -> None:
+        """Ollama HTTP 연결 풀 정리 (ServiceContainer 종료 시 호출)"""
+        http_client = getattr(self.client, "_client", None)
+        if http_client is not None:
+            http_client.close()
+
+
+class AsyncOllamaEmbeddingService:
+    """비동기 Ollama 임베딩 서비스
+
+    OllamaEmbeddingService와 같은 인터페이스(embed_text / embed_query / embed_batch)를
+    코루틴으로 제공합니다. 하나의 ollama.AsyncClient(httpx 연결 풀)를 공유하고,
+    세마포어로 동시 요청 수를 max_concurrency개로 제한합니다.
+    embed_batch는 모든 배치 요청을 한꺼번에 스케줄링하여(파이프라이닝)
+    세마포어가 허용하는 만큼 연결 풀 위에서 동시에 진행시킵니다.
+
+    [NOTE] 생성 시 모델 확인을 하지 않습니다 (이벤트 루프 밖에서도 생성 가능).
+    필요하면 verify_model_exists()를 직접 await 하세요.
+    """
+
+    def __init__(
+        self,
+        config: Optional[EmbeddingConfig] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None
+    ):
+        """
+        Args:
+            config: 임베딩 설정 (기본값: nomic-embed-text, 768차원)
+            query_cache: 쿼리 임베딩 캐시 (None이면 캐시 미사용)
+        """
+        self.config = config or EmbeddingConfig()
+        self.query_cache = query_cache
+        self.client = ollama.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.config.max_concurrency,
+                max_keepalive_connections=self.config.max_concurrency
+            )
+        )
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        logger.info(
+            f"AsyncOllamaEmbeddingService 초기화: model={self.config.model_name}, "
+            f"max_concurrency={self.config.max_concurrency}"
+        )
+
+    async def verify_model_exists(self) -> None:
+        """
+        Ollama 모델 존재 여부 확인
+
+        Raises:
+            EmbeddingServiceError: 모델이 없거나 연결 실패 시
+        """
+        try:
+            response = await self.client.list()
+            model_names = [model.model for model in response.models]
+            search_names = [self.config.model_name, f"{self.config.model_name}:latest"]
+        except Exception as e:
+            logger.error(f"Ollama 연결 실패: {e}")
+            raise EmbeddingServiceError(f"Ollama 연결 실패: {e}")
+
+        if not any(name in model_names for name in search_names):
+            raise EmbeddingServiceError(
+                f"Ollama 모델 '{self.config.model_name}'이 없습니다. "
+                f"다음 명령으로 다운로드하세요: "
+                f"ollama pull {self.config.model_name}"
+            )
+
+    async def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        다중 입력 임베딩 요청 (세마포어 + 요청 단위 재시도)
+
+        Args:
+            texts: 빈 텍스트가 제외된 텍스트 리스트
+
+        Returns:
+            List[List[float]]: 임베딩 벡터 리스트
+
+        Raises:
+            EmbeddingServiceError: 재시도 후에도 요청 실패
+            EmbeddingDimensionError: 차원 불일치
+        """
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.config.max_retries),
+                wait=wait_exponential(multiplier=1, min=1, max=10),
+                reraise=True
+            ):
+                with attempt:
+                    async with self._semaphore:
+                        response = await self.client.embed(
+                            model=self.config.model_name,
+                            input=texts
+                        )
+        except Exception as e:
+            logger.error(f"임베딩 생성 실패: {e}")
+            raise EmbeddingServiceError(f"임베딩 생성 실패: {e}")
+
+        embeddings = list(response["embeddings"])
+        _validate_batch_embeddings(
+            embeddings,
+            expected_count=len(texts),
+            expected_dimension=self.config.expected_dimension
+        )
+
+        return embeddings
+
+    async def embed_text(self, text: str) -> List[float]:
+        """
+        단일 텍스트 임베딩 생성 (재시도 로직 포함)
+
+        Args:
+            text: 임베딩할 텍스트
+
+        Returns:
+            List[float]: 임베딩 벡터 (768차원)
+
+        Raises:
+            EmbeddingServiceError: 임베딩 생성 실패
+            EmbeddingDimensionError: 차원 불일치
+        """
+        if not text or not text.strip():
+            logger.warning("빈 텍스트 입력, 0 벡터 반환")
+            return [0.0] * self.config.expected_dimension
+
+        embeddings = await self._embed_many([text])
+        return embeddings[0]
+
+    async def embed_query(self, query: str) -> List[float]:
+        """
+        검색 쿼리 임베딩 생성
+
+        Args:
+            query: 검색어 (이미 검증 완료)
+
+        Returns:
+            List[float]: 768차원 임베딩 벡터
+
+        Raises:
+            EmbeddingServiceError: 임베딩 생성 실패
+        """
+        if self.query_cache is not None:
+            cached = self.query_cache.get(query, self.config.model_name)
+            if cached is not None:
+                logger.debug(f"쿼리 임베딩 캐시 히트: '{query[:50]}'")
+                return cached
+
+        logger.info(f"검색 쿼리 임베딩 생성 (async): '{query[:50]}...'")
+
+        try:
+            embedding = await self.embed_text(query)
+        except Exception as e:
+            logger.error(f"검색 쿼리 임베딩 실패: {e}")
+            raise EmbeddingServiceError(f"검색 쿼리 임베딩 실패: {e}")
+
+        if self.query_cache is not None:
+            self.query_cache.put(query, self.config.model_name, embedding)
+
+        return embedding
+
+    async def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        여러 검색 쿼리 임베딩 생성 (캐시 미스만 배치 요청)
+
+        Args:
+            queries: 검색어 리스트 (이미 검증 완료)
+
+        Returns:
+            List[List[float]]: 입력 순서의 임베딩 벡터 (실패 항목은 0 벡터)
+
+        Raises:
+            EmbeddingDimensionError: 배치 응답의 차원이 설정과 다를 때
+        """
+        embeddings, misses = _lookup_query_cache(self.query_cache, queries, self.config.model_name)
+        if misses:
+            vectors = await self.embed_batch([queries[idx] for idx in misses])
+            _fill_query_cache(self.query_cache, queries, misses, vectors, embeddings, self.config.model_name)
+        return embeddings
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        배치 텍스트 임베딩 생성
+
+        batch_size 단위 배치 요청을 모두 동시에 스케줄링하고, 실제 동시 전송 수는
+        세마포어(max_concurrency)가 제한합니다. 실패한 배치는 항목별로 재시도하여
+        실패한 항목만 0 벡터로 대체합니다.
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            List[List[float]]: 임베딩 벡터 리스트 (입력 순서 유지)
+
+        Raises:
+            EmbeddingDimensionError: 배치 응답의 차원이 설정과 다를 때
+        """
+        if not texts:
+            return []
+
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+        pending = []
+        for idx, text in enumerate(texts):
+            if text and text.strip():
+                pending.append(idx)
+            else:
+                embeddings[idx] = [0.0] * self.config.expected_dimension
+
+        batches = [
+            pending[i:i + self.config.batch_size]
+            for i in range(0, len(pending), self.config.batch_size)
+        ]
+
+        batch_results = await asyncio.gather(*[
+            self._embed_batch_isolated([texts[idx] for idx in batch])
+            for batch in batches
+        ])
+
+        failed_indices = []
+        for indices, vectors in zip(batches, batch_results):
+            for idx, vector in zip(indices, vectors):
+                if vector is None:
+                    failed_indices.append(idx)
+                    vector = [0.0] * self.config.expected_dimension
+                embeddings[idx] = vector
 
         if failed_indices:
             logger.warning(
                 f"배치 임베딩 중 {len(failed_indices)}개 실패: {failed_indices}"
             )
 
-        logger.info(f"배치 임베딩 완료: {len(embeddings)}개 생성")
+        logger.info(
+            f"배치 임베딩 완료 (async): {len(embeddings)}개 생성 "
+            f"(요청 {len(batches)}회)"
+        )
 
         return embeddings
 
+    async def _embed_batch_isolated(
+        self,
+        texts: List[str]
+    ) -> List[Optional[List[float]]]:
+        """배치 요청 1회 처리 (실패 시 항목별 재시도로 격리)"""
+        try:
+            return await self._embed_many(texts)
+        except EmbeddingDimensionError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"배치 요청 실패, 항목별 임베딩으로 재시도: "
+                f"{len(texts)}개 텍스트, error={e}"
+            )
+
+        async def embed_one(text: str) -> Optional[List[float]]:
+            try:
+                return (await self._embed_many([text]))[0]
+            except EmbeddingDimensionError:
+                raise
+            except Exception as e:
+                logger.error(f"텍스트 임베딩 실패: {e}")
+                return None
+
+        return list(await asyncio.gather(*[embed_one(text) for text in texts]))
+
     def get_embedding_dimension(self) -> int:
         """임베딩 차원 반환"""
         return self.config.expected_dimension
+
+    async def aclose(self) -> None:
+        """Ollama 비동기 HTTP 연결 풀 정리"""
+        http_client = getattr(self.client, "_client", None)
+        if http_client is not None:
+            await http_client.aclose()
@@ -0,0 +1,298 @@
+"""
+검색 히스토리 write-behind 싱크
+
+검색 API가 쿼리/응답을 저장할 때마다 커밋 + refresh를 기다리면 DB 왕복 2~3회가
+요청 지연에 그대로 더해집니다. 싱크는 레코드를 메모리 큐에 넣고 즉시 반환하며,
+백그라운드 태스크가 개수(batch_size) 또는 시간(flush_interval_seconds) 기준으로
+모아서 테이블별 INSERT 1회(executemany)로 저장합니다.
+
+- query_id는 클라이언트에서 생성(uuid4)하므로 저장 전에도 응답에 사용 가능
+- 대기 레코드 수는 max_pending으로 제한, 초과분은 버리고 dropped로 집계
+- 쿼리 레코드가 버려지거나 저장에 실패하면 그 쿼리의 응답도 버림
+  (응답만 저장하면 FK 위반으로 같은 배치의 다른 레코드까지 롤백되므로)
+- 앱 종료 시 main.py lifespan에서 stop()을 호출하여 남은 레코드를 모두 저장
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.db.base import async_session_maker
+from app.repositories.search_repository import (
+    DEFAULT_USER_ID,
+    SearchRepository,
+    build_response_row
+)
+from app.schemas.search import SearchQueryResponse
+
+logger = logging.getLogger(__name__)
+
+_QUERY = "query"
+_RESPONSE = "response"
+
+
+class HistorySinkConfig(BaseModel):
+    """검색 히스토리 싱크 설정"""
+
+    max_pending: int = Field(
+        default_factory=lambda: settings.HISTORY_SINK_MAX_PENDING,
+        ge=1,
+        description="대기 레코드 최대 개수 (초과 시 버림)"
+    )
+    batch_size: int = Field(
+        default_factory=lambda: settings.HISTORY_SINK_BATCH_SIZE,
+        ge=1,
+        description="한 번에 저장할 최대 레코드 수"
+    )
+    flush_interval_seconds: float = Field(
+        default_factory=lambda: settings.HISTORY_SINK_FLUSH_INTERVAL_SECONDS,
+        gt=0,
+        description="레코드가 대기하는 최대 시간 (초)"
+    )
+
+
+class SearchHistorySink:
+    """
+    검색 히스토리 write-behind 싱크
+
+    record_query()/record_response()는 이벤트 루프에서 호출되며 I/O 없이 반환합니다.
+    쿼리는 항상 응답보다 먼저 큐에 들어가므로 같은 배치이거나 앞선 배치에 포함되어
+    응답의 FK(search_queries.id)가 보장됩니다. 버려지거나 저장에 실패한 쿼리 ID는
+    최근 max_pending개까지 기억해 두고 그 응답을 저장 대상에서 제외합니다.
+    """
+
+    def __init__(
+        self,
+        config: Optional[HistorySinkConfig] = None,
+        session_factory: Callable[[], Any] = async_session_maker
+    ):
+        """
+        Args:
+            config: 싱크 설정 (None이면 환경 변수 기반 기본값)
+            session_factory: AsyncSession을 만드는 팩토리 (async context manager)
+        """
+        self.config = config or HistorySinkConfig()
+        self._session_factory = session_factory
+        self._pending: Deque[Tuple[str, Dict[str, Any]]] = deque()
+        self._lost_queries: "OrderedDict[UUID, None]" = OrderedDict()  # 저장되지 않는 쿼리 ID
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.failed_batches = 0
+
+    def start(self) -> None:
+        """
+        백그라운드 저장 태스크 시작 (실행 중인 이벤트 루프 필요)
+
+        이미 현재 루프에서 실행 중이면 무시합니다. 다른 이벤트 루프에서 만든
+        태스크가 남아 있으면(테스트 등) 현재 루프에서 새로 시작합니다.
+
+        Raises:
+            RuntimeError: 실행 중인 이벤트 루프가 없을 때
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker_running(loop):
+            return
+
+        self._closing = False
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run())
+        logger.info(
+            f"검색 히스토리 싱크 시작: batch_size={self.config.batch_size}, "
+            f"flush_interval={self.config.flush_interval_seconds}s"
+        )
+
+    def _worker_running(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """현재 루프에서 저장 태스크가 실행 중인지 여부"""
+        return (
+            self._task is not None
+            and not self._task.done()
+            and self._task.get_loop() is loop
+        )
+
+    async def stop(self) -> None:
+        """
+        신규 레코드 수신을 멈추고 남은 레코드를 모두 저장한 뒤 종료 (앱 종료 시)
+        """
+        self._closing = True
+        if self._worker_running(asyncio.get_running_loop()):
+            self._wakeup.set()
+            await self._task
+        else:
+            await self.flush()
+        self._task = None
+
+        logger.info(
+            f"검색 히스토리 싱크 종료: written={self.written}, dropped={self.dropped}"
+        )
+
+    def record_query(
+        self,
+        user_id: Optional[UUID],
+        query: str,
+        session_id: Optional[str] = None
+    ) -> UUID:
+        """
+        검색 쿼리 기록 (저장은 백그라운드)
+
+        Args:
+            user_id: 사용자 ID (None이면 임시 사용자 ID)
+            query: 검색어
+            session_id: 세션 ID (선택적)
+
+        Returns:
+            UUID: 생성된 query_id (큐가 가득 차 버려진 경우에도 반환)
+        """
+        query_id = uuid4()
+        self._enqueue(_QUERY, {
+            "id": query_id,
+            "user_id": user_id or DEFAULT_USER_ID,
+            "query": query,
+            "session_id": session_id,
+            "timestamp": datetime.now(timezone.utc)
+        })
+        return query_id
+
+    def record_response(self, query_id: UUID, response: SearchQueryResponse) -> None:
+        """
+        검색 응답 기록 (저장은 백그라운드)
+
+        Args:
+            query_id: record_query()가 반환한 쿼리 ID
+            response: 최종 응답
+        """
+        row = build_response_row(query_id, response)
+        row["timestamp"] = datetime.now(timezone.utc)
+        self._enqueue(_RESPONSE, row)
+
+    def _mark_lost(self, query_ids: List[UUID]) -> None:
+        """저장되지 않는 쿼리 ID 기록 (최근 max_pending개만 유지)"""
+        for query_id in query_ids:
+            self._lost_queries[query_id] = None
+        while len(self._lost_queries) > self.config.max_pending:
+            self._lost_queries.popitem(last=False)
+
+    def _enqueue(self, kind: str, row: Dict[str, Any]) -> None:
+        """큐에 추가 (가득 찼거나 종료 중이거나 쿼리가 저장되지 않는 응답이면 버림)"""
+        if (
+            self._closing
+            or len(self._pending) >= self.config.max_pending
+            or (kind == _RESPONSE and row["query_id"] in self._lost_queries)
+        ):
+            if kind == _QUERY:
+                self._mark_lost([row["id"]])
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    f"검색 히스토리 레코드 버림: dropped={self.dropped}, "
+                    f"pending={len(self._pending)}"
+                )
+            return
+
+        self._pending.append((kind, row))
+        self.enqueued += 1
+
+        try:
+            self.start()
+        except RuntimeError:
+            # 실행 중인 이벤트 루프가 없으면 stop()/flush() 시 저장
+            return
+        if len(self._pending) >= self.config.batch_size:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """개수/시간 기준으로 배치 저장 (종료 요청 시 남은 레코드까지 저장)"""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=self.config.flush_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            await self.flush()
+
+            if self._closing:
+                return
+
+    async def flush(self) -> int:
+        """
+        대기 중인 레코드를 batch_size 단위로 모두 저장
+
+        Returns:
+            int: 저장된 레코드 수 (실패한 배치 제외)
+        """
+        written = 0
+        while self._pending:
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(self.config.batch_size, len(self._pending)))
+            ]
+            written += await self._write(batch)
+        return written
+
+    async def _write(self, batch: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """배치 1개 저장 (실패 시 배치 전체를 dropped로 집계, 예외는 전파하지 않음)"""
+        queries = [row for kind, row in batch if kind == _QUERY]
+        responses = [
+            row for kind, row in batch
+            if kind == _RESPONSE and row["query_id"] not in self._lost_queries
+        ]
+        # 앞선 배치에서 쿼리 저장에 실패한 응답 (FK 위반 방지)
+        orphaned = len(batch) - len(queries) - len(responses)
+        self.dropped += orphaned
+        batch_size = len(queries) + len(responses)
+        if not batch_size:
+            return 0
+
+        try:
+            async with self._session_factory() as session:
+                await SearchRepository(session).save_history_batch(queries, responses)
+        except Exception as e:
+            self._mark_lost([row["id"] for row in queries])
+            self.failed_batches += 1
+            self.dropped += batch_size
+            logger.error(
+                f"검색 히스토리 배치 저장 실패 (검색은 성공): records={batch_size}, "
+                f"dropped={self.dropped}, error={e}"
+            )
+            return 0
+
+        self.batches += 1
+        self.written += batch_size
+        logger.debug(
+            f"검색 히스토리 배치 저장: queries={len(queries)}, responses={len(responses)}"
+        )
+        return batch_size
+
+    def stats(self) -> Dict[str, float]:
+        """
+        싱크 통계 (모니터링용)
+
+        Returns:
+            Dict: pending, enqueued, written, dropped, batches, failed_batches
+        """
+        return {
+            "pending": len(self._pending),
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches
+        }
+
+
+# Global singleton instance
+history_sink = SearchHistorySink()
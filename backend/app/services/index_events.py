@@ -0,0 +1,94 @@
+"""
+인덱스 변경 이벤트
+
+문서가 인덱싱되거나 삭제(수정 파일 교체 포함)되면 DocumentIndexer가 이벤트를
+발행하고, 검색 결과를 보관하는 캐시가 구독하여 해당 문서를 출처로 쓰는 항목을
+무효화합니다.
+
+스케줄러는 API 서버 프로세스 안에서 실행되므로 프로세스 내 구독으로 충분합니다.
+다른 워커 프로세스의 캐시는 TTL로 만료됩니다.
+"""
+
+import logging
+import threading
+from enum import Enum
+from typing import Callable, List
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class IndexEventType(str, Enum):
+    """인덱스 변경 유형"""
+    INDEXED = "indexed"  # Milvus 반영 완료 (새 문서)
+    REMOVED = "removed"  # Milvus에서 삭제 (삭제 또는 수정 파일의 기존 문서)
+
+
+class IndexEvent(BaseModel):
+    """인덱스 변경 이벤트"""
+
+    event_type: IndexEventType = Field(..., description="변경 유형")
+    document_ids: List[str] = Field(..., description="변경된 문서 ID")
+
+
+IndexEventHandler = Callable[[IndexEvent], None]
+
+
+class IndexEventBus:
+    """
+    프로세스 내 인덱스 변경 이벤트 발행/구독 (스레드 안전)
+
+    인덱싱 파이프라인의 저장 단계는 작업 스레드에서 실행되므로 핸들러도
+    해당 스레드에서 호출됩니다. 핸들러 실패는 인덱싱에 영향을 주지 않습니다.
+    """
+
+    def __init__(self):
+        self._handlers: List[IndexEventHandler] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, handler: IndexEventHandler) -> None:
+        """
+        핸들러 등록
+
+        Args:
+            handler: IndexEvent를 받는 콜백
+        """
+        with self._lock:
+            if handler not in self._handlers:
+                self._handlers.append(handler)
+
+    def unsubscribe(self, handler: IndexEventHandler) -> None:
+        """
+        핸들러 해제 (등록되지 않았으면 무시)
+
+        Args:
+            handler: 등록했던 콜백
+        """
+        with self._lock:
+            if handler in self._handlers:
+                self._handlers.remove(handler)
+
+    def publish(self, event_type: IndexEventType, document_ids: List[str]) -> None:
+        """
+        이벤트 발행
+
+        Args:
+            event_type: 변경 유형
+            document_ids: 변경된 문서 ID
+        """
+        if not document_ids:
+            return
+
+        event = IndexEvent(event_type=event_type, document_ids=[str(i) for i in document_ids])
+        with self._lock:
+            handlers = list(self._handlers)
+
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                logger.warning(f"인덱스 이벤트 처리 실패 ({event_type.value}): {e}")
+
+
+# Global singleton instance
+index_events = IndexEventBus()
@@ -0,0 +1,685 @@
+"""
+파이프라인 인덱싱 엔진
+
+문서 인덱싱을 단계별로 나누고 단계 사이를 크기 제한 큐로 연결하여,
+CPU 작업(파싱/청킹)과 네트워크 작업(임베딩/저장)이 서로 겹쳐 실행되도록 합니다.
+
+    file_paths → [parse] → queue → [embed] → queue → [store] → results
+
+- parse: 프로세스 풀에서 파싱 + 청킹 (parse_workers개 동시, 파일별 CPU/메모리/시간 제한)
+- embed: 여러 문서의 청크를 모아 embed_batch_chunks 단위로 임베딩 (청크 캐시 우선)
+- store: 여러 문서를 모아 PostgreSQL에 커밋(index_status=pending)한 뒤 Milvus 쓰기 버퍼에 추가.
+  버퍼가 행 수/바이트 임계치에서 insert하면 해당 문서를 indexed로 표시하고,
+  insert 실패 문서는 PostgreSQL에서 삭제합니다. flush는 실행 종료 시 1회(또는 타이머).
+
+각 큐는 queue_size로 제한되므로 뒤 단계가 느리면 앞 단계가 대기합니다 (backpressure).
+단계별 처리량은 StageStats로 보고합니다.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union
+)
+from pydantic import BaseModel, Field
+from pymilvus import Collection
+from sqlalchemy.orm import Session
+
+from app.db.base import SessionLocal
+from app.db.milvus_client import get_milvus_collection
+from app.services.document_indexer import (
+    DocumentIndexer,
+    DocumentIndexerConfig,
+    IndexingResult,
+    parse_and_chunk
+)
+from app.services.document_parser.base_parser import ParsedDocument
+from app.services.embedding_cache import ChunkEmbeddingCache, get_chunk_embedding_cache
+from app.services.embedding_service import AsyncOllamaEmbeddingService
+from app.services.lexical_index import LexicalIndex, get_lexical_index
+from app.services.parsing_executor import ParsingExecutor, ParsingExecutorConfig
+from app.services.milvus_writer import (
+    MilvusWriteBuffer,
+    MilvusWriteBufferConfig,
+    MilvusWriteError,
+    WriteOutcome
+)
+from app.scheduler.manifest import IndexStatus
+from app.services.text_chunker import TextChunk
+
+logger = logging.getLogger(__name__)
+
+# 단계 종료 신호
+_DONE = object()
+
+DocumentSource = Union[str, Dict[str, Any]]
+
+
+class PipelineConfig(BaseModel):
+    """파이프라인 단계별 동시성/배치 설정"""
+
+    parse_workers: int = Field(
+        default_factory=lambda: min(4, os.cpu_count() or 1),
+        ge=1,
+        le=32,
+        description="파싱 프로세스 수 (= 동시에 파싱하는 문서 수)"
+    )
+    embed_concurrency: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="동시에 진행하는 임베딩 배치 수"
+    )
+    embed_batch_chunks: int = Field(
+        default=128,
+        ge=1,
+        le=4096,
+        description="임베딩 배치 1회에 모으는 최대 청크 수 (여러 문서 합산)"
+    )
+    store_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="동시에 진행하는 저장 배치 수"
+    )
+    store_batch_chunks: int = Field(
+        default=1000,
+        ge=1,
+        le=20000,
+        description="저장 배치 1회에 모으는 최대 청크 수 (PostgreSQL 커밋 1회)"
+    )
+    queue_size: int = Field(
+        default=16,
+        ge=1,
+        le=1024,
+        description="단계 사이 큐 크기 (문서 수)"
+    )
+    use_process_pool: bool = Field(
+        default=True,
+        description="파싱을 프로세스 풀에서 실행 (False면 스레드 풀)"
+    )
+
+
+class StageStats(BaseModel):
+    """단계별 처리 통계"""
+
+    name: str = Field(..., description="단계 이름")
+    workers: int = Field(..., description="동시 작업 수")
+    documents: int = Field(default=0, description="처리한 문서 수")
+    chunks: int = Field(default=0, description="처리한 청크 수")
+    batches: int = Field(default=0, description="처리한 배치 수")
+    failed: int = Field(default=0, description="실패한 문서 수")
+    busy_seconds: float = Field(default=0.0, description="작업 시간 합계 (워커 합산)")
+    wall_seconds: float = Field(default=0.0, description="단계 시작~종료 시간")
+
+    @property
+    def documents_per_second(self) -> float:
+        """문서 처리량 (wall 기준)"""
+        return self.documents / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        """청크 처리량 (wall 기준)"""
+        return self.chunks / self.wall_seconds if self.wall_seconds else 0.0
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약"""
+        return (
+            f"{self.name}: {self.documents} docs, {self.chunks} chunks, "
+            f"{self.batches} batches, {self.failed} failed, "
+            f"{self.documents_per_second:.1f} docs/s, "
+            f"{self.chunks_per_second:.1f} chunks/s, "
+            f"busy {self.busy_seconds:.2f}s / wall {self.wall_seconds:.2f}s"
+        )
+
+
+class PipelineReport(BaseModel):
+    """파이프라인 실행 결과"""
+
+    results: List[IndexingResult] = Field(default_factory=list, description="문서별 결과 (입력 순서)")
+    stages: List[StageStats] = Field(default_factory=list, description="단계별 통계")
+    wall_seconds: float = Field(default=0.0, description="전체 실행 시간")
+
+    @property
+    def success_count(self) -> int:
+        """성공 문서 수"""
+        return sum(1 for result in self.results if result.success)
+
+    @property
+    def failed_count(self) -> int:
+        """실패 문서 수"""
+        return len(self.results) - self.success_count
+
+
+class _PipelineItem:
+    """단계 사이를 이동하는 문서 단위 작업"""
+
+    __slots__ = (
+        "file_path", "replace_document_ids", "start_time", "parsed_doc",
+        "chunks", "embeddings", "cache_hits", "access_level", "department", "result"
+    )
+
+    def __init__(self, file_path: str, replace_document_ids: Optional[List[str]] = None):
+        self.file_path = file_path
+        self.replace_document_ids = replace_document_ids
+        self.start_time = time.time()
+        self.parsed_doc: Optional[ParsedDocument] = None
+        self.chunks: List[TextChunk] = []
+        self.embeddings: List[List[float]] = []
+        self.cache_hits = 0
+        self.access_level = 1  # 저장 단계에서 문서 메타데이터 기준으로 설정 (BM25 색인용)
+        self.department: Optional[str] = None
+        self.result: Optional[IndexingResult] = None
+
+    def fail(self, error: Exception) -> None:
+        """실패 결과 기록 + 중간 데이터 해제"""
+        self.result = IndexingResult(
+            success=False,
+            file_path=self.file_path,
+            error_message=str(error),
+            processing_time_ms=int((time.time() - self.start_time) * 1000)
+        )
+        self.release()
+
+    def succeed(self, document_id: str) -> None:
+        """성공 결과 기록 + 중간 데이터 해제"""
+        total = len(self.chunks)
+        self.result = IndexingResult(
+            success=True,
+            document_id=document_id,
+            file_path=self.file_path,
+            total_chunks=total,
+            indexed_chunks=total,
+            cache_hits=self.cache_hits,
+            cache_hit_rate=round(self.cache_hits / total, 4) if total else 0.0,
+            processing_time_ms=int((time.time() - self.start_time) * 1000)
+        )
+        self.release()
+
+    def release(self) -> None:
+        """파싱 결과/임베딩 참조 해제 (큐에 쌓인 문서의 메모리 절약)"""
+        self.parsed_doc = None
+        self.chunks = []
+        self.embeddings = []
+
+
+class IndexingPipeline:
+    """파싱 → 임베딩 → 저장을 겹쳐 실행하는 인덱싱 파이프라인"""
+
+    def __init__(
+        self,
+        config: Optional[PipelineConfig] = None,
+        embedding_service: Optional[AsyncOllamaEmbeddingService] = None,
+        chunk_cache: Optional[ChunkEmbeddingCache] = None,
+        collection: Optional[Collection] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        indexer_config: Optional[DocumentIndexerConfig] = None,
+        writer_config: Optional[MilvusWriteBufferConfig] = None,
+        lexical_index: Optional[LexicalIndex] = None
+    ):
+        """
+        Args:
+            config: 파이프라인 설정
+            embedding_service: 비동기 임베딩 서비스 (None이면 실행마다 생성 후 정리)
+            chunk_cache: 청크 임베딩 캐시 (기본값: 프로세스 공유 캐시)
+            collection: Milvus Collection (None이면 실행 시 로드)
+            session_factory: 저장 배치마다 사용할 DB 세션 팩토리
+            indexer_config: DocumentIndexer 설정 (Collection명 등)
+            writer_config: Milvus 쓰기 버퍼 설정
+            lexical_index: BM25 역색인 (기본값: 프로세스 공유 색인)
+        """
+        self.config = config or PipelineConfig()
+        self.embedding_service = embedding_service
+        self.chunk_cache = chunk_cache if chunk_cache is not None else get_chunk_embedding_cache()
+        self.collection = collection
+        self.session_factory = session_factory
+        self.indexer_config = indexer_config or DocumentIndexerConfig()
+        self.writer_config = writer_config or MilvusWriteBufferConfig()
+        self.lexical_index = lexical_index if lexical_index is not None else get_lexical_index()
+
+        self._parser: Optional[ParsingExecutor] = None
+        self._owns_embedding_service = False
+        self._writer: Optional[MilvusWriteBuffer] = None
+        # Milvus insert 결과를 기다리는 문서 (document_id → 작업)
+        self._awaiting: Dict[str, _PipelineItem] = {}
+        self._awaiting_lock = threading.Lock()
+
+    async def run(
+        self,
+        documents: Union[Iterable[DocumentSource], AsyncIterable[DocumentSource]]
+    ) -> PipelineReport:
+        """
+        파이프라인 실행
+
+        Args:
+            documents: 파일 경로 또는 {'file_path', 'replace_document_ids'} dict의
+                (비동기) 이터러블. 비동기 이터러블이면 받는 즉시 처리를 시작합니다.
+
+        Returns:
+            PipelineReport: 문서별 결과 + 단계별 통계
+        """
+        config = self.config
+        start = time.perf_counter()
+
+        parse_stats = StageStats(name="parse", workers=config.parse_workers)
+        embed_stats = StageStats(name="embed", workers=config.embed_concurrency)
+        store_stats = StageStats(name="store", workers=config.store_concurrency)
+
+        parse_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        store_queue: asyncio.Queue = asyncio.Queue(maxsize=config.queue_size)
+        items: List[_PipelineItem] = []
+
+        await self._open()
+        try:
+            await asyncio.gather(
+                self._feed(documents, parse_queue, items, config.parse_workers),
+                self._run_stage(
+                    self._parse_worker, parse_queue, embed_queue, parse_stats,
+                    downstream_workers=config.embed_concurrency
+                ),
+                self._run_stage(
+                    self._embed_worker, embed_queue, store_queue, embed_stats,
+                    downstream_workers=config.store_concurrency
+                ),
+                self._run_stage(self._store_worker, store_queue, None, store_stats),
+            )
+        finally:
+            # 실행이 중단돼도 버퍼에 남은 문서는 insert/정리
+            try:
+                store_stats.failed += await asyncio.to_thread(self._flush_writer)
+            finally:
+                await self._close()
+
+        report = PipelineReport(
+            results=[item.result for item in items],
+            stages=[parse_stats, embed_stats, store_stats],
+            wall_seconds=time.perf_counter() - start
+        )
+
+        logger.info(
+            f"파이프라인 인덱싱 완료: 성공 {report.success_count}, "
+            f"실패 {report.failed_count}, {report.wall_seconds:.2f}s"
+        )
+        for stats in report.stages:
+            logger.info(f"  {stats.summary()}")
+
+        return report
+
+    # ------------------------------------------------------------------
+    # 리소스
+    # ------------------------------------------------------------------
+
+    async def _open(self) -> None:
+        """실행 단위 리소스 준비 (프로세스 풀, 임베딩 클라이언트, Collection)"""
+        if self.config.use_process_pool:
+            self._parser = ParsingExecutor(
+                ParsingExecutorConfig(workers=self.config.parse_workers)
+            )
+            self._parser.start()
+
+        if self.embedding_service is None:
+            self.embedding_service = AsyncOllamaEmbeddingService()
+            self._owns_embedding_service = True
+
+        if self.collection is None:
+            self.collection = await asyncio.to_thread(
+                get_milvus_collection, self.indexer_config.collection_name
+            )
+
+        self._writer = MilvusWriteBuffer(self.collection, self.writer_config)
+
+    async def _close(self) -> None:
+        """실행 단위 리소스 정리"""
+        if self._parser is not None:
+            logger.info(f"파싱 프로세스 풀 통계: {self._parser.stats()}")
+            await asyncio.to_thread(self._parser.shutdown)
+            self._parser = None
+
+        self._writer = None
+
+        if self._owns_embedding_service and self.embedding_service is not None:
+            await self.embedding_service.aclose()
+            self.embedding_service = None
+            self._owns_embedding_service = False
+
+    # ------------------------------------------------------------------
+    # 단계 실행
+    # ------------------------------------------------------------------
+
+    async def _feed(
+        self,
+        documents: Union[Iterable[DocumentSource], AsyncIterable[DocumentSource]],
+        outbox: asyncio.Queue,
+        items: List[_PipelineItem],
+        downstream_workers: int
+    ) -> None:
+        """입력을 첫 단계 큐에 공급 (큐가 가득 차면 대기)"""
+        try:
+            if hasattr(documents, "__aiter__"):
+                async for source in documents:
+                    await self._put_source(source, outbox, items)
+            else:
+                for source in documents:
+                    await self._put_source(source, outbox, items)
+        finally:
+            for _ in range(downstream_workers):
+                await outbox.put(_DONE)
+
+    @staticmethod
+    async def _put_source(
+        source: DocumentSource,
+        outbox: asyncio.Queue,
+        items: List[_PipelineItem]
+    ) -> None:
+        """입력 하나를 작업 단위로 변환하여 큐에 추가"""
+        if isinstance(source, str):
+            item = _PipelineItem(source)
+        else:
+            item = _PipelineItem(source["file_path"], source.get("replace_document_ids"))
+        items.append(item)
+        await outbox.put(item)
+
+    async def _run_stage(
+        self,
+        worker: Callable,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        stats: StageStats,
+        downstream_workers: int = 0
+    ) -> None:
+        """단계 워커 실행 후 다음 단계에 종료 신호 전달"""
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*[
+                worker(inbox, outbox, stats) for _ in range(stats.workers)
+            ])
+        finally:
+            stats.wall_seconds = time.perf_counter() - start
+            if outbox is not None:
+                for _ in range(downstream_workers):
+                    await outbox.put(_DONE)
+
+    @staticmethod
+    def _collect_batch(
+        first: _PipelineItem,
+        inbox: asyncio.Queue,
+        max_chunks: int
+    ) -> tuple:
+        """
+        큐에 이미 도착한 문서를 max_chunks까지 모으기 (대기하지 않음)
+
+        Returns:
+            tuple: (문서 리스트, 종료 신호 수신 여부)
+        """
+        batch = [first]
+        total = len(first.chunks)
+        while total < max_chunks:
+            try:
+                item = inbox.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+            total += len(item.chunks)
+        return batch, False
+
+    async def _parse_worker(
+        self,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue,
+        stats: StageStats
+    ) -> None:
+        """파싱 + 청킹 (프로세스 풀)"""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+
+            started = time.perf_counter()
+            try:
+                if self._parser is not None:
+                    item.parsed_doc, item.chunks = await self._parser.parse(item.file_path)
+                else:
+                    item.parsed_doc, item.chunks = await loop.run_in_executor(
+                        None, parse_and_chunk, item.file_path
+                    )
+            except Exception as e:
+                logger.error(f"파싱 실패: {item.file_path}, error={e}")
+                item.fail(e)
+                stats.failed += 1
+                continue
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+
+            stats.documents += 1
+            stats.chunks += len(item.chunks)
+            await outbox.put(item)
+
+    async def _embed_worker(
+        self,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue,
+        stats: StageStats
+    ) -> None:
+        """여러 문서의 청크를 모아 임베딩 (청크 캐시 우선)"""
+        finished = False
+        while not finished:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+
+            batch, finished = self._collect_batch(item, inbox, self.config.embed_batch_chunks)
+
+            started = time.perf_counter()
+            try:
+                await self._embed_documents(batch)
+            except Exception as e:
+                logger.error(f"임베딩 배치 실패: {len(batch)}개 문서, error={e}")
+                for failed in batch:
+                    failed.fail(e)
+                stats.failed += len(batch)
+                continue
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+
+            stats.batches += 1
+            stats.documents += len(batch)
+            stats.chunks += sum(len(done.chunks) for done in batch)
+            for done in batch:
+                await outbox.put(done)
+
+    async def _embed_documents(self, batch: List[_PipelineItem]) -> None:
+        """배치 임베딩 (캐시 미스만 Ollama 호출) 후 문서별로 분배"""
+        texts = [chunk.content for item in batch for chunk in item.chunks]
+        model_name = self.embedding_service.config.model_name
+
+        if self.chunk_cache is not None:
+            embeddings = await asyncio.to_thread(self.chunk_cache.get_many, texts, model_name)
+        else:
+            embeddings = [None] * len(texts)
+
+        misses = [idx for idx, vector in enumerate(embeddings) if vector is None]
+        if misses:
+            miss_texts = [texts[idx] for idx in misses]
+            vectors = await self.embedding_service.embed_batch(miss_texts)
+            for idx, vector in zip(misses, vectors):
+                embeddings[idx] = vector
+            if self.chunk_cache is not None:
+                await asyncio.to_thread(
+                    self.chunk_cache.put_many, miss_texts, model_name, vectors
+                )
+
+        miss_set = set(misses)
+        offset = 0
+        for item in batch:
+            count = len(item.chunks)
+            item.embeddings = embeddings[offset:offset + count]
+            item.cache_hits = sum(
+                1 for idx in range(offset, offset + count) if idx not in miss_set
+            )
+            offset += count
+
+    async def _store_worker(
+        self,
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        stats: StageStats
+    ) -> None:
+        """여러 문서를 모아 PostgreSQL + Milvus에 저장"""
+        finished = False
+        while not finished:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+
+            batch, finished = self._collect_batch(item, inbox, self.config.store_batch_chunks)
+            chunk_count = sum(len(done.chunks) for done in batch)
+
+            started = time.perf_counter()
+            try:
+                stats.failed += await asyncio.to_thread(self._store_documents, batch)
+            except Exception as e:
+                logger.error(f"저장 배치 실패: {len(batch)}개 문서, error={e}")
+                for failed in batch:
+                    failed.fail(e)
+                stats.failed += len(batch)
+                continue
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+
+            stats.batches += 1
+            stats.documents += len(batch)
+            stats.chunks += chunk_count
+
+    def _store_documents(self, batch: List[_PipelineItem]) -> int:
+        """
+        저장 배치 1회 (스레드에서 실행)
+
+        문서 메타데이터를 index_status=pending으로 커밋한 뒤 엔티티를 쓰기 버퍼에
+        추가합니다. 커밋 후 중단되면 다음 스캔에서 pending 문서가 재인덱싱됩니다.
+
+        Returns:
+            int: 이번 호출에서 Milvus insert 실패로 처리된 문서 수
+
+        Raises:
+            Exception: PostgreSQL 저장 실패 (배치 전체 롤백)
+        """
+        db = self.session_factory()
+        try:
+            indexer = self._create_indexer(db)
+
+            documents: Dict[str, _PipelineItem] = {}
+            scope_fields: Dict[str, Dict[str, Any]] = {}
+            try:
+                for item in batch:
+                    document = indexer._save_document_metadata(
+                        item.file_path, item.parsed_doc, len(item.chunks),
+                        index_status=IndexStatus.PENDING
+                    )
+                    documents[str(document.id)] = item
+                    scope_fields[str(document.id)] = indexer.milvus_scope_fields(document)
+                    item.access_level, item.department = document.access_level, document.department
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+
+            with self._awaiting_lock:
+                self._awaiting.update(documents)
+
+            outcome = WriteOutcome()
+            for document_id, item in documents.items():
+                rows = indexer.build_milvus_rows(
+                    document_id, item.chunks, item.embeddings, **scope_fields[document_id]
+                )
+                outcome.merge(self._writer.add(document_id, rows))
+
+            return self._settle(indexer, outcome)
+        finally:
+            db.close()
+
+    def _flush_writer(self) -> int:
+        """
+        쓰기 버퍼의 남은 엔티티 insert + flush (실행 종료 시 1회)
+
+        BM25 역색인도 이 시점에 디스크에 저장합니다.
+
+        Returns:
+            int: Milvus insert 실패로 처리된 문서 수
+        """
+        if self._writer is None:
+            return 0
+
+        outcome = self._writer.flush()
+        try:
+            if not outcome.inserted and not outcome.failed:
+                return 0
+
+            db = self.session_factory()
+            try:
+                return self._settle(self._create_indexer(db), outcome)
+            finally:
+                db.close()
+        finally:
+            if self.lexical_index is not None:
+                self.lexical_index.maybe_save(force=True)
+
+    def _settle(self, indexer: DocumentIndexer, outcome: WriteOutcome) -> int:
+        """
+        insert 결과를 문서별로 반영
+
+        - 성공: indexed로 표시 후 교체 대상 기존 문서 삭제
+        - 실패: pending 문서를 PostgreSQL/Milvus에서 삭제 (기존 문서는 유지)
+
+        Returns:
+            int: 실패 처리한 문서 수
+        """
+        with self._awaiting_lock:
+            inserted = [(doc_id, self._awaiting.pop(doc_id)) for doc_id in outcome.inserted]
+            failed = [
+                (doc_id, self._awaiting.pop(doc_id), error)
+                for doc_id, error in outcome.failed.items()
+            ]
+
+        if inserted:
+            indexer.mark_indexed([doc_id for doc_id, _ in inserted])
+            for doc_id, item in inserted:
+                indexer.index_lexical(doc_id, item.chunks, item.access_level, item.department)
+            replaced = [
+                old_id for _, item in inserted for old_id in item.replace_document_ids or []
+            ]
+            if replaced:
+                indexer.delete_documents(replaced)
+            for doc_id, item in inserted:
+                item.succeed(doc_id)
+
+        if failed:
+            indexer.delete_documents([doc_id for doc_id, _, _ in failed])
+            for _, item, error in failed:
+                item.fail(MilvusWriteError(error))
+
+        return len(failed)
+
+    def _create_indexer(self, db: Session) -> DocumentIndexer:
+        """저장용 DocumentIndexer (공유 Collection/캐시 사용)"""
+        return DocumentIndexer(
+            db_session=db,
+            config=self.indexer_config,
+            chunk_cache=self.chunk_cache,
+            collection=self.collection,
+            lexical_index=self.lexical_index
+        )
@@ -0,0 +1,663 @@
+"""
+청크 본문 BM25 역색인 (하이브리드 검색의 어휘 검색 계층)
+
+조문 번호, 서식명처럼 정확한 용어가 중요한 규정 질의는 임베딩 코사인 검색만으로는
+놓치는 경우가 많습니다. 청크 본문에 대한 BM25 역색인을 메모리에 유지하고,
+DocumentIndexer가 문서 단위로 증분 갱신하며, 주기적으로 디스크에 저장합니다.
+
+토큰화 (형태소 분석기 없이 한국어 대응):
+- 한글 연속 구간은 음절 바이그램 ("휴가를" → "휴가", "가를"), 한 글자는 그대로
+- 영문/숫자 구간은 소문자 단어 그대로
+- 한글과 숫자/영문이 섞인 짧은 단어("제12조", "3호서식")는 전체도 토큰으로 추가
+
+메모리 구조 (수백만 청크 기준):
+- 청크는 정수 ID로 관리하며, 문서 하나의 청크는 연속 ID 구간 [start, start + count)
+- 청크별 값(토큰 수, 접근 레벨, 부서 번호, 문서 번호)은 array로 보관 (청크당 11바이트)
+- 포스팅 리스트는 (청크 ID 간격, tf)를 varint로 인코딩한 bytearray (포스팅당 2~4바이트)
+- 삭제는 문서 번호만 비워 두고(tombstone), 비율이 compaction_ratio를 넘으면 재구성
+
+저장 형식: numpy .npz (배열만 저장, pickle 없음)
+- 청크/문서/토큰별 값은 고정 크기 정수 배열, 포스팅은 하나로 이어 붙인 바이트 배열 + 오프셋
+- 토큰 목록, 문서 ID, 부서명, 카운터는 JSON 헤더 (UTF-8 바이트 배열)
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.services.access_control import AccessScope
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[0-9a-z가-힣]+")
+_SEGMENT_PATTERN = re.compile(r"[가-힣]+|[0-9a-z]+")
+_MIXED_TOKEN_MAX_LENGTH = 10
+_FORMAT_VERSION = 2
+
+# array typecode → 저장용 numpy dtype (청크/문서/토큰별 정수 배열)
+_ARRAY_FIELDS = {
+    "last_chunk": ("I", np.uint32),
+    "df": ("I", np.uint32),
+    "lengths": ("I", np.uint32),
+    "levels": ("B", np.uint8),
+    "departments": ("H", np.uint16),
+    "owners": ("I", np.uint32),
+    "document_starts": ("I", np.uint32),
+    "document_counts": ("I", np.uint32),
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    BM25용 토큰화 (인덱싱과 검색에 같은 규칙 사용)
+
+    Args:
+        text: 원문
+
+    Returns:
+        List[str]: 토큰 리스트 (중복 포함, tf 계산용)
+    """
+    tokens: List[str] = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        segments = _SEGMENT_PATTERN.findall(word)
+        for segment in segments:
+            if "가" <= segment[0] <= "힣" and len(segment) > 1:
+                tokens.extend(segment[i:i + 2] for i in range(len(segment) - 1))
+            else:
+                tokens.append(segment)
+        if len(segments) > 1 and len(word) <= _MIXED_TOKEN_MAX_LENGTH:
+            tokens.append(word)
+    return tokens
+
+
+def _append_varint(buffer: bytearray, value: int) -> None:
+    """부호 없는 정수를 7비트 단위 varint로 추가"""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _iter_postings(buffer: bytes) -> Iterator[Tuple[int, int]]:
+    """포스팅 리스트 디코딩: (청크 ID, tf) 순회"""
+    chunk_id = value = shift = 0
+    is_gap = True
+    for byte in buffer:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        if is_gap:
+            chunk_id += value
+        else:
+            yield chunk_id, value
+        is_gap = not is_gap
+        value = shift = 0
+
+
+class LexicalIndexConfig(BaseModel):
+    """BM25 역색인 설정"""
+
+    path: Optional[str] = Field(
+        default_factory=lambda: settings.LEXICAL_INDEX_PATH,
+        description="저장 파일 경로 (None이면 메모리 전용)"
+    )
+    save_interval_seconds: float = Field(
+        default_factory=lambda: settings.LEXICAL_INDEX_SAVE_INTERVAL_SECONDS,
+        description="증분 갱신 후 디스크 저장 최소 간격 (초)"
+    )
+    k1: float = Field(default=1.2, ge=0, description="BM25 tf 포화 계수")
+    b: float = Field(default=0.75, ge=0, le=1, description="BM25 문서 길이 정규화 계수")
+    max_df_ratio: float = Field(
+        default=0.05,
+        gt=0,
+        le=1,
+        description="이 비율보다 많은 청크에 나오는 토큰은 검색에서 제외 (IDF가 낮고 디코딩 비용만 큼)"
+    )
+    min_df_cutoff: int = Field(
+        default=1000,
+        ge=1,
+        description="문서 빈도가 이 값 이하인 토큰은 max_df_ratio와 관계없이 검색 (작은 색인 보호)"
+    )
+    compaction_ratio: float = Field(
+        default=0.2,
+        gt=0,
+        le=1,
+        description="삭제된 청크 비율이 이 값을 넘으면 포스팅 리스트 재구성"
+    )
+
+
+@dataclass
+class LexicalHit:
+    """BM25 검색 결과"""
+    document_id: str
+    chunk_index: int
+    score: float
+
+
+class LexicalIndex:
+    """
+    청크 본문 BM25 역색인 (스레드 안전)
+
+    문서의 청크는 Milvus와 같은 chunk_index(0부터 연속)로 저장되므로
+    (document_id, chunk_index)로 Milvus 엔티티와 대응됩니다.
+    """
+
+    def __init__(self, config: Optional[LexicalIndexConfig] = None):
+        """
+        Args:
+            config: 역색인 설정 (None이면 환경 변수 기반 기본값)
+        """
+        self.config = config or LexicalIndexConfig()
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._reset()
+
+    def _reset(self) -> None:
+        """빈 색인 상태로 초기화"""
+        # 토큰 → 토큰 번호, 토큰 번호별 포스팅/마지막 청크 ID/문서 빈도
+        self._terms: Dict[str, int] = {}
+        self._postings: List[bytearray] = []
+        self._last_chunk = array("I")
+        self._df = array("I")
+
+        # 청크 ID별 값
+        self._lengths = array("I")
+        self._levels = array("B")
+        self._departments = array("H")
+        self._owners = array("I")
+
+        # 문서 번호별 값 (삭제된 문서는 document_id가 None)
+        self._document_ids: List[Optional[str]] = []
+        self._document_starts = array("I")
+        self._document_counts = array("I")
+        self._documents: Dict[str, int] = {}
+
+        # 부서 번호 (0은 부서 없음)
+        self._department_names: List[Optional[str]] = [None]
+        self._department_numbers: Dict[str, int] = {}
+
+        self._live_chunks = 0
+        self._deleted_chunks = 0
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        """검색 대상 청크 수"""
+        return self._live_chunks
+
+    def add_document(
+        self,
+        document_id: str,
+        contents: Sequence[str],
+        access_level: int,
+        department: Optional[str] = None
+    ) -> int:
+        """
+        문서의 청크 추가 (같은 document_id가 있으면 교체)
+
+        Args:
+            document_id: 문서 ID
+            contents: chunk_index 순서의 청크 본문
+            access_level: 문서 접근 레벨 (1-3)
+            department: 문서 부서
+
+        Returns:
+            int: 추가된 청크 수
+        """
+        with self._lock:
+            self._remove_locked(document_id)
+
+            ordinal = len(self._document_ids)
+            self._document_ids.append(document_id)
+            self._document_starts.append(len(self._lengths))
+            self._document_counts.append(len(contents))
+            self._documents[document_id] = ordinal
+            department_number = self._department_number(department)
+
+            for content in contents:
+                chunk_id = len(self._lengths)
+                tokens = tokenize(content)
+                self._lengths.append(len(tokens))
+                self._levels.append(access_level)
+                self._departments.append(department_number)
+                self._owners.append(ordinal)
+                self._total_length += len(tokens)
+
+                for term, tf in Counter(tokens).items():
+                    self._add_posting(term, chunk_id, tf)
+
+            self._live_chunks += len(contents)
+            self._dirty = True
+            return len(contents)
+
+    def remove_documents(self, document_ids: Sequence[str]) -> int:
+        """
+        문서의 청크 삭제 (삭제 비율이 높으면 재구성)
+
+        Args:
+            document_ids: 문서 ID 리스트 (색인에 없으면 무시)
+
+        Returns:
+            int: 삭제된 청크 수
+        """
+        with self._lock:
+            removed = sum(self._remove_locked(document_id) for document_id in document_ids)
+            if removed:
+                self._dirty = True
+                if self._deleted_chunks > self.config.compaction_ratio * len(self._lengths):
+                    self.compact()
+            return removed
+
+    def _remove_locked(self, document_id: str) -> int:
+        """문서 tombstone 처리 (lock 보유 상태에서 호출)"""
+        ordinal = self._documents.pop(document_id, None)
+        if ordinal is None:
+            return 0
+
+        self._document_ids[ordinal] = None
+        start = self._document_starts[ordinal]
+        count = self._document_counts[ordinal]
+        self._total_length -= sum(self._lengths[start:start + count])
+        self._live_chunks -= count
+        self._deleted_chunks += count
+        return count
+
+    def _department_number(self, department: Optional[str]) -> int:
+        """부서명 → 부서 번호 (처음 보는 부서는 등록)"""
+        if not department:
+            return 0
+        number = self._department_numbers.get(department)
+        if number is None:
+            number = len(self._department_names)
+            self._department_names.append(department)
+            self._department_numbers[department] = number
+        return number
+
+    def _add_posting(self, term: str, chunk_id: int, tf: int) -> None:
+        """포스팅 추가 (청크 ID는 증가 순서로만 들어옴)"""
+        term_id = self._terms.get(term)
+        if term_id is None:
+            term_id = len(self._postings)
+            self._terms[term] = term_id
+            self._postings.append(bytearray())
+            self._last_chunk.append(0)
+            self._df.append(0)
+
+        buffer = self._postings[term_id]
+        _append_varint(buffer, chunk_id - self._last_chunk[term_id])
+        _append_varint(buffer, tf)
+        self._last_chunk[term_id] = chunk_id
+        self._df[term_id] += 1
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 50,
+        scope: Optional[AccessScope] = None
+    ) -> List[LexicalHit]:
+        """
+        BM25 검색 (권한 범위 밖 청크는 점수 계산 전에 제외)
+
+        Args:
+            query: 검색어
+            top_k: 반환할 최대 결과 수
+            scope: 사용자 권한 범위 (None이면 필터 없음)
+
+        Returns:
+            List[LexicalHit]: BM25 점수 내림차순 결과
+        """
+        terms = set(tokenize(query))
+        k1, b = self.config.k1, self.config.b
+
+        # lock 안에서는 포스팅 bytes 복사와 배열 참조만 가져오고, 디코딩/점수 계산은
+        # lock 밖에서 수행 (증분 갱신은 배열 뒤에 추가, compact는 새 객체로 교체하므로
+        # 가져온 참조는 포스팅 복사본과 일관됨)
+        with self._lock:
+            total = self._live_chunks
+            if not terms or not total:
+                return []
+
+            avg_length = self._total_length / total or 1.0
+            max_df = max(self.config.min_df_cutoff, int(total * self.config.max_df_ratio))
+            selected: List[Tuple[float, bytes]] = []
+            for term in terms:
+                term_id = self._terms.get(term)
+                if term_id is None or self._df[term_id] > max_df:
+                    continue
+                df = self._df[term_id]
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                selected.append((idf, bytes(self._postings[term_id])))
+
+            lengths, owners = self._lengths, self._owners
+            document_ids, document_starts = self._document_ids, self._document_starts
+            levels, departments = self._levels, self._departments
+            department_names = self._department_names
+
+        allowed: Dict[Tuple[int, int], bool] = {}
+        scores: Dict[int, float] = {}
+        for idf, postings in selected:
+            for chunk_id, tf in _iter_postings(postings):
+                if document_ids[owners[chunk_id]] is None:
+                    continue
+                if scope is not None:
+                    key = (levels[chunk_id], departments[chunk_id])
+                    permitted = allowed.get(key)
+                    if permitted is None:
+                        permitted = allowed[key] = scope.allows(key[0], department_names[key[1]])
+                    if not permitted:
+                        continue
+
+                norm = k1 * (1 - b + b * lengths[chunk_id] / avg_length)
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        hits = []
+        for chunk_id, score in heapq.nlargest(top_k, scores.items(), key=lambda item: item[1]):
+            ordinal = owners[chunk_id]
+            document_id = document_ids[ordinal]
+            if document_id is None:
+                continue  # 점수 계산 중 삭제됨
+            hits.append(LexicalHit(
+                document_id=document_id,
+                chunk_index=chunk_id - document_starts[ordinal],
+                score=score
+            ))
+        return hits
+
+    def compact(self) -> None:
+        """
+        삭제된 청크를 제거하고 청크 ID를 다시 매겨 포스팅 리스트 재구성
+
+        ID 순서가 유지되므로 기존 포스팅을 디코딩하면서 바로 다시 인코딩합니다.
+        """
+        with self._lock:
+            started = time.perf_counter()
+            remap = array("i", [-1]) * len(self._lengths)
+
+            lengths, levels = array("I"), array("B")
+            departments, owners = array("H"), array("I")
+            document_ids: List[Optional[str]] = []
+            starts, counts = array("I"), array("I")
+            documents: Dict[str, int] = {}
+
+            for ordinal, document_id in enumerate(self._document_ids):
+                if document_id is None:
+                    continue
+                new_ordinal = len(document_ids)
+                start = self._document_starts[ordinal]
+                count = self._document_counts[ordinal]
+                document_ids.append(document_id)
+                starts.append(len(lengths))
+                counts.append(count)
+                documents[document_id] = new_ordinal
+                for chunk_id in range(start, start + count):
+                    remap[chunk_id] = len(lengths)
+                    lengths.append(self._lengths[chunk_id])
+                    levels.append(self._levels[chunk_id])
+                    departments.append(self._departments[chunk_id])
+                    owners.append(new_ordinal)
+
+            terms: Dict[str, int] = {}
+            postings: List[bytearray] = []
+            last_chunk, dfs = array("I"), array("I")
+            for term, term_id in self._terms.items():
+                buffer, last, df = bytearray(), 0, 0
+                for chunk_id, tf in _iter_postings(self._postings[term_id]):
+                    new_id = remap[chunk_id]
+                    if new_id < 0:
+                        continue
+                    _append_varint(buffer, new_id - last)
+                    _append_varint(buffer, tf)
+                    last, df = new_id, df + 1
+                if df:
+                    terms[term] = len(postings)
+                    postings.append(buffer)
+                    last_chunk.append(last)
+                    dfs.append(df)
+
+            removed = self._deleted_chunks
+            self._terms, self._postings = terms, postings
+            self._last_chunk, self._df = last_chunk, dfs
+            self._lengths, self._levels = lengths, levels
+            self._departments, self._owners = departments, owners
+            self._document_ids, self._documents = document_ids, documents
+            self._document_starts, self._document_counts = starts, counts
+            self._deleted_chunks = 0
+            self._dirty = True
+
+            logger.info(
+                f"BM25 색인 재구성: 삭제 청크 {removed}개 제거, "
+                f"chunks={len(lengths)}, terms={len(terms)}, "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms"
+            )
+
+    def save(self) -> bool:
+        """
+        디스크에 저장 (임시 파일에 쓴 뒤 교체하므로 중간 상태가 남지 않음)
+
+        Returns:
+            bool: 저장 여부 (경로가 없거나 실패하면 False)
+        """
+        path = self.config.path
+        if not path:
+            return False
+
+        with self._lock:
+            state = self._snapshot()
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **self._encode_state(state))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self._dirty = True
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            logger.warning(f"BM25 색인 저장 실패: {path}, error={e}")
+            return False
+
+        logger.info(f"BM25 색인 저장: {path}, chunks={state['live_chunks']}")
+        return True
+
+    def maybe_save(self, force: bool = False) -> bool:
+        """
+        변경이 있고 저장 간격이 지났으면 저장 (증분 갱신 후 호출)
+
+        Args:
+            force: True면 저장 간격과 무관하게 변경이 있으면 저장 (작업/앱 종료 시)
+
+        Returns:
+            bool: 저장 여부
+        """
+        if not self._dirty:
+            return False
+        if not force and time.monotonic() - self._last_save < self.config.save_interval_seconds:
+            return False
+        return self.save()
+
+    def load(self) -> bool:
+        """
+        디스크에서 불러오기 (파일이 없거나 형식이 다르면 빈 색인 유지)
+
+        Returns:
+            bool: 불러오기 성공 여부
+        """
+        path = self.config.path
+        if not path or not os.path.exists(path):
+            return False
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                state = self._decode_state(data)
+        except Exception as e:
+            logger.warning(
+                f"BM25 색인 불러오기 실패 (빈 색인으로 시작, "
+                f"scripts/build_lexical_index.py로 재생성 필요): {e}"
+            )
+            return False
+
+        with self._lock:
+            self._restore(state)
+            self._dirty = False
+        logger.info(f"BM25 색인 불러오기: {path}, chunks={self._live_chunks}")
+        return True
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """저장용 상태 (lock 보유 상태에서 호출, bytearray/array는 복사)"""
+        return {
+            "version": _FORMAT_VERSION,
+            "terms": dict(self._terms),
+            "postings": [bytes(buffer) for buffer in self._postings],
+            "last_chunk": array("I", self._last_chunk),
+            "df": array("I", self._df),
+            "lengths": array("I", self._lengths),
+            "levels": array("B", self._levels),
+            "departments": array("H", self._departments),
+            "owners": array("I", self._owners),
+            "document_ids": list(self._document_ids),
+            "document_starts": array("I", self._document_starts),
+            "document_counts": array("I", self._document_counts),
+            "department_names": list(self._department_names),
+            "live_chunks": self._live_chunks,
+            "deleted_chunks": self._deleted_chunks,
+            "total_length": self._total_length,
+        }
+
+    @staticmethod
+    def _encode_state(state: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """_snapshot 상태 → .npz 배열 (객체 배열 없이 정수/바이트 배열만)"""
+        terms = [""] * len(state["terms"])
+        for term, term_id in state["terms"].items():
+            terms[term_id] = term
+        header = {
+            "version": state["version"],
+            "terms": terms,
+            "document_ids": state["document_ids"],
+            "department_names": state["department_names"],
+            "live_chunks": state["live_chunks"],
+            "deleted_chunks": state["deleted_chunks"],
+            "total_length": state["total_length"],
+        }
+
+        postings = state["postings"]
+        offsets = np.zeros(len(postings) + 1, dtype=np.uint64)
+        np.cumsum([len(buffer) for buffer in postings], out=offsets[1:])
+
+        arrays = {
+            "header": np.frombuffer(json.dumps(header, ensure_ascii=False).encode("utf-8"), dtype=np.uint8),
+            "postings": np.frombuffer(b"".join(postings), dtype=np.uint8),
+            "posting_offsets": offsets,
+        }
+        for name, (_, dtype) in _ARRAY_FIELDS.items():
+            arrays[name] = np.frombuffer(state[name].tobytes(), dtype=dtype)
+        return arrays
+
+    @staticmethod
+    def _decode_state(data: Any) -> Dict[str, Any]:
+        """
+        .npz 배열 → _restore 상태
+
+        Raises:
+            ValueError: 형식 버전이 다르거나 배열 크기가 맞지 않을 때
+        """
+        header = json.loads(data["header"].tobytes().decode("utf-8"))
+        if header.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 형식 버전: {header.get('version')}")
+
+        blob = data["postings"].tobytes()
+        offsets = data["posting_offsets"].tolist()
+        if len(offsets) != len(header["terms"]) + 1 or offsets[-1] != len(blob):
+            raise ValueError("포스팅 오프셋이 토큰 수/포스팅 크기와 맞지 않음")
+
+        state = {
+            **header,
+            "terms": {term: term_id for term_id, term in enumerate(header["terms"])},
+            "postings": [blob[start:end] for start, end in zip(offsets, offsets[1:])],
+        }
+        for name, (typecode, dtype) in _ARRAY_FIELDS.items():
+            state[name] = array(typecode, data[name].astype(dtype, copy=False).tobytes())
+        return state
+
+    def _restore(self, state: Dict[str, Any]) -> None:
+        """저장된 상태 복원 (lock 보유 상태에서 호출)"""
+        self._terms = state["terms"]
+        self._postings = [bytearray(buffer) for buffer in state["postings"]]
+        self._last_chunk = state["last_chunk"]
+        self._df = state["df"]
+        self._lengths = state["lengths"]
+        self._levels = state["levels"]
+        self._departments = state["departments"]
+        self._owners = state["owners"]
+        self._document_ids = state["document_ids"]
+        self._document_starts = state["document_starts"]
+        self._document_counts = state["document_counts"]
+        self._documents = {
+            document_id: ordinal
+            for ordinal, document_id in enumerate(self._document_ids)
+            if document_id is not None
+        }
+        self._department_names = state["department_names"]
+        self._department_numbers = {
+            name: number
+            for number, name in enumerate(self._department_names)
+            if name is not None
+        }
+        self._live_chunks = state["live_chunks"]
+        self._deleted_chunks = state["deleted_chunks"]
+        self._total_length = state["total_length"]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        색인 통계 (모니터링용)
+
+        Returns:
+            Dict: documents, chunks, deleted_chunks, terms, posting_bytes
+        """
+        with self._lock:
+            return {
+                "documents": len(self._documents),
+                "chunks": self._live_chunks,
+                "deleted_chunks": self._deleted_chunks,
+                "terms": len(self._terms),
+                "posting_bytes": sum(len(buffer) for buffer in self._postings),
+            }
+
+
+_lexical_index: Optional[LexicalIndex] = None
+_lexical_index_lock = threading.Lock()
+
+
+def get_lexical_index() -> Optional[LexicalIndex]:
+    """
+    프로세스 공유 BM25 역색인 반환 (최초 호출 시 디스크에서 불러옴)
+
+    Returns:
+        Optional[LexicalIndex]: 비활성화되었으면 None
+    """
+    global _lexical_index
+
+    if not settings.LEXICAL_INDEX_ENABLED:
+        return None
+
+    with _lexical_index_lock:
+        if _lexical_index is None:
+            _lexical_index = LexicalIndex()
+            _lexical_index.load()
+        return _lexical_index
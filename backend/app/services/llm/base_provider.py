@@ -4,8 +4,9 @@ LLM Provider 추상 베이스 클래스
 Task 2.5a: LLM 기본 답변 생성
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 from pydantic import BaseModel, Field
 import logging
 
@@ -51,6 +52,42 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def agenerate(self, prompt: str) -> str:
+        """
+        프롬프트 기반 답변 생성 (비동기, 취소 가능)
+
+        기본 구현은 generate()를 스레드에서 실행합니다 (취소 시 스레드는 끝까지 실행).
+        비동기 클라이언트를 지원하는 Provider는 오버라이드하여 취소 시 요청을 중단합니다.
+
+        Args:
+            prompt: 전체 프롬프트 (질문 + 컨텍스트 포함)
+
+        Returns:
+            str: 생성된 답변
+
+        Raises:
+            ValueError: 답변 생성 실패 시
+        """
+        return await asyncio.to_thread(self.generate, prompt)
+
+    async def agenerate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        프롬프트 기반 답변을 생성되는 대로 스트리밍
+
+        기본 구현은 generate()를 스레드에서 실행한 뒤 전체 답변을 한 번에 내보냅니다.
+        토큰 단위 스트리밍을 지원하는 Provider는 오버라이드합니다.
+
+        Args:
+            prompt: 전체 프롬프트 (질문 + 컨텍스트 포함)
+
+        Yields:
+            str: 답변 조각 (토큰)
+
+        Raises:
+            ValueError: 답변 생성 실패 시
+        """
+        yield await asyncio.to_thread(self.generate, prompt)
+
     @abstractmethod
     def health_check(self) -> bool:
         """
@@ -60,3 +97,19 @@ class BaseLLMProvider(ABC):
             bool: 정상 동작 여부
         """
         pass
+
+    def close(self) -> None:
+        """
+        Provider 리소스 정리 (기본값: 아무 작업 없음)
+
+        HTTP 연결 풀 등을 보유한 Provider는 오버라이드합니다.
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """
+        비동기 클라이언트 리소스 정리 (기본값: 아무 작업 없음)
+
+        agenerate_stream용 비동기 클라이언트를 보유한 Provider는 오버라이드합니다.
+        """
+        pass
@@ -4,7 +4,7 @@ Ollama LLM Provider
 Task 2.5a: LLM 기본 답변 생성
 """
 
-from typing import Optional
+from typing import AsyncIterator, Optional
 import ollama
 from app.services.llm.base_provider import BaseLLMProvider, LLMConfig
 import logging
@@ -29,6 +29,7 @@ class OllamaProvider(BaseLLMProvider):
             )
         super().__init__(config)
         self.client = ollama.Client()
+        self._async_client: Optional[ollama.AsyncClient] = None  # 비동기 호출용 (필요 시 생성)
 
         # 모델 존재 확인
         if not self._verify_model_exists():
@@ -107,6 +108,83 @@ class OllamaProvider(BaseLLMProvider):
             logger.error(f"Ollama 답변 생성 실패: {e}")
             raise ValueError(f"LLM 답변 생성 실패: {e}")
 
+    def _get_async_client(self) -> ollama.AsyncClient:
+        """비동기 클라이언트 (최초 사용 시 생성)"""
+        if self._async_client is None:
+            self._async_client = ollama.AsyncClient()
+        return self._async_client
+
+    async def agenerate(self, prompt: str) -> str:
+        """
+        Ollama 답변 생성 (비동기, 취소 시 HTTP 요청 중단)
+
+        Args:
+            prompt: 전체 프롬프트
+
+        Returns:
+            str: 생성된 답변
+
+        Raises:
+            ValueError: 답변 생성 실패 시
+        """
+        try:
+            logger.info(f"Ollama 답변 생성 시작 (async): prompt_length={len(prompt)}")
+
+            response = await self._get_async_client().generate(
+                model=self.config.model_name,
+                prompt=prompt,
+                options={
+                    "temperature": self.config.temperature,
+                    "num_predict": self.config.max_tokens
+                }
+            )
+
+            answer = response["response"].strip()
+
+            logger.info(
+                f"Ollama 답변 생성 완료 (async): answer_length={len(answer)}"
+            )
+
+            return answer
+
+        except Exception as e:
+            logger.error(f"Ollama 답변 생성 실패: {e}")
+            raise ValueError(f"LLM 답변 생성 실패: {e}")
+
+    async def agenerate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Ollama 스트리밍 답변 생성 (토큰 단위)
+
+        Args:
+            prompt: 전체 프롬프트
+
+        Yields:
+            str: 답변 조각
+
+        Raises:
+            ValueError: 답변 생성 실패 시
+        """
+        logger.info(f"Ollama 스트리밍 답변 생성 시작: prompt_length={len(prompt)}")
+
+        try:
+            stream = await self._get_async_client().generate(
+                model=self.config.model_name,
+                prompt=prompt,
+                stream=True,
+                options={
+                    "temperature": self.config.temperature,
+                    "num_predict": self.config.max_tokens
+                }
+            )
+            async for part in stream:
+                token = part["response"]
+                if token:
+                    yield token
+
+        except Exception as e:
+            logger.error(f"Ollama 스트리밍 답변 생성 실패: {e}")
+            raise ValueError(f"LLM 답변 생성 실패: {e}")
+
     def health_check(self) -> bool:
         """
         Ollama 상태 확인
@@ -134,3 +212,15 @@ class OllamaProvider(BaseLLMProvider):
         except Exception as e:
             logger.error(f"Ollama health check 실패: {e}")
             return False
+
+    def close(self) -> None:
+        """Ollama HTTP 연결 풀 정리"""
+        http_client = getattr(self.client, "_client", None)
+        if http_client is not None:
+            http_client.close()
+
+    async def aclose(self) -> None:
+        """비동기 HTTP 연결 풀 정리"""
+        if self._async_client is not None:
+            await self._async_client._client.aclose()
+            self._async_client = None
@@ -5,8 +5,8 @@ Task 2.5a: LLM 기본 답변 생성
 """
 
 import os
-from typing import Optional
-from openai import OpenAI
+from typing import AsyncIterator, Optional
+from openai import AsyncOpenAI, OpenAI
 from app.services.llm.base_provider import BaseLLMProvider, LLMConfig
 import logging
 
@@ -42,6 +42,7 @@ class OpenAIProvider(BaseLLMProvider):
             )
 
         self.client = OpenAI(api_key=api_key)
+        self.async_client = AsyncOpenAI(api_key=api_key)
         logger.info(f"OpenAI Provider 초기화: model={self.config.model_name}")
 
     def generate(self, prompt: str) -> str:
@@ -83,6 +84,79 @@ class OpenAIProvider(BaseLLMProvider):
             logger.error(f"OpenAI 답변 생성 실패: {e}")
             raise ValueError(f"LLM 답변 생성 실패: {e}")
 
+    async def agenerate(self, prompt: str) -> str:
+        """
+        OpenAI 답변 생성 (비동기, 취소 시 HTTP 요청 중단)
+
+        Args:
+            prompt: 전체 프롬프트
+
+        Returns:
+            str: 생성된 답변
+
+        Raises:
+            ValueError: 답변 생성 실패 시
+        """
+        try:
+            logger.info(f"OpenAI 답변 생성 시작 (async): prompt_length={len(prompt)}")
+
+            response = await self.async_client.chat.completions.create(
+                model=self.config.model_name,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+                timeout=self.config.timeout
+            )
+
+            answer = response.choices[0].message.content.strip()
+
+            logger.info(
+                f"OpenAI 답변 생성 완료 (async): answer_length={len(answer)}, "
+                f"tokens={response.usage.total_tokens}"
+            )
+
+            return answer
+
+        except Exception as e:
+            logger.error(f"OpenAI 답변 생성 실패: {e}")
+            raise ValueError(f"LLM 답변 생성 실패: {e}")
+
+    async def agenerate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """
+        OpenAI 스트리밍 답변 생성 (토큰 단위)
+
+        Args:
+            prompt: 전체 프롬프트
+
+        Yields:
+            str: 답변 조각
+
+        Raises:
+            ValueError: 답변 생성 실패 시
+        """
+        logger.info(f"OpenAI 스트리밍 답변 생성 시작: prompt_length={len(prompt)}")
+
+        try:
+            stream = await self.async_client.chat.completions.create(
+                model=self.config.model_name,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+                timeout=self.config.timeout,
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"OpenAI 스트리밍 답변 생성 실패: {e}")
+            raise ValueError(f"LLM 답변 생성 실패: {e}")
+
     def health_check(self) -> bool:
         """
         OpenAI API 상태 확인
@@ -99,3 +173,11 @@ class OpenAIProvider(BaseLLMProvider):
         except Exception as e:
             logger.error(f"OpenAI health check 실패: {e}")
             return False
+
+    def close(self) -> None:
+        """OpenAI HTTP 연결 풀 정리"""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """OpenAI 비동기 HTTP 연결 풀 정리"""
+        await self.async_client.close()
@@ -0,0 +1,211 @@
+"""
+Milvus 쓰기 버퍼
+
+문서마다 insert + flush 하면 flush마다 segment가 봉인되어 작은 segment가 대량으로
+생기고 벌크 인덱싱이 느려집니다. MilvusWriteBuffer는 여러 문서의 엔티티를 모아
+행 수/바이트 기준으로 큰 배치로 insert하고, flush는 작업 종료 시점이나
+flush_interval_seconds 경과 시에만 호출합니다.
+
+insert 결과는 문서 단위로 돌려주므로 (WriteOutcome) 호출자가 문서별로
+성공/실패를 기록하고 PostgreSQL 상태를 맞출 수 있습니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+from pymilvus import Collection
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# content/metadata 외 고정 필드(document_id, chunk_index 등) 추정 크기
+_ROW_OVERHEAD_BYTES = 64
+
+
+class MilvusWriteError(Exception):
+    """배치 insert 실패 (해당 배치에 포함된 문서의 실패 사유)"""
+    pass
+
+
+class MilvusWriteBufferConfig(BaseModel):
+    """Milvus 쓰기 버퍼 설정"""
+
+    max_rows: int = Field(
+        default_factory=lambda: settings.MILVUS_WRITE_BUFFER_MAX_ROWS,
+        ge=1,
+        description="insert 1회 최대 행 수"
+    )
+    max_bytes: int = Field(
+        default_factory=lambda: settings.MILVUS_WRITE_BUFFER_MAX_BYTES,
+        ge=1,
+        description="insert 1회 최대 추정 바이트"
+    )
+    flush_interval_seconds: float = Field(
+        default_factory=lambda: settings.MILVUS_FLUSH_INTERVAL_SECONDS,
+        ge=0,
+        description="마지막 flush 이후 이 시간이 지나면 다음 쓰기 때 flush (0이면 작업 종료 시에만)"
+    )
+
+
+class WriteOutcome(BaseModel):
+    """insert 결과 (문서 단위)"""
+
+    inserted: List[str] = Field(default_factory=list, description="insert 성공 문서 ID")
+    failed: Dict[str, str] = Field(default_factory=dict, description="insert 실패 문서 ID → 오류")
+
+    def merge(self, other: "WriteOutcome") -> None:
+        """다른 결과 합치기"""
+        self.inserted.extend(other.inserted)
+        self.failed.update(other.failed)
+
+
+def estimate_row_bytes(content: str, embedding: List[float], metadata: dict) -> int:
+    """
+    엔티티 1개의 insert 크기 추정
+
+    Args:
+        content: 청크 본문
+        embedding: 임베딩 벡터 (float32로 전송)
+        metadata: 청크 메타데이터
+
+    Returns:
+        int: 추정 바이트
+    """
+    return (
+        len(content.encode("utf-8"))
+        + len(embedding) * 4
+        + len(str(metadata))
+        + _ROW_OVERHEAD_BYTES
+    )
+
+
+class MilvusWriteBuffer:
+    """여러 문서의 엔티티를 모아 배치 insert, flush는 작업 경계/타이머에서만"""
+
+    def __init__(
+        self,
+        collection: Collection,
+        config: Optional[MilvusWriteBufferConfig] = None
+    ):
+        """
+        Args:
+            collection: Milvus Collection
+            config: 버퍼 설정
+        """
+        self.collection = collection
+        self.config = config or MilvusWriteBufferConfig()
+
+        self._lock = threading.Lock()
+        self._columns: List[list] = []
+        self._document_ids: List[str] = []
+        self._rows = 0
+        self._bytes = 0
+        self._unflushed_rows = 0
+        self._last_flush = time.monotonic()
+
+        self._inserts = 0
+        self._flushes = 0
+        self._inserted_rows = 0
+
+    def add(self, document_id: str, rows: List[list]) -> WriteOutcome:
+        """
+        문서 하나의 엔티티 추가 (임계치를 넘으면 insert)
+
+        Args:
+            document_id: 문서 ID
+            rows: DocumentIndexer.build_milvus_rows 결과 (컬럼 단위)
+
+        Returns:
+            WriteOutcome: 이번 호출로 insert된 문서 결과 (insert가 없으면 빈 결과)
+        """
+        contents, embeddings, metadatas = rows[1], rows[2], rows[4]
+        size = sum(
+            estimate_row_bytes(content, embedding, metadata)
+            for content, embedding, metadata in zip(contents, embeddings, metadatas)
+        )
+
+        with self._lock:
+            if not self._columns:
+                self._columns = [[] for _ in rows]
+            for column, values in zip(self._columns, rows):
+                column.extend(values)
+            self._document_ids.append(document_id)
+            self._rows += len(contents)
+            self._bytes += size
+
+            outcome = WriteOutcome()
+            if self._rows >= self.config.max_rows or self._bytes >= self.config.max_bytes:
+                outcome = self._insert_locked()
+            if self._flush_due():
+                outcome.merge(self._insert_locked())
+                self._flush_locked()
+            return outcome
+
+    def flush(self) -> WriteOutcome:
+        """
+        남은 엔티티 insert 후 flush (작업 종료 시 호출)
+
+        Returns:
+            WriteOutcome: 남은 엔티티의 insert 결과
+        """
+        with self._lock:
+            outcome = self._insert_locked()
+            self._flush_locked()
+            return outcome
+
+    def stats(self) -> Dict[str, int]:
+        """insert/flush 횟수 통계"""
+        with self._lock:
+            return {
+                "inserts": self._inserts,
+                "flushes": self._flushes,
+                "inserted_rows": self._inserted_rows,
+                "buffered_rows": self._rows,
+            }
+
+    def _flush_due(self) -> bool:
+        """타이머 기준 flush 필요 여부"""
+        interval = self.config.flush_interval_seconds
+        return bool(interval) and time.monotonic() - self._last_flush >= interval
+
+    def _insert_locked(self) -> WriteOutcome:
+        """버퍼 전체를 insert 1회로 전송 (lock 보유 상태에서 호출)"""
+        if not self._document_ids:
+            return WriteOutcome()
+
+        columns, document_ids, rows = self._columns, self._document_ids, self._rows
+        self._columns, self._document_ids = [], []
+        self._rows = self._bytes = 0
+
+        try:
+            self.collection.insert(columns)
+        except Exception as e:
+            logger.error(f"Milvus 배치 insert 실패: {len(document_ids)}개 문서, {rows}개 엔티티, error={e}")
+            # 부분 반영됐을 수 있는 엔티티는 호출자가 문서 삭제로 정리
+            return WriteOutcome(failed={document_id: str(e) for document_id in document_ids})
+
+        self._inserts += 1
+        self._inserted_rows += rows
+        self._unflushed_rows += rows
+        logger.info(f"Milvus 배치 insert: {len(document_ids)}개 문서, {rows}개 엔티티")
+        return WriteOutcome(inserted=document_ids)
+
+    def _flush_locked(self) -> None:
+        """flush 호출 (insert된 엔티티가 있을 때만)"""
+        self._last_flush = time.monotonic()
+        if not self._unflushed_rows:
+            return
+
+        try:
+            self.collection.flush()
+        except Exception as e:
+            # insert된 데이터는 유지되고 Milvus가 자동으로 segment를 봉인하므로 경고만 남김
+            logger.warning(f"Milvus flush 실패: {e}")
+            return
+
+        self._flushes += 1
+        logger.info(f"Milvus flush: {self._unflushed_rows}개 엔티티")
+        self._unflushed_rows = 0
@@ -0,0 +1,340 @@
+"""
+문서 파싱 프로세스 풀 (파일 단위 격리)
+
+pypdf 같은 순수 Python 파서는 GIL을 잡고 있어 스레드로는 CPU 병렬화가 되지 않고,
+병적인 파일 하나(수백 페이지 스캔 PDF, 압축 폭탄 등)가 인덱싱 작업 전체를 멈출 수
+있습니다. ParsingExecutor는 parse_and_chunk를 spawn 프로세스 풀에서 실행하고
+파일마다 자원 제한을 적용합니다.
+
+- 페이지 병렬 추출: 워커 안에서는 끔 (parse_and_chunk_in_worker, page_workers=1).
+  워커가 다시 프로세스 풀을 만들면 손자 프로세스의 CPU 시간이 제한에 잡히지 않고,
+  풀 재생성 시 종료되지 않으며, 프로세스 수가 workers × page_workers로 늘어남
+
+- CPU 시간: 파일마다 RLIMIT_CPU soft 한도를 (누적 사용량 + 제한)으로 올리고,
+  초과 시 SIGXCPU 핸들러가 ParsingLimitExceededError를 발생 (워커는 계속 사용)
+- 메모리: 워커 시작 시 RLIMIT_AS 설정 (초과 시 MemoryError → ParsingLimitExceededError)
+- 처리 시간: CPU를 쓰지 않고 멈춘 경우(I/O 대기 등) 풀을 종료 후 재생성,
+  함께 실행 중이던 다른 파일은 한 번 재시도
+- 워커 재활용: max_tasks_per_child개 파일을 처리한 워커는 새 프로세스로 교체
+- 결과 전달: ParsedDocument/TextChunk를 기본 타입 튜플로 펼쳐 반환
+  (pydantic 모델보다 프로세스 간 전달이 작고 빠름), 부모 프로세스에서 검증 없이 복원
+
+resource 모듈이 없는 플랫폼(Windows)에서는 CPU/메모리 제한 없이 처리 시간 제한만 적용합니다.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.services.document_indexer import parse_and_chunk
+from app.services.document_parser.base_parser import (
+    ParsedDocument,
+    ParsedPage,
+    ParserConfig,
+    ParsingLimitExceededError
+)
+from app.services.text_chunker import TextChunk
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+ParseFunction = Callable[[str], Tuple[ParsedDocument, List[TextChunk]]]
+# (페이지 튜플 리스트, total_pages, total_characters, metadata, 청크 튜플 리스트)
+ParsePayload = Tuple[List[Tuple[Any, ...]], int, int, Dict[str, Any], List[Tuple[Any, ...]]]
+
+
+class ParsingExecutorConfig(BaseModel):
+    """파싱 프로세스 풀 설정"""
+
+    workers: int = Field(
+        default_factory=lambda: min(4, os.cpu_count() or 1),
+        ge=1,
+        le=32,
+        description="워커 프로세스 수"
+    )
+    cpu_time_limit_seconds: int = Field(
+        default_factory=lambda: settings.PARSING_CPU_TIME_LIMIT_SECONDS,
+        ge=0,
+        description="파일당 CPU 시간 제한 (0이면 제한 없음)"
+    )
+    memory_limit_mb: int = Field(
+        default_factory=lambda: settings.PARSING_MEMORY_LIMIT_MB,
+        ge=0,
+        description="워커 주소 공간 제한 (0이면 제한 없음)"
+    )
+    timeout_seconds: float = Field(
+        default_factory=lambda: settings.PARSING_TIMEOUT_SECONDS,
+        gt=0,
+        description="파일당 처리 시간 제한"
+    )
+    max_tasks_per_child: int = Field(
+        default_factory=lambda: settings.PARSING_MAX_TASKS_PER_CHILD,
+        ge=1,
+        description="워커 하나가 처리할 최대 파일 수 (이후 새 프로세스로 교체)"
+    )
+
+
+def encode_parse_result(
+    parsed_doc: ParsedDocument,
+    chunks: List[TextChunk]
+) -> ParsePayload:
+    """
+    파싱 결과를 프로세스 간 전달용 기본 타입 튜플로 변환
+
+    Args:
+        parsed_doc: 파싱 결과
+        chunks: 청크 리스트
+
+    Returns:
+        ParsePayload: 페이지/청크를 튜플로 펼친 값
+    """
+    return (
+        [(page.page_number, page.content, page.metadata) for page in parsed_doc.pages],
+        parsed_doc.total_pages,
+        parsed_doc.total_characters,
+        parsed_doc.metadata,
+        [
+            (chunk.content, chunk.chunk_index, chunk.document_id,
+             chunk.document_title, chunk.page_number, chunk.start_char, chunk.end_char)
+            for chunk in chunks
+        ],
+    )
+
+
+def decode_parse_result(payload: ParsePayload) -> Tuple[ParsedDocument, List[TextChunk]]:
+    """
+    encode_parse_result 결과 복원 (워커에서 검증된 값이므로 재검증하지 않음)
+
+    Args:
+        payload: 튜플로 펼친 파싱 결과
+
+    Returns:
+        Tuple[ParsedDocument, List[TextChunk]]: 파싱 결과와 청크 리스트
+    """
+    pages, total_pages, total_characters, metadata, chunk_rows = payload
+    parsed_doc = ParsedDocument.model_construct(
+        pages=[
+            ParsedPage.model_construct(page_number=number, content=content, metadata=page_metadata)
+            for number, content, page_metadata in pages
+        ],
+        total_pages=total_pages,
+        total_characters=total_characters,
+        metadata=metadata
+    )
+    chunks = [
+        TextChunk.model_construct(
+            content=content,
+            chunk_index=chunk_index,
+            document_id=document_id,
+            document_title=document_title,
+            page_number=page_number,
+            start_char=start_char,
+            end_char=end_char
+        )
+        for content, chunk_index, document_id, document_title, page_number, start_char, end_char
+        in chunk_rows
+    ]
+    return parsed_doc, chunks
+
+
+def parse_and_chunk_in_worker(file_path: str) -> Tuple[ParsedDocument, List[TextChunk]]:
+    """
+    워커 프로세스용 parse_and_chunk (페이지 범위 병렬 추출 없이 순차 추출)
+
+    Args:
+        file_path: 문서 파일 경로
+
+    Returns:
+        Tuple[ParsedDocument, List[TextChunk]]: 파싱 결과와 청크 리스트
+    """
+    return parse_and_chunk(file_path, parser_config=ParserConfig(page_workers=1))
+
+
+def _on_cpu_limit(signum, frame) -> None:
+    """SIGXCPU 핸들러 (워커 프로세스)"""
+    raise ParsingLimitExceededError("파싱 CPU 시간 제한 초과")
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    """워커 프로세스 초기화: 메모리 제한 + CPU 제한 시그널 핸들러"""
+    if resource is None:
+        return
+
+    if memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+    signal.signal(signal.SIGXCPU, _on_cpu_limit)
+
+
+def _parse_in_worker(
+    parse_function: ParseFunction,
+    file_path: str,
+    cpu_time_limit_seconds: int
+) -> ParsePayload:
+    """
+    워커 프로세스에서 파일 1개 파싱 (CPU 시간 제한 적용)
+
+    RLIMIT_CPU는 프로세스 누적 사용량 기준이므로, 파일마다 soft 한도를
+    현재 사용량 + 제한으로 올렸다가 끝나면 해제합니다.
+    """
+    limited = resource is not None and cpu_time_limit_seconds > 0
+    if limited:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = math.ceil(usage.ru_utime + usage.ru_stime)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        resource.setrlimit(resource.RLIMIT_CPU, (used + cpu_time_limit_seconds, hard))
+
+    try:
+        parsed_doc, chunks = parse_function(file_path)
+        return encode_parse_result(parsed_doc, chunks)
+    except MemoryError:
+        raise ParsingLimitExceededError("파싱 메모리 제한 초과")
+    finally:
+        if limited:
+            resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+
+
+class ParsingExecutor:
+    """
+    문서 파싱 프로세스 풀
+
+    parse()는 이벤트 루프에서 await 하며, 동시에 처리되는 파일 수는 workers개입니다.
+    풀 재생성은 이벤트 루프 스레드에서만 일어나므로 별도 lock이 필요 없습니다.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ParsingExecutorConfig] = None,
+        parse_function: ParseFunction = parse_and_chunk_in_worker
+    ):
+        """
+        Args:
+            config: 풀 설정 (None이면 환경 변수 기반 기본값)
+            parse_function: 워커에서 실행할 함수 (모듈 수준 함수여야 하며,
+                워커 안에서 프로세스 풀을 만들지 않아야 함)
+        """
+        self.config = config or ParsingExecutorConfig()
+        self.parse_function = parse_function
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._generation = 0
+
+        self.parsed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.restarts = 0
+
+    def start(self) -> None:
+        """프로세스 풀 생성 (이미 있으면 무시)"""
+        if self._pool is not None:
+            return
+
+        # fork는 부모의 gRPC/HTTP 연결 상태를 복제하므로 spawn 사용
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.config.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.config.memory_limit_mb,),
+            max_tasks_per_child=self.config.max_tasks_per_child
+        )
+        self._generation += 1
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료 (실행 중인 파싱이 끝날 때까지 대기)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def parse(self, file_path: str) -> Tuple[ParsedDocument, List[TextChunk]]:
+        """
+        파일 1개 파싱 + 청킹
+
+        Args:
+            file_path: 문서 파일 경로
+
+        Returns:
+            Tuple[ParsedDocument, List[TextChunk]]: 파싱 결과와 청크 리스트
+
+        Raises:
+            ParsingLimitExceededError: CPU/메모리/처리 시간 제한 초과, 워커 비정상 종료
+            DocumentParserError, ValueError: 파서 오류 (parse_and_chunk 참고)
+        """
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(2):
+            self.start()
+            generation = self._generation
+
+            try:
+                future = loop.run_in_executor(
+                    self._pool, _parse_in_worker,
+                    self.parse_function, file_path, self.config.cpu_time_limit_seconds
+                )
+                payload = await asyncio.wait_for(future, timeout=self.config.timeout_seconds)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                self.failed += 1
+                self._restart(generation, reason=f"처리 시간 초과: {file_path}")
+                raise ParsingLimitExceededError(
+                    f"파싱 처리 시간 제한 초과 ({self.config.timeout_seconds:.0f}s)"
+                )
+            except BrokenProcessPool:
+                # 다른 파일 때문에 풀이 재생성됐거나 이 파일이 워커를 죽인 경우
+                self._restart(generation, reason=f"워커 비정상 종료: {file_path}")
+                if attempt:
+                    self.failed += 1
+                    raise ParsingLimitExceededError("파싱 워커가 비정상 종료되었습니다")
+                continue
+            except Exception:
+                self.failed += 1
+                raise
+
+            self.parsed += 1
+            return decode_parse_result(payload)
+
+    def _restart(self, generation: int, reason: str) -> None:
+        """
+        풀 강제 종료 후 다음 parse()에서 재생성 (같은 세대는 한 번만)
+
+        ProcessPoolExecutor는 실행 중인 작업을 취소할 수 없으므로 워커 프로세스를
+        직접 종료합니다. 같은 풀에서 실행 중이던 작업은 BrokenProcessPool로 끝나 재시도됩니다.
+        """
+        if generation != self._generation or self._pool is None:
+            return
+
+        pool, self._pool = self._pool, None
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        self.restarts += 1
+        logger.warning(f"파싱 프로세스 풀 재생성 ({reason})")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        파싱 통계 (모니터링용)
+
+        Returns:
+            Dict: parsed, failed, timeouts, restarts
+        """
+        return {
+            "parsed": self.parsed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "restarts": self.restarts
+        }
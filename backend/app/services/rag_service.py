@@ -5,20 +5,24 @@ Task 2.5a: LLM 기본 답변 생성
 Task 2.5b: LLM 안정성 강화 (Hallucination 방지, 타임아웃, 재시도)
 """
 
+import asyncio
+import contextvars
 import os
 import re
-import signal
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional, Dict, Any
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type
+    retry_if_exception_type,
+    retry_if_not_exception_type
 )
 from app.services.llm.base_provider import BaseLLMProvider
 from app.services.llm.ollama_provider import OllamaProvider
 from app.services.llm.openai_provider import OpenAIProvider
 from app.services.vector_search import SearchResult
+from app.utils.deadline import DeadlineExceeded, raise_if_expired, time_left
 import logging
 
 logger = logging.getLogger(__name__)
@@ -64,6 +68,54 @@ def load_rag_prompt_template() -> str:
 # 프롬프트 템플릿 로드
 RAG_PROMPT_TEMPLATE = load_rag_prompt_template()
 
+# LLM 타임아웃 재시도 조건: 단계 타임아웃만 재시도 (요청 예산 소진은 즉시 실패)
+_RETRY_ON_TIMEOUT = (
+    retry_if_exception_type(TimeoutError)
+    & retry_if_not_exception_type(DeadlineExceeded)
+)
+
+# 출처 패턴: "문서", "출처", "규정", "에 따르면" 등 (Task 2.5b)
+CITATION_PATTERNS = [
+    re.compile(r"문서"),
+    re.compile(r"출처"),
+    re.compile(r"규정"),
+    re.compile(r"에 따르면"),
+    re.compile(r"따라서"),
+    re.compile(r"\[문서 \d+\]"),  # [문서 1], [문서 2] 등
+]
+
+
+class CitationTracker:
+    """스트리밍 답변의 출처 포함 여부를 토큰 단위로 확인
+
+    패턴이 토큰 경계에 걸칠 수 있으므로 직전 텍스트 끝부분(WINDOW자)과
+    새 토큰을 이어 붙여 검사합니다. 전체 답변을 다시 검사하지 않습니다.
+    """
+
+    WINDOW = 32  # 가장 긴 출처 패턴보다 충분히 길게
+
+    def __init__(self):
+        self.found = False
+        self._tail = ""
+
+    def feed(self, token: str) -> bool:
+        """
+        토큰 추가 후 출처 포함 여부 반환
+
+        Args:
+            token: 답변 조각
+
+        Returns:
+            bool: 지금까지의 답변에 출처가 포함되었는지
+        """
+        if self.found:
+            return True
+
+        text = self._tail + token
+        self.found = any(pattern.search(text) for pattern in CITATION_PATTERNS)
+        self._tail = text[-self.WINDOW:]
+        return self.found
+
 
 class RAGService:
     """RAG (Retrieval-Augmented Generation) 서비스"""
@@ -73,6 +125,14 @@ class RAGService:
     FALLBACK_NO_DOCUMENTS = "죄송합니다. 관련 문서를 찾을 수 없습니다."
     FALLBACK_LOW_CONFIDENCE = "답변을 찾을 수 없습니다. 아래 검색 결과를 참고하세요."
     FALLBACK_NO_SOURCE = "답변 생성에 실패했습니다. 검색 결과를 확인해 주세요."
+    LLM_TIMEOUT_SECONDS = 60  # LLM 호출 1회 최대 시간 (요청 예산이 더 적으면 예산 기준)
+
+    # Fallback 답변 → fallback_reason
+    _FALLBACK_REASONS = {
+        FALLBACK_NO_DOCUMENTS: "no_documents",
+        FALLBACK_LOW_CONFIDENCE: "low_confidence",
+        FALLBACK_NO_SOURCE: "no_source_citation",
+    }
 
     def __init__(self, provider_type: str = "ollama"):
         """
@@ -92,8 +152,20 @@ class RAGService:
         else:
             raise ValueError(f"Unknown provider type: {provider_type}")
 
+        # 동기 경로의 LLM 호출용 (타임아웃 시 호출 스레드가 기다리지 않도록 분리)
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm")
+
         logger.info(f"RAGService 초기화: provider={provider_type}")
 
+    def close(self) -> None:
+        """LLM Provider 리소스 정리"""
+        self._executor.shutdown(wait=False)
+        self.llm_provider.close()
+
+    async def aclose(self) -> None:
+        """LLM Provider 비동기 리소스 정리 (스트리밍 클라이언트)"""
+        await self.llm_provider.aclose()
+
     def generate_answer(
         self,
         query: str,
@@ -109,12 +181,91 @@ class RAGService:
         Returns:
             str: 생성된 답변 (Fallback 포함)
         """
-        # [STEP 1] 검색 결과 없음 → Fallback
+        # [STEP 1-2] 검색 결과 없음 / 낮은 관련도 → Fallback
+        fallback = self._check_search_results(search_results)
+        if fallback is not None:
+            return fallback
+
+        # [STEP 3-4] Context + 프롬프트 구성
+        prompt = self._build_prompt(query, search_results)
+
+        # [STEP 5] LLM 답변 생성 (타임아웃 + 재시도)
+        try:
+            answer = self._generate_with_retry(prompt)
+        except Exception as e:
+            logger.error(f"RAG 답변 생성 실패: {e}")
+            return self.FALLBACK_NO_SOURCE
+
+        # [STEP 6] 출처 검증 (Task 2.5b)
+        return self._verify_citation(answer)
+
+    async def agenerate_answer(
+        self,
+        query: str,
+        search_results: List[SearchResult]
+    ) -> str:
+        """
+        검색 결과 기반 답변 생성 (비동기 버전)
+
+        LLM 호출은 요청 시간 예산(Deadline)의 남은 시간 안에서 실행되며,
+        초과 시 호출을 취소하고 Fallback을 반환합니다.
+
+        Args:
+            query: 사용자 질문
+            search_results: 벡터 검색 결과
+
+        Returns:
+            str: 생성된 답변 (Fallback 포함)
+        """
+        fallback = self._check_search_results(search_results)
+        if fallback is not None:
+            return fallback
+
+        prompt = self._build_prompt(query, search_results)
+
+        try:
+            answer = await self._agenerate_with_retry(prompt)
+        except Exception as e:
+            logger.error(f"RAG 답변 생성 실패: {e}")
+            return self.FALLBACK_NO_SOURCE
+
+        return self._verify_citation(answer)
+
+    def _verify_citation(self, answer: str) -> str:
+        """
+        출처 검증 (Task 2.5b)
+
+        Args:
+            answer: LLM 답변
+
+        Returns:
+            str: 출처가 있으면 답변, 없으면 FALLBACK_NO_SOURCE
+        """
+        if not self._has_source_citation(answer):
+            logger.error(
+                f"출처 미포함 답변 거부: answer='{answer[:100]}...'"
+            )
+            return self.FALLBACK_NO_SOURCE
+
+        logger.info("RAG 답변 생성 성공 (출처 검증 완료)")
+        return answer
+
+    def _check_search_results(self, search_results: List[SearchResult]) -> Optional[str]:
+        """
+        LLM 호출 전 Fallback 판단 (Task 2.5b)
+
+        Args:
+            search_results: 벡터 검색 결과
+
+        Returns:
+            Optional[str]: Fallback 답변 (LLM을 호출해도 되면 None)
+        """
+        # 검색 결과 없음 → Fallback
         if not search_results:
             logger.warning("검색 결과 없음, Fallback 반환")
             return self.FALLBACK_NO_DOCUMENTS
 
-        # [STEP 2] 관련도 점수 확인 (Task 2.5b)
+        # 관련도 점수 확인
         avg_relevance = sum(r.relevance_score for r in search_results) / len(search_results)
 
         if avg_relevance < self.CONFIDENCE_THRESHOLD:
@@ -123,37 +274,31 @@ class RAGService:
             )
             return self.FALLBACK_LOW_CONFIDENCE
 
-        # [STEP 3] Context 구성
-        context = self._build_context(search_results)
+        return None
 
-        # [STEP 4] 프롬프트 구성
-        prompt = RAG_PROMPT_TEMPLATE.format(
-            context=context,
-            query=query
-        )
+    def _build_prompt(self, query: str, search_results: List[SearchResult]) -> str:
+        """
+        검색 결과로 RAG 프롬프트 구성
+
+        Args:
+            query: 사용자 질문
+            search_results: 벡터 검색 결과
+
+        Returns:
+            str: 프롬프트
+        """
+        context = self._build_context(search_results)
+        avg_relevance = sum(r.relevance_score for r in search_results) / len(search_results)
 
         logger.info(
             f"RAG 답변 생성 시작: query='{query[:50]}...', "
             f"context_length={len(context)}, avg_relevance={avg_relevance:.3f}"
         )
 
-        # [STEP 5] LLM 답변 생성 (타임아웃 + 재시도)
-        try:
-            answer = self._generate_with_retry(prompt)
-
-            # [STEP 6] 출처 검증 (Task 2.5b)
-            if not self._has_source_citation(answer):
-                logger.error(
-                    f"출처 미포함 답변 거부: answer='{answer[:100]}...'"
-                )
-                return self.FALLBACK_NO_SOURCE
-
-            logger.info("RAG 답변 생성 성공 (출처 검증 완료)")
-            return answer
-
-        except Exception as e:
-            logger.error(f"RAG 답변 생성 실패: {e}")
-            return self.FALLBACK_NO_SOURCE
+        return RAG_PROMPT_TEMPLATE.format(
+            context=context,
+            query=query
+        )
 
     def _build_context(self, search_results: List[SearchResult]) -> str:
         """
@@ -193,19 +338,8 @@ class RAGService:
         Returns:
             bool: 출처 포함 여부
         """
-        # 출처 패턴: "문서", "출처", "규정", "에 따르면" 등
-        citation_patterns = [
-            r"문서",
-            r"출처",
-            r"규정",
-            r"에 따르면",
-            r"따라서",
-            r"\[문서 \d+\]"  # [문서 1], [문서 2] 등
-        ]
-
-        for pattern in citation_patterns:
-            if re.search(pattern, answer):
-                return True
+        if any(pattern.search(answer) for pattern in CITATION_PATTERNS):
+            return True
 
         logger.warning(f"출처 미포함: answer='{answer[:100]}...'")
         return False
@@ -213,13 +347,16 @@ class RAGService:
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(TimeoutError),
+        retry=_RETRY_ON_TIMEOUT,
         reraise=True
     )
     def _generate_with_retry(self, prompt: str) -> str:
         """
         재시도 로직이 포함된 LLM 답변 생성 (Task 2.5b)
 
+        호출은 전용 스레드 풀에서 실행하고 호출자는 남은 시간만큼만 기다리므로
+        어느 스레드에서 호출해도 동작합니다 (SIGALRM 불필요).
+
         Args:
             prompt: 프롬프트
 
@@ -227,34 +364,166 @@ class RAGService:
             str: 생성된 답변
 
         Raises:
-            TimeoutError: 60초 타임아웃
+            DeadlineExceeded: 요청 시간 예산 초과 (재시도 없음)
+            TimeoutError: LLM_TIMEOUT_SECONDS 초과 (최대 3회 시도)
             ValueError: LLM 생성 실패
         """
-        logger.info("LLM 답변 생성 시작 (타임아웃: 60초)")
+        timeout = time_left("llm", self.LLM_TIMEOUT_SECONDS)
+        logger.info(f"LLM 답변 생성 시작 (타임아웃: {timeout:.1f}초)")
 
-        def timeout_handler(signum, frame):
-            raise TimeoutError("LLM 답변 생성 타임아웃 (60초)")
+        # contextvar(요청 Deadline 등)를 작업 스레드에 전달
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, self.llm_provider.generate, prompt)
 
         try:
-            # Timeout 설정 (60초)
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(60)
+            return future.result(timeout=timeout)
+        except TimeoutError as e:
+            future.cancel()
+            raise_if_expired("llm", e)
+            logger.warning(f"LLM 타임아웃 발생 ({timeout:.1f}초), 재시도...")
+            raise TimeoutError(f"LLM 답변 생성 타임아웃 ({timeout:.1f}초)") from e
+        except Exception as e:
+            logger.error(f"LLM 답변 생성 실패: {e}")
+            raise ValueError(f"LLM 답변 생성 실패: {e}")
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=_RETRY_ON_TIMEOUT,
+        reraise=True
+    )
+    async def _agenerate_with_retry(self, prompt: str) -> str:
+        """
+        재시도 로직이 포함된 LLM 답변 생성 (비동기 버전)
+
+        남은 시간이 지나면 LLM 호출 자체를 취소합니다.
+
+        Args:
+            prompt: 프롬프트
 
-            try:
-                answer = self.llm_provider.generate(prompt)
-                signal.alarm(0)  # 타임아웃 해제
-                return answer
+        Returns:
+            str: 생성된 답변
 
-            except TimeoutError:
-                signal.alarm(0)
-                logger.warning("LLM 타임아웃 발생, 재시도...")
-                raise
+        Raises:
+            DeadlineExceeded: 요청 시간 예산 초과 (재시도 없음)
+            TimeoutError: LLM_TIMEOUT_SECONDS 초과 (최대 3회 시도)
+            ValueError: LLM 생성 실패
+        """
+        timeout = time_left("llm", self.LLM_TIMEOUT_SECONDS)
+        logger.info(f"LLM 답변 생성 시작 (async, 타임아웃: {timeout:.1f}초)")
 
+        try:
+            return await asyncio.wait_for(self.llm_provider.agenerate(prompt), timeout)
+        except TimeoutError as e:
+            raise_if_expired("llm", e)
+            logger.warning(f"LLM 타임아웃 발생 ({timeout:.1f}초), 재시도...")
+            raise
+        except ValueError:
+            raise
         except Exception as e:
-            signal.alarm(0)  # 타임아웃 해제 (안전)
             logger.error(f"LLM 답변 생성 실패: {e}")
             raise ValueError(f"LLM 답변 생성 실패: {e}")
 
+    async def astream_answer(
+        self,
+        query: str,
+        search_results: List[SearchResult]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        검색 결과 기반 답변 스트리밍 생성
+
+        LLM이 만드는 토큰을 그대로 내보내고, 출처 포함 여부는 토큰마다
+        CitationTracker로 확인합니다. 스트림이 끝날 때까지 출처가 없으면
+        마지막 result 이벤트에서 FALLBACK_NO_SOURCE로 대체하므로
+        클라이언트는 스트리밍된 텍스트를 result.answer로 교체해야 합니다.
+
+        타임아웃은 토큰 하나를 기다리는 단계마다 LLM_TIMEOUT_SECONDS(요청 예산이 더 적으면
+        남은 예산)이며, 클라이언트가 이벤트를 소비하는 시간에는 적용하지 않습니다.
+        이미 토큰을 보낸 뒤에는 중복 출력이 되므로 재시도하지 않습니다.
+
+        Args:
+            query: 사용자 질문
+            search_results: 벡터 검색 결과
+
+        Yields:
+            Dict: 이벤트
+                - {"type": "token", "text": str}
+                - {"type": "citation"} (출처를 처음 확인한 시점, 1회)
+                - {"type": "result", "answer", "is_fallback", "fallback_reason"} (마지막)
+        """
+        fallback = self._check_search_results(search_results)
+        if fallback is not None:
+            yield {"type": "result", **self._fallback_result(fallback)}
+            return
+
+        prompt = self._build_prompt(query, search_results)
+        tracker = CitationTracker()
+        parts: List[str] = []
+
+        # 타임아웃은 다음 토큰 대기에만 적용 (yield 중에는 타임아웃 범위 밖)
+        stream = self.llm_provider.agenerate_stream(prompt)
+
+        try:
+            while True:
+                try:
+                    token = await asyncio.wait_for(
+                        stream.__anext__(),
+                        time_left("llm", self.LLM_TIMEOUT_SECONDS)
+                    )
+                except StopAsyncIteration:
+                    break
+
+                parts.append(token)
+                yield {"type": "token", "text": token}
+
+                if not tracker.found and tracker.feed(token):
+                    yield {"type": "citation"}
+
+        except TimeoutError:
+            logger.error("LLM 스트리밍 타임아웃 (요청 예산 또는 LLM_TIMEOUT_SECONDS 초과)")
+            yield {"type": "result", **self._fallback_result(self.FALLBACK_NO_SOURCE)}
+            return
+
+        except Exception as e:
+            logger.error(f"RAG 스트리밍 답변 생성 실패: {e}")
+            yield {"type": "result", **self._fallback_result(self.FALLBACK_NO_SOURCE)}
+            return
+
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        answer = "".join(parts).strip()
+        if not tracker.found:
+            logger.error(f"출처 미포함 답변 거부: answer='{answer[:100]}...'")
+            answer = self.FALLBACK_NO_SOURCE
+        else:
+            logger.info("RAG 스트리밍 답변 생성 성공 (출처 검증 완료)")
+
+        yield {"type": "result", **self._fallback_result(answer)}
+
+    async def agenerate_answer_with_fallback(
+        self,
+        query: str,
+        search_results: List[SearchResult]
+    ) -> Dict[str, Any]:
+        """
+        Fallback 정보를 포함한 답변 생성 (비동기 버전)
+
+        Args:
+            query: 사용자 질문
+            search_results: 벡터 검색 결과
+
+        Returns:
+            dict: generate_answer_with_fallback과 동일
+        """
+        answer = await self.agenerate_answer(query, search_results)
+        return {
+            **self._fallback_result(answer),
+            "search_results": search_results if answer in self._FALLBACK_REASONS else []
+        }
+
     def generate_answer_with_fallback(
         self,
         query: str,
@@ -278,25 +547,24 @@ class RAGService:
         # 답변 생성 시도
         answer = self.generate_answer(query, search_results)
 
-        # Fallback 여부 확인
-        is_fallback = answer in [
-            self.FALLBACK_NO_DOCUMENTS,
-            self.FALLBACK_LOW_CONFIDENCE,
-            self.FALLBACK_NO_SOURCE
-        ]
-
-        fallback_reason = None
-        if is_fallback:
-            if answer == self.FALLBACK_NO_DOCUMENTS:
-                fallback_reason = "no_documents"
-            elif answer == self.FALLBACK_LOW_CONFIDENCE:
-                fallback_reason = "low_confidence"
-            elif answer == self.FALLBACK_NO_SOURCE:
-                fallback_reason = "no_source_citation"
+        return {
+            **self._fallback_result(answer),
+            "search_results": search_results if answer in self._FALLBACK_REASONS else []
+        }
+
+    def _fallback_result(self, answer: str) -> Dict[str, Any]:
+        """
+        답변의 Fallback 여부/이유 구성
+
+        Args:
+            answer: 최종 답변
 
+        Returns:
+            dict: {"answer", "is_fallback", "fallback_reason"}
+        """
+        fallback_reason = self._FALLBACK_REASONS.get(answer)
         return {
             "answer": answer,
-            "is_fallback": is_fallback,
-            "fallback_reason": fallback_reason,
-            "search_results": search_results if is_fallback else []
+            "is_fallback": fallback_reason is not None,
+            "fallback_reason": fallback_reason
         }
@@ -56,10 +56,7 @@ class ResponseBuilder:
         )
 
         # Step 1: DocumentSource 변환
-        sources = [
-            ResponseBuilder._to_document_source(result)
-            for result in search_results
-        ]
+        sources = ResponseBuilder.build_sources(search_results)
 
         # Step 2: PerformanceMetrics 생성
         perf_metrics = PerformanceMetrics(
@@ -94,6 +91,22 @@ class ResponseBuilder:
 
         return response
 
+    @staticmethod
+    def build_sources(search_results: List[SearchResult]) -> List[DocumentSource]:
+        """
+        검색 결과 리스트 → DocumentSource 리스트 변환
+
+        Args:
+            search_results: 검색 결과 리스트
+
+        Returns:
+            List[DocumentSource]: 문서 출처 리스트
+        """
+        return [
+            ResponseBuilder._to_document_source(result)
+            for result in search_results
+        ]
+
     @staticmethod
     def _to_document_source(result: SearchResult) -> DocumentSource:
         """
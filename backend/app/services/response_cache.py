@@ -0,0 +1,547 @@
+"""
+검색 응답 캐시 (정확 일치)
+
+같은 검색 요청(정규화 쿼리 + limit + 권한 필터 표현식)은 임베딩/Milvus/LLM을
+다시 거치지 않고 이전 응답을 반환합니다. 같은 요청이 동시에 여러 건 들어오면
+첫 요청만 계산하고 나머지는 그 결과를 기다립니다 (request coalescing).
+
+무효화:
+- 키에 컬렉션 버전을 포함하고, 문서 인덱싱/삭제 이벤트(index_events)마다 버전을
+  올립니다. 이전 버전의 항목은 더 이상 조회되지 않고 LRU/TTL로 정리됩니다.
+
+저장소 (ResponseCacheBackend):
+- InMemoryResponseCacheBackend: 프로세스 내 LRU + TTL (기본)
+- SQLiteResponseCacheBackend: 같은 호스트의 워커 프로세스가 공유하는 SQLite 파일
+  (Redis 등 공유 저장소는 ResponseCacheBackend를 구현하여 교체)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.schemas.search import SearchQueryResponse
+from app.schemas.user import UserContext
+from app.services.embedding_cache import normalize_query
+from app.services.index_events import IndexEvent
+from app.services.semantic_cache import cache_scope
+from app.utils.deadline import DeadlineExceeded, time_left, with_deadline
+
+logger = logging.getLogger(__name__)
+
+# LLM 실패로 생긴 Fallback은 일시적이므로 캐시하지 않음
+_UNCACHEABLE_FALLBACK_REASONS = {"no_source_citation"}
+
+
+class ResponseCacheConfig(BaseModel):
+    """검색 응답 캐시 설정"""
+
+    max_entries: int = Field(
+        default_factory=lambda: settings.RESPONSE_CACHE_MAX_ENTRIES,
+        ge=1,
+        description="메모리 저장소 최대 항목 수 (LRU)"
+    )
+    ttl_seconds: float = Field(
+        default_factory=lambda: settings.RESPONSE_CACHE_TTL_SECONDS,
+        gt=0,
+        description="항목 유효 시간 (초)"
+    )
+    shared_path: Optional[str] = Field(
+        default_factory=lambda: settings.RESPONSE_CACHE_SHARED_PATH,
+        description="워커 간 공유 SQLite 파일 경로 (None이면 프로세스 내 LRU)"
+    )
+    wait_timeout_seconds: float = Field(
+        default_factory=lambda: settings.SEARCH_TIMEOUT_SECONDS,
+        gt=0,
+        description="진행 중인 같은 요청의 결과를 기다리는 최대 시간 (요청 예산이 더 적으면 남은 예산)"
+    )
+
+
+class ResponseCacheBackend(ABC):
+    """응답 캐시 저장소 인터페이스 (값은 직렬화된 JSON 문자열)"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """값 조회 (없거나 만료 시 None)"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """값 저장"""
+        pass
+
+    @abstractmethod
+    def version(self) -> int:
+        """현재 컬렉션 버전"""
+        pass
+
+    @abstractmethod
+    def bump_version(self) -> int:
+        """컬렉션 버전 증가 (이전 버전 항목 무효화)"""
+        pass
+
+    def close(self) -> None:
+        """리소스 정리"""
+        pass
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """프로세스 내 LRU + TTL 저장소"""
+
+    def __init__(self, max_entries: int):
+        """
+        Args:
+            max_entries: 최대 항목 수
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.time() > expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def bump_version(self) -> int:
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def size(self) -> int:
+        """현재 항목 수"""
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteResponseCacheBackend(ResponseCacheBackend):
+    """
+    SQLite 공유 저장소 (WAL 모드, 여러 워커 프로세스가 같은 파일 사용)
+
+    컬렉션 버전도 같은 파일에 저장하므로 한 워커의 인덱싱이 모든 워커의
+    캐시를 무효화합니다.
+    """
+
+    _PURGE_EVERY = 200  # set 호출 N회마다 만료 항목 정리
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 파일 경로 (상위 디렉토리가 없으면 생성)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "  key TEXT PRIMARY KEY,"
+            "  value TEXT NOT NULL,"
+            "  expires_at REAL NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_meta ("
+            "  name TEXT PRIMARY KEY,"
+            "  value INTEGER NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO cache_meta (name, value) VALUES ('collection_version', 0)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at >= ?",
+                (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + ttl_seconds)
+            )
+            self._writes += 1
+            if self._writes % self._PURGE_EVERY == 0:
+                self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+            self._conn.commit()
+
+    def version(self) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache_meta WHERE name = 'collection_version'"
+            ).fetchone()
+        return row[0] if row else 0
+
+    def bump_version(self) -> int:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE cache_meta SET value = value + 1 WHERE name = 'collection_version'"
+            )
+            self._conn.commit()
+            row = self._conn.execute(
+                "SELECT value FROM cache_meta WHERE name = 'collection_version'"
+            ).fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SearchResponseCache:
+    """
+    검색 응답 캐시 + 동시 요청 합치기 (스레드 안전)
+
+    진행 중인 계산은 concurrent.futures.Future로 공유하므로 asyncio 태스크와
+    스레드 모두 같은 계산을 기다릴 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ResponseCacheConfig] = None,
+        backend: Optional[ResponseCacheBackend] = None
+    ):
+        """
+        Args:
+            config: 캐시 설정
+            backend: 저장소 (None이면 config.shared_path로 SQLite, 경로가 없거나 열기 실패 시 메모리)
+        """
+        self.config = config or ResponseCacheConfig()
+
+        if backend is None and self.config.shared_path:
+            try:
+                backend = SQLiteResponseCacheBackend(self.config.shared_path)
+            except Exception as e:
+                logger.warning(f"공유 응답 캐시 비활성화 (열기 실패, 메모리 사용): {e}")
+                backend = None
+        self.backend = backend or InMemoryResponseCacheBackend(self.config.max_entries)
+
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+        logger.info(
+            f"SearchResponseCache 초기화: backend={self.backend.__class__.__name__}, "
+            f"ttl={self.config.ttl_seconds}s"
+        )
+
+    def make_key(
+        self,
+        query: str,
+        limit: int,
+        user: Optional[UserContext],
+        namespace: str = ""
+    ) -> str:
+        """
+        캐시 키 생성 (현재 컬렉션 버전 포함)
+
+        Args:
+            query: 검색어 (정규화하여 사용)
+            limit: 최대 결과 수
+            user: 사용자 컨텍스트 (권한 필터 표현식으로 변환)
+            namespace: 응답에 영향을 주는 추가 구분값 (LLM Provider 등)
+
+        Returns:
+            str: "v{버전}:{SHA-256}"
+        """
+        payload = "\x00".join([namespace, normalize_query(query), cache_scope(user, limit)])
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"v{self._version()}:{digest}"
+
+    def get(self, key: str) -> Optional[SearchQueryResponse]:
+        """
+        캐시 조회 (저장소 오류는 미스 처리)
+
+        Args:
+            key: make_key 결과
+
+        Returns:
+            Optional[SearchQueryResponse]: 캐시된 응답
+        """
+        try:
+            value = self.backend.get(key)
+            response = SearchQueryResponse.model_validate_json(value) if value else None
+        except Exception as e:
+            logger.warning(f"응답 캐시 조회 실패 (캐시 미스 처리): {e}")
+            with self._lock:
+                self.errors += 1
+            return None
+
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return response
+
+    def put(self, key: str, response: SearchQueryResponse) -> bool:
+        """
+        응답 저장 (일시적 Fallback은 저장하지 않음)
+
+        Args:
+            key: make_key 결과
+            response: 검색 응답
+
+        Returns:
+            bool: 저장 여부
+        """
+        if response.metadata.fallback_reason in _UNCACHEABLE_FALLBACK_REASONS:
+            return False
+
+        try:
+            self.backend.set(key, response.model_dump_json(), self.config.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"응답 캐시 저장 실패: {e}")
+            with self._lock:
+                self.errors += 1
+            return False
+        return True
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], SearchQueryResponse]
+    ) -> Tuple[SearchQueryResponse, bool]:
+        """
+        캐시 조회, 없으면 계산 (같은 키의 동시 계산은 한 번만)
+
+        진행 중인 계산은 wait_timeout_seconds(요청 예산이 더 적으면 남은 예산)까지만
+        기다리며, 시간이 지나면 직접 계산합니다.
+
+        Args:
+            key: make_key 결과
+            compute: 응답 계산 함수
+
+        Returns:
+            Tuple[SearchQueryResponse, bool]: (응답, 직접 계산 여부)
+
+        Raises:
+            DeadlineExceeded: 기다리는 동안 요청 시간 예산 초과
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached, False
+
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                return self._lead(key, future, compute), True
+            try:
+                return future.result(
+                    timeout=time_left("response_cache", self.config.wait_timeout_seconds)
+                ), False
+            except CancelledError:
+                # 계산 담당 요청이 취소됨 → 다시 시도 (직접 계산 담당이 될 수 있음)
+                continue
+            except DeadlineExceeded:
+                raise
+            except TimeoutError:
+                # 계산 담당 요청이 멈춤 → 합치지 않고 직접 계산 (요청 예산 초과는 그대로 전파)
+                logger.warning("응답 캐시 대기 시간 초과, 직접 계산")
+                return compute(), True
+
+    async def aget_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[SearchQueryResponse]]
+    ) -> Tuple[SearchQueryResponse, bool]:
+        """
+        get_or_compute의 비동기 버전
+
+        대기 중인 요청이 취소되어도 진행 중인 계산은 취소되지 않습니다.
+        계산 담당 요청은 취소/실패/저장 실패 여부와 관계없이 대기 중인 요청에
+        결과를 전달합니다.
+
+        Args:
+            key: make_key 결과
+            compute: 응답 계산 코루틴 함수
+
+        Returns:
+            Tuple[SearchQueryResponse, bool]: (응답, 직접 계산 여부)
+
+        Raises:
+            DeadlineExceeded: 기다리는 동안 요청 시간 예산 초과
+        """
+        cached = await asyncio.to_thread(self.get, key)
+        if cached is not None:
+            return cached, False
+
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                response = await with_deadline(
+                    asyncio.shield(asyncio.wrap_future(future)),
+                    "response_cache",
+                    self.config.wait_timeout_seconds
+                )
+                return response, False
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # 이 요청 자체가 취소됨
+                # 계산 담당 요청이 취소됨 → 다시 시도
+            except DeadlineExceeded:
+                raise
+            except TimeoutError:
+                # 계산 담당 요청이 멈춤 → 합치지 않고 직접 계산
+                logger.warning("응답 캐시 대기 시간 초과, 직접 계산")
+                return await compute(), True
+
+        try:
+            response = await compute()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+
+        # 저장 중 취소/실패되어도 대기 중인 요청에는 계산 결과를 전달
+        try:
+            await asyncio.to_thread(self.put, key, response)
+        finally:
+            self._finish(key, future, response=response)
+        return response, True
+
+    def on_index_event(self, event: IndexEvent) -> None:
+        """index_events 핸들러 (인덱싱/삭제 모두 컬렉션 버전 증가)"""
+        self.invalidate()
+
+    def invalidate(self) -> int:
+        """
+        컬렉션 버전 증가 (모든 기존 항목 무효화)
+
+        Returns:
+            int: 새 버전 (실패 시 -1)
+        """
+        try:
+            version = self.backend.bump_version()
+        except Exception as e:
+            logger.warning(f"응답 캐시 버전 증가 실패: {e}")
+            return -1
+        logger.debug(f"응답 캐시 컬렉션 버전 증가: v{version}")
+        return version
+
+    def stats(self) -> Dict[str, float]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: hits, misses, coalesced, errors, inflight, version, hit_rate
+        """
+        version = self._version()
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "inflight": len(self._inflight),
+                "version": version,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def close(self) -> None:
+        """저장소 정리"""
+        self.backend.close()
+
+    def _version(self) -> int:
+        """현재 컬렉션 버전 (저장소 오류 시 -1 → 캐시 키가 달라져 사실상 미스)"""
+        try:
+            return self.backend.version()
+        except Exception as e:
+            logger.warning(f"응답 캐시 버전 조회 실패: {e}")
+            return -1
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """진행 중인 계산에 합류하거나 새로 등록 (반환: Future, 계산 담당 여부)"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = self._inflight[key] = Future()
+            return future, True
+
+    def _lead(
+        self,
+        key: str,
+        future: Future,
+        compute: Callable[[], SearchQueryResponse]
+    ) -> SearchQueryResponse:
+        """계산 담당 요청의 동기 실행"""
+        try:
+            response = compute()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+
+        try:
+            self.put(key, response)
+        finally:
+            self._finish(key, future, response=response)
+        return response
+
+    def _finish(
+        self,
+        key: str,
+        future: Future,
+        response: Optional[SearchQueryResponse] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """진행 중 목록에서 제거 후 대기 중인 요청에 결과 전달 (한 번만)"""
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        if future.done():
+            return
+        if error is None:
+            future.set_result(response)
+        elif isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(error)
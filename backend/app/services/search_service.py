@@ -7,12 +7,17 @@ Task 2.4 버전: 권한 기반 필터링 추가
 Task 2.6 버전: 출처 추적 및 응답 구성 (RAG 통합, 성능 측정)
 """
 
-from typing import List, Optional
-from app.schemas.search import DocumentSource, SearchQueryResponse
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from app.schemas.search import DocumentSource, PerformanceMetrics, SearchQueryResponse
 from app.schemas.user import UserContext
 from app.services.vector_search import VectorSearchService, SearchResult
 from app.services.rag_service import RAGService
 from app.services.response_builder import ResponseBuilder
+from app.services.response_cache import SearchResponseCache
+from app.services.semantic_cache import CachedAnswer, SemanticAnswerCache, cache_scope
+from app.core.config import settings
+from app.utils.deadline import deadline_scope
 from app.utils.timer import PerformanceTimer
 import logging
 
@@ -22,10 +27,28 @@ logger = logging.getLogger(__name__)
 class SearchService:
     """통합 검색 서비스 (Task 2.3-2.6에서 점진적 완성)"""
 
-    def __init__(self):
-        """SearchService 초기화"""
-        self.vector_search = VectorSearchService()
-        self.rag_service = RAGService(provider_type="ollama")
+    def __init__(
+        self,
+        vector_search: Optional[VectorSearchService] = None,
+        rag_service: Optional[RAGService] = None,
+        answer_cache: Optional[SemanticAnswerCache] = None,
+        response_cache: Optional[SearchResponseCache] = None
+    ):
+        """
+        SearchService 초기화
+
+        Args:
+            vector_search: 벡터 검색 서비스 (기본값: 새 VectorSearchService)
+            rag_service: RAG 서비스 (기본값: Ollama 기반 RAGService)
+            answer_cache: 의미 기반 답변 캐시 (None이면 사용 안 함, asearch/astream_search에서 사용)
+            response_cache: 정확 일치 응답 캐시 (None이면 사용 안 함, search/asearch에서 사용)
+
+        [NOTE] API 요청 경로에서는 ServiceContainer가 만든 공유 인스턴스를 주입합니다.
+        """
+        self.vector_search = vector_search or VectorSearchService()
+        self.rag_service = rag_service or RAGService(provider_type="ollama")
+        self.answer_cache = answer_cache
+        self.response_cache = response_cache
         logger.info("SearchService 초기화 완료 (VectorSearch + RAG)")
 
     def search_documents(
@@ -87,6 +110,9 @@ class SearchService:
         """
         전체 검색 플로우 (Task 2.6 완성: 벡터 검색 + RAG 답변 생성 + 성능 측정)
 
+        response_cache가 있으면 같은 요청(정규화 쿼리, limit, 권한 범위)은 캐시된
+        응답을 반환하고, 동시에 들어온 같은 요청은 계산 1회를 공유합니다.
+
         Args:
             query: 검색어
             limit: 최대 결과 수
@@ -104,6 +130,170 @@ class SearchService:
             f"user={user.user_id if user else 'anonymous'}"
         )
 
+        if self.response_cache is None:
+            return self._run_search(query, limit, user, timer)
+
+        start_time = time.perf_counter()
+        response, computed = self.response_cache.get_or_compute(
+            self._response_cache_key(query, limit, user),
+            lambda: self._run_search(query, limit, user, timer)
+        )
+        return response if computed else self._reuse_response(response, query, start_time)
+
+    async def asearch(
+        self,
+        query: str,
+        limit: int = 5,
+        user: Optional[UserContext] = None,
+        timer: Optional[PerformanceTimer] = None,
+        budget_seconds: Optional[float] = None
+    ) -> SearchQueryResponse:
+        """
+        전체 검색 플로우 (비동기 버전)
+
+        쿼리 임베딩은 비동기 임베딩 서비스로 await 하고, Milvus 검색은 스레드에서
+        실행하여 이벤트 루프를 막지 않습니다. search()와 달리 임베딩 시간을
+        별도로 측정합니다.
+
+        요청 전체에 budget_seconds 시간 예산(Deadline)을 적용하며, 임베딩/Milvus/LLM
+        호출은 각각 남은 시간을 타임아웃으로 사용합니다. 응답 캐시는 search()와 같습니다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            user: 사용자 컨텍스트 (권한 필터링용)
+            timer: 성능 측정 타이머 (없으면 자동 생성)
+            budget_seconds: 시간 예산 (기본값: settings.SEARCH_TIMEOUT_SECONDS)
+
+        Returns:
+            SearchQueryResponse: 구조화된 응답 (답변, 출처, 성능 데이터)
+
+        Raises:
+            DeadlineExceeded: 임베딩/검색 단계에서 시간 예산 초과
+        """
+        if timer is None:
+            timer = PerformanceTimer()
+
+        logger.info(
+            f"검색 플로우 시작 (async): query='{query}', limit={limit}, "
+            f"user={user.user_id if user else 'anonymous'}"
+        )
+
+        with deadline_scope(budget_seconds or settings.SEARCH_TIMEOUT_SECONDS):
+            if self.response_cache is None:
+                return await self._run_asearch(query, limit, user, timer)
+
+            # 같은 요청이 진행 중이면 그 결과를 공유 (계산 담당 요청의 예산 적용)
+            start_time = time.perf_counter()
+            response, computed = await self.response_cache.aget_or_compute(
+                self._response_cache_key(query, limit, user),
+                lambda: self._run_asearch(query, limit, user, timer)
+            )
+        return response if computed else self._reuse_response(response, query, start_time)
+
+    async def astream_search(
+        self,
+        query: str,
+        limit: int = 5,
+        user: Optional[UserContext] = None,
+        timer: Optional[PerformanceTimer] = None,
+        budget_seconds: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        전체 검색 플로우 (스트리밍 버전)
+
+        검색이 끝나는 즉시 출처를 내보내고, 이후 LLM 답변을 토큰 단위로 내보냅니다.
+        asearch()와 같은 시간 예산을 적용합니다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+            user: 사용자 컨텍스트 (권한 필터링용)
+            timer: 성능 측정 타이머 (없으면 자동 생성)
+            budget_seconds: 시간 예산 (기본값: settings.SEARCH_TIMEOUT_SECONDS)
+
+        Yields:
+            Tuple[str, Any]: (이벤트명, 데이터)
+                - ("timing", {"phase": "embedding" | "search" | "first_token", "elapsed_ms": int})
+                - ("sources", {"sources": List[DocumentSource]})
+                - ("token", {"text": str})
+                - ("citation", {"verified": True})
+                - ("done", SearchQueryResponse)
+        """
+        if timer is None:
+            timer = PerformanceTimer()
+
+        logger.info(
+            f"검색 플로우 시작 (stream): query='{query}', limit={limit}, "
+            f"user={user.user_id if user else 'anonymous'}"
+        )
+
+        with deadline_scope(budget_seconds or settings.SEARCH_TIMEOUT_SECONDS):
+            # Step 1: 쿼리 임베딩 생성
+            with timer.measure("embedding"):
+                query_embedding = await self.vector_search.aembed_query(query)
+            yield "timing", {"phase": "embedding", "elapsed_ms": timer.get("embedding")}
+
+            # 캐시 히트: 출처와 답변 전체를 한 번에 전송
+            cached = self._lookup_answer(query_embedding, user, limit)
+            if cached is not None:
+                yield "sources", {"sources": ResponseBuilder.build_sources(cached.search_results)}
+                yield "token", {"text": cached.rag_result["answer"]}
+                yield "citation", {"verified": True}
+                yield "done", self._build_response(
+                    query, cached.rag_result, cached.search_results, timer
+                )
+                return
+
+            # Step 2: 벡터 검색 → 출처 즉시 전송
+            with timer.measure("search"):
+                search_results = await self.vector_search.asearch_by_vector(
+                    query_embedding,
+                    top_k=limit,
+                    user=user,
+                    query=query
+                )
+            yield "timing", {"phase": "search", "elapsed_ms": timer.get("search")}
+            yield "sources", {"sources": ResponseBuilder.build_sources(search_results)}
+
+            # Step 3: RAG 답변 스트리밍 (첫 토큰 시간 측정)
+            rag_result = None
+            llm_start = time.perf_counter()
+            first_token = True
+            with timer.measure("llm"):
+                async for event in self.rag_service.astream_answer(query, search_results):
+                    if event["type"] == "token":
+                        if first_token:
+                            first_token = False
+                            yield "timing", {
+                                "phase": "first_token",
+                                "elapsed_ms": int((time.perf_counter() - llm_start) * 1000)
+                            }
+                        yield "token", {"text": event["text"]}
+                    elif event["type"] == "citation":
+                        yield "citation", {"verified": True}
+                    else:
+                        rag_result = event
+            self._store_answer(query, query_embedding, user, limit, rag_result, search_results)
+
+        # Step 4: 최종 응답 (히스토리 저장/클라이언트 답변 확정용)
+        response = self._build_response(query, rag_result, search_results, timer)
+
+        logger.info(
+            f"검색 플로우 완료 (stream): query_id={response.query_id}, "
+            f"total_time={timer.get_total()}ms, sources={len(search_results)}"
+        )
+
+        yield "done", response
+
+    def _run_search(
+        self,
+        query: str,
+        limit: int,
+        user: Optional[UserContext],
+        timer: PerformanceTimer
+    ) -> SearchQueryResponse:
+        """search()의 캐시 미스 경로 (벡터 검색 + RAG 답변 생성)"""
         # Step 1: 쿼리 임베딩 생성 (성능 측정)
         with timer.measure("embedding"):
             # 임베딩은 vector_search.search 내부에서 수행되지만
@@ -125,7 +315,121 @@ class SearchService:
             )
 
         # Step 4: 응답 구성
-        response = ResponseBuilder.build_search_response(
+        response = self._build_response(query, rag_result, search_results, timer)
+
+        logger.info(
+            f"검색 플로우 완료: query_id={response.query_id}, "
+            f"total_time={timer.get_total()}ms, sources={len(search_results)}"
+        )
+
+        return response
+
+    async def _run_asearch(
+        self,
+        query: str,
+        limit: int,
+        user: Optional[UserContext],
+        timer: PerformanceTimer
+    ) -> SearchQueryResponse:
+        """asearch()의 캐시 미스 경로 (호출자의 Deadline 범위 안에서 실행)"""
+        # Step 1: 쿼리 임베딩 생성 (성능 측정)
+        with timer.measure("embedding"):
+            query_embedding = await self.vector_search.aembed_query(query)
+
+        # 유사 질문의 답변이 캐시에 있으면 검색/LLM 생략
+        cached = self._lookup_answer(query_embedding, user, limit)
+        if cached is not None:
+            search_results, rag_result = cached.search_results, cached.rag_result
+        else:
+            # Step 2: 벡터 검색 (성능 측정)
+            with timer.measure("search"):
+                search_results = await self.vector_search.asearch_by_vector(
+                    query_embedding,
+                    top_k=limit,
+                    user=user,
+                    query=query
+                )
+
+            # Step 3: RAG 답변 생성 (성능 측정)
+            with timer.measure("llm"):
+                rag_result = await self.rag_service.agenerate_answer_with_fallback(
+                    query, search_results
+                )
+            self._store_answer(query, query_embedding, user, limit, rag_result, search_results)
+
+        # Step 4: 응답 구성
+        response = self._build_response(query, rag_result, search_results, timer)
+
+        logger.info(
+            f"검색 플로우 완료 (async): query_id={response.query_id}, "
+            f"total_time={timer.get_total()}ms, sources={len(search_results)}"
+        )
+
+        return response
+
+    def _response_cache_key(
+        self,
+        query: str,
+        limit: int,
+        user: Optional[UserContext]
+    ) -> str:
+        """응답 캐시 키 (LLM Provider별로 분리)"""
+        return self.response_cache.make_key(
+            query, limit, user, namespace=self.rag_service.provider_type
+        )
+
+    @staticmethod
+    def _reuse_response(
+        cached: SearchQueryResponse,
+        query: str,
+        start_time: float
+    ) -> SearchQueryResponse:
+        """
+        캐시/공유 응답을 이 요청의 응답으로 복사 (query_id, 시각, 성능 데이터는 새로)
+
+        Args:
+            cached: 캐시된 응답
+            query: 이 요청의 검색어
+            start_time: 캐시 조회 시작 시각 (perf_counter)
+
+        Returns:
+            SearchQueryResponse: 새 응답
+        """
+        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        logger.info(f"응답 캐시 사용: query='{query}', total_time={elapsed_ms}ms")
+        return SearchQueryResponse(
+            query=query,
+            answer=cached.answer,
+            sources=cached.sources,
+            performance=PerformanceMetrics(
+                embedding_time_ms=0,
+                search_time_ms=0,
+                llm_time_ms=0,
+                total_time_ms=elapsed_ms
+            ),
+            metadata=cached.metadata
+        )
+
+    def _build_response(
+        self,
+        query: str,
+        rag_result: Dict[str, Any],
+        search_results: List[SearchResult],
+        timer: PerformanceTimer
+    ) -> SearchQueryResponse:
+        """
+        RAG 결과 + 성능 데이터로 최종 응답 구성
+
+        Args:
+            query: 검색어
+            rag_result: generate_answer_with_fallback 결과
+            search_results: 벡터 검색 결과
+            timer: 성능 측정 타이머
+
+        Returns:
+            SearchQueryResponse: 구조화된 응답
+        """
+        return ResponseBuilder.build_search_response(
             query=query,
             answer=rag_result["answer"],
             search_results=search_results,
@@ -140,9 +444,55 @@ class SearchService:
             model_used=f"{self.rag_service.provider_type}/llama3"
         )
 
-        logger.info(
-            f"검색 플로우 완료: query_id={response.query_id}, "
-            f"total_time={timer.get_total()}ms, sources={len(search_results)}"
-        )
+    def _lookup_answer(
+        self,
+        query_embedding: List[float],
+        user: Optional[UserContext],
+        limit: int
+    ) -> Optional[CachedAnswer]:
+        """
+        의미 캐시 조회 (캐시 미사용/조회 실패 시 None)
 
-        return response
+        Args:
+            query_embedding: 쿼리 임베딩
+            user: 사용자 컨텍스트
+            limit: 최대 결과 수
+
+        Returns:
+            Optional[CachedAnswer]: 유사 질문의 캐시된 답변
+        """
+        if self.answer_cache is None:
+            return None
+
+        try:
+            cached = self.answer_cache.lookup(query_embedding, cache_scope(user, limit))
+        except Exception as e:
+            logger.warning(f"의미 캐시 조회 실패 (캐시 미스 처리): {e}")
+            return None
+
+        if cached is not None:
+            logger.info(
+                f"의미 캐시 히트: similarity={cached.similarity:.4f}, "
+                f"cached_query='{cached.query}'"
+            )
+        return cached
+
+    def _store_answer(
+        self,
+        query: str,
+        query_embedding: List[float],
+        user: Optional[UserContext],
+        limit: int,
+        rag_result: Dict[str, Any],
+        search_results: List[SearchResult]
+    ) -> None:
+        """의미 캐시 저장 (실패해도 검색 결과에는 영향 없음)"""
+        if self.answer_cache is None or rag_result is None:
+            return
+
+        try:
+            self.answer_cache.put(
+                query, query_embedding, cache_scope(user, limit), rag_result, search_results
+            )
+        except Exception as e:
+            logger.warning(f"의미 캐시 저장 실패: {e}")
@@ -0,0 +1,352 @@
+"""
+의미 기반 답변 캐시 (SemanticAnswerCache)
+
+"연차 사용 방법", "연차는 어떻게 쓰나요"처럼 표현만 다른 질문마다 LLM 답변을
+다시 생성하면 수 초가 걸립니다. 쿼리 임베딩의 코사인 유사도가 임계값 이상인
+이전 질문이 있으면 그 답변과 출처를 그대로 반환합니다.
+
+- 접근 범위(권한 필터 + 결과 수)별로 분리된 인덱스 → 다른 권한의 답변은 절대 재사용 안 함
+- 인덱스: 정규화된 float32 행렬 + 내적 (캐시 크기 수천 건 규모에서는 정확 탐색이
+  별도 ANN 라이브러리보다 단순하고 충분히 빠름)
+- TTL 만료 + 전체 항목 수 기준 LRU 제거
+- 출처 문서가 삭제/재인덱싱되면 (index_events) 해당 문서를 쓰는 항목 무효화
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from itertools import count
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.schemas.user import UserContext
+from app.services.access_control import AccessControlService
+from app.services.index_events import IndexEvent, IndexEventType
+from app.services.vector_search import SearchResult
+
+logger = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 16
+
+
+def cache_scope(user: Optional[UserContext], limit: int) -> str:
+    """
+    캐시 범위 키 (같은 범위 안에서만 답변 재사용)
+
+    권한 범위(AccessScope)가 같은 사용자는 같은 문서를 보므로 답변을 공유합니다.
+
+    Args:
+        user: 사용자 컨텍스트 (None이면 필터 없음)
+        limit: 최대 결과 수
+
+    Returns:
+        str: 범위 키
+    """
+    scope_key = AccessControlService.scope_for(user).cache_key if user else "*"
+    return f"{scope_key}|limit={limit}"
+
+
+class SemanticCacheConfig(BaseModel):
+    """의미 기반 답변 캐시 설정"""
+
+    similarity_threshold: float = Field(
+        default_factory=lambda: settings.SEMANTIC_CACHE_SIMILARITY_THRESHOLD,
+        gt=0,
+        le=1,
+        description="캐시 히트 최소 코사인 유사도"
+    )
+    max_entries: int = Field(
+        default_factory=lambda: settings.SEMANTIC_CACHE_MAX_ENTRIES,
+        ge=1,
+        description="전체 최대 항목 수 (LRU)"
+    )
+    ttl_seconds: float = Field(
+        default_factory=lambda: settings.SEMANTIC_CACHE_TTL_SECONDS,
+        gt=0,
+        description="항목 유효 시간 (초)"
+    )
+
+
+class CachedAnswer(BaseModel):
+    """캐시된 답변"""
+
+    query: str = Field(..., description="최초 질문")
+    rag_result: Dict[str, Any] = Field(..., description="generate_answer_with_fallback 결과")
+    search_results: List[Any] = Field(..., description="답변 근거 검색 결과 (SearchResult)")
+    similarity: float = Field(0.0, description="조회 질문과의 코사인 유사도")
+
+
+class _CacheEntry:
+    """캐시 항목 (내부용)"""
+
+    __slots__ = ("key", "index_key", "query", "rag_result", "search_results", "document_ids", "created_at")
+
+    def __init__(
+        self,
+        key: int,
+        index_key: Tuple[str, int],
+        query: str,
+        rag_result: Dict[str, Any],
+        search_results: List[SearchResult]
+    ):
+        self.key = key
+        self.index_key = index_key
+        self.query = query
+        self.rag_result = rag_result
+        self.search_results = search_results
+        self.document_ids: Set[str] = {result.document_id for result in search_results}
+        self.created_at = time.time()
+
+
+class _ScopeIndex:
+    """
+    범위 하나의 벡터 인덱스 (정규화 벡터 행렬)
+
+    행 추가는 용량을 두 배씩 늘려 amortized O(1), 삭제는 마지막 행과 교체합니다.
+    """
+
+    __slots__ = ("vectors", "keys", "positions")
+
+    def __init__(self, dimension: int):
+        self.vectors = np.empty((_INITIAL_CAPACITY, dimension), dtype=np.float32)
+        self.keys: List[int] = []
+        self.positions: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: int, vector: np.ndarray) -> None:
+        size = len(self.keys)
+        if size == len(self.vectors):
+            grown = np.empty((size * 2, self.vectors.shape[1]), dtype=np.float32)
+            grown[:size] = self.vectors
+            self.vectors = grown
+        self.vectors[size] = vector
+        self.positions[key] = size
+        self.keys.append(key)
+
+    def remove(self, key: int) -> None:
+        position = self.positions.pop(key)
+        last = len(self.keys) - 1
+        if position != last:
+            moved = self.keys[last]
+            self.vectors[position] = self.vectors[last]
+            self.keys[position] = moved
+            self.positions[moved] = position
+        self.keys.pop()
+
+    def nearest(self, vector: np.ndarray) -> Optional[Tuple[int, float]]:
+        """가장 유사한 항목 (키, 코사인 유사도)"""
+        if not self.keys:
+            return None
+        scores = self.vectors[:len(self.keys)] @ vector
+        position = int(np.argmax(scores))
+        return self.keys[position], float(scores[position])
+
+
+def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+    """단위 벡터로 정규화 (0 벡터는 None)"""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return None
+    return vector / norm
+
+
+class SemanticAnswerCache:
+    """
+    쿼리 임베딩 유사도 기반 RAG 답변 캐시 (스레드 안전)
+
+    Fallback 답변은 LLM 호출 없이 만들어지거나(낮은 관련도) 일시적 실패일 수
+    있으므로 저장하지 않습니다.
+    """
+
+    def __init__(self, config: Optional[SemanticCacheConfig] = None):
+        """
+        Args:
+            config: 캐시 설정
+        """
+        self.config = config or SemanticCacheConfig()
+        self._entries: "OrderedDict[int, _CacheEntry]" = OrderedDict()
+        self._indexes: Dict[Tuple[str, int], _ScopeIndex] = {}
+        self._by_document: Dict[str, Set[int]] = {}
+        self._keys = count()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+        logger.info(
+            f"SemanticAnswerCache 초기화: threshold={self.config.similarity_threshold}, "
+            f"max_entries={self.config.max_entries}, ttl={self.config.ttl_seconds}s"
+        )
+
+    def lookup(self, embedding: List[float], scope: str) -> Optional[CachedAnswer]:
+        """
+        유사 질문의 답변 조회
+
+        Args:
+            embedding: 쿼리 임베딩
+            scope: 캐시 범위 키 (cache_scope)
+
+        Returns:
+            Optional[CachedAnswer]: 임계값 이상인 가장 유사한 항목 (없으면 None)
+        """
+        vector = _normalize(embedding)
+
+        with self._lock:
+            index = self._indexes.get((scope, len(embedding)))
+            while vector is not None and index is not None:
+                found = index.nearest(vector)
+                if found is None:
+                    break
+
+                key, similarity = found
+                entry = self._entries[key]
+                if time.time() - entry.created_at > self.config.ttl_seconds:
+                    # 만료 항목은 제거 후 다음 후보 확인
+                    self._remove_locked(key)
+                    self.expirations += 1
+                    continue
+                if similarity < self.config.similarity_threshold:
+                    break
+
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return CachedAnswer(
+                    query=entry.query,
+                    rag_result=entry.rag_result,
+                    search_results=entry.search_results,
+                    similarity=similarity
+                )
+
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        query: str,
+        embedding: List[float],
+        scope: str,
+        rag_result: Dict[str, Any],
+        search_results: List[SearchResult]
+    ) -> bool:
+        """
+        답변 저장
+
+        Args:
+            query: 질문
+            embedding: 쿼리 임베딩
+            scope: 캐시 범위 키 (cache_scope)
+            rag_result: generate_answer_with_fallback 결과
+            search_results: 답변 근거 검색 결과
+
+        Returns:
+            bool: 저장 여부 (Fallback 답변/0 벡터는 저장하지 않음)
+        """
+        vector = _normalize(embedding)
+        if vector is None or rag_result.get("is_fallback") or not search_results:
+            return False
+
+        with self._lock:
+            key = next(self._keys)
+            index_key = (scope, len(vector))
+            entry = _CacheEntry(key, index_key, query, rag_result, list(search_results))
+            self._entries[key] = entry
+
+            index = self._indexes.get(index_key)
+            if index is None:
+                index = self._indexes[index_key] = _ScopeIndex(len(vector))
+            index.add(key, vector)
+
+            for document_id in entry.document_ids:
+                self._by_document.setdefault(document_id, set()).add(key)
+
+            while len(self._entries) > self.config.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+                self.evictions += 1
+
+        return True
+
+    def invalidate_documents(self, document_ids: List[str]) -> int:
+        """
+        문서를 출처로 쓰는 항목 무효화
+
+        Args:
+            document_ids: 변경/삭제된 문서 ID
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        with self._lock:
+            keys: Set[int] = set()
+            for document_id in document_ids:
+                keys.update(self._by_document.get(document_id, ()))
+            for key in keys:
+                self._remove_locked(key)
+            self.invalidations += len(keys)
+
+        if keys:
+            logger.info(f"의미 캐시 무효화: {len(keys)}개 항목 (문서 {len(document_ids)}개 변경)")
+        return len(keys)
+
+    def on_index_event(self, event: IndexEvent) -> None:
+        """
+        index_events 핸들러 (삭제/교체된 문서만 무효화)
+
+        새로 인덱싱된 문서가 더 나은 출처일 수 있는 경우는 TTL로 반영됩니다.
+        """
+        if event.event_type == IndexEventType.REMOVED:
+            self.invalidate_documents(event.document_ids)
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._indexes.clear()
+            self._by_document.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        캐시 통계
+
+        Returns:
+            Dict: hits, misses, evictions, expirations, invalidations, size, hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+    def _remove_locked(self, key: int) -> None:
+        """항목 제거 (lock 보유 상태에서 호출)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        index = self._indexes[entry.index_key]
+        index.remove(key)
+        if not index:
+            del self._indexes[entry.index_key]
+
+        for document_id in entry.document_ids:
+            keys = self._by_document.get(document_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_document[document_id]
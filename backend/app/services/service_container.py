@@ -0,0 +1,437 @@
+"""
+프로세스 전역 서비스 컨테이너
+
+검색 경로에서 사용하는 서비스(임베딩, 벡터 검색, RAG)를 프로세스당 한 번만
+생성하여 재사용합니다. 요청마다 SearchService를 새로 만들면 Ollama 모델 확인
+(client.list())과 Milvus Collection 로드가 매번 반복되기 때문입니다.
+
+생명주기:
+- startup(): main.py lifespan에서 호출, 서비스 생성 + 워밍업
+- reload(): 설정 변경 시 새 서비스를 만든 뒤 원자적으로 교체 (핫 리로드, 답변/응답 캐시 무효화),
+  이전 서비스는 처리 중인 요청이 끝날 유예 시간 뒤에 정리
+- shutdown(): HTTP 연결 풀 정리 (async, 정리 대기 중인 이전 서비스 포함)
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Dict, List, Optional, Set
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.services.embedding_service import (
+    OllamaEmbeddingService,
+    AsyncOllamaEmbeddingService,
+    EmbeddingConfig
+)
+from app.services.embedding_cache import (
+    QueryEmbeddingCache,
+    get_chunk_embedding_cache
+)
+from app.services.index_events import index_events
+from app.services.lexical_index import get_lexical_index
+from app.services.response_cache import SearchResponseCache
+from app.services.semantic_cache import SemanticAnswerCache
+from app.services.vector_search import VectorSearchService
+from app.services.rag_service import RAGService
+from app.services.search_service import SearchService
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainerConfig(BaseModel):
+    """서비스 컨테이너 설정 (핫 리로드 단위)"""
+
+    collection_name: str = Field(
+        default_factory=lambda: settings.MILVUS_COLLECTION_NAME,
+        description="Milvus Collection명"
+    )
+    llm_provider: str = Field(
+        default_factory=lambda: settings.LLM_PROVIDER,
+        description="LLM Provider (ollama, openai)"
+    )
+    embedding: EmbeddingConfig = Field(
+        default_factory=EmbeddingConfig,
+        description="임베딩 서비스 설정"
+    )
+    query_cache_enabled: bool = Field(
+        default_factory=lambda: settings.EMBEDDING_CACHE_ENABLED,
+        description="쿼리 임베딩 캐시 사용 여부"
+    )
+    answer_cache_enabled: bool = Field(
+        default_factory=lambda: settings.SEMANTIC_CACHE_ENABLED,
+        description="의미 기반 답변 캐시 사용 여부"
+    )
+    response_cache_enabled: bool = Field(
+        default_factory=lambda: settings.RESPONSE_CACHE_ENABLED,
+        description="정확 일치 응답 캐시 사용 여부"
+    )
+    warmup: bool = Field(
+        default_factory=lambda: settings.SERVICE_WARMUP_ENABLED,
+        description="생성 직후 워밍업 수행 여부"
+    )
+    retire_grace_seconds: float = Field(
+        default_factory=lambda: settings.SEARCH_TIMEOUT_SECONDS,
+        ge=0.0,
+        description="리로드 후 이전 서비스를 정리하기까지 대기 시간 (처리 중인 요청의 최대 시간)"
+    )
+
+
+class ServiceBundle:
+    """한 번에 생성/교체되는 서비스 묶음"""
+
+    def __init__(
+        self,
+        config: ServiceContainerConfig,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+        answer_cache: Optional[SemanticAnswerCache] = None,
+        response_cache: Optional[SearchResponseCache] = None
+    ):
+        """
+        Args:
+            config: 컨테이너 설정
+            query_cache: 쿼리 임베딩 캐시 (리로드 간 공유)
+            answer_cache: 의미 기반 답변 캐시
+            response_cache: 정확 일치 응답 캐시
+        """
+        self.config = config
+        self.embedding_service = OllamaEmbeddingService(
+            config.embedding,
+            query_cache=query_cache
+        )
+        self.async_embedding_service = AsyncOllamaEmbeddingService(
+            config.embedding,
+            query_cache=query_cache
+        )
+        self.vector_search = VectorSearchService(
+            collection_name=config.collection_name,
+            embedding_service=self.embedding_service,
+            async_embedding_service=self.async_embedding_service,
+            lexical_index=get_lexical_index()
+        )
+        self.rag_service = RAGService(provider_type=config.llm_provider)
+        self.search_service = SearchService(
+            vector_search=self.vector_search,
+            rag_service=self.rag_service,
+            answer_cache=answer_cache,
+            response_cache=response_cache
+        )
+
+    def warm_up(self) -> None:
+        """Milvus Collection 로드 + 임베딩 모델 사전 로드"""
+        self.vector_search.warm_up()
+
+    async def aclose(self) -> None:
+        """보유한 HTTP 연결 풀 정리 (실패해도 계속 진행)"""
+        for resource in (self.embedding_service, self.rag_service):
+            try:
+                resource.close()
+            except Exception as e:
+                logger.warning(f"{resource.__class__.__name__} 정리 실패: {e}")
+
+        for resource in (self.async_embedding_service, self.rag_service):
+            try:
+                await resource.aclose()
+            except Exception as e:
+                logger.warning(f"{resource.__class__.__name__} 비동기 정리 실패: {e}")
+
+
+class ServiceContainer:
+    """프로세스 전역 서비스 컨테이너
+
+    서비스는 최초 사용 시(또는 startup 시) 한 번 생성되며,
+    이후 모든 요청이 같은 인스턴스를 공유합니다.
+    """
+
+    def __init__(self, config: Optional[ServiceContainerConfig] = None):
+        """
+        Args:
+            config: 컨테이너 설정 (None이면 환경 변수 기반 기본값)
+        """
+        self._config = config
+        self._bundle: Optional[ServiceBundle] = None
+        self._lock = threading.Lock()
+        self._query_cache: Optional[QueryEmbeddingCache] = None
+        self._answer_cache: Optional[SemanticAnswerCache] = None
+        self._response_cache: Optional[SearchResponseCache] = None
+        self._retired: List[ServiceBundle] = []  # 리로드로 교체되어 정리 대기 중인 묶음
+        self._close_tasks: Set[asyncio.Task] = set()
+        self.generation = 0  # reload 횟수 (모니터링용)
+
+    @property
+    def config(self) -> ServiceContainerConfig:
+        """현재 설정 (아직 생성 전이면 기본 설정)"""
+        return self._config or ServiceContainerConfig()
+
+    @property
+    def is_ready(self) -> bool:
+        """서비스 생성 완료 여부"""
+        return self._bundle is not None
+
+    def _get_query_cache(
+        self,
+        config: ServiceContainerConfig
+    ) -> Optional[QueryEmbeddingCache]:
+        """쿼리 임베딩 캐시 (리로드 후에도 유지, 키에 모델명이 포함되어 모델 변경에 안전)"""
+        if not config.query_cache_enabled:
+            return None
+        if self._query_cache is None:
+            self._query_cache = QueryEmbeddingCache()
+        return self._query_cache
+
+    def _get_answer_cache(
+        self,
+        config: ServiceContainerConfig
+    ) -> Optional[SemanticAnswerCache]:
+        """의미 기반 답변 캐시 (최초 생성 시 인덱스 변경 이벤트 구독)"""
+        if not config.answer_cache_enabled:
+            return None
+        if self._answer_cache is None:
+            self._answer_cache = SemanticAnswerCache()
+            index_events.subscribe(self._answer_cache.on_index_event)
+        return self._answer_cache
+
+    def _get_response_cache(
+        self,
+        config: ServiceContainerConfig
+    ) -> Optional[SearchResponseCache]:
+        """정확 일치 응답 캐시 (문서 인덱싱/삭제 시 컬렉션 버전 증가)"""
+        if not config.response_cache_enabled:
+            return None
+        if self._response_cache is None:
+            self._response_cache = SearchResponseCache()
+            index_events.subscribe(self._response_cache.on_index_event)
+        return self._response_cache
+
+    def _build(self, config: ServiceContainerConfig) -> ServiceBundle:
+        """새 서비스 묶음 생성 (+ 워밍업)"""
+        bundle = ServiceBundle(
+            config,
+            query_cache=self._get_query_cache(config),
+            answer_cache=self._get_answer_cache(config),
+            response_cache=self._get_response_cache(config)
+        )
+
+        if config.warmup:
+            try:
+                bundle.warm_up()
+            except Exception as e:
+                # 워밍업 실패는 치명적이지 않음 (첫 요청에서 다시 시도됨)
+                logger.warning(f"서비스 워밍업 실패 (계속 진행): {e}")
+
+        return bundle
+
+    def _get_bundle(self) -> ServiceBundle:
+        """서비스 묶음 반환 (없으면 생성)"""
+        bundle = self._bundle
+        if bundle is not None:
+            return bundle
+
+        with self._lock:
+            if self._bundle is None:
+                config = self._config or ServiceContainerConfig()
+                self._bundle = self._build(config)
+                self._config = config
+                self.generation += 1
+                logger.info(f"서비스 컨테이너 초기화 완료: generation={self.generation}")
+            return self._bundle
+
+    def startup(self) -> None:
+        """
+        앱 시작 시 서비스 생성 및 워밍업
+
+        Ollama/Milvus가 아직 준비되지 않았어도 서버 기동은 계속되며,
+        첫 요청에서 다시 생성을 시도합니다.
+        """
+        try:
+            self._get_bundle()
+        except Exception as e:
+            logger.error(f"서비스 컨테이너 초기화 실패 (첫 요청 시 재시도): {e}")
+
+    def reload(
+        self,
+        config: Optional[ServiceContainerConfig] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> int:
+        """
+        서비스 핫 리로드
+
+        새 서비스 묶음을 먼저 완전히 생성/워밍업한 뒤 교체하므로,
+        생성 중에도 기존 서비스로 요청을 계속 처리합니다.
+        처리 중인 요청이 이전 인스턴스를 참조할 수 있으므로 이전 묶음은
+        retire_grace_seconds(검색 요청 시간 예산) 뒤에 한 번 정리합니다.
+
+        비동기 HTTP 클라이언트는 서버 이벤트 루프에 묶여 있으므로 정리도 그 루프에서
+        실행합니다. asyncio.to_thread 등 워커 스레드에서 호출할 때는 서버 루프를
+        loop로 넘겨야 합니다.
+
+        Args:
+            config: 새 설정 (None이면 현재 설정 유지)
+            loop: 이전 묶음을 정리할 이벤트 루프 (None이면 현재 실행 중인 루프)
+
+        Returns:
+            int: 새 generation 번호
+
+        Raises:
+            Exception: 새 서비스 생성 실패 시 (기존 서비스는 유지됨)
+        """
+        new_config = config or self._config or ServiceContainerConfig()
+        new_bundle = self._build(new_config)
+
+        # LLM/임베딩 모델이 바뀌었을 수 있으므로 이전 답변은 재사용하지 않음
+        if self._answer_cache is not None:
+            self._answer_cache.clear()
+        if self._response_cache is not None:
+            self._response_cache.invalidate()
+
+        with self._lock:
+            old_bundle, self._bundle = self._bundle, new_bundle
+            self._config = new_config
+            self.generation += 1
+            generation = self.generation
+
+        if old_bundle is not None:
+            self._retire(old_bundle, new_config.retire_grace_seconds, loop)
+
+        logger.info(
+            f"서비스 컨테이너 리로드 완료: generation={generation}, "
+            f"collection={new_config.collection_name}, "
+            f"llm_provider={new_config.llm_provider}"
+        )
+        return generation
+
+    def _retire(
+        self,
+        bundle: ServiceBundle,
+        grace_seconds: float,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> None:
+        """
+        교체된 서비스 묶음을 유예 시간 뒤에 정리하도록 예약
+
+        정리는 항상 서비스가 사용하던 이벤트 루프에서 실행합니다. 다른 스레드에서
+        호출되어도 call_soon_threadsafe로 그 루프에 타이머를 등록합니다.
+        루프가 없으면(스크립트/테스트) 예약하지 않고 shutdown()에서 정리합니다.
+        유예 시간 전에 shutdown()이 호출되면 shutdown()에서 바로 정리합니다.
+
+        Args:
+            bundle: 교체된 이전 서비스 묶음
+            grace_seconds: 정리 전 대기 시간 (초)
+            loop: 정리를 실행할 이벤트 루프 (None이면 현재 실행 중인 루프)
+        """
+        with self._lock:
+            self._retired.append(bundle)
+
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                logger.info("이벤트 루프 없음: 이전 서비스 묶음은 종료 시 정리")
+                return
+
+        def _schedule_close() -> None:
+            task = loop.create_task(self._close_retired(bundle))
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+
+        loop.call_soon_threadsafe(loop.call_later, grace_seconds, _schedule_close)
+
+    async def _close_retired(self, bundle: ServiceBundle) -> None:
+        """정리 대기 중인 묶음을 한 번만 정리 (이미 정리되었으면 무시)"""
+        with self._lock:
+            if bundle not in self._retired:
+                return
+            self._retired.remove(bundle)
+
+        await bundle.aclose()
+        logger.info("이전 서비스 묶음 정리 완료")
+
+    async def shutdown(self) -> None:
+        """앱 종료 시 연결 풀 정리"""
+        with self._lock:
+            bundle, self._bundle = self._bundle, None
+            retired = list(self._retired)
+
+        for old_bundle in retired:
+            await self._close_retired(old_bundle)
+
+        if bundle is not None:
+            await bundle.aclose()
+            logger.info("서비스 컨테이너 종료 완료")
+
+        if self._query_cache is not None:
+            self._query_cache.close()
+            self._query_cache = None
+
+        if self._answer_cache is not None:
+            index_events.unsubscribe(self._answer_cache.on_index_event)
+            self._answer_cache = None
+
+        if self._response_cache is not None:
+            index_events.unsubscribe(self._response_cache.on_index_event)
+            self._response_cache.close()
+            self._response_cache = None
+
+    def cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        캐시 통계 (모니터링용)
+
+        Returns:
+            Dict: 캐시 이름 → 통계
+        """
+        stats: Dict[str, Dict[str, float]] = {}
+        if self._query_cache is not None:
+            stats["query_embedding"] = self._query_cache.stats()
+        if self._answer_cache is not None:
+            stats["semantic_answer"] = self._answer_cache.stats()
+        if self._response_cache is not None:
+            stats["search_response"] = self._response_cache.stats()
+
+        chunk_cache = get_chunk_embedding_cache()
+        if chunk_cache is not None:
+            stats["chunk_embedding"] = chunk_cache.stats()
+        return stats
+
+    @property
+    def search_service(self) -> SearchService:
+        """공유 SearchService"""
+        return self._get_bundle().search_service
+
+    @property
+    def vector_search(self) -> VectorSearchService:
+        """공유 VectorSearchService"""
+        return self._get_bundle().vector_search
+
+    @property
+    def embedding_service(self) -> OllamaEmbeddingService:
+        """공유 OllamaEmbeddingService"""
+        return self._get_bundle().embedding_service
+
+    @property
+    def async_embedding_service(self) -> AsyncOllamaEmbeddingService:
+        """공유 AsyncOllamaEmbeddingService (세마포어로 동시 요청 수 제한)"""
+        return self._get_bundle().async_embedding_service
+
+    @property
+    def rag_service(self) -> RAGService:
+        """공유 RAGService"""
+        return self._get_bundle().rag_service
+
+
+# Global singleton instance
+service_container = ServiceContainer()
+
+
+def get_service_container() -> ServiceContainer:
+    """
+    FastAPI 의존성: 프로세스 전역 ServiceContainer 반환
+
+    서비스 생성(Ollama/Milvus 연결)은 라우터 내부에서 속성 접근 시점에 일어나므로,
+    요청 검증 오류(422)가 서비스 장애보다 먼저 보고됩니다.
+
+    Usage:
+        @router.post("/")
+        async def search(services: ServiceContainer = Depends(get_service_container)):
+            search_service = services.search_service
+    """
+    return service_container
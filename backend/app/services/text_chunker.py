@@ -1,14 +1,23 @@
 """
 텍스트 청크 분할 로직 구현
 
-LangChain RecursiveCharacterTextSplitter를 활용하여
-파싱된 문서를 RAG 처리에 적합한 크기로 분할합니다.
+RecursiveOffsetSplitter(LangChain RecursiveCharacterTextSplitter와 같은 분할 규칙,
+오프셋 출력)를 활용하여 파싱된 문서를 RAG 처리에 적합한 크기로 분할합니다.
+
+iter_chunks()는 페이지 iterator를 받아 청크를 순서대로 반환하는 스트리밍 모드로,
+문서 전체를 한 문자열로 합치지 않고 윈도우(STREAM_WINDOW_CHUNKS개 청크 크기)만
+유지하므로 메모리 사용량이 문서 크기와 무관하게 페이지 1개 + 윈도우로 제한됩니다.
+
+두 방식 모두 페이지를 이어 붙이면서 페이지 시작 위치(누적 문자 수) 표를 만들고,
+청크 시작 위치를 이진 탐색하여 청크가 시작하는 페이지 번호와 문자 범위를 기록합니다.
 """
 
-from typing import List, Optional
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional
 from pydantic import BaseModel, Field
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from app.services.document_parser.base_parser import ParsedDocument
+from app.services.document_parser.base_parser import ParsedDocument, ParsedPage
+from app.services.text_splitter import RecursiveOffsetSplitter
 
 
 class TextChunk(BaseModel):
@@ -19,6 +28,8 @@ class TextChunk(BaseModel):
     document_id: Optional[str] = Field(None, description="원본 문서 ID")
     document_title: Optional[str] = Field(None, description="원본 문서 제목")
     page_number: Optional[int] = Field(None, ge=1, description="원본 페이지 번호")
+    start_char: Optional[int] = Field(None, ge=0, description="문서 텍스트(페이지를 빈 줄로 연결) 기준 시작 위치")
+    end_char: Optional[int] = Field(None, ge=0, description="문서 텍스트 기준 끝 위치 (포함하지 않음)")
 
     class Config:
         json_schema_extra = {
@@ -27,7 +38,9 @@ class TextChunk(BaseModel):
                 "chunk_index": 0,
                 "document_id": "doc_12345",
                 "document_title": "Sample Document",
-                "page_number": 1
+                "page_number": 1,
+                "start_char": 0,
+                "end_char": 38
             }
         }
 
@@ -65,22 +78,23 @@ class ChunkerConfig(BaseModel):
 class DocumentChunker:
     """문서 청킹 서비스
 
-    ParsedDocument를 받아 LangChain RecursiveCharacterTextSplitter로
-    텍스트를 분할하고 메타데이터를 보존합니다.
+    ParsedDocument를 받아 RecursiveOffsetSplitter로 텍스트를 분할하고
+    메타데이터를 보존합니다. 청크 문자열은 TextChunk를 만들 때만 잘라냅니다.
     """
 
+    # 스트리밍 모드에서 분할 전까지 모아 두는 텍스트 크기 (chunk_size 배수)
+    STREAM_WINDOW_CHUNKS = 8
+
     def __init__(self, config: Optional[ChunkerConfig] = None):
         """
         Args:
             config: 청크 분할 설정 (기본값: chunk_size=500, chunk_overlap=50)
         """
         self.config = config or ChunkerConfig()
-        self.splitter = RecursiveCharacterTextSplitter(
+        self.splitter = RecursiveOffsetSplitter(
             chunk_size=self.config.chunk_size,
             chunk_overlap=self.config.chunk_overlap,
             separators=self.config.separators,
-            length_function=len,
-            is_separator_regex=False,
         )
 
     def chunk_document(self, document: ParsedDocument, document_id: Optional[str] = None) -> List[TextChunk]:
@@ -99,29 +113,124 @@ class DocumentChunker:
         if not document.pages:
             raise ValueError("Document content is empty")
 
-        # 모든 페이지의 텍스트를 연결
-        full_text = "\n\n".join(page.content for page in document.pages if page.content.strip())
+        # 모든 페이지의 텍스트를 연결하면서 페이지 시작 위치(누적 문자 수) 기록
+        texts = []
+        page_starts = array("q")
+        page_numbers = array("l")
+        offset = 0
+        for page in document.pages:
+            if not page.content.strip():
+                continue
+            if texts:
+                offset += 2  # "\n\n"
+            page_starts.append(offset)
+            page_numbers.append(page.page_number)
+            texts.append(page.content)
+            offset += len(page.content)
+
+        full_text = "\n\n".join(texts)
 
         if not full_text.strip():
             raise ValueError("Document content is empty")
 
-        # LangChain splitter로 텍스트 분할
-        text_splits = self.splitter.split_text(full_text)
-
-        # TextChunk 객체 생성 (메타데이터 보존)
+        # TextChunk 객체 생성 (메타데이터 보존, 시작 위치로 페이지 번호 조회)
         chunks = []
-        for idx, text in enumerate(text_splits):
+        for idx, (start, end) in enumerate(self.splitter.split_offsets(full_text)):
             chunk = TextChunk(
-                content=text,
+                content=full_text[start:end],
                 chunk_index=idx,
                 document_id=document_id or document.metadata.get("file_path"),
                 document_title=document.metadata.get("title"),
-                page_number=document.total_pages
+                page_number=page_numbers[bisect_right(page_starts, start) - 1],
+                start_char=start,
+                end_char=end
             )
             chunks.append(chunk)
 
         return chunks
 
+    def iter_chunks(
+        self,
+        pages: Iterable[ParsedPage],
+        document_id: Optional[str] = None,
+        document_title: Optional[str] = None
+    ) -> Iterator[TextChunk]:
+        """페이지 스트림을 청크로 분할 (스트리밍 모드)
+
+        페이지를 chunk_document와 같이 빈 줄("\n\n")로 이어 붙이되, 윈도우 크기만큼
+        쌓일 때마다 완성된 최상위 조각만 분할하여 확정된 청크를 바로 반환합니다.
+        다음 페이지와 합쳐질 수 있는 부분은 만드는 중인 청크의 첫 조각 위치부터 남겨
+        다시 분할하므로 (RecursiveOffsetSplitter.split_complete_offsets)
+        청크 내용, 순서, page_number, 문자 범위가 chunk_document와 같습니다.
+
+        Args:
+            pages: 페이지 iterable (예: parser.iter_pages(file_path))
+            document_id: 문서 식별자 (파일 경로 등)
+            document_title: 문서 제목
+
+        Yields:
+            TextChunk: chunk_index 순서대로 (빈 문서면 반환 없음)
+        """
+        window = self.config.chunk_size * self.STREAM_WINDOW_CHUNKS
+        buffer = ""
+        joined = False  # 이미 반환한 페이지가 있어 다음 페이지 앞에 구분자가 필요한지
+        base = 0  # buffer[0]의 문서 텍스트 기준 위치
+        # 버퍼 안의 페이지 시작 위치와 페이지 번호 (bisect로 청크 시작 페이지 조회)
+        page_starts = array("q")
+        page_numbers = array("l")
+        chunk_index = 0
+
+        for page in pages:
+            if not page.content.strip():
+                continue
+
+            if buffer or joined:
+                buffer += "\n\n"
+            page_starts.append(len(buffer))
+            page_numbers.append(page.page_number)
+            buffer += page.content
+            joined = True
+
+            if len(buffer) < window:
+                continue
+
+            spans, keep = self.splitter.split_complete_offsets(buffer)
+            if not keep:
+                continue
+
+            for start, end in spans:
+                yield TextChunk(
+                    content=buffer[start:end],
+                    chunk_index=chunk_index,
+                    document_id=document_id,
+                    document_title=document_title,
+                    page_number=page_numbers[bisect_right(page_starts, start) - 1],
+                    start_char=base + start,
+                    end_char=base + end
+                )
+                chunk_index += 1
+
+            first = max(bisect_right(page_starts, keep) - 1, 0)
+            buffer = buffer[keep:]
+            base += keep
+            page_starts = array("q", (max(0, start - keep) for start in page_starts[first:]))
+            page_numbers = page_numbers[first:]
+
+        if not buffer.strip():
+            return
+
+        for start, end in self.splitter.split_offsets(buffer):
+            yield TextChunk(
+                content=buffer[start:end],
+                chunk_index=chunk_index,
+                document_id=document_id,
+                document_title=document_title,
+                page_number=page_numbers[bisect_right(page_starts, start) - 1],
+                start_char=base + start,
+                end_char=base + end
+            )
+            chunk_index += 1
+
     def chunk_text(self, text: str, metadata: Optional[dict] = None) -> List[TextChunk]:
         """순수 텍스트를 청크로 분할
 
@@ -138,16 +247,16 @@ class DocumentChunker:
         if not text or not text.strip():
             raise ValueError("Text is empty")
 
-        text_splits = self.splitter.split_text(text)
-
         chunks = []
-        for idx, chunk_text in enumerate(text_splits):
+        for idx, (start, end) in enumerate(self.splitter.split_offsets(text)):
             chunk = TextChunk(
-                content=chunk_text,
+                content=text[start:end],
                 chunk_index=idx,
                 document_id=metadata.get("document_id") if metadata else None,
                 document_title=metadata.get("title") if metadata else None,
-                page_number=metadata.get("page_number") if metadata else None
+                page_number=metadata.get("page_number") if metadata else None,
+                start_char=start,
+                end_char=end
             )
             chunks.append(chunk)
 
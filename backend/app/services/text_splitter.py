@@ -0,0 +1,207 @@
+"""
+오프셋 기반 재귀 텍스트 분할기
+
+LangChain RecursiveCharacterTextSplitter(keep_separator=True, strip_whitespace=True,
+length_function=len)와 같은 청크를 만들되, 부분 문자열을 잘라 다시 합치는 대신
+원문의 (시작, 끝) 위치만 다룹니다.
+
+- 구분자 위치: 구분자별 패턴을 생성 시 한 번 컴파일하고, 구간의 위치만
+  finditer(pos, endpos)로 찾음 (부분 문자열 복사 없음, 각 구간은 우선순위 단계마다 한 번만 스캔)
+- 조각/청크: (start, end) 튜플로만 처리하고 split_text()에서만 문자열로 만듦
+- 의미: 구분자 우선순위, 구분자를 다음 조각 앞에 붙이는 방식, 병합/겹침(overlap) 규칙,
+  청크 앞뒤 공백 제거가 LangChain과 동일 (scripts/benchmark_chunker.py에서 비교)
+"""
+
+import re
+from operator import methodcaller
+from typing import List, Pattern, Tuple
+
+Span = Tuple[int, int]
+
+_match_start = methodcaller("start")
+
+
+class RecursiveOffsetSplitter:
+    """구분자 우선순위 기반 재귀 분할기 (오프셋 출력)"""
+
+    def __init__(self, chunk_size: int, chunk_overlap: int, separators: List[str]):
+        """
+        Args:
+            chunk_size: 청크 최대 크기 (문자 수)
+            chunk_overlap: 청크 간 겹침 크기 (문자 수)
+            separators: 분할 구분자 우선순위 ("" 는 문자 단위 분할)
+
+        Raises:
+            ValueError: chunk_overlap이 chunk_size보다 큰 경우
+        """
+        if chunk_overlap > chunk_size:
+            raise ValueError(
+                f"chunk_overlap({chunk_overlap})이 chunk_size({chunk_size})보다 큽니다"
+            )
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separators = list(separators)
+        self._patterns: List[Pattern] = [re.compile(re.escape(separator)) for separator in self.separators]
+
+    def split_text(self, text: str) -> List[str]:
+        """
+        텍스트를 청크 문자열로 분할
+
+        Args:
+            text: 분할할 텍스트
+
+        Returns:
+            List[str]: 청크 리스트
+        """
+        return [text[start:end] for start, end in self.split_offsets(text)]
+
+    def split_offsets(self, text: str) -> List[Span]:
+        """
+        텍스트를 청크 위치로 분할
+
+        Args:
+            text: 분할할 텍스트
+
+        Returns:
+            List[Span]: 청크의 (시작, 끝) 위치 (원문 순서, 겹침 구간은 중복 포함)
+        """
+        spans: List[Span] = []
+        self._split_range(text, 0, len(text), 0, spans)
+        return spans
+
+    def split_complete_offsets(self, text: str) -> Tuple[List[Span], int]:
+        """
+        뒤에 텍스트가 더 이어지는 앞부분을 분할 (스트리밍 분할용)
+
+        최우선 구분자(separators[0])로 나눈 조각 중 마지막 조각은 뒤 텍스트와 이어질 수
+        있으므로 완성된 조각만 분할합니다. 반환하는 청크는 전체 텍스트를 split_offsets로
+        분할한 결과의 앞부분과 같고, 나머지는 resume 위치부터 뒤 텍스트와 이어 붙여
+        다시 분할하면 전체 분할 결과와 같아집니다.
+
+        - 작은 조각이 이어지는 구간은 병합 중 확정된 청크만 반환하고,
+          아직 만드는 중인 청크의 첫 조각 시작 위치를 resume으로 반환
+        - resume은 항상 최우선 구분자 위치(조각 시작)이므로 이어 붙인 텍스트도
+          같은 구분자 위치에서 나뉨
+
+        Args:
+            text: 전체 텍스트의 앞부분 (조각 시작 위치 또는 텍스트 처음부터)
+
+        Returns:
+            Tuple[List[Span], int]: (확정된 청크 위치, 다시 분할할 시작 위치)
+        """
+        if not self.separators or not self.separators[0]:
+            return [], 0
+
+        occurrences = list(map(_match_start, self._patterns[0].finditer(text)))
+        if not occurrences:
+            return [], 0
+
+        bounds = [0, *occurrences]
+        pieces = [(left, right) for left, right in zip(bounds, bounds[1:]) if left < right]
+        spans: List[Span] = []
+        good: List[Span] = []
+        for piece in pieces:
+            if piece[1] - piece[0] < self.chunk_size:
+                good.append(piece)
+                continue
+
+            if good:
+                self._merge(text, good, spans)
+                good = []
+            if len(self.separators) == 1:
+                spans.append(piece)
+            else:
+                self._split_range(text, piece[0], piece[1], 1, spans)
+
+        if not good:
+            return spans, occurrences[-1]
+        first = self._merge(text, good, spans, final=False)
+        return spans, good[first][0]
+
+    def _split_range(
+        self,
+        text: str,
+        start: int,
+        end: int,
+        level: int,
+        spans: List[Span]
+    ) -> None:
+        """text[start:end]를 separators[level:] 우선순위로 분할하여 spans에 추가"""
+        separators = self.separators[level:]
+        separator = separators[-1] if separators else ""
+        next_level = len(self.separators)
+
+        occurrences = None
+        for i, candidate in enumerate(separators):
+            if candidate == "":
+                separator = candidate
+                break
+            if text.find(candidate, start, end) >= 0:
+                # re.split과 같이 왼쪽부터 겹치지 않게 찾은 위치
+                occurrences = list(map(_match_start, self._patterns[level + i].finditer(text, start, end)))
+                separator = candidate
+                next_level = level + i + 1
+                break
+
+        # 조각: 구분자 앞에서 나눔 (구분자는 다음 조각의 앞에 붙음), 빈 조각 제외
+        if separator == "":
+            pieces = [(i, i + 1) for i in range(start, end)]
+        else:
+            bounds = [start, *(occurrences or ()), end]
+            pieces = [(left, right) for left, right in zip(bounds, bounds[1:]) if left < right]
+
+        good: List[Span] = []
+        for piece in pieces:
+            if piece[1] - piece[0] < self.chunk_size:
+                good.append(piece)
+                continue
+
+            if good:
+                self._merge(text, good, spans)
+                good = []
+            if next_level >= len(self.separators):
+                spans.append(piece)
+            else:
+                self._split_range(text, piece[0], piece[1], next_level, spans)
+
+        if good:
+            self._merge(text, good, spans)
+
+    def _merge(self, text: str, pieces: List[Span], spans: List[Span], final: bool = True) -> int:
+        """
+        연속된 작은 조각을 chunk_size 이하로 병합
+
+        조각은 연속 구간이므로 현재 청크를 pieces[first:index] 범위로만 표현합니다.
+        청크를 내보낸 뒤에는 총 길이가 chunk_overlap 이하가 될 때까지 앞 조각을 버려
+        남은 조각이 다음 청크의 겹침 구간이 됩니다.
+
+        final이 False이면 뒤에 조각이 더 이어지므로 마지막 청크는 내보내지 않습니다.
+        마지막 청크의 첫 조각부터 다시 병합하면 같은 결과가 됩니다.
+
+        Returns:
+            int: 마지막 청크의 첫 조각 번호
+        """
+        first = 0
+        total = 0
+        for index, (start, end) in enumerate(pieces):
+            length = end - start
+            if total + length > self.chunk_size and index > first:
+                self._append_stripped(text, pieces[first][0], pieces[index - 1][1], spans)
+                while total > self.chunk_overlap or (total + length > self.chunk_size and total > 0):
+                    total -= pieces[first][1] - pieces[first][0]
+                    first += 1
+            total += length
+
+        if final:
+            self._append_stripped(text, pieces[first][0], pieces[-1][1], spans)
+        return first
+
+    @staticmethod
+    def _append_stripped(text: str, start: int, end: int, spans: List[Span]) -> None:
+        """앞뒤 공백을 제외한 위치 추가 (공백뿐이면 추가하지 않음)"""
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            spans.append((start, end))
@@ -3,20 +3,40 @@
 
 Milvus 벡터 데이터베이스에서 COSINE 유사도 기반 검색을 수행합니다.
 권한 기반 필터링을 지원합니다.
+
+BM25 역색인(LexicalIndex)이 주어지면 하이브리드 검색을 수행합니다:
+벡터 후보와 BM25 후보를 reciprocal rank fusion으로 합쳐 순위를 정하고,
+BM25에서만 나온 청크는 Milvus에서 조회해 같은 COSINE 관련도 점수를 붙입니다.
 """
 
-from typing import List, Optional
+import asyncio
+import math
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from pydantic import BaseModel, Field
 from pymilvus import Collection
 import logging
 
+from app.core.config import settings
 from app.db.milvus_client import get_milvus_collection
-from app.services.embedding_service import OllamaEmbeddingService
+from app.services.embedding_service import (
+    OllamaEmbeddingService,
+    AsyncOllamaEmbeddingService
+)
 from app.schemas.user import UserContext
-from app.services.access_control import AccessControlService
+from app.services.access_control import (
+    AccessControlService,
+    AccessScope,
+    collection_has_scope_fields
+)
+from app.services.lexical_index import LexicalIndex
+from app.utils.deadline import time_left, with_deadline
 
 logger = logging.getLogger(__name__)
 
+ChunkKey = Tuple[str, int]  # (document_id, chunk_index)
+
 
 @dataclass
 class SearchResult:
@@ -29,22 +49,86 @@ class SearchResult:
     metadata: dict
 
 
+class HybridSearchConfig(BaseModel):
+    """하이브리드 검색 설정"""
+
+    candidates: int = Field(
+        default_factory=lambda: settings.HYBRID_SEARCH_CANDIDATES,
+        description="검색기별 후보 수 (top_k보다 작으면 top_k)"
+    )
+    rrf_k: int = Field(
+        default_factory=lambda: settings.HYBRID_SEARCH_RRF_K,
+        description="RRF 순위 상수"
+    )
+    vector_weight: float = Field(
+        default_factory=lambda: settings.HYBRID_SEARCH_VECTOR_WEIGHT,
+        description="벡터 검색 순위 가중치"
+    )
+    lexical_weight: float = Field(
+        default_factory=lambda: settings.HYBRID_SEARCH_LEXICAL_WEIGHT,
+        description="BM25 검색 순위 가중치"
+    )
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]],
+    weights: Sequence[float],
+    k: int = 60
+) -> List[Tuple[Hashable, float]]:
+    """
+    여러 순위 목록을 reciprocal rank fusion으로 합치기
+
+    score(d) = Σ weight_i / (k + rank_i(d))  (rank는 1부터)
+
+    Args:
+        rankings: 검색기별 결과 키 목록 (순위 순서)
+        weights: 검색기별 가중치
+        k: 순위 상수
+
+    Returns:
+        List[Tuple]: (키, 융합 점수) 점수 내림차순 (동점은 먼저 나온 순서)
+    """
+    scores: Dict[Hashable, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + weight / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """코사인 유사도 (-1 ~ 1, 0 벡터는 0)"""
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    if not norm:
+        return 0.0
+    return sum(x * y for x, y in zip(a, b)) / norm
+
+
 class VectorSearchService:
     """Milvus 벡터 검색 서비스"""
 
     def __init__(
         self,
         collection_name: str = "rag_document_chunks",
-        embedding_service: Optional[OllamaEmbeddingService] = None
+        embedding_service: Optional[OllamaEmbeddingService] = None,
+        async_embedding_service: Optional[AsyncOllamaEmbeddingService] = None,
+        lexical_index: Optional[LexicalIndex] = None,
+        hybrid_config: Optional[HybridSearchConfig] = None
     ):
         """
         Args:
             collection_name: Milvus Collection 이름
             embedding_service: 임베딩 서비스 (기본값: OllamaEmbeddingService)
+            async_embedding_service: 비동기 임베딩 서비스 (asearch에서 사용, 선택)
+            lexical_index: BM25 역색인 (None이면 벡터 검색만)
+            hybrid_config: 하이브리드 검색 설정
         """
         self.collection_name = collection_name
         self.embedding_service = embedding_service or OllamaEmbeddingService()
+        self.async_embedding_service = async_embedding_service
+        self.lexical_index = lexical_index
+        self.hybrid_config = hybrid_config or HybridSearchConfig()
         self.collection: Optional[Collection] = None
+        self.scope_fields_enabled = False  # 스칼라 권한 필드(partition key) 사용 여부
 
         # 검색 파라미터
         self.search_params = {
@@ -52,17 +136,51 @@ class VectorSearchService:
             "params": {"ef": 64}
         }
         self.relevance_threshold = 0.7  # 최소 관련도 점수
+        self.search_batch_size = settings.VECTOR_SEARCH_BATCH_SIZE  # search_many 배치 크기
 
         logger.info(
             f"VectorSearchService 초기화: collection={collection_name}, "
-            f"threshold={self.relevance_threshold}"
+            f"threshold={self.relevance_threshold}, hybrid={lexical_index is not None}"
         )
 
     def _ensure_collection(self):
         """Collection 로드 (lazy loading)"""
         if self.collection is None:
             self.collection = get_milvus_collection(self.collection_name)
-            logger.info(f"Milvus Collection '{self.collection_name}' 로드 완료")
+            self.scope_fields_enabled = collection_has_scope_fields(self.collection)
+            logger.info(
+                f"Milvus Collection '{self.collection_name}' 로드 완료: "
+                f"scope_fields={self.scope_fields_enabled}"
+            )
+
+    def warm_up(self) -> None:
+        """
+        첫 요청 지연 제거를 위한 사전 준비
+
+        Milvus Collection을 로드하고 임베딩 모델을 한 번 호출해
+        Ollama가 모델을 메모리에 올려두도록 합니다.
+        """
+        self._ensure_collection()
+        self.embedding_service.embed_text("warm-up")
+        logger.info(f"VectorSearchService 워밍업 완료: collection={self.collection_name}")
+
+    def _build_filter_expression(self, scope: Optional[AccessScope]) -> Optional[str]:
+        """
+        권한 필터 표현식 선택 (AccessScope에 미리 만들어 둔 표현식)
+
+        Collection에 스칼라 권한 필드가 있으면 partition key(access_scope)로
+        파티션을 프루닝하는 표현식을, 없으면(마이그레이션 전) 기존 metadata JSON
+        경로 표현식을 사용합니다.
+
+        Args:
+            scope: 사용자 권한 범위 (None이면 필터 없음)
+
+        Returns:
+            Optional[str]: Milvus 필터 표현식
+        """
+        if scope is None:
+            return None
+        return scope.expression(self.scope_fields_enabled)
 
     def search(
         self,
@@ -86,87 +204,474 @@ class VectorSearchService:
         """
         self._ensure_collection()
 
-        # Step 1: 권한 필터 표현식 생성
-        filter_expr = None
-        if user:
-            filter_expr = AccessControlService.build_filter_expression(user)
-            logger.info(
-                f"권한 필터 적용: user={user.user_id}, "
-                f"filter='{filter_expr}'"
-            )
-
-        # Step 2: 쿼리 임베딩 생성
+        # Step 1: 쿼리 임베딩 생성
         logger.info(f"검색 시작: query='{query[:50]}...', top_k={top_k}")
         query_embedding = self.embedding_service.embed_query(query)
 
-        # Step 3: Milvus 검색 실행 (필터 포함)
+        # Step 2: Milvus 검색 실행 (권한 필터 포함, BM25 역색인이 있으면 하이브리드)
+        return self.search_by_vector(query_embedding, top_k=top_k, user=user, query=query)
+
+    def search_by_vector(
+        self,
+        query_embedding: List[float],
+        top_k: int = 5,
+        user: Optional[UserContext] = None,
+        query: Optional[str] = None
+    ) -> List[SearchResult]:
+        """
+        임베딩 벡터로 Milvus 검색 실행 (권한 필터링 포함)
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+            top_k: 반환할 최대 결과 수
+            user: 사용자 컨텍스트 (권한 필터링용)
+            query: 검색어 (주어지고 BM25 역색인이 있으면 하이브리드 검색)
+
+        Returns:
+            List[SearchResult]: 검색 결과 (권한 필터링 완료, 벡터 검색은 관련도 순,
+                하이브리드 검색은 RRF 순)
+
+        Raises:
+            ValueError: Collection이 없거나 검색 실패 시
+        """
+        scope = AccessControlService.scope_for(user) if user else None
+        if query and self.lexical_index is not None and len(self.lexical_index):
+            results = self._hybrid_search(query, query_embedding, top_k, scope)
+        else:
+            results = self._search_vectors([query_embedding], top_k, scope)[0]
+
+        logger.info(
+            f"권한 필터링 검색 완료: found={len(results)}, "
+            f"user={user.user_id if user else 'anonymous'}, "
+            f"avg_score={sum(r.relevance_score for r in results) / len(results) if results else 0:.3f}"
+        )
+
+        return results
+
+    def _search_vectors(
+        self,
+        query_embeddings: List[List[float]],
+        top_k: int,
+        scope: Optional[AccessScope]
+    ) -> List[List[SearchResult]]:
+        """
+        같은 권한 범위의 쿼리 벡터들을 Milvus search 1회로 검색
+
+        Args:
+            query_embeddings: 쿼리 임베딩 벡터 리스트 (nq)
+            top_k: 쿼리별 최대 결과 수
+            scope: 권한 범위 (None이면 필터 없음)
+
+        Returns:
+            List[List[SearchResult]]: 입력 순서의 쿼리별 검색 결과
+
+        Raises:
+            ValueError: Collection이 없거나 검색 실패 시
+        """
+        self._ensure_collection()
+
+        filter_expr = self._build_filter_expression(scope)
+        output_fields = ["document_id", "chunk_index", "content", "page_number", "metadata"]
+        if scope is not None and self.scope_fields_enabled:
+            # 결과 후처리(scope.allows)용 권한 필드
+            output_fields += ["access_level", "department"]
+
+        # 요청 Deadline의 남은 시간 (스레드에서 호출돼도 contextvar로 전달됨)
+        timeout = time_left("search")
+
         try:
             search_results = self.collection.search(
-                data=[query_embedding],
+                data=query_embeddings,
                 anns_field="embedding",
                 param=self.search_params,
                 limit=top_k,
                 expr=filter_expr,
-                output_fields=[
-                    "document_id",
-                    "chunk_index",
-                    "content",
-                    "page_number",
-                    "metadata"
-                ]
+                output_fields=output_fields,
+                timeout=timeout
             )
 
-            # Step 4: 결과 파싱 및 필터링
-            results = self._parse_results(search_results[0])
-
-            logger.info(
-                f"권한 필터링 검색 완료: found={len(results)}, "
-                f"user={user.user_id if user else 'anonymous'}, "
-                f"avg_score={sum(r.relevance_score for r in results) / len(results) if results else 0:.3f}"
-            )
-
-            return results
+            # 결과 파싱 및 필터링
+            post_filter = scope if self.scope_fields_enabled else None
+            return [self._parse_results(hits, post_filter) for hits in search_results]
 
         except Exception as e:
             logger.error(f"권한 기반 벡터 검색 실패: {e}")
             raise ValueError(f"벡터 검색 실패: {e}")
 
-    def _parse_results(self, raw_results) -> List[SearchResult]:
+    def _hybrid_search(
+        self,
+        query: str,
+        query_embedding: List[float],
+        top_k: int,
+        scope: Optional[AccessScope]
+    ) -> List[SearchResult]:
         """
-        Milvus 검색 결과 파싱 및 필터링
+        벡터 + BM25 후보를 RRF로 합친 검색
+
+        BM25 검색이나 추가 조회가 실패하면 벡터 검색 결과만 반환합니다.
 
         Args:
-            raw_results: Milvus SearchResult 객체
+            query: 검색어
+            query_embedding: 쿼리 임베딩 벡터
+            top_k: 반환할 최대 결과 수
+            scope: 권한 범위 (None이면 필터 없음)
 
         Returns:
-            List[SearchResult]: 파싱된 검색 결과
+            List[SearchResult]: RRF 순서의 검색 결과 (관련도 임계값 통과분만)
+
+        Raises:
+            ValueError: 벡터 검색 실패 시
         """
-        results = []
+        config = self.hybrid_config
+        candidates = max(top_k, config.candidates)
+        vector_results = self._search_vectors([query_embedding], candidates, scope)[0]
 
-        for hit in raw_results:
-            # COSINE 유사도: -1 ~ 1 → 0 ~ 1로 정규화
-            normalized_score = (hit.score + 1) / 2
-
-            # 관련도 점수 필터링
-            if normalized_score < self.relevance_threshold:
-                logger.debug(
-                    f"낮은 관련도로 제외: score={normalized_score:.3f}, "
-                    f"content='{hit.entity.get('content', '')[:50]}...'"
+        try:
+            lexical_hits = self.lexical_index.search(query, candidates, scope)
+        except Exception as e:
+            logger.warning(f"BM25 검색 실패 (벡터 검색 결과만 사용): {e}")
+            return vector_results[:top_k]
+
+        by_key: Dict[ChunkKey, SearchResult] = {
+            (result.document_id, result.chunk_index): result for result in vector_results
+        }
+        fused = reciprocal_rank_fusion(
+            [list(by_key), [(hit.document_id, hit.chunk_index) for hit in lexical_hits]],
+            [config.vector_weight, config.lexical_weight],
+            k=config.rrf_k
+        )
+
+        # 상위부터 top_k개를 채울 때까지, BM25에서만 나온 청크는 모아서 조회
+        results: List[SearchResult] = []
+        pending = [key for key, _ in fused]
+        while pending and len(results) < top_k:
+            window, pending = pending[:top_k - len(results)], pending[top_k - len(results):]
+            missing = [key for key in window if key not in by_key]
+            if missing:
+                try:
+                    by_key.update(self._fetch_chunks(missing, query_embedding, scope))
+                except Exception as e:
+                    logger.warning(f"BM25 후보 조회 실패 (벡터 검색 결과만 사용): {e}")
+                    return vector_results[:top_k]
+            results.extend(by_key[key] for key in window if key in by_key)
+
+        logger.info(
+            f"하이브리드 검색: vector={len(vector_results)}, lexical={len(lexical_hits)}, "
+            f"fused={len(fused)}, returned={len(results)}"
+        )
+        return results
+
+    def _fetch_chunks(
+        self,
+        keys: List[ChunkKey],
+        query_embedding: List[float],
+        scope: Optional[AccessScope]
+    ) -> Dict[ChunkKey, SearchResult]:
+        """
+        BM25에서만 나온 청크를 Milvus에서 조회해 COSINE 관련도 점수 계산
+
+        Args:
+            keys: (document_id, chunk_index) 리스트
+            query_embedding: 쿼리 임베딩 벡터
+            scope: 권한 범위 (검색과 같은 필터 표현식/후처리 적용)
+
+        Returns:
+            Dict: 키 → 검색 결과 (권한/관련도 임계값을 통과한 청크만)
+        """
+        chunk_indexes: Dict[str, List[int]] = defaultdict(list)
+        for document_id, chunk_index in keys:
+            chunk_indexes[document_id].append(chunk_index)
+        expr = " or ".join(
+            f'(document_id == "{document_id}" and chunk_index in {indexes})'
+            for document_id, indexes in chunk_indexes.items()
+        )
+
+        filter_expr = self._build_filter_expression(scope)
+        if filter_expr:
+            expr = f"({expr}) and ({filter_expr})"
+
+        output_fields = [
+            "document_id", "chunk_index", "content", "page_number", "metadata", "embedding"
+        ]
+        if scope is not None and self.scope_fields_enabled:
+            output_fields += ["access_level", "department"]
+
+        rows = self.collection.query(
+            expr=expr,
+            output_fields=output_fields,
+            timeout=time_left("search")
+        )
+
+        post_filter = scope if self.scope_fields_enabled else None
+        fetched: Dict[ChunkKey, SearchResult] = {}
+        for row in rows:
+            score = _cosine_similarity(query_embedding, row.get("embedding") or [])
+            result = self._to_result(row, score, post_filter)
+            if result is not None:
+                fetched[(result.document_id, result.chunk_index)] = result
+        return fetched
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        users: Optional[Sequence[Optional[UserContext]]] = None
+    ) -> List[List[SearchResult]]:
+        """
+        여러 쿼리 일괄 검색 (평가 작업, 대량 Q&A 도구용)
+
+        search_batch_size개씩 임베딩을 배치로 만들고, 배치 안에서 권한 범위가 같은
+        쿼리끼리 묶어 Milvus search 1회(nq개 벡터)로 검색합니다.
+
+        Args:
+            queries: 검색어 리스트
+            top_k: 쿼리별 최대 결과 수
+            users: 쿼리별 사용자 컨텍스트 (None이면 모두 필터 없음)
+
+        Returns:
+            List[List[SearchResult]]: 입력 순서의 쿼리별 검색 결과
+                (임베딩에 실패한 쿼리는 빈 리스트)
+
+        Raises:
+            ValueError: users 길이가 queries와 다르거나 검색 실패 시
+        """
+        scopes = self._scopes_for(queries, users)
+        results: List[List[SearchResult]] = [[] for _ in queries]
+
+        for start in range(0, len(queries), self.search_batch_size):
+            indices = list(range(start, min(start + self.search_batch_size, len(queries))))
+            embeddings = self.embedding_service.embed_queries([queries[i] for i in indices])
+            for group, vectors, scope in self._group_by_scope(indices, embeddings, scopes):
+                for idx, hits in zip(group, self._search_vectors(vectors, top_k, scope)):
+                    results[idx] = hits
+
+        logger.info(
+            f"일괄 검색 완료: queries={len(queries)}, "
+            f"found={sum(len(hits) for hits in results)}"
+        )
+        return results
+
+    async def asearch_many(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        users: Optional[Sequence[Optional[UserContext]]] = None
+    ) -> List[List[SearchResult]]:
+        """
+        search_many의 비동기 버전 (임베딩은 비동기 서비스, Milvus 호출은 스레드)
+
+        Args:
+            queries: 검색어 리스트
+            top_k: 쿼리별 최대 결과 수
+            users: 쿼리별 사용자 컨텍스트 (None이면 모두 필터 없음)
+
+        Returns:
+            List[List[SearchResult]]: 입력 순서의 쿼리별 검색 결과
+
+        Raises:
+            ValueError: users 길이가 queries와 다르거나 검색 실패 시
+        """
+        scopes = self._scopes_for(queries, users)
+        results: List[List[SearchResult]] = [[] for _ in queries]
+
+        for start in range(0, len(queries), self.search_batch_size):
+            indices = list(range(start, min(start + self.search_batch_size, len(queries))))
+            batch = [queries[i] for i in indices]
+            if self.async_embedding_service is not None:
+                embeddings = await self.async_embedding_service.embed_queries(batch)
+            else:
+                embeddings = await asyncio.to_thread(self.embedding_service.embed_queries, batch)
+
+            for group, vectors, scope in self._group_by_scope(indices, embeddings, scopes):
+                group_results = await asyncio.to_thread(
+                    self._search_vectors, vectors, top_k, scope
                 )
+                for idx, hits in zip(group, group_results):
+                    results[idx] = hits
+
+        logger.info(
+            f"일괄 검색 완료 (async): queries={len(queries)}, "
+            f"found={sum(len(hits) for hits in results)}"
+        )
+        return results
+
+    @staticmethod
+    def _scopes_for(
+        queries: List[str],
+        users: Optional[Sequence[Optional[UserContext]]]
+    ) -> List[Optional[AccessScope]]:
+        """쿼리별 권한 범위 (같은 레벨/부서 사용자는 같은 AccessScope 객체)"""
+        if users is None:
+            return [None] * len(queries)
+        if len(users) != len(queries):
+            raise ValueError(
+                f"users 길이({len(users)})가 queries 길이({len(queries)})와 다릅니다"
+            )
+        return [AccessControlService.scope_for(user) if user else None for user in users]
+
+    @staticmethod
+    def _group_by_scope(
+        indices: List[int],
+        embeddings: List[List[float]],
+        scopes: List[Optional[AccessScope]]
+    ) -> List[Tuple[List[int], List[List[float]], Optional[AccessScope]]]:
+        """
+        배치 안의 쿼리를 권한 범위별로 묶기 (임베딩 실패한 0 벡터는 제외)
+
+        Returns:
+            List[Tuple]: (쿼리 인덱스, 임베딩 벡터, 권한 범위) 그룹
+        """
+        groups: Dict[Optional[AccessScope], Tuple[List[int], List[List[float]]]] = {}
+        for idx, vector in zip(indices, embeddings):
+            if not any(vector):
+                logger.warning(f"임베딩 실패로 검색 제외: query_index={idx}")
                 continue
+            group = groups.setdefault(scopes[idx], ([], []))
+            group[0].append(idx)
+            group[1].append(vector)
+        return [(group[0], group[1], scope) for scope, group in groups.items()]
+
+    async def aembed_query(self, query: str) -> List[float]:
+        """
+        쿼리 임베딩 생성 (이벤트 루프 비차단)
+
+        비동기 임베딩 서비스가 있으면 직접 await 하고,
+        없으면 동기 서비스를 스레드에서 실행합니다.
 
-            result = SearchResult(
-                document_id=hit.entity.get("document_id"),
-                chunk_index=hit.entity.get("chunk_index"),
-                content=hit.entity.get("content"),
-                page_number=hit.entity.get("page_number"),
-                relevance_score=normalized_score,
-                metadata=hit.entity.get("metadata", {})
+        Args:
+            query: 검색어
+
+        Returns:
+            List[float]: 쿼리 임베딩 벡터
+
+        Raises:
+            DeadlineExceeded: 요청 시간 예산 초과
+        """
+        if self.async_embedding_service is not None:
+            return await with_deadline(
+                self.async_embedding_service.embed_query(query), "embedding"
             )
+        return await with_deadline(
+            asyncio.to_thread(self.embedding_service.embed_query, query), "embedding"
+        )
+
+    async def asearch_by_vector(
+        self,
+        query_embedding: List[float],
+        top_k: int = 5,
+        user: Optional[UserContext] = None,
+        query: Optional[str] = None
+    ) -> List[SearchResult]:
+        """
+        search_by_vector의 비동기 버전 (Milvus 호출은 스레드에서 실행)
+
+        pymilvus 클라이언트가 동기 gRPC API만 제공하므로 스레드로 위임합니다.
+        Milvus 호출에는 요청 Deadline의 남은 시간이 timeout으로 전달됩니다.
+        """
+        return await with_deadline(
+            asyncio.to_thread(self.search_by_vector, query_embedding, top_k, user, query),
+            "search"
+        )
+
+    async def asearch(
+        self,
+        query: str,
+        top_k: int = 5,
+        user: Optional[UserContext] = None
+    ) -> List[SearchResult]:
+        """
+        search의 비동기 버전 (이벤트 루프를 막지 않음)
+
+        Args:
+            query: 검색어
+            top_k: 반환할 최대 결과 수
+            user: 사용자 컨텍스트 (권한 필터링용)
+
+        Returns:
+            List[SearchResult]: 검색 결과
+
+        Raises:
+            ValueError: Collection이 없거나 검색 실패 시
+        """
+        logger.info(f"검색 시작 (async): query='{query[:50]}...', top_k={top_k}")
+        query_embedding = await self.aembed_query(query)
+        return await self.asearch_by_vector(
+            query_embedding, top_k=top_k, user=user, query=query
+        )
+
+    def _parse_results(
+        self,
+        raw_results,
+        scope: Optional[AccessScope] = None
+    ) -> List[SearchResult]:
+        """
+        Milvus 검색 결과 파싱 및 필터링
 
-            results.append(result)
+        Args:
+            raw_results: Milvus SearchResult 객체
+            scope: 권한 범위 (주어지면 access_level/department로 한 번 더 확인)
+
+        Returns:
+            List[SearchResult]: 파싱된 검색 결과
+        """
+        results = []
+
+        for hit in raw_results:
+            result = self._to_result(hit.entity, hit.score, scope)
+            if result is not None:
+                results.append(result)
 
         # 관련도 내림차순 정렬 (이미 정렬되어 있지만 명시적으로)
         results.sort(key=lambda r: r.relevance_score, reverse=True)
 
         return results
+
+    def _to_result(
+        self,
+        entity,
+        score: float,
+        scope: Optional[AccessScope] = None
+    ) -> Optional[SearchResult]:
+        """
+        Milvus 엔티티 1건을 SearchResult로 변환 (권한/관련도 필터링)
+
+        Args:
+            entity: 검색 hit의 entity 또는 query 결과 행 (get 지원)
+            score: COSINE 유사도 (-1 ~ 1)
+            scope: 권한 범위 (주어지면 access_level/department로 한 번 더 확인)
+
+        Returns:
+            Optional[SearchResult]: 제외 대상이면 None
+        """
+        # [HARD RULE] 필터와 같은 규칙으로 재확인 (권한 없는 문서 노출 방지)
+        if scope is not None and not scope.allows(
+            entity.get("access_level"),
+            entity.get("department") or None
+        ):
+            logger.warning(
+                f"권한 후처리로 제외: document_id={entity.get('document_id')}"
+            )
+            return None
+
+        # COSINE 유사도: -1 ~ 1 → 0 ~ 1로 정규화
+        normalized_score = (score + 1) / 2
+
+        # 관련도 점수 필터링
+        if normalized_score < self.relevance_threshold:
+            logger.debug(
+                f"낮은 관련도로 제외: score={normalized_score:.3f}, "
+                f"content='{entity.get('content', '')[:50]}...'"
+            )
+            return None
+
+        # page_number는 스칼라 필드가 아니라 metadata JSON에 저장됨
+        metadata = entity.get("metadata") or {}
+
+        return SearchResult(
+            document_id=entity.get("document_id"),
+            chunk_index=entity.get("chunk_index"),
+            content=entity.get("content"),
+            page_number=entity.get("page_number") or metadata.get("page_number"),
+            relevance_score=normalized_score,
+            metadata=entity.get("metadata", {})
+        )
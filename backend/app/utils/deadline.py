@@ -0,0 +1,172 @@
+"""
+요청 단위 시간 예산 (Deadline)
+
+검색 요청마다 Deadline을 만들어 contextvar에 두고, 임베딩/Milvus/LLM 호출은
+남은 시간을 타임아웃으로 사용합니다. contextvar는 asyncio 태스크와
+asyncio.to_thread로 실행되는 스레드에 복사되므로 동시 요청이 각자의 예산을
+가지며, SIGALRM처럼 메인 스레드나 프로세스 전역 알람에 의존하지 않습니다.
+
+Usage:
+    with deadline_scope(settings.SEARCH_TIMEOUT_SECONDS):
+        embedding = await with_deadline(embed(query), "embedding")
+        results = collection.search(..., timeout=time_left("search"))
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """요청 시간 예산 초과"""
+
+    def __init__(self, phase: str):
+        super().__init__(f"요청 시간 예산 초과 (phase={phase})")
+        self.phase = phase
+
+
+class Deadline:
+    """요청 하나의 만료 시각"""
+
+    def __init__(self, budget_seconds: float):
+        """
+        Args:
+            budget_seconds: 요청 전체 시간 예산 (초)
+        """
+        self.budget_seconds = budget_seconds
+        self.expires_at = time.monotonic() + budget_seconds
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 0 이상)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """만료 여부"""
+        return self.remaining() <= 0
+
+    def timeout(self, cap: Optional[float] = None) -> float:
+        """
+        호출에 사용할 타임아웃 (남은 시간과 cap 중 작은 값)
+
+        Args:
+            cap: 호출별 최대 타임아웃 (초)
+
+        Returns:
+            float: 타임아웃 (초)
+        """
+        remaining = self.remaining()
+        return min(remaining, cap) if cap is not None else remaining
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 Deadline (없으면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(budget_seconds: float) -> Iterator[Deadline]:
+    """
+    시간 예산 범위 설정
+
+    이미 바깥 범위가 있으면 더 이른 만료 시각을 사용합니다 (예산은 늘어나지 않음).
+
+    Args:
+        budget_seconds: 시간 예산 (초)
+
+    Yields:
+        Deadline: 이 범위에서 적용되는 Deadline
+    """
+    deadline = Deadline(budget_seconds)
+    outer = _current_deadline.get()
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def time_left(phase: str, cap: Optional[float] = None) -> Optional[float]:
+    """
+    현재 단계에 사용할 타임아웃
+
+    Args:
+        phase: 단계명 (로그/예외용)
+        cap: 단계별 최대 타임아웃 (초)
+
+    Returns:
+        Optional[float]: 타임아웃 (Deadline이 없으면 cap, cap도 없으면 None)
+
+    Raises:
+        DeadlineExceeded: 이미 예산을 모두 사용한 경우
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return cap
+    if deadline.expired:
+        raise DeadlineExceeded(phase)
+    return deadline.timeout(cap)
+
+
+def raise_if_expired(phase: str, error: BaseException) -> None:
+    """
+    타임아웃 발생 시 원인이 요청 예산 소진이면 DeadlineExceeded로 변환
+
+    Args:
+        phase: 단계명
+        error: 발생한 타임아웃 예외
+
+    Raises:
+        DeadlineExceeded: 요청 예산을 모두 사용한 경우
+    """
+    deadline = _current_deadline.get()
+    if deadline is not None and deadline.expired:
+        logger.warning(f"요청 시간 예산 초과: phase={phase}, budget={deadline.budget_seconds}s")
+        raise DeadlineExceeded(phase) from error
+
+
+async def with_deadline(
+    awaitable: Awaitable[T],
+    phase: str,
+    cap: Optional[float] = None
+) -> T:
+    """
+    남은 시간 안에 awaitable 실행 (초과 시 취소)
+
+    Args:
+        awaitable: 실행할 코루틴/퓨처
+        phase: 단계명
+        cap: 단계별 최대 타임아웃 (초)
+
+    Returns:
+        awaitable 결과
+
+    Raises:
+        DeadlineExceeded: 요청 예산 초과
+        TimeoutError: 단계별 cap 초과 (예산은 남음)
+    """
+    try:
+        timeout = time_left(phase, cap)
+    except DeadlineExceeded:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()  # 실행하지 않은 코루틴 경고 방지
+        raise
+
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except TimeoutError as e:
+        raise_if_expired(phase, e)
+        raise
@@ -0,0 +1,35 @@
+"""
+Server-Sent Events 포맷 유틸리티
+
+스트리밍 검색 API(/api/v1/search/stream)에서 사용합니다.
+"""
+
+import json
+from typing import Any
+from pydantic import BaseModel
+
+
+def _to_jsonable(data: Any) -> Any:
+    """pydantic 모델(중첩 포함)을 JSON 직렬화 가능한 값으로 변환"""
+    if isinstance(data, BaseModel):
+        return data.model_dump(mode="json")
+    if isinstance(data, dict):
+        return {key: _to_jsonable(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_to_jsonable(value) for value in data]
+    return data
+
+
+def format_sse(event: str, data: Any) -> str:
+    """
+    SSE 메시지 1개 구성
+
+    Args:
+        event: 이벤트명
+        data: 데이터 (dict 또는 pydantic 모델, JSON으로 직렬화)
+
+    Returns:
+        str: "event: ...\\ndata: ...\\n\\n" 형식 문자열
+    """
+    payload = json.dumps(_to_jsonable(data), ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
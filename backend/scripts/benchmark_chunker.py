@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+청크 분할기 벤치마크
+
+LangChain RecursiveCharacterTextSplitter(기존 DocumentChunker 구현)와
+RecursiveOffsetSplitter(현재 구현)의 분할 처리량을 비교하고, 두 분할기의
+청크가 같은지 확인합니다.
+
+입력 파일을 주지 않으면 PDF 추출 결과와 비슷한 합성 코퍼스(줄 단위 줄바꿈,
+조문/문단 빈 줄, 한국어/영어 혼합, 공백 없는 긴 토큰)를 만들어 사용합니다.
+
+Usage:
+    python scripts/benchmark_chunker.py
+    python scripts/benchmark_chunker.py --size-mb 20 --chunk-size 500 --chunk-overlap 50
+    python scripts/benchmark_chunker.py --files docs/*.txt --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from app.services.text_chunker import ChunkerConfig
+from app.services.text_splitter import RecursiveOffsetSplitter
+
+WORDS = (
+    "연차 휴가 사용 신청 승인 절차 급여 지급 기준 근무 시간 임직원 규정 부서장 "
+    "제출 서식 보고 교육 출장 정산 보안 정보 자산 관리 the policy applies to all "
+    "employees and contractors unless otherwise stated in section appendix"
+).split()
+
+
+def build_corpus(size_mb: float, seed: int) -> List[str]:
+    """PDF 추출 텍스트와 비슷한 합성 문서 생성 (문서당 약 200KB)"""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    documents = []
+    total = 0
+
+    while total < target:
+        lines = []
+        length = 0
+        article = 1
+        while length < 200_000:
+            if rng.random() < 0.08:
+                lines.append(f"\n제{article}조 ({rng.choice(WORDS)})")
+                article += 1
+            words = [rng.choice(WORDS) for _ in range(rng.randint(4, 18))]
+            if rng.random() < 0.02:
+                words.append("https://intranet.example.com/" + "x" * rng.randint(80, 600))
+            line = " ".join(words) + rng.choice([".", "", ","])
+            lines.append(line)
+            length += len(line) + 1
+        document = "\n".join(lines)
+        documents.append(document)
+        total += len(document)
+
+    return documents
+
+
+def measure(split: Callable[[str], list], documents: List[str], repeat: int) -> float:
+    """repeat회 중 최소 처리 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            split(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="청크 분할기 벤치마크 (LangChain 대비)")
+    parser.add_argument("--files", nargs="*", help="입력 텍스트 파일 (없으면 합성 코퍼스)")
+    parser.add_argument("--size-mb", type=float, default=10.0, help="합성 코퍼스 크기 (MB)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="청크 크기 (문자 수)")
+    parser.add_argument("--chunk-overlap", type=int, default=50, help="청크 겹침 크기 (문자 수)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--seed", type=int, default=42, help="합성 코퍼스 시드")
+    args = parser.parse_args()
+
+    if args.files:
+        documents = [Path(path).read_text(encoding="utf-8") for path in args.files]
+    else:
+        documents = build_corpus(args.size_mb, args.seed)
+
+    config = ChunkerConfig(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap)
+    baseline = RecursiveCharacterTextSplitter(
+        chunk_size=config.chunk_size,
+        chunk_overlap=config.chunk_overlap,
+        separators=config.separators,
+        length_function=len,
+        is_separator_regex=False,
+    )
+    native = RecursiveOffsetSplitter(config.chunk_size, config.chunk_overlap, config.separators)
+
+    characters = sum(len(document) for document in documents)
+    print(
+        f"문서 {len(documents):,}개, {characters / 1024 / 1024:.1f}M자, "
+        f"chunk_size={config.chunk_size}, chunk_overlap={config.chunk_overlap}"
+    )
+
+    # 결과 동일성 확인
+    chunk_count = 0
+    for document in documents:
+        expected = baseline.split_text(document)
+        if native.split_text(document) != expected:
+            sys.exit("청크 불일치: RecursiveOffsetSplitter 결과가 LangChain과 다릅니다")
+        chunk_count += len(expected)
+    print(f"청크 {chunk_count:,}개, 두 분할기 결과 동일")
+
+    results = [
+        ("langchain split_text", measure(baseline.split_text, documents, args.repeat)),
+        ("native split_text", measure(native.split_text, documents, args.repeat)),
+        ("native split_offsets", measure(native.split_offsets, documents, args.repeat)),
+    ]
+
+    baseline_time = results[0][1]
+    print(f"{'splitter':<22} | {'time(s)':>8} | {'MB/s':>7} | {'speedup':>7}")
+    print("-" * 54)
+    for name, elapsed in results:
+        print(
+            f"{name:<22} | {elapsed:>8.3f} | "
+            f"{characters / 1024 / 1024 / elapsed:>7.1f} | {baseline_time / elapsed:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+FileScanner 신규 문서 스캔 벤치마크
+
+파일마다 SELECT 하던 기존 방식(N+1)과 기존 문서 경로를 스트리밍 쿼리 1회로
+읽는 현재 방식의 스캔 시간을 코퍼스 크기별로 비교합니다.
+
+DB 왕복 지연은 --latency-ms로 모사합니다 (실제 Postgres 없이 실행 가능).
+코퍼스의 절반은 이미 인덱싱된 문서로 간주합니다.
+
+Usage:
+    python scripts/benchmark_file_scanner.py
+    python scripts/benchmark_file_scanner.py --sizes 1000 10000 50000 --latency-ms 0.5
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Set
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import select
+
+from app.models.document import Document
+from app.scheduler.file_scanner import FileScanner
+
+
+class SimulatedResult:
+    """execute() 결과 (scalar_one_or_none만 지원)"""
+
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+
+class SimulatedStreamResult:
+    """stream() 결과 (partitions만 지원)"""
+
+    def __init__(self, session: "SimulatedSession", rows: List[tuple], batch_size: int):
+        self._session = session
+        self._rows = rows
+        self._batch_size = batch_size
+
+    async def partitions(self):
+        for i in range(0, len(self._rows), self._batch_size):
+            await self._session.round_trip()
+            yield self._rows[i:i + self._batch_size]
+
+
+class SimulatedSession:
+    """쿼리마다 고정 왕복 지연을 주는 AsyncSession 대역"""
+
+    def __init__(self, known_sources: Set[str], latency_ms: float):
+        self.known_sources = known_sources
+        self.latency = latency_ms / 1000
+        self.round_trips = 0
+
+    async def round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+
+    async def execute(self, stmt):
+        await self.round_trip()
+        source = stmt.whereclause.right.value
+        return SimulatedResult(source if source in self.known_sources else None)
+
+    async def rollback(self):
+        pass
+
+    async def stream(self, stmt):
+        await self.round_trip()
+        batch_size = stmt.get_execution_options().get("yield_per", 1000)
+        rows = [(source,) for source in sorted(self.known_sources)]
+        return SimulatedStreamResult(self, rows, batch_size)
+
+
+async def legacy_scan(scanner: FileScanner, db: SimulatedSession) -> int:
+    """기존 방식: 파일마다 존재 여부 SELECT (N+1)"""
+    new_count = 0
+    for walked in scanner.walker.walk_sync():
+        stmt = select(Document).where(Document.source == walked.path)
+        result = await db.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            new_count += 1
+    return new_count
+
+
+def create_corpus(root: Path, size: int) -> Set[str]:
+    """빈 .txt 파일 생성 (100개씩 하위 디렉토리), 절반을 기존 문서로 반환"""
+    known = set()
+    for i in range(size):
+        directory = root / f"dir_{i // 100:05d}"
+        directory.mkdir(exist_ok=True)
+        path = directory / f"doc_{i:07d}.txt"
+        path.touch()
+        if i % 2 == 0:
+            known.add(str(path.absolute()))
+    return known
+
+
+async def run(sizes: List[int], latency_ms: float) -> None:
+    print(f"DB 왕복 지연: {latency_ms}ms")
+    print(f"{'files':>8} | {'legacy(s)':>10} {'queries':>8} | {'streamed(s)':>11} {'queries':>8} | {'speedup':>7}")
+    print("-" * 68)
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            known = create_corpus(Path(tmp), size)
+            scanner = FileScanner(tmp)
+
+            db = SimulatedSession(known, latency_ms)
+            start = time.perf_counter()
+            legacy_new = await legacy_scan(scanner, db)
+            legacy_time = time.perf_counter() - start
+            legacy_queries = db.round_trips
+
+            db = SimulatedSession(known, latency_ms)
+            start = time.perf_counter()
+            new_docs = await scanner.scan_for_new_documents(db)
+            streamed_time = time.perf_counter() - start
+            streamed_queries = db.round_trips
+
+            assert legacy_new == len(new_docs)
+
+            print(
+                f"{size:>8} | {legacy_time:>10.3f} {legacy_queries:>8} | "
+                f"{streamed_time:>11.3f} {streamed_queries:>8} | "
+                f"{legacy_time / streamed_time:>6.1f}x"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FileScanner 스캔 벤치마크")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 5000, 20000],
+        help="코퍼스 크기 (파일 수)"
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.5,
+        help="DB 왕복 지연 (밀리초)"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.sizes, args.latency_ms))
+
+
+if __name__ == "__main__":
+    main()
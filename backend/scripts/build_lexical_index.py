@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+BM25 역색인 전체 재생성
+
+하이브리드 검색용 BM25 역색인(app/services/lexical_index.py)은 DocumentIndexer가
+증분 갱신하지만, 기능 도입 전에 인덱싱된 문서나 색인 파일이 손상된 경우에는
+Milvus에 저장된 청크 본문으로 전체를 다시 만들어야 합니다. 권한 값(access_level,
+department)은 PostgreSQL documents 테이블에서 조회하며, 임베딩은 다시 계산하지 않습니다.
+
+실행 중인 API 서버는 시작 시 불러온 색인을 메모리에 유지하므로, 재생성 후
+서버를 재시작해야 새 색인이 적용됩니다.
+
+Usage:
+    python scripts/build_lexical_index.py
+    python scripts/build_lexical_index.py --output /tmp/lexical_index.npz --documents-per-query 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pymilvus import Collection, connections, utility
+
+from app.core.config import settings
+from app.services.lexical_index import LexicalIndex, LexicalIndexConfig
+from migrate_milvus_access_scope import load_document_scopes
+
+
+def load_chunk_contents(
+    collection: Collection,
+    document_ids: List[str],
+    batch_size: int
+) -> Dict[str, Dict[int, str]]:
+    """
+    문서들의 청크 본문 조회
+
+    Args:
+        collection: Milvus Collection
+        document_ids: 문서 ID 리스트
+        batch_size: query_iterator 배치 크기
+
+    Returns:
+        Dict: document_id → {chunk_index: content}
+    """
+    id_list = ", ".join(f'"{document_id}"' for document_id in document_ids)
+    iterator = collection.query_iterator(
+        batch_size=batch_size,
+        expr=f"document_id in [{id_list}]",
+        output_fields=["document_id", "chunk_index", "content"]
+    )
+
+    contents: Dict[str, Dict[int, str]] = {}
+    try:
+        while True:
+            batch = iterator.next()
+            if not batch:
+                break
+            for entity in batch:
+                contents.setdefault(entity["document_id"], {})[entity["chunk_index"]] = entity["content"]
+    finally:
+        iterator.close()
+
+    return contents
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BM25 역색인 전체 재생성")
+    parser.add_argument("--collection", default=settings.MILVUS_COLLECTION_NAME, help="Milvus Collection")
+    parser.add_argument("--output", default=settings.LEXICAL_INDEX_PATH, help="색인 파일 경로")
+    parser.add_argument("--documents-per-query", type=int, default=100, help="Milvus 조회 1회당 문서 수")
+    parser.add_argument("--batch-size", type=int, default=1000, help="query_iterator 배치 크기")
+    args = parser.parse_args()
+
+    connections.connect(alias="default", host=settings.MILVUS_HOST, port=settings.MILVUS_PORT, timeout=10)
+
+    if not utility.has_collection(args.collection):
+        sys.exit(f"Collection이 없습니다: {args.collection}")
+    collection = Collection(args.collection)
+    collection.load()
+
+    scopes = load_document_scopes()
+    print(f"문서 권한 정보 {len(scopes):,}건 로드")
+
+    index = LexicalIndex(LexicalIndexConfig(path=args.output))
+    document_ids = list(scopes)
+    start = time.perf_counter()
+    missing = 0
+
+    for offset in range(0, len(document_ids), args.documents_per_query):
+        batch_ids = document_ids[offset:offset + args.documents_per_query]
+        contents = load_chunk_contents(collection, batch_ids, args.batch_size)
+
+        for document_id in batch_ids:
+            chunks = contents.get(document_id)
+            if not chunks:
+                # Milvus insert 전이거나 실패한 문서
+                missing += 1
+                continue
+            access_level, department = scopes[document_id]
+            index.add_document(
+                document_id,
+                [chunks[chunk_index] for chunk_index in sorted(chunks)],
+                access_level,
+                department
+            )
+
+        print(f"  documents={min(offset + len(batch_ids), len(document_ids)):,}/{len(document_ids):,}")
+
+    if not index.save():
+        sys.exit(f"색인 저장 실패: {args.output}")
+
+    stats = index.stats()
+    print(
+        f"재생성 완료: 문서 {stats['documents']:,}건, 청크 {stats['chunks']:,}개, "
+        f"토큰 {stats['terms']:,}종, 포스팅 {stats['posting_bytes'] / 1024 / 1024:.1f}MB "
+        f"(Milvus에 없는 문서 {missing:,}건), {time.perf_counter() - start:.1f}s"
+    )
+    print("API 서버를 재시작하면 새 색인이 적용됩니다.")
+
+    connections.disconnect("default")
+
+
+if __name__ == "__main__":
+    main()
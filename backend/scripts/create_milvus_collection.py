@@ -22,35 +22,28 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 load_dotenv()
 
+# Number of hash partitions for the access_scope partition key
+NUM_PARTITIONS = 64
+
+HNSW_INDEX_PARAMS = {
+    "index_type": "HNSW",
+    "metric_type": "COSINE",
+    "params": {
+        "M": 16,
+        "efConstruction": 256
+    }
+}
 
-def create_collection():
-    """Create RAG document chunks collection with HNSW index."""
-
-    # Connection parameters
-    host = os.getenv("MILVUS_HOST", "localhost")
-    port = os.getenv("MILVUS_PORT", "19530")
-    collection_name = os.getenv("MILVUS_COLLECTION_NAME", "rag_document_chunks")
 
-    print(f"Connecting to Milvus at {host}:{port}...")
-    connections.connect(
-        alias="default",
-        host=host,
-        port=port,
-        timeout=10
-    )
+def build_collection_schema() -> CollectionSchema:
+    """
+    Build the RAG document chunks schema.
 
-    # Check if collection already exists
-    if utility.has_collection(collection_name):
-        print(f"⚠️  Collection '{collection_name}' already exists")
-        response = input("Drop and recreate? (yes/no): ")
-        if response.lower() == "yes":
-            utility.drop_collection(collection_name)
-            print(f"Dropped existing collection '{collection_name}'")
-        else:
-            print("Aborting. Collection not modified.")
-            return
-
-    # Define schema
+    access_level and department are scalar fields (not metadata JSON paths),
+    and access_scope ("public" or the document department, see
+    AccessControlService.access_scope) is the partition key so permission-
+    filtered searches only visit the public and the user's department partitions.
+    """
     fields = [
         FieldSchema(
             name="id",
@@ -87,37 +80,86 @@ def create_collection():
             dtype=DataType.JSON,
             description="Additional metadata (page_number, section, etc.)"
         ),
+        FieldSchema(
+            name="access_level",
+            dtype=DataType.INT8,
+            description="Document access level (1=Public, 2=Internal, 3=Confidential)"
+        ),
+        FieldSchema(
+            name="department",
+            dtype=DataType.VARCHAR,
+            max_length=100,
+            description="Document department (empty if none)"
+        ),
+        FieldSchema(
+            name="access_scope",
+            dtype=DataType.VARCHAR,
+            max_length=100,
+            is_partition_key=True,
+            description="Partition key: 'public' for L1 documents, otherwise department"
+        ),
     ]
 
-    schema = CollectionSchema(
+    return CollectionSchema(
         fields=fields,
         enable_dynamic_field=True,
         description="RAG document chunks with embeddings for semantic search"
     )
 
+
+def create_indexes(collection: Collection) -> None:
+    """Create the HNSW vector index and the access_level scalar index."""
+    collection.create_index(
+        field_name="embedding",
+        index_params=HNSW_INDEX_PARAMS,
+        index_name="embedding_hnsw_index"
+    )
+    collection.create_index(
+        field_name="access_level",
+        index_name="access_level_index"
+    )
+
+
+def create_collection():
+    """Create RAG document chunks collection with HNSW index."""
+
+    # Connection parameters
+    host = os.getenv("MILVUS_HOST", "localhost")
+    port = os.getenv("MILVUS_PORT", "19530")
+    collection_name = os.getenv("MILVUS_COLLECTION_NAME", "rag_document_chunks")
+
+    print(f"Connecting to Milvus at {host}:{port}...")
+    connections.connect(
+        alias="default",
+        host=host,
+        port=port,
+        timeout=10
+    )
+
+    # Check if collection already exists
+    if utility.has_collection(collection_name):
+        print(f"⚠️  Collection '{collection_name}' already exists")
+        response = input("Drop and recreate? (yes/no): ")
+        if response.lower() == "yes":
+            utility.drop_collection(collection_name)
+            print(f"Dropped existing collection '{collection_name}'")
+        else:
+            print("Aborting. Collection not modified.")
+            return
+
+    schema = build_collection_schema()
+
     print(f"Creating collection '{collection_name}'...")
     collection = Collection(
         name=collection_name,
         schema=schema,
-        using="default"
+        using="default",
+        num_partitions=NUM_PARTITIONS
     )
 
     # Create HNSW index
-    print("Creating HNSW index on 'embedding' field...")
-    index_params = {
-        "index_type": "HNSW",
-        "metric_type": "COSINE",
-        "params": {
-            "M": 16,
-            "efConstruction": 256
-        }
-    }
-
-    collection.create_index(
-        field_name="embedding",
-        index_params=index_params,
-        index_name="embedding_hnsw_index"
-    )
+    print("Creating HNSW index on 'embedding' and scalar index on 'access_level'...")
+    create_indexes(collection)
 
     print("Loading collection into memory...")
     collection.load()
@@ -129,6 +171,7 @@ def create_collection():
     print(f"   Index: HNSW (M=16, efConstruction=256)")
     print(f"   Metric: COSINE")
     print(f"   Dimension: 768")
+    print(f"   Partition key: access_scope ({NUM_PARTITIONS} partitions)")
     print(f"   Entities: {collection.num_entities}")
 
     # Show schema
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Milvus Collection 권한 필드 마이그레이션
+
+기존 Collection(권한 정보 없음, metadata JSON만 보유)의 엔티티를 스칼라 권한 필드
+(access_level, department)와 partition key(access_scope)가 있는 새 스키마
+(scripts/create_milvus_collection.py)로 복사합니다. 권한 값은 PostgreSQL
+documents 테이블에서 document_id로 조회하며, 임베딩은 다시 계산하지 않습니다.
+
+1. 대상 Collection 생성 ({source}_scoped, 이미 있으면 중단)
+2. query_iterator로 원본을 배치 단위로 읽어 권한 컬럼을 붙여 insert
+3. flush 후 엔티티 수 검증
+4. --swap: 원본 삭제 후 대상 Collection을 원본 이름으로 변경
+
+--swap 전까지 API는 원본 Collection을 계속 사용합니다. 복사 중 인덱싱된 문서는
+누락될 수 있으므로 스케줄러를 멈춘 상태에서 실행하거나, swap 후 전체 재스캔을
+실행하세요.
+
+Usage:
+    python scripts/migrate_milvus_access_scope.py
+    python scripts/migrate_milvus_access_scope.py --batch-size 2000 --swap
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pymilvus import Collection, connections, utility
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.document import Document
+from app.services.access_control import AccessControlService, collection_has_scope_fields
+from create_milvus_collection import (
+    NUM_PARTITIONS,
+    build_collection_schema,
+    create_indexes
+)
+
+SOURCE_FIELDS = ["document_id", "content", "embedding", "chunk_index", "metadata"]
+
+
+def load_document_scopes() -> Dict[str, Tuple[int, Optional[str]]]:
+    """
+    PostgreSQL 문서별 권한 정보 조회
+
+    Returns:
+        Dict: document_id → (access_level, department)
+    """
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(Document.id, Document.access_level, Document.department)
+        ).all()
+    return {str(document_id): (level, department) for document_id, level, department in rows}
+
+
+def copy_entities(
+    source: Collection,
+    target: Collection,
+    scopes: Dict[str, Tuple[int, Optional[str]]],
+    batch_size: int
+) -> Tuple[int, int]:
+    """
+    원본 엔티티에 권한 컬럼을 붙여 대상 Collection에 insert
+
+    Args:
+        source: 원본 Collection
+        target: 새 스키마 Collection
+        scopes: document_id → (access_level, department)
+        batch_size: 배치 크기
+
+    Returns:
+        Tuple[int, int]: (복사한 엔티티 수, PostgreSQL에 없어 건너뛴 엔티티 수)
+    """
+    copied = skipped = 0
+    iterator = source.query_iterator(
+        batch_size=batch_size,
+        expr="",
+        output_fields=SOURCE_FIELDS
+    )
+
+    try:
+        while True:
+            batch = iterator.next()
+            if not batch:
+                break
+
+            columns = [[] for _ in range(8)]
+            for entity in batch:
+                scope = scopes.get(entity["document_id"])
+                if scope is None:
+                    # 삭제된 문서의 잔여 엔티티는 옮기지 않음
+                    skipped += 1
+                    continue
+
+                # 컬럼 순서는 DocumentIndexer.build_milvus_rows와 동일
+                access_level, department = scope
+                values = [
+                    entity["document_id"],
+                    entity["content"],
+                    entity["embedding"],
+                    entity["chunk_index"],
+                    entity.get("metadata") or {},
+                    access_level,
+                    department or "",
+                    AccessControlService.access_scope(access_level, department),
+                ]
+                for column, value in zip(columns, values):
+                    column.append(value)
+
+            if columns[0]:
+                target.insert(columns)
+                copied += len(columns[0])
+            print(f"  copied={copied:,} skipped={skipped:,}")
+    finally:
+        iterator.close()
+
+    return copied, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Milvus 권한 필드(partition key) 마이그레이션")
+    parser.add_argument("--source", default=settings.MILVUS_COLLECTION_NAME, help="원본 Collection")
+    parser.add_argument("--target", default=None, help="대상 Collection (기본값: {source}_scoped)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="query_iterator 배치 크기")
+    parser.add_argument("--swap", action="store_true", help="검증 후 원본을 삭제하고 대상을 원본 이름으로 변경")
+    args = parser.parse_args()
+
+    target_name = args.target or f"{args.source}_scoped"
+
+    connections.connect(alias="default", host=settings.MILVUS_HOST, port=settings.MILVUS_PORT, timeout=10)
+
+    if not utility.has_collection(args.source):
+        sys.exit(f"원본 Collection이 없습니다: {args.source}")
+    source = Collection(args.source)
+    if collection_has_scope_fields(source):
+        print(f"'{args.source}'는 이미 권한 필드가 있습니다. 마이그레이션이 필요 없습니다.")
+        return
+    if utility.has_collection(target_name):
+        sys.exit(f"대상 Collection이 이미 있습니다: {target_name} (삭제 후 다시 실행)")
+
+    source.load()
+    scopes = load_document_scopes()
+    print(f"문서 권한 정보 {len(scopes):,}건 로드")
+
+    target = Collection(
+        name=target_name,
+        schema=build_collection_schema(),
+        num_partitions=NUM_PARTITIONS
+    )
+    create_indexes(target)
+    print(f"대상 Collection 생성: {target_name} ({NUM_PARTITIONS} partitions)")
+
+    start = time.perf_counter()
+    copied, skipped = copy_entities(source, target, scopes, args.batch_size)
+    target.flush()
+    elapsed = time.perf_counter() - start
+
+    print(f"복사 완료: {copied:,}건 (건너뜀 {skipped:,}건), {elapsed:.1f}s")
+
+    expected = source.num_entities - skipped
+    if target.num_entities != expected:
+        sys.exit(
+            f"엔티티 수 불일치: target={target.num_entities:,}, expected={expected:,} "
+            f"(원본은 유지됨, {target_name} 확인 필요)"
+        )
+
+    if args.swap:
+        source.release()
+        utility.drop_collection(args.source)
+        utility.rename_collection(target_name, args.source)
+        Collection(args.source).load()
+        print(f"교체 완료: '{target_name}' → '{args.source}' (API 서버 재시작 또는 /admin/services/reload 필요)")
+    else:
+        print(f"확인 후 --swap으로 교체하세요: {target_name} → {args.source}")
+
+    connections.disconnect("default")
+
+
+if __name__ == "__main__":
+    main()
@@ -114,13 +114,15 @@ def test_quality_evaluation_sample_questions():
 
     results = []
 
-    for sample in SAMPLE_QUESTIONS:
+    # 1. 벡터 검색 (전체 질문을 배치 임베딩 + Milvus 검색 1회로)
+    all_search_results = vector_search.search_many(
+        [sample["question"] for sample in SAMPLE_QUESTIONS], top_k=3
+    )
+
+    for sample, search_results in zip(SAMPLE_QUESTIONS, all_search_results):
         question_id = sample["id"]
         question = sample["question"]
 
-        # 1. 벡터 검색
-        search_results = vector_search.search(question, top_k=3)
-
         # 2. RAG 답변 생성
         answer = rag_service.generate_answer(question, search_results)
 
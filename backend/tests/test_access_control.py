@@ -5,7 +5,10 @@ AccessControlService의 필터 표현식 생성 및 문서 접근 검증을 테
 """
 
 import pytest
-from app.services.access_control import AccessControlService
+from unittest.mock import MagicMock
+from app.services.access_control import AccessControlService, collection_has_scope_fields
+from app.services.document_indexer import DocumentIndexer
+from app.services.vector_search import VectorSearchService
 from app.schemas.user import UserContext
 
 
@@ -233,3 +236,112 @@ def test_l3_user_filter_expression_structure():
 
     # 부서 조건 (모든 레벨)
     assert '(metadata["department"] == "Finance")' in filter_expr
+
+
+def test_partition_filter_matches_document_access_rules():
+    """TC13: 스칼라 필드 필터는 모든 사용자/문서 조합에서 can_access_document와 일치"""
+    users = [
+        UserContext("u1", 1, "Engineering"),
+        UserContext("u2", 2, "Engineering"),
+        UserContext("u3", 3, "Engineering"),
+        UserContext("u4", 2, "Management"),
+    ]
+    documents = [
+        (level, department)
+        for level in (1, 2, 3)
+        for department in ("Engineering", "Sales", None)
+    ]
+
+    for user in users:
+        filter_expr = AccessControlService.build_partition_filter_expression(user)
+        for level, department in documents:
+            # Milvus 표현식 문법(==, in [...], and)은 Python 식으로도 평가 가능
+            visible = eval(filter_expr, {}, {
+                "access_level": level,
+                "access_scope": AccessControlService.access_scope(level, department),
+            })
+            assert visible == AccessControlService.can_access_document(
+                user, level, department
+            ), (user, level, department, filter_expr)
+
+
+def test_partition_filter_prunes_to_public_and_own_department():
+    """TC14: 부서 사용자의 필터는 Public + 자부서 파티션만 지정"""
+    filter_expr = AccessControlService.build_partition_filter_expression(
+        UserContext("u1", 3, 'R&D "Lab"')
+    )
+
+    assert filter_expr == 'access_scope in ["public", "R&D \\"Lab\\""]'
+    assert AccessControlService.build_partition_filter_expression(
+        UserContext("u2", 1, "Sales")
+    ) == 'access_scope == "public"'
+    assert AccessControlService.access_scope(1, "Sales") == "public"
+    assert AccessControlService.access_scope(2, "Sales") == "Sales"
+
+
+def test_scope_fields_detected_from_collection_schema():
+    """TC15: Collection 스키마에 권한 필드가 있을 때만 스칼라 필터/컬럼 사용"""
+    legacy = MagicMock()
+    legacy.schema.fields = [MagicMock(), MagicMock()]
+    legacy.schema.fields[0].name = "document_id"
+    legacy.schema.fields[1].name = "metadata"
+    scoped = MagicMock()
+    scoped.schema.fields = []
+    for name in ("document_id", "metadata", "access_level", "department", "access_scope"):
+        field = MagicMock()
+        field.name = name
+        scoped.schema.fields.append(field)
+
+    assert collection_has_scope_fields(legacy) is False
+    assert collection_has_scope_fields(scoped) is True
+
+    chunks = [MagicMock(content="본문", document_title="t", page_number=1)] * 2
+    legacy_rows = DocumentIndexer.build_milvus_rows("doc-1", chunks, [[0.0]] * 2)
+    scoped_rows = DocumentIndexer.build_milvus_rows("doc-1", chunks, [[0.0]] * 2, 2, "Sales")
+
+    assert len(legacy_rows) == 5
+    assert scoped_rows[5:] == [[2, 2], ["Sales", "Sales"], ["Sales", "Sales"]]
+
+
+def test_scope_is_memoized_per_level_and_department():
+    """TC16: 같은 (레벨, 부서) 사용자는 같은 AccessScope 객체 공유"""
+    first = AccessControlService.scope_for(UserContext("u1", 2, "Engineering"))
+    second = AccessControlService.scope_for(UserContext("u2", 2, "Engineering"))
+    other = AccessControlService.scope_for(UserContext("u3", 2, "Sales"))
+
+    assert first is second
+    assert first is not other
+    assert first.cache_key != other.cache_key
+    assert first.expression(scope_fields=False) == AccessControlService.build_filter_expression(
+        UserContext("u4", 2, "Engineering")
+    )
+    assert first.expression(scope_fields=True) == first.milvus_expression
+
+
+def test_scope_rejects_unsafe_expression():
+    """TC17: 검증에 실패하는 표현식(위험한 키워드 포함 부서명)은 범위 생성 거부"""
+    with pytest.raises(ValueError):
+        AccessControlService.scope_for(UserContext("u1", 2, "Ops; DROP"))
+
+
+def test_vector_search_post_filters_with_scope():
+    """TC18: 스칼라 권한 필드 Collection의 검색 결과는 scope.allows로 재확인"""
+    def hit(document_id, access_level, department):
+        entity = {
+            "document_id": document_id,
+            "chunk_index": 0,
+            "content": "본문",
+            "access_level": access_level,
+            "department": department,
+        }
+        return MagicMock(score=0.9, entity=entity)
+
+    service = VectorSearchService(embedding_service=MagicMock())
+    scope = AccessControlService.scope_for(UserContext("u1", 2, "Engineering"))
+
+    results = service._parse_results(
+        [hit("public", 1, ""), hit("own", 2, "Engineering"), hit("leak", 3, "Engineering")],
+        scope
+    )
+
+    assert [result.document_id for result in results] == ["public", "own"]
@@ -0,0 +1,164 @@
+"""
+요청 시간 예산 (Deadline) 테스트
+
+deadline_scope 중첩, with_deadline 취소, 스레드/동시 요청 간 예산 전달,
+RAGService의 SIGALRM 없는 LLM 타임아웃과 /search 504 응답을 검증합니다.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.rag_service import RAGService
+from app.services.service_container import get_service_container
+from app.utils.deadline import (
+    DeadlineExceeded,
+    current_deadline,
+    deadline_scope,
+    time_left,
+    with_deadline
+)
+
+
+def _rag_service(generate):
+    """generate 동작을 지정한 Provider를 가진 RAGService"""
+    provider = MagicMock()
+    provider.generate.side_effect = generate
+    with patch("app.services.rag_service.OllamaProvider", return_value=provider):
+        return RAGService(provider_type="ollama"), provider
+
+
+def test_nested_scope_never_extends_budget():
+    """TC01: 안쪽 범위는 바깥 예산을 넘지 못하고, 범위를 벗어나면 해제"""
+    assert current_deadline() is None
+    assert time_left("llm", cap=60) == 60
+
+    with deadline_scope(1.0) as outer:
+        with deadline_scope(100.0) as inner:
+            assert inner is outer
+            assert time_left("llm", cap=60) <= 1.0
+        with deadline_scope(0.5) as tighter:
+            assert tighter is not outer
+            assert time_left("llm") <= 0.5
+
+    assert current_deadline() is None
+
+
+def test_time_left_raises_after_expiry():
+    """TC02: 예산을 모두 사용하면 DeadlineExceeded (단계명 포함)"""
+    with deadline_scope(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            time_left("search")
+
+    assert exc_info.value.phase == "search"
+    assert isinstance(exc_info.value, TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_with_deadline_cancels_and_propagates_to_threads():
+    """TC03: 남은 시간 초과 시 취소, to_thread 작업에도 같은 Deadline 전달"""
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with deadline_scope(0.05):
+        thread_timeout = await asyncio.to_thread(time_left, "search")
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            await with_deadline(slow(), "embedding")
+
+    assert 0 < thread_timeout <= 0.05
+    assert exc_info.value.phase == "embedding"
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_have_independent_budgets():
+    """TC04: 동시 요청은 각자의 예산을 가짐 (짧은 예산만 초과)"""
+    async def request(budget):
+        with deadline_scope(budget):
+            await with_deadline(asyncio.sleep(0.1), "llm")
+            return budget
+
+    results = await asyncio.gather(request(0.02), request(5.0), return_exceptions=True)
+
+    assert isinstance(results[0], DeadlineExceeded)
+    assert results[1] == 5.0
+
+
+def test_sync_llm_timeout_works_off_main_thread():
+    """TC05: 메인 스레드가 아니어도 LLM 타임아웃 동작, 예산 소진은 재시도 없음"""
+    rag_service, provider = _rag_service(lambda prompt: time.sleep(0.5) or "답변")
+    errors = []
+
+    def worker():
+        with deadline_scope(0.05):
+            try:
+                rag_service._generate_with_retry("프롬프트")
+            except Exception as e:
+                errors.append(e)
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    elapsed = time.perf_counter() - start
+    rag_service.close()
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], DeadlineExceeded)
+    assert provider.generate.call_count == 1
+    assert elapsed < 0.4
+
+
+@pytest.mark.asyncio
+async def test_async_answer_falls_back_on_deadline():
+    """TC06: 비동기 답변 생성은 예산 초과 시 LLM 호출을 취소하고 Fallback"""
+    rag_service, provider = _rag_service(lambda prompt: "답변")
+
+    async def agenerate(prompt):
+        await asyncio.sleep(10)
+
+    provider.agenerate = agenerate
+    results = [MagicMock(relevance_score=0.9, content="본문", metadata={}, page_number=1)]
+
+    with deadline_scope(0.05):
+        start = time.perf_counter()
+        with patch.object(rag_service, "_build_prompt", return_value="프롬프트"):
+            result = await rag_service.agenerate_answer_with_fallback("연차", results)
+        elapsed = time.perf_counter() - start
+    rag_service.close()
+
+    assert result["answer"] == RAGService.FALLBACK_NO_SOURCE
+    assert result["is_fallback"] is True
+    assert elapsed < 1.0
+
+
+def test_search_endpoint_returns_504_on_deadline():
+    """TC07: /search는 예산 초과 시 504와 일반화된 메시지 반환"""
+    services = MagicMock()
+    services.search_service.asearch = AsyncMock(side_effect=DeadlineExceeded("search"))
+
+    app.dependency_overrides[get_service_container] = lambda: services
+    try:
+        with patch("app.routers.search.history_sink") as sink:
+            response = TestClient(app).post(
+                "/api/v1/search/",
+                json={"query": "연차 사용 방법은 무엇인가요"}
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 504
+    assert response.json()["detail"] == {
+        "error": "GatewayTimeout",
+        "message": "검색 처리 시간이 초과되었습니다."
+    }
@@ -0,0 +1,87 @@
+"""
+병렬 디렉토리 순회 테스트
+
+DirectoryWalker의 필터링/심볼릭 링크 차단과
+IndexingQueue의 스트리밍 처리(순회 중 인덱싱 시작)를 검증합니다.
+"""
+
+import asyncio
+import os
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.scheduler.directory_walker import DirectoryWalker
+from app.scheduler.indexing_queue import IndexingQueue
+from app.services.indexing_pipeline import PipelineConfig
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """3단계 하위 디렉토리 + 지원/미지원 파일 + 심볼릭 링크"""
+    for i in range(5):
+        sub = tmp_path / f"dept_{i}" / "2024"
+        sub.mkdir(parents=True)
+        (sub / f"policy_{i}.pdf").write_bytes(b"%PDF")
+        (sub / f"notes_{i}.MD").write_text("# 메모")
+        (sub / f"image_{i}.png").write_bytes(b"\x89PNG")
+    os.symlink(tmp_path / "dept_0", tmp_path / "link_dir")
+    os.symlink(tmp_path / "dept_0" / "2024" / "policy_0.pdf", tmp_path / "link.pdf")
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_walk_filters_and_skips_symlinks(corpus):
+    """TC01: 확장자 필터(대소문자 무시) + 심볼릭 링크 제외 + stat 정보 포함"""
+    walker = DirectoryWalker(str(corpus), extensions={".pdf", ".md"}, max_workers=4)
+
+    walked = [item async for item in walker.walk()]
+
+    assert len(walked) == 10
+    assert all("link" not in item.path for item in walked)
+    pdf = next(item for item in walked if item.name == "policy_1.pdf")
+    assert pdf.size == 4
+    assert pdf.mtime == os.stat(pdf.path).st_mtime
+    assert sorted(walked) == sorted(walker.walk_sync())
+
+
+@pytest.mark.asyncio
+async def test_queue_starts_before_walk_finishes():
+    """TC02: 스트림의 첫 문서는 마지막 문서가 나오기 전에 인덱싱 시작"""
+    events = []
+
+    async def documents():
+        for i in range(3):
+            events.append(f"yield-{i}")
+            yield {"file_path": f"/docs/{i}.txt"}
+            await asyncio.sleep(0.01)
+
+    def fake_parse(file_path):
+        events.append(f"index-{file_path}")
+        return MagicMock(), [MagicMock(content=file_path)]
+
+    def fake_store(batch):
+        for item in batch:
+            item.succeed("doc-id")
+        return 0
+
+    queue = IndexingQueue(
+        pipeline_config=PipelineConfig(parse_workers=2, use_process_pool=False)
+    )
+    embedding_service = AsyncMock()
+    embedding_service.config = MagicMock(model_name="m")
+    embedding_service.embed_batch.side_effect = lambda texts: [[1.0] for _ in texts]
+
+    with patch(
+        "app.services.indexing_pipeline.AsyncOllamaEmbeddingService",
+        return_value=embedding_service
+    ), \
+            patch("app.services.indexing_pipeline.get_milvus_collection"), \
+            patch("app.services.indexing_pipeline.get_chunk_embedding_cache", return_value=None), \
+            patch("app.services.indexing_pipeline.parse_and_chunk", side_effect=fake_parse), \
+            patch(
+                "app.services.indexing_pipeline.IndexingPipeline._store_documents",
+                side_effect=fake_store
+            ):
+        results = await queue.process_stream(documents())
+
+    assert results["success"] == 3
+    assert events.index("index-/docs/0.txt") < events.index("yield-2")
@@ -0,0 +1,177 @@
+"""
+임베딩 캐시 테스트
+
+QueryEmbeddingCache의 정규화/LRU/TTL/디스크 계층 동작과
+ChunkEmbeddingCache의 재인덱싱 시 재사용 동작을 검증합니다.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from app.services.embedding_cache import (
+    QueryEmbeddingCache,
+    ChunkEmbeddingCache,
+    SQLiteEmbeddingStore,
+    EmbeddingCacheConfig,
+    normalize_query,
+    make_cache_key,
+)
+from app.services.embedding_service import OllamaEmbeddingService, EmbeddingConfig
+from app.services.document_indexer import DocumentIndexer
+
+
+def _config(**kwargs) -> EmbeddingCacheConfig:
+    """디스크 계층 없는 기본 설정"""
+    values = {"max_entries": 100, "ttl_seconds": 60, "disk_path": None}
+    values.update(kwargs)
+    return EmbeddingCacheConfig(**values)
+
+
+def test_normalize_query():
+    """TC01: 공백/대소문자/유니코드 정규화"""
+    decomposed = "\u1100\u1161 \u1100\u1161"  # 자모 분리 입력 ("가 가")
+    assert normalize_query("  연차   사용\t방법 ") == "연차 사용 방법"
+    assert normalize_query("HR Policy") == "hr policy"
+    assert normalize_query(decomposed) == "가 가"
+
+
+def test_key_includes_model_name():
+    """TC02: 모델이 다르면 다른 키"""
+    assert make_cache_key("급여 지급일", "a") != make_cache_key("급여 지급일", "b")
+    assert make_cache_key("급여  지급일", "a") == make_cache_key("급여 지급일", "a")
+
+
+def test_hit_and_miss_counters():
+    """TC03: 히트/미스 카운터 및 float32 저장"""
+    cache = QueryEmbeddingCache(_config())
+
+    assert cache.get("연차 사용 방법", "m") is None
+    cache.put("연차 사용 방법", "m", [0.1, 0.2, 0.3])
+    vector = cache.get(" 연차 사용  방법", "m")
+
+    assert vector == pytest.approx([0.1, 0.2, 0.3], rel=1e-6)
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    stored, _ = next(iter(cache._entries.values()))
+    assert stored.dtype == np.float32
+
+
+def test_lru_eviction():
+    """TC04: 최대 항목 수 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = QueryEmbeddingCache(_config(max_entries=2))
+    cache.put("a", "m", [1.0])
+    cache.put("b", "m", [2.0])
+    cache.get("a", "m")  # a를 최근 사용으로
+    cache.put("c", "m", [3.0])
+
+    assert cache.get("b", "m") is None
+    assert cache.get("a", "m") == [1.0]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    """TC05: TTL 경과 항목은 미스"""
+    cache = QueryEmbeddingCache(_config(ttl_seconds=10))
+    with patch("app.services.embedding_cache.time.time", return_value=1000.0):
+        cache.put("a", "m", [1.0])
+    with patch("app.services.embedding_cache.time.time", return_value=1011.0):
+        assert cache.get("a", "m") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_disk_tier_shared_between_instances(tmp_path):
+    """TC06: 디스크 계층은 다른 인스턴스(워커)와 공유"""
+    path = str(tmp_path / "cache" / "embeddings.db")
+    writer = QueryEmbeddingCache(_config(disk_path=path))
+    writer.put("급여 지급일", "m", [0.5, 0.25])
+
+    reader = QueryEmbeddingCache(_config(disk_path=path))
+    assert reader.get("급여 지급일", "m") == [0.5, 0.25]
+    assert reader.stats()["disk_hits"] == 1
+
+    writer.close()
+    reader.close()
+
+
+def test_embed_query_uses_cache():
+    """TC07: 캐시 히트 시 Ollama 호출 생략"""
+    client = MagicMock()
+    model = MagicMock()
+    model.model = "nomic-embed-text:latest"
+    client.list.return_value = MagicMock(models=[model])
+    client.embeddings.return_value = {"embedding": [0.5] * 768}
+
+    with patch("app.services.embedding_service.ollama.Client", return_value=client):
+        service = OllamaEmbeddingService(
+            EmbeddingConfig(),
+            query_cache=QueryEmbeddingCache(_config())
+        )
+        first = service.embed_query("연차 사용 방법")
+        second = service.embed_query("연차  사용 방법")
+
+    assert first == second
+    assert client.embeddings.call_count == 1
+
+
+# ============================================================================
+# Chunk Embedding Cache Tests
+# ============================================================================
+
+
+@pytest.fixture
+def chunk_cache(tmp_path):
+    """임시 SQLite 파일 기반 청크 캐시"""
+    store = SQLiteEmbeddingStore(str(tmp_path / "chunks.db"))
+    yield ChunkEmbeddingCache(store)
+    store.close()
+
+
+def test_chunk_cache_content_addressed(chunk_cache):
+    """TC08: 원문이 같으면 히트, 한 글자라도 다르면 미스 (정규화 없음)"""
+    chunk_cache.put_many(["제1조 목적", "제2조 정의"], "m", [[1.0, 2.0], [3.0, 4.0]])
+
+    vectors = chunk_cache.get_many(["제2조 정의", "제1조  목적", "제1조 목적"], "m")
+
+    assert vectors == [[3.0, 4.0], None, [1.0, 2.0]]
+    assert chunk_cache.get_many(["제1조 목적"], "other-model") == [None]
+    assert chunk_cache.stats()["hits"] == 2
+
+
+def test_chunk_cache_skips_zero_vectors(chunk_cache):
+    """TC09: 임베딩 실패로 대체된 0 벡터는 저장하지 않음"""
+    chunk_cache.put_many(["ok", "failed"], "m", [[1.0], [0.0]])
+
+    assert chunk_cache.get_many(["ok", "failed"], "m") == [[1.0], None]
+
+
+def test_reindex_embeds_only_changed_chunks(chunk_cache):
+    """TC10: 재인덱싱 시 캐시 미스 청크만 Ollama로 전송 + 히트율 보고"""
+    embedding_service = MagicMock()
+    embedding_service.config = EmbeddingConfig(expected_dimension=2)
+    embedding_service.embed_batch.side_effect = lambda texts: [
+        [float(len(text)), 1.0] for text in texts
+    ]
+
+    with patch("app.services.document_indexer.get_milvus_collection"):
+        indexer = DocumentIndexer(
+            db_session=MagicMock(),
+            embedding_service=embedding_service,
+            chunk_cache=chunk_cache
+        )
+
+    def run(texts):
+        chunks = [MagicMock(content=text) for text in texts]
+        with patch.object(indexer, "_parse_and_chunk", return_value=(MagicMock(), chunks)), \
+                patch.object(indexer, "_save_document_metadata", return_value=MagicMock(id=1)), \
+                patch.object(indexer, "_save_to_milvus", side_effect=lambda document_id, chunks, embeddings: len(embeddings)):
+            return indexer.index_document("doc.txt")
+
+    first = run(["a", "bb", "ccc"])
+    second = run(["a", "bb", "dddd"])
+
+    assert first.cache_hits == 0
+    assert second.cache_hits == 2
+    assert second.cache_hit_rate == pytest.approx(2 / 3, abs=1e-4)
+    assert embedding_service.embed_batch.call_args.args[0] == ["dddd"]
@@ -4,9 +4,13 @@
 OllamaEmbeddingService의 동작을 검증합니다.
 """
 
+import asyncio
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from tenacity import wait_none
 from app.services.embedding_service import (
     OllamaEmbeddingService,
+    AsyncOllamaEmbeddingService,
     EmbeddingConfig,
     EmbeddingServiceError,
     EmbeddingDimensionError,
@@ -170,3 +174,157 @@ def test_different_texts_different_embeddings(embedding_service):
 
     # 다른 텍스트는 다른 임베딩을 생성해야 함
     assert embedding1 != embedding2
+
+
+# ============================================================================
+# Batch Mode Tests (Ollama Mock)
+# ============================================================================
+
+
+def _fake_vector(text: str, dimension: int = 768):
+    """텍스트 길이 기반 결정적 가짜 벡터"""
+    return [float(len(text))] * dimension
+
+
+@pytest.fixture
+def mock_client():
+    """Ollama Client Mock (모델 목록 + /api/embed 다중 입력)"""
+    client = MagicMock()
+    model = MagicMock()
+    model.model = "nomic-embed-text:latest"
+    client.list.return_value = MagicMock(models=[model])
+    client.embed.side_effect = lambda model, input: {
+        "embeddings": [_fake_vector(text) for text in input]
+    }
+    client.embeddings.side_effect = lambda model, prompt: {
+        "embedding": _fake_vector(prompt)
+    }
+    with patch("app.services.embedding_service.ollama.Client", return_value=client):
+        yield client
+
+
+def test_batch_uses_multi_input_requests(mock_client):
+    """TC13: batch_size 단위로 다중 입력 요청 전송"""
+    service = OllamaEmbeddingService(EmbeddingConfig(batch_size=4, max_in_flight=2))
+    texts = [f"text {i}" for i in range(10)]
+
+    embeddings = service.embed_batch(texts)
+
+    assert mock_client.embed.call_count == 3  # 4 + 4 + 2
+    assert mock_client.embeddings.call_count == 0
+    assert embeddings == [_fake_vector(text) for text in texts]
+
+
+def test_batch_preserves_order_and_empty_texts(mock_client):
+    """TC14: 입력 순서 유지 + 빈 텍스트는 요청 없이 0 벡터"""
+    service = OllamaEmbeddingService(EmbeddingConfig(batch_size=2))
+    texts = ["a", "", "ccc", "  ", "ee"]
+
+    embeddings = service.embed_batch(texts)
+
+    assert embeddings[0] == _fake_vector("a")
+    assert embeddings[2] == _fake_vector("ccc")
+    assert embeddings[4] == _fake_vector("ee")
+    assert all(x == 0.0 for x in embeddings[1])
+    assert all(x == 0.0 for x in embeddings[3])
+    sent = [text for call in mock_client.embed.call_args_list for text in call.kwargs["input"]]
+    assert sent == ["a", "ccc", "ee"]
+
+
+def test_batch_failure_isolated_per_item(mock_client):
+    """TC15: 배치 요청 실패 시 항목별 재시도, 실패 항목만 0 벡터"""
+    mock_client.embed.side_effect = RuntimeError("batch failed")
+
+    def single(model, prompt):
+        if prompt == "bad":
+            raise RuntimeError("item failed")
+        return {"embedding": _fake_vector(prompt)}
+
+    mock_client.embeddings.side_effect = single
+    service = OllamaEmbeddingService(EmbeddingConfig(batch_size=8, max_retries=1))
+
+    # 항목별 재시도 대기 시간 제거 (테스트 시간 단축)
+    with patch.object(OllamaEmbeddingService.embed_text.retry, "wait", wait_none()):
+        embeddings = service.embed_batch(["good", "bad", "fine"])
+
+    assert embeddings[0] == _fake_vector("good")
+    assert all(x == 0.0 for x in embeddings[1])
+    assert embeddings[2] == _fake_vector("fine")
+
+
+def test_batch_dimension_mismatch_raises(mock_client):
+    """TC16: 배치 전체에 차원 검증 적용"""
+    mock_client.embed.side_effect = lambda model, input: {
+        "embeddings": [_fake_vector(text, dimension=384) for text in input]
+    }
+    service = OllamaEmbeddingService(EmbeddingConfig(batch_size=8))
+
+    with pytest.raises(EmbeddingDimensionError):
+        service.embed_batch(["one", "two"])
+
+
+# ============================================================================
+# Async Client Tests (Ollama Mock)
+# ============================================================================
+
+
+@pytest.fixture
+def mock_async_client():
+    """Ollama AsyncClient Mock (동시 요청 수 기록)"""
+    client = MagicMock()
+    state = {"in_flight": 0, "peak": 0}
+
+    async def embed(model, input):
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return {"embeddings": [_fake_vector(text) for text in input]}
+
+    client.embed = AsyncMock(side_effect=embed)
+    client.state = state
+    with patch("app.services.embedding_service.ollama.AsyncClient", return_value=client):
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_async_batch_bounded_concurrency(mock_async_client):
+    """TC17: 배치 요청은 동시에 스케줄링되지만 max_concurrency를 넘지 않음"""
+    service = AsyncOllamaEmbeddingService(
+        EmbeddingConfig(batch_size=2, max_concurrency=3)
+    )
+    texts = [f"text {i}" for i in range(20)]
+
+    embeddings = await service.embed_batch(texts)
+
+    assert mock_async_client.embed.await_count == 10
+    assert 1 < mock_async_client.state["peak"] <= 3
+    assert embeddings == [_fake_vector(text) for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_failure_isolated_per_item(mock_async_client):
+    """TC18: 비동기 배치 실패 시 항목별 재시도, 실패 항목만 0 벡터"""
+    async def embed(model, input):
+        if len(input) > 1 or input[0] == "bad":
+            raise RuntimeError("failed")
+        return {"embeddings": [_fake_vector(input[0])]}
+
+    mock_async_client.embed.side_effect = embed
+    service = AsyncOllamaEmbeddingService(EmbeddingConfig(batch_size=8, max_retries=1))
+
+    embeddings = await service.embed_batch(["good", "bad", ""])
+
+    assert embeddings[0] == _fake_vector("good")
+    assert all(x == 0.0 for x in embeddings[1])
+    assert all(x == 0.0 for x in embeddings[2])
+
+
+@pytest.mark.asyncio
+async def test_async_query_error_wrapped(mock_async_client):
+    """TC19: 비동기 쿼리 임베딩 실패 시 EmbeddingServiceError"""
+    mock_async_client.embed.side_effect = RuntimeError("connection refused")
+    service = AsyncOllamaEmbeddingService(EmbeddingConfig(max_retries=1))
+
+    with pytest.raises(EmbeddingServiceError):
+        await service.embed_query("휴가 정책")
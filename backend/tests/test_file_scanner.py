@@ -0,0 +1,163 @@
+"""
+FileScanner 테스트
+
+기존 문서 조회가 파일 수와 무관하게 스트리밍 쿼리 1회로 끝나는지 검증합니다.
+"""
+
+import os
+import re
+import pytest
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.scheduler.file_scanner import FileScanner
+
+
+class FakeStreamSession:
+    """stream()만 지원하는 AsyncSession 대역 (호출 횟수 기록)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.stream_calls = 0
+        self.execute = MagicMock(side_effect=AssertionError("per-file query"))
+        self.rollback = AsyncMock()
+
+    async def stream(self, stmt):
+        self.stream_calls += 1
+        rows = self.rows
+
+        class Result:
+            async def partitions(self):
+                yield rows
+
+        return Result()
+
+
+@pytest.mark.asyncio
+async def test_scan_new_documents_single_query(tmp_path):
+    """TC01: 파일 수와 무관하게 스트리밍 쿼리 1회, 메모리에서 비교"""
+    for i in range(20):
+        (tmp_path / f"doc_{i}.txt").write_text("본문")
+    known = [(str((tmp_path / f"doc_{i}.txt").absolute()),) for i in range(0, 20, 2)]
+    db = FakeStreamSession(known)
+
+    new_docs = await FileScanner(str(tmp_path)).scan_for_new_documents(db)
+
+    assert db.stream_calls == 1
+    assert len(new_docs) == 10
+    assert all(doc["file_type"] == "txt" for doc in new_docs)
+
+
+@pytest.mark.asyncio
+async def test_scan_for_changes_single_query(tmp_path):
+    """TC02: 변경 감지도 매니페스트 조회 1회"""
+    (tmp_path / "a.md").write_text("# 제목")
+    (tmp_path / "b.md").write_text("# 제목")
+    deleted_path = str((tmp_path / "gone.md").absolute())
+    db = FakeStreamSession([("doc-1", deleted_path, {"content_hash": "h"})])
+
+    diff = await FileScanner(str(tmp_path)).scan_for_changes(db)
+
+    assert db.stream_calls == 1
+    assert diff.summary() == {"new": 2, "modified": 0, "unchanged": 0, "deleted": 1}
+
+
+@pytest.mark.asyncio
+async def test_unreadable_directory_suppresses_deletion(tmp_path):
+    """TC03: 읽지 못한 디렉토리 하위 문서는 삭제하지 않음 (다른 경로는 삭제)"""
+    (tmp_path / "hr").mkdir()
+    (tmp_path / "hr" / "leave.md").write_text("# 휴가")
+    (tmp_path / "finance").mkdir()
+    (tmp_path / "a.md").write_text("# 제목")
+    hr_path = str((tmp_path / "hr" / "leave.md").absolute())
+    finance_path = str((tmp_path / "finance" / "pay.md").absolute())
+    gone_path = str((tmp_path / "gone.md").absolute())
+    db = FakeStreamSession([
+        ("doc-1", hr_path, {}),
+        ("doc-2", finance_path, {}),
+        ("doc-3", gone_path, {}),
+    ])
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == "finance":
+            raise PermissionError("permission denied")
+        return real_scandir(path)
+
+    with patch("app.scheduler.directory_walker.os.scandir", side_effect=scandir):
+        diff = await FileScanner(str(tmp_path)).scan_for_changes(db)
+
+    assert [doc.document_id for doc in diff.deleted] == ["doc-3"]
+
+
+@pytest.mark.asyncio
+async def test_empty_root_refuses_deletion(tmp_path):
+    """TC04: 저장소가 비어 있으면 (마운트 누락 등) 기존 문서를 삭제하지 않음"""
+    db = FakeStreamSession([
+        ("doc-1", str((tmp_path / "a.md").absolute()), {}),
+        ("doc-2", str((tmp_path / "b.md").absolute()), {}),
+    ])
+
+    diff = await FileScanner(str(tmp_path / "mount")).scan_for_changes(db)
+
+    assert diff.summary()["deleted"] == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_ratio_guard_aborts_mass_deletion(tmp_path):
+    """TC05: 삭제 비율이 max_delete_ratio를 넘으면 삭제 전체 중단"""
+    (tmp_path / "keep.md").write_text("# 유지")
+    rows = [("doc-keep", str((tmp_path / "keep.md").absolute()), {})]
+    rows.extend(
+        (f"doc-{i}", str((tmp_path / f"gone_{i}.md").absolute()), {}) for i in range(5)
+    )
+
+    guarded = await FileScanner(
+        str(tmp_path), max_delete_ratio=0.5, delete_guard_min_count=2
+    ).scan_for_changes(FakeStreamSession(rows))
+    allowed = await FileScanner(
+        str(tmp_path), max_delete_ratio=0.9, delete_guard_min_count=2
+    ).scan_for_changes(FakeStreamSession(rows))
+
+    assert guarded.summary()["deleted"] == 0
+    assert allowed.summary()["deleted"] == 5
+
+
+def _like_filter(stmt, rows):
+    """문장의 LIKE 조건(접두사, ESCAPE '/' 사용 시 반영)을 적용한 source 행만 반환"""
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    escape = "/" if "ESCAPE '/'" in str(compiled) else None
+    (pattern,) = compiled.params.values()
+    regex = ""
+    escaped = False
+    for char in pattern + "%":
+        if escaped:
+            regex += re.escape(char)
+            escaped = False
+        elif char == escape:
+            escaped = True
+        else:
+            regex += {"%": ".*", "_": "."}.get(char, re.escape(char))
+    return [row for row in rows if re.fullmatch(regex, row[1], re.DOTALL)]
+
+
+@pytest.mark.asyncio
+async def test_underscore_in_root_is_not_wildcard(tmp_path):
+    """TC06: 저장소 경로의 "_"는 와일드카드가 아님 (비슷한 이름의 다른 저장소 문서는 삭제하지 않음)"""
+    root = tmp_path / "doc_store"
+    root.mkdir()
+    (root / "a.md").write_text("# 제목")
+    sibling_path = str((tmp_path / "docXstore" / "b.md").absolute())
+    db = FakeStreamSession([
+        ("doc-1", str((root / "a.md").absolute()), {}),
+        ("doc-2", sibling_path, {}),
+    ])
+    stream = db.stream
+
+    async def filtered_stream(stmt):
+        db.rows = _like_filter(stmt, db.rows)
+        return await stream(stmt)
+
+    db.stream = filtered_stream
+    diff = await FileScanner(str(root), delete_guard_min_count=100).scan_for_changes(db)
+
+    assert diff.summary()["deleted"] == 0
@@ -0,0 +1,169 @@
+"""
+검색 히스토리 write-behind 싱크 테스트
+
+SearchHistorySink의 배치 저장(개수/시간 기준), 쿼리→응답 저장 순서,
+대기 레코드 상한과 dropped 집계, 종료 시 잔여 레코드 저장을 검증합니다.
+"""
+
+import asyncio
+import pytest
+from pydantic import ValidationError
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+from app.repositories.search_repository import DEFAULT_USER_ID
+from app.services.history_sink import HistorySinkConfig, SearchHistorySink
+from app.services.response_builder import ResponseBuilder
+
+
+def _response():
+    return ResponseBuilder.build_search_response(
+        query="연차 사용 방법",
+        answer="문서에 따르면 가능합니다.",
+        search_results=[],
+        performance={"total_time_ms": 1200}
+    )
+
+
+class _FakeRepository:
+    """save_history_batch 호출을 기록하는 Repository"""
+
+    calls = []
+    fail = False
+
+    def __init__(self, session):
+        pass
+
+    async def save_history_batch(self, queries, responses):
+        if _FakeRepository.fail:
+            raise RuntimeError("db down")
+        _FakeRepository.calls.append((list(queries), list(responses)))
+
+
+@asynccontextmanager
+async def _session():
+    yield None
+
+
+@pytest.fixture
+def repository():
+    _FakeRepository.calls = []
+    _FakeRepository.fail = False
+    with patch("app.services.history_sink.SearchRepository", _FakeRepository):
+        yield _FakeRepository
+
+
+def _sink(**config):
+    values = {"max_pending": 100, "batch_size": 10, "flush_interval_seconds": 0.05}
+    values.update(config)
+    return SearchHistorySink(HistorySinkConfig(**values), session_factory=_session)
+
+
+@pytest.mark.asyncio
+async def test_records_flushed_in_one_batch_after_interval(repository):
+    """TC01: 기록은 즉시 반환되고 flush 주기 후 쿼리/응답이 한 배치로 저장"""
+    sink = _sink()
+    query_id = sink.record_query(None, "연차 사용 방법", "s1")
+    sink.record_response(query_id, _response())
+
+    assert repository.calls == []
+    await asyncio.sleep(0.15)
+
+    assert len(repository.calls) == 1
+    queries, responses = repository.calls[0]
+    assert queries[0]["id"] == query_id
+    assert queries[0]["user_id"] == DEFAULT_USER_ID
+    assert responses[0]["query_id"] == query_id
+    assert responses[0]["response_time_ms"] == 1200
+    assert sink.stats()["written"] == 2
+    await sink.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_early_flush(repository):
+    """TC02: batch_size만큼 쌓이면 주기를 기다리지 않고 저장"""
+    sink = _sink(batch_size=4, flush_interval_seconds=10)
+    for i in range(2):
+        query_id = sink.record_query(None, f"질문 {i}")
+        sink.record_response(query_id, _response())
+    await asyncio.sleep(0.05)
+
+    assert len(repository.calls) == 1
+    assert sink.stats()["batches"] == 1
+    await sink.stop()
+
+
+@pytest.mark.asyncio
+async def test_overflow_is_dropped_and_counted(repository):
+    """TC03: 대기 레코드 상한을 넘으면 버리고 dropped 집계"""
+    sink = _sink(max_pending=3, flush_interval_seconds=10, batch_size=100)
+    for i in range(5):
+        sink.record_query(None, f"질문 {i}")
+
+    assert sink.stats()["pending"] == 3
+    assert sink.stats()["dropped"] == 2
+    await sink.stop()
+    assert sink.stats()["written"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_pending_records(repository):
+    """TC04: 종료 시 주기 전이라도 남은 레코드를 batch_size 단위로 모두 저장"""
+    sink = _sink(batch_size=2, flush_interval_seconds=10)
+    for i in range(5):
+        sink.record_query(None, f"질문 {i}")
+    await sink.stop()
+
+    assert [len(queries) for queries, _ in repository.calls] == [2, 2, 1]
+    assert sink.stats()["pending"] == 0
+
+    sink.record_query(None, "종료 후 질문")
+    assert sink.stats()["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_counted_not_raised(repository):
+    """TC05: DB 저장 실패는 검색에 전파되지 않고 dropped/failed_batches로 집계"""
+    repository.fail = True
+    sink = _sink()
+    query_id = sink.record_query(None, "연차 사용 방법")
+    sink.record_response(query_id, _response())
+    await sink.stop()
+
+    stats = sink.stats()
+    assert stats["failed_batches"] == 1
+    assert stats["dropped"] == 2
+    assert stats["written"] == 0
+
+
+@pytest.mark.asyncio
+async def test_responses_of_lost_queries_are_dropped(repository):
+    """TC06: 버려지거나 저장 실패한 쿼리의 응답은 저장하지 않음 (FK 위반으로 배치 롤백 방지)"""
+    sink = _sink(max_pending=1, batch_size=1, flush_interval_seconds=10)
+    kept = sink.record_query(None, "저장되는 질문")
+    overflow = sink.record_query(None, "버려지는 질문")
+    await sink.flush()
+    sink.record_response(overflow, _response())
+    sink.record_response(kept, _response())
+    await sink.flush()
+
+    repository.fail = True
+    failed = sink.record_query(None, "저장 실패 질문")
+    await sink.flush()
+    repository.fail = False
+    sink.record_response(failed, _response())
+    await sink.stop()
+
+    saved_responses = [row["query_id"] for _, responses in repository.calls for row in responses]
+    assert saved_responses == [kept]
+    assert sink.stats()["dropped"] == 4
+
+
+@pytest.mark.parametrize("field, value", [
+    ("batch_size", 0),
+    ("max_pending", 0),
+    ("flush_interval_seconds", 0),
+])
+def test_config_rejects_non_positive_values(field, value):
+    """TC07: batch_size=0 등은 flush 무한 루프를 만들므로 설정 단계에서 거부"""
+    with pytest.raises(ValidationError):
+        HistorySinkConfig(**{field: value})
@@ -0,0 +1,202 @@
+"""
+파이프라인 인덱싱 엔진 테스트
+
+IndexingPipeline의 문서 간 임베딩 배치, 청크 캐시 재사용,
+문서 단위 실패 격리, Milvus 쓰기 버퍼를 통한 저장/정리를 검증합니다.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from app.services.document_indexer import DocumentIndexer
+from app.services.embedding_cache import ChunkEmbeddingCache, SQLiteEmbeddingStore
+from app.services.indexing_pipeline import IndexingPipeline, PipelineConfig, _PipelineItem
+from app.services.milvus_writer import MilvusWriteBuffer, MilvusWriteBufferConfig
+from app.scheduler.manifest import IndexStatus
+
+
+def _chunks(file_path, count=2):
+    """파일 경로로 구분되는 청크 리스트"""
+    return [MagicMock(content=f"{file_path}#{i}") for i in range(count)]
+
+
+def _embedding_service(delay=0.0):
+    """호출마다 delay만큼 걸리는 비동기 임베딩 서비스 대역"""
+    service = AsyncMock()
+    service.config = MagicMock(model_name="m")
+
+    async def embed_batch(texts):
+        await asyncio.sleep(delay)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    service.embed_batch.side_effect = embed_batch
+    return service
+
+
+def _pipeline(embedding_service, chunk_cache=None, **config):
+    """스레드 풀 파싱 + Milvus/DB 대역 파이프라인"""
+    values = {"parse_workers": 2, "use_process_pool": False}
+    values.update(config)
+    with patch("app.services.indexing_pipeline.get_chunk_embedding_cache", return_value=None):
+        return IndexingPipeline(
+            config=PipelineConfig(**values),
+            embedding_service=embedding_service,
+            chunk_cache=chunk_cache,
+            collection=MagicMock(),
+            session_factory=MagicMock
+        )
+
+
+def _fake_store(batch):
+    for item in batch:
+        item.succeed(f"id-{item.file_path}")
+    return 0
+
+
+@pytest.mark.asyncio
+async def test_embedding_batches_span_documents():
+    """TC01: 임베딩이 느린 동안 도착한 여러 문서의 청크를 한 번에 임베딩"""
+    service = _embedding_service(delay=0.05)
+    pipeline = _pipeline(service, embed_batch_chunks=64, embed_concurrency=1)
+    paths = [f"/docs/{i}.txt" for i in range(6)]
+
+    with patch("app.services.indexing_pipeline.parse_and_chunk",
+               side_effect=lambda path: (MagicMock(), _chunks(path))), \
+            patch.object(pipeline, "_store_documents", side_effect=_fake_store):
+        report = await pipeline.run(paths)
+
+    batch_sizes = [len(call.args[0]) for call in service.embed_batch.call_args_list]
+    assert [result.file_path for result in report.results] == paths
+    assert report.success_count == 6
+    assert sum(batch_sizes) == 12
+    assert len(batch_sizes) < 6
+    assert max(batch_sizes) > 2
+
+    embed_stats = report.stages[1]
+    assert embed_stats.name == "embed"
+    assert embed_stats.documents == 6
+    assert embed_stats.chunks == 12
+
+
+@pytest.mark.asyncio
+async def test_chunk_cache_hits_skip_embedding(tmp_path):
+    """TC02: 캐시에 있는 청크는 임베딩 요청에서 제외"""
+    store = SQLiteEmbeddingStore(str(tmp_path / "chunks.db"))
+    cache = ChunkEmbeddingCache(store)
+    cache.put_many(["/docs/a.txt#0"], "m", [[9.0, 9.0]])
+
+    service = _embedding_service()
+    pipeline = _pipeline(service, chunk_cache=cache)
+    stored = {}
+
+    def store_documents(batch):
+        for item in batch:
+            stored[item.file_path] = item.embeddings
+        return _fake_store(batch)
+
+    with patch("app.services.indexing_pipeline.parse_and_chunk",
+               side_effect=lambda path: (MagicMock(), _chunks(path))), \
+            patch.object(pipeline, "_store_documents", side_effect=store_documents):
+        report = await pipeline.run(["/docs/a.txt"])
+    store.close()
+
+    assert service.embed_batch.call_args.args[0] == ["/docs/a.txt#1"]
+    assert stored["/docs/a.txt"][0] == [9.0, 9.0]
+    assert report.results[0].cache_hits == 1
+    assert report.results[0].cache_hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_parse_failure_is_isolated():
+    """TC03: 파싱 실패 문서만 실패 처리, 나머지는 계속 진행"""
+    def parse(path):
+        if "bad" in path:
+            raise ValueError("빈 문서")
+        return MagicMock(), _chunks(path)
+
+    pipeline = _pipeline(_embedding_service())
+    with patch("app.services.indexing_pipeline.parse_and_chunk", side_effect=parse), \
+            patch.object(pipeline, "_store_documents", side_effect=_fake_store):
+        report = await pipeline.run(["/docs/ok.txt", "/docs/bad.txt", "/docs/ok2.txt"])
+
+    assert [result.success for result in report.results] == [True, False, True]
+    assert report.results[1].error_message == "빈 문서"
+    assert report.stages[0].failed == 1
+
+
+def _store_items(pipeline, specs):
+    """_store_documents 입력 작업 생성 (파일 경로, 교체 문서 ID)"""
+    items = []
+    for path, replace in specs:
+        item = _PipelineItem(path, replace)
+        item.parsed_doc = MagicMock()
+        item.chunks = [MagicMock(content="a", document_title="t", page_number=1)]
+        item.embeddings = [[0.1, 0.2]]
+        items.append(item)
+    return items
+
+
+def _buffered_pipeline(session):
+    """행 임계치 10의 쓰기 버퍼를 가진 파이프라인"""
+    pipeline = _pipeline(_embedding_service())
+    pipeline.session_factory = lambda: session
+    pipeline._writer = MilvusWriteBuffer(
+        pipeline.collection,
+        MilvusWriteBufferConfig(max_rows=10, max_bytes=10 ** 9, flush_interval_seconds=0)
+    )
+    return pipeline
+
+
+def test_store_batches_share_one_milvus_insert():
+    """TC04: 여러 저장 배치가 버퍼를 공유하여 insert/flush 1회, 교체 문서는 insert 후 삭제"""
+    session = MagicMock()
+    pipeline = _buffered_pipeline(session)
+    first = _store_items(pipeline, [("/docs/0.txt", None)])
+    second = _store_items(pipeline, [("/docs/1.txt", ["old-1"])])
+
+    ids = iter(["doc-0", "doc-1"])
+    with patch.object(
+        DocumentIndexer, "_save_document_metadata",
+        side_effect=lambda *args, **kwargs: MagicMock(id=next(ids))
+    ) as save, \
+            patch.object(DocumentIndexer, "mark_indexed") as mark_indexed, \
+            patch.object(DocumentIndexer, "delete_documents") as delete_documents:
+        pipeline._store_documents(first)
+        pipeline._store_documents(second)
+        assert pipeline.collection.insert.call_count == 0
+        assert first[0].result is None
+        failed = pipeline._flush_writer()
+
+    inserted = pipeline.collection.insert.call_args.args[0]
+    assert failed == 0
+    assert pipeline.collection.insert.call_count == 1
+    assert pipeline.collection.flush.call_count == 1
+    assert inserted[0] == ["doc-0", "doc-1"]
+    assert save.call_args.kwargs["index_status"] == IndexStatus.PENDING
+    mark_indexed.assert_called_once_with(["doc-0", "doc-1"])
+    delete_documents.assert_called_once_with(["old-1"])
+    assert [item.result.document_id for item in first + second] == ["doc-0", "doc-1"]
+
+
+def test_failed_insert_removes_pending_documents():
+    """TC05: insert 실패 시 해당 문서만 실패 처리, pending 문서 삭제, 기존 문서 유지"""
+    session = MagicMock()
+    pipeline = _buffered_pipeline(session)
+    pipeline.collection.insert.side_effect = RuntimeError("milvus down")
+    items = _store_items(pipeline, [("/docs/0.txt", ["old-0"])])
+
+    with patch.object(
+        DocumentIndexer, "_save_document_metadata",
+        side_effect=lambda *args, **kwargs: MagicMock(id="doc-0")
+    ), \
+            patch.object(DocumentIndexer, "mark_indexed") as mark_indexed, \
+            patch.object(DocumentIndexer, "delete_documents") as delete_documents:
+        pipeline._store_documents(items)
+        failed = pipeline._flush_writer()
+
+    assert failed == 1
+    assert items[0].result.success is False
+    assert "milvus down" in items[0].result.error_message
+    mark_indexed.assert_not_called()
+    delete_documents.assert_called_once_with(["doc-0"])
+    pipeline.collection.flush.assert_not_called()
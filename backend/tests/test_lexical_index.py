@@ -0,0 +1,169 @@
+"""
+BM25 역색인 / 하이브리드 검색 테스트
+
+LexicalIndex의 한국어 토큰화, BM25 순위, 권한 필터, 증분 삭제/재구성, 저장/불러오기와
+VectorSearchService의 reciprocal rank fusion 결합을 검증합니다.
+"""
+
+import numpy as np
+from unittest.mock import MagicMock
+from app.schemas.user import UserContext
+from app.services.access_control import AccessControlService
+from app.services.lexical_index import LexicalIndex, LexicalIndexConfig, tokenize
+from app.services.vector_search import (
+    HybridSearchConfig,
+    VectorSearchService,
+    reciprocal_rank_fusion
+)
+
+
+def _index(path=None):
+    index = LexicalIndex(LexicalIndexConfig(path=path, save_interval_seconds=0))
+    index.add_document("doc-leave", [
+        "제1조 목적 이 규정은 임직원의 휴가 사용에 관한 사항을 정한다.",
+        "제12조 연차휴가를 사용하려면 휴가신청서(3호서식)를 제출한다.",
+    ], access_level=1)
+    index.add_document("doc-eng", [
+        "제12조 배포 승인 절차는 엔지니어링 리드가 검토한다.",
+    ], access_level=2, department="Engineering")
+    index.add_document("doc-pay", [
+        "급여는 매월 25일에 지급한다. 휴가 수당은 별도 지급한다.",
+    ], access_level=1)
+    return index
+
+
+def test_tokenize_korean_bigrams_and_mixed_terms():
+    """TC01: 한글은 음절 바이그램, 숫자 섞인 단어는 전체도 토큰"""
+    tokens = tokenize("제12조 연차휴가를 HR-Form")
+
+    assert "제12조" in tokens and "12" in tokens
+    assert {"연차", "차휴", "휴가", "가를"} <= set(tokens)
+    assert {"hr", "form"} <= set(tokens)
+
+
+def test_exact_terms_rank_first():
+    """TC02: 조문 번호/서식명이 들어간 청크가 BM25 상위, chunk_index는 문서 내 순서"""
+    index = _index()
+
+    hits = index.search("제12조 3호서식 연차휴가", top_k=3)
+
+    assert (hits[0].document_id, hits[0].chunk_index) == ("doc-leave", 1)
+    assert hits[0].score > hits[1].score
+    assert index.search("존재하지않는용어") == []
+
+
+def test_scope_filters_before_ranking():
+    """TC03: 권한 범위 밖 청크는 결과에 나오지 않음"""
+    index = _index()
+    sales = AccessControlService.scope_for(UserContext("u1", 2, "Sales"))
+    engineering = AccessControlService.scope_for(UserContext("u2", 2, "Engineering"))
+
+    assert "doc-eng" not in {hit.document_id for hit in index.search("배포 승인", scope=sales)}
+    assert index.search("배포 승인", scope=engineering)[0].document_id == "doc-eng"
+
+
+def test_remove_and_compact_keep_results_consistent():
+    """TC04: 삭제 문서는 즉시 제외, 재구성 후에도 나머지 결과/청크 번호 유지"""
+    index = _index()
+    index.config.compaction_ratio = 0.9
+
+    assert index.remove_documents(["doc-leave", "missing"]) == 2
+    assert index.stats()["deleted_chunks"] == 2
+    assert "doc-leave" not in {hit.document_id for hit in index.search("휴가")}
+
+    index.compact()
+    hits = index.search("급여 지급")
+
+    assert (hits[0].document_id, hits[0].chunk_index) == ("doc-pay", 0)
+    stats = index.stats()
+    assert (stats["documents"], stats["chunks"], stats["deleted_chunks"]) == (2, 2, 0)
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    """TC05: 저장 후 새 인스턴스에서 불러오면 같은 검색 결과, 이후 증분 추가 가능"""
+    path = str(tmp_path / "index" / "lexical.npz")
+    index = _index(path)
+    index.remove_documents(["doc-pay"])  # tombstone도 저장/복원
+    assert index.maybe_save() is True
+    assert index.maybe_save() is False  # 변경 없음
+
+    # 배열만 저장 (객체 배열/pickle 없이 읽힘)
+    with np.load(path, allow_pickle=False) as data:
+        assert all(data[name].dtype != object for name in data.files)
+
+    loaded = LexicalIndex(LexicalIndexConfig(path=path))
+    assert loaded.load() is True
+    assert loaded.search("제12조 3호서식") == index.search("제12조 3호서식")
+    assert loaded.search("휴가 급여") == index.search("휴가 급여")
+    assert loaded.stats() == index.stats()
+
+    loaded.add_document("doc-new", ["출장비 정산 서식"], access_level=1)
+    assert loaded.search("출장비")[0].document_id == "doc-new"
+
+
+def test_rrf_prefers_items_ranked_by_both():
+    """TC06: 두 검색기에 모두 나온 항목이 한쪽 1위보다 앞섬, 가중치 반영"""
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["d", "b"]], [1.0, 1.0], k=60)
+    assert [key for key, _ in fused][:2] == ["b", "a"]
+
+    lexical_heavy = reciprocal_rank_fusion([["a"], ["d"]], [1.0, 2.0], k=60)
+    assert lexical_heavy[0][0] == "d"
+
+
+def _hit(document_id, chunk_index, score):
+    entity = {"document_id": document_id, "chunk_index": chunk_index, "content": "본문", "metadata": {}}
+    return MagicMock(score=score, entity=entity)
+
+
+def test_hybrid_search_fuses_and_fetches_lexical_only_chunks():
+    """TC07: BM25에서만 나온 청크는 Milvus에서 조회해 COSINE 점수를 붙이고 RRF 순으로 반환"""
+    index = _index()
+    # 청크 4개짜리 색인에서도 흔한 토큰("휴가", "제12조")은 제외되도록 문서 빈도 상한 적용
+    index.config.max_df_ratio = 0.5
+    index.config.min_df_cutoff = 1
+    service = VectorSearchService(
+        embedding_service=MagicMock(),
+        lexical_index=index,
+        hybrid_config=HybridSearchConfig(candidates=10, rrf_k=60, vector_weight=1.0, lexical_weight=1.5)
+    )
+    service.collection = MagicMock()
+    service.collection.search.return_value = [[_hit("doc-pay", 0, 0.8)]]
+    service.collection.query.return_value = [{
+        "document_id": "doc-leave", "chunk_index": 1, "content": "제12조 연차휴가",
+        "metadata": {}, "embedding": [1.0, 0.0]
+    }]
+
+    results = service.search_by_vector([1.0, 0.0], top_k=2, query="제12조 3호서식 연차휴가")
+
+    assert [(r.document_id, r.chunk_index) for r in results] == [("doc-leave", 1), ("doc-pay", 0)]
+    assert results[0].relevance_score == 1.0
+    expr = service.collection.query.call_args_list[0].kwargs["expr"]
+    assert 'document_id == "doc-leave" and chunk_index in [1]' in expr
+    assert service.collection.search.call_args.kwargs["limit"] == 10
+
+
+def test_hybrid_search_falls_back_to_vector_results():
+    """TC08: BM25 검색 실패 또는 검색어 없음이면 벡터 검색 결과만 사용"""
+    index = MagicMock()
+    index.__len__.return_value = 10
+    index.search.side_effect = RuntimeError("corrupted")
+    service = VectorSearchService(embedding_service=MagicMock(), lexical_index=index)
+    service.collection = MagicMock()
+    service.collection.search.return_value = [[_hit("doc-pay", 0, 0.8), _hit("doc-leave", 0, 0.6)]]
+
+    results = service.search_by_vector([1.0, 0.0], top_k=1, query="급여")
+    assert [r.document_id for r in results] == ["doc-pay"]
+
+    service.search_by_vector([1.0, 0.0], top_k=1)
+    assert service.collection.search.call_args.kwargs["limit"] == 1
+    assert index.search.call_count == 1
+
+
+def test_common_terms_skipped_only_in_large_index():
+    """TC09: 문서 빈도 상한은 min_df_cutoff보다 많이 나오는 토큰에만 적용"""
+    index = _index()
+    assert index.search("휴가")  # 작은 색인: 흔한 토큰도 검색
+
+    index.config.min_df_cutoff = 1
+    assert index.search("휴가") == []  # df=3 > max(1, 4 * 0.05)
+    assert index.search("3호서식")[0].document_id == "doc-leave"
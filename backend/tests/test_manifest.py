@@ -0,0 +1,135 @@
+"""
+매니페스트 변경 감지 테스트
+
+diff_manifest의 신규/수정/변경 없음/삭제 분류를 검증합니다.
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock
+from app.scheduler.file_scanner import FileScanner
+from app.scheduler.manifest import (
+    FileManifestEntry,
+    KnownDocument,
+    build_manifest_entry,
+    compute_content_hash,
+    diff_manifest,
+)
+
+
+def _entry(path: str, size: int = 10, mtime: float = 100.0) -> FileManifestEntry:
+    return FileManifestEntry(file_path=path, file_size_bytes=size, file_mtime=mtime)
+
+
+def _known(path: str, doc_id: str = "doc-1", size: int = 10, mtime: float = 100.0,
+           content_hash: str = "h1") -> KnownDocument:
+    return KnownDocument(
+        document_id=doc_id,
+        file_path=path,
+        file_size_bytes=size,
+        file_mtime=mtime,
+        content_hash=content_hash
+    )
+
+
+def test_classifies_new_and_deleted():
+    """TC01: DB에 없는 파일은 신규, 파일이 없는 문서는 삭제"""
+    diff = diff_manifest(
+        current={"/docs/a.txt": _entry("/docs/a.txt")},
+        known={"/docs/b.txt": [_known("/docs/b.txt", doc_id="doc-b")]},
+    )
+
+    assert [e.file_path for e in diff.new] == ["/docs/a.txt"]
+    assert [d.document_id for d in diff.deleted] == ["doc-b"]
+    assert diff.has_changes
+
+
+def test_unchanged_skips_hashing():
+    """TC02: 크기/mtime이 같으면 해시를 계산하지 않음"""
+    hasher = MagicMock()
+
+    diff = diff_manifest(
+        current={"/docs/a.txt": _entry("/docs/a.txt")},
+        known={"/docs/a.txt": [_known("/docs/a.txt")]},
+        hasher=hasher
+    )
+
+    assert diff.summary() == {"new": 0, "modified": 0, "unchanged": 1, "deleted": 0}
+    hasher.assert_not_called()
+    assert not diff.has_changes
+
+
+def test_touched_file_with_same_hash_is_unchanged():
+    """TC03: mtime만 바뀌고 내용이 같으면 변경 없음 (매니페스트만 갱신)"""
+    diff = diff_manifest(
+        current={"/docs/a.txt": _entry("/docs/a.txt", mtime=200.0)},
+        known={"/docs/a.txt": [_known("/docs/a.txt")]},
+        hasher=lambda path: "h1"
+    )
+
+    assert diff.unchanged == 1
+    assert diff.touched[0].document_ids == ["doc-1"]
+    assert diff.touched[0].entry.file_mtime == 200.0
+    assert not diff.has_changes
+
+
+def test_modified_file_replaces_old_documents():
+    """TC04: 내용 해시가 다르면 수정, 기존 문서 ID 전달"""
+    diff = diff_manifest(
+        current={"/docs/a.txt": _entry("/docs/a.txt", size=20)},
+        known={"/docs/a.txt": [_known("/docs/a.txt")]},
+        hasher=lambda path: "h2"
+    )
+
+    assert diff.modified[0].replace_document_ids == ["doc-1"]
+    assert diff.modified[0].entry.content_hash == "h2"
+
+
+@pytest.mark.parametrize("known_docs", [
+    # 매니페스트가 없는 기존 문서 (해시 미기록)
+    [KnownDocument(document_id="doc-1", file_path="/docs/a.txt", file_size_bytes=10)],
+    # 같은 경로가 중복 인덱싱된 경우
+    [_known("/docs/a.txt", doc_id="doc-1"), _known("/docs/a.txt", doc_id="doc-2")],
+])
+def test_legacy_or_duplicate_documents_reindexed(known_docs):
+    """TC05: 해시 미기록/중복 문서는 한 번 재인덱싱"""
+    diff = diff_manifest(
+        current={"/docs/a.txt": _entry("/docs/a.txt")},
+        known={"/docs/a.txt": known_docs},
+        hasher=lambda path: "h1"
+    )
+
+    assert len(diff.modified) == 1
+    assert diff.modified[0].replace_document_ids == [d.document_id for d in known_docs]
+
+
+def test_scanner_collects_supported_files(tmp_path):
+    """TC06: 지원 확장자만 stat 수집, 매니페스트 항목 생성"""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.md").write_text("# 제목")
+    (tmp_path / "b.txt").write_text("본문")
+    (tmp_path / "c.exe").write_bytes(b"\x00")
+
+    walked = FileScanner(str(tmp_path)).walker.walk_sync()
+
+    assert sorted(f.name for f in walked) == ["a.md", "b.txt"]
+    entry = build_manifest_entry(str(tmp_path / "b.txt"), with_hash=True)
+    assert entry.file_size_bytes == len("본문".encode("utf-8"))
+    assert entry.content_hash == compute_content_hash(str(tmp_path / "b.txt"))
+
+
+def test_pending_document_reindexed():
+    """TC07: Milvus 반영 전에 중단된(pending) 문서는 크기/mtime/해시가 같아도 수정"""
+    pending = KnownDocument.from_row(
+        "doc-1", "/docs/a.txt",
+        {"file_size_bytes": 10, "file_mtime": 100.0, "content_hash": "h1",
+         "index_status": "pending"}
+    )
+
+    diff = diff_manifest(
+        current={"/docs/a.txt": _entry("/docs/a.txt")},
+        known={"/docs/a.txt": [pending]},
+        hasher=lambda path: "h1"
+    )
+
+    assert diff.modified[0].replace_document_ids == ["doc-1"]
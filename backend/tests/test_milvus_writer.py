@@ -0,0 +1,75 @@
+"""
+Milvus 쓰기 버퍼 테스트
+
+MilvusWriteBuffer의 행/바이트 임계치 insert, 작업 종료 flush,
+타이머 flush 동작을 검증합니다.
+"""
+
+from unittest.mock import MagicMock, patch
+from app.services.document_indexer import DocumentIndexer
+from app.services.milvus_writer import MilvusWriteBuffer, MilvusWriteBufferConfig
+
+
+def _rows(document_id, count=2, content="본문"):
+    chunks = [MagicMock(content=content, document_title="t", page_number=1)] * count
+    return DocumentIndexer.build_milvus_rows(document_id, chunks, [[0.0] * 4] * count)
+
+
+def _buffer(**kwargs):
+    values = {"max_rows": 100, "max_bytes": 10 ** 9, "flush_interval_seconds": 0}
+    values.update(kwargs)
+    collection = MagicMock()
+    return MilvusWriteBuffer(collection, MilvusWriteBufferConfig(**values)), collection
+
+
+def test_inserts_when_row_threshold_reached():
+    """TC01: 행 수 임계치에 도달할 때까지 여러 문서를 모아 insert 1회"""
+    buffer, collection = _buffer(max_rows=5)
+
+    assert buffer.add("a", _rows("a")).inserted == []
+    assert buffer.add("b", _rows("b")).inserted == []
+    outcome = buffer.add("c", _rows("c"))
+
+    assert outcome.inserted == ["a", "b", "c"]
+    assert collection.insert.call_count == 1
+    assert len(collection.insert.call_args.args[0][0]) == 6
+    collection.flush.assert_not_called()
+
+
+def test_inserts_when_byte_threshold_reached():
+    """TC02: 바이트 임계치 초과 시 insert"""
+    buffer, collection = _buffer(max_bytes=500)
+
+    outcome = buffer.add("a", _rows("a", count=1, content="가" * 200))
+
+    assert outcome.inserted == ["a"]
+    assert collection.insert.call_count == 1
+
+
+def test_flush_only_at_job_end():
+    """TC03: flush()는 남은 엔티티 insert 후 flush 1회, 빈 버퍼는 flush 생략"""
+    buffer, collection = _buffer()
+    buffer.add("a", _rows("a"))
+    buffer.add("b", _rows("b"))
+
+    outcome = buffer.flush()
+    buffer.flush()
+
+    assert outcome.inserted == ["a", "b"]
+    assert collection.insert.call_count == 1
+    assert collection.flush.call_count == 1
+    assert buffer.stats() == {
+        "inserts": 1, "flushes": 1, "inserted_rows": 4, "buffered_rows": 0
+    }
+
+
+def test_timer_flush_on_next_write():
+    """TC04: flush 간격이 지나면 다음 쓰기 때 insert + flush"""
+    with patch("app.services.milvus_writer.time.monotonic", return_value=0.0):
+        buffer, collection = _buffer(flush_interval_seconds=60)
+        buffer.add("a", _rows("a"))
+    with patch("app.services.milvus_writer.time.monotonic", return_value=61.0):
+        outcome = buffer.add("b", _rows("b"))
+
+    assert outcome.inserted == ["a", "b"]
+    assert collection.flush.call_count == 1
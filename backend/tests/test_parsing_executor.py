@@ -0,0 +1,177 @@
+"""
+파싱 프로세스 풀 테스트
+
+ParsingExecutor의 결과 직렬화, 실제 파서 실행, 파일별 CPU/메모리/처리 시간 제한,
+워커 재활용을 검증합니다. 워커 함수는 spawn 프로세스에서 import 되도록 모듈 수준에 둡니다.
+"""
+
+import os
+import sys
+import time
+import pytest
+from unittest.mock import patch
+from app.services.document_indexer import parse_and_chunk
+from app.services.document_parser import ParsedDocument, ParsedPage, ParsingLimitExceededError
+from app.services.document_parser.factory import DocumentParserFactory
+from app.services.parsing_executor import (
+    ParsingExecutor,
+    ParsingExecutorConfig,
+    decode_parse_result,
+    encode_parse_result,
+    parse_and_chunk_in_worker
+)
+from app.services.text_chunker import TextChunk
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="resource 모듈 필요")
+
+
+def _result(marker: str):
+    parsed_doc = ParsedDocument(
+        pages=[ParsedPage(page_number=1, content=marker, metadata={"pid": os.getpid()})],
+        total_pages=1,
+        total_characters=len(marker),
+        metadata={"title": marker}
+    )
+    return parsed_doc, [TextChunk(
+        content=marker, chunk_index=0, document_title=marker, page_number=1,
+        start_char=0, end_char=len(marker)
+    )]
+
+
+def _report_pid(file_path):
+    return _result(file_path)
+
+
+def _burn_cpu(file_path):
+    while True:
+        pass
+
+
+def _hang(file_path):
+    if file_path == "hang":
+        time.sleep(60)
+    return _result(file_path)
+
+
+def _allocate(file_path):
+    blob = bytearray(1024 * 1024 * 1024)
+    return _result(str(len(blob)))
+
+
+def _executor(parse_function, **config):
+    values = {
+        "workers": 1,
+        "cpu_time_limit_seconds": 0,
+        "memory_limit_mb": 0,
+        "timeout_seconds": 30,
+        "max_tasks_per_child": 50,
+    }
+    values.update(config)
+    return ParsingExecutor(ParsingExecutorConfig(**values), parse_function=parse_function)
+
+
+def test_encode_decode_roundtrip():
+    """TC01: 전달 값은 기본 타입 튜플뿐이고, 복원하면 같은 값"""
+    parsed_doc, chunks = _result("연차 휴가 규정 " * 200)
+
+    payload = encode_parse_result(parsed_doc, chunks)
+    decoded_doc, decoded_chunks = decode_parse_result(payload)
+
+    pages, _, _, _, chunk_rows = payload
+    assert all(type(row) is tuple for row in pages + chunk_rows)
+    assert decoded_doc.model_dump() == parsed_doc.model_dump()
+    assert [chunk.model_dump() for chunk in decoded_chunks] == [chunk.model_dump() for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_parses_real_file_in_worker(tmp_path):
+    """TC02: 기본 파서(parse_and_chunk)를 워커에서 실행한 결과가 직접 실행과 같음"""
+    path = tmp_path / "policy.txt"
+    path.write_text("제1조 목적\n이 규정은 휴가 사용에 관한 사항을 정한다.\n" * 50, encoding="utf-8")
+    executor = _executor(parse_and_chunk)
+
+    try:
+        parsed_doc, chunks = await executor.parse(str(path))
+    finally:
+        executor.shutdown()
+
+    expected_doc, expected_chunks = parse_and_chunk(str(path))
+    assert parsed_doc.total_characters == expected_doc.total_characters
+    assert [chunk.content for chunk in chunks] == [chunk.content for chunk in expected_chunks]
+    assert executor.stats()["parsed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cpu_limit_fails_file_but_keeps_worker():
+    """TC03: CPU 시간 제한 초과 파일만 실패, 같은 워커로 다음 파일 처리"""
+    executor = _executor(_burn_cpu, cpu_time_limit_seconds=1)
+
+    try:
+        with pytest.raises(ParsingLimitExceededError):
+            await executor.parse("spin")
+        executor.parse_function = _report_pid
+        parsed_doc, _ = await executor.parse("next")
+    finally:
+        executor.shutdown()
+
+    assert parsed_doc.metadata["title"] == "next"
+    assert executor.stats()["restarts"] == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_limit():
+    """TC04: 메모리 제한을 넘는 파일은 ParsingLimitExceededError"""
+    executor = _executor(_allocate, memory_limit_mb=512)
+
+    try:
+        with pytest.raises(ParsingLimitExceededError):
+            await executor.parse("big")
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_restarts_pool():
+    """TC05: 처리 시간 초과 시 풀을 재생성하고 이후 파일은 정상 처리"""
+    executor = _executor(_hang, timeout_seconds=3)
+
+    try:
+        with pytest.raises(ParsingLimitExceededError):
+            await executor.parse("hang")
+        parsed_doc, _ = await executor.parse("ok")
+    finally:
+        executor.shutdown()
+
+    assert parsed_doc.metadata["title"] == "ok"
+    assert executor.stats()["timeouts"] == 1
+    assert executor.stats()["restarts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_workers_recycled_after_max_tasks():
+    """TC06: max_tasks_per_child개 처리한 워커는 새 프로세스로 교체"""
+    executor = _executor(_report_pid, max_tasks_per_child=1)
+
+    try:
+        pids = [(await executor.parse(f"doc{i}"))[0].pages[0].metadata["pid"] for i in range(3)]
+    finally:
+        executor.shutdown()
+
+    assert len(set(pids)) == 3
+    assert os.getpid() not in pids
+
+
+def test_worker_parse_disables_page_parallelism(tmp_path):
+    """TC07: 기본 워커 함수는 page_workers=1로 파싱 (워커 안에서 프로세스 풀을 만들지 않음)"""
+    path = tmp_path / "policy.txt"
+    path.write_text("제1조 목적\n이 규정은 휴가 사용에 관한 사항을 정한다.\n", encoding="utf-8")
+
+    with patch(
+        "app.services.document_indexer.DocumentParserFactory.get_parser",
+        wraps=DocumentParserFactory.get_parser
+    ) as get_parser:
+        parsed_doc, chunks = parse_and_chunk_in_worker(str(path))
+
+    assert get_parser.call_args.kwargs["config"].page_workers == 1
+    assert chunks and parsed_doc.total_pages == 1
+    assert ParsingExecutor().parse_function is parse_and_chunk_in_worker
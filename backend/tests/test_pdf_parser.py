@@ -222,3 +222,76 @@ def test_malicious_pdf_rejection(pdf_parser):
     except MaliciousFileError:
         # 악성 PDF 거부 (더 안전한 방법)
         pass
+
+
+# ============================================
+# Streaming Tests (스트리밍 모드)
+# ============================================
+
+def test_iter_pages_matches_parse(pdf_parser):
+    """
+    TC11: iter_pages 스트리밍 파싱
+    - 입력: 3페이지 PDF (2번째 페이지 빈 페이지)
+    - 기대 결과: parse()와 같은 페이지를 순서대로, 빈 페이지 제외
+    """
+    pdf_path = str(FIXTURES_DIR / "sample_with_empty_page.pdf")
+
+    pages = pdf_parser.iter_pages(pdf_path)
+    first = next(pages)
+
+    assert first.page_number == 1
+    assert [first, *pages] == pdf_parser.parse(pdf_path).pages
+
+
+def test_iter_pages_validates_on_first_page(pdf_parser):
+    """
+    TC12: iter_pages 에러 처리
+    - 입력: 손상된 PDF
+    - 기대 결과: 첫 페이지 요청 시 CorruptedFileError
+    """
+    pages = pdf_parser.iter_pages(str(FIXTURES_DIR / "sample_corrupted.pdf"))
+
+    with pytest.raises(CorruptedFileError):
+        next(pages)
+
+
+# ============================================
+# Parallel Extraction Tests (페이지 범위 병렬 추출)
+# ============================================
+
+def test_parallel_page_ranges_match_serial(pdf_parser):
+    """
+    TC13: 페이지 범위 병렬 추출
+    - 입력: 10페이지 PDF, 3페이지 범위 x 워커 2개 / 빈 페이지 포함 PDF, 1페이지 범위
+    - 기대 결과: 순차 추출과 같은 페이지/순서/번호
+    """
+    parallel = PDFParser(ParserConfig(parallel_page_threshold=2, pages_per_range=3, page_workers=2))
+    pdf_path = str(FIXTURES_DIR / "sample_10pages.pdf")
+
+    result = parallel.parse(pdf_path)
+
+    assert result == pdf_parser.parse(pdf_path)
+    assert [page.page_number for page in result.pages] == list(range(1, 11))
+
+    parallel.config.pages_per_range = 1
+    with_empty = parallel.parse(str(FIXTURES_DIR / "sample_with_empty_page.pdf"))
+    assert [page.page_number for page in with_empty.pages] == [1, 3]
+
+
+def test_parallel_falls_back_to_serial(pdf_parser):
+    """
+    TC14: 워커 프로세스 생성 실패
+    - 기대 결과: 순차 추출로 대체하여 같은 결과
+    """
+    from unittest.mock import patch
+
+    parallel = PDFParser(ParserConfig(parallel_page_threshold=2, page_workers=2))
+    pdf_path = str(FIXTURES_DIR / "sample_5pages.pdf")
+
+    with patch(
+        "app.services.document_parser.pdf_parser.ProcessPoolExecutor",
+        side_effect=OSError("process limit")
+    ):
+        result = parallel.parse(pdf_path)
+
+    assert result == pdf_parser.parse(pdf_path)
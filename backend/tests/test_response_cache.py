@@ -0,0 +1,269 @@
+"""
+검색 응답 캐시 테스트
+
+SearchResponseCache의 키 구성(정규화/limit/권한 범위), 동시 요청 합치기,
+컬렉션 버전 무효화, SQLite 공유 저장소와 SearchService 연동을 검증합니다.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.schemas.user import UserContext
+from app.services.index_events import IndexEventBus, IndexEventType
+from app.services.response_builder import ResponseBuilder
+from app.services.response_cache import (
+    ResponseCacheConfig,
+    SearchResponseCache,
+    SQLiteResponseCacheBackend
+)
+from app.services.search_service import SearchService
+
+
+def _response(answer="휴가 규정에 따르면 가능합니다.", fallback_reason=None):
+    return ResponseBuilder.build_search_response(
+        query="연차 사용 방법",
+        answer=answer,
+        search_results=[],
+        performance={"total_time_ms": 2800},
+        is_fallback=fallback_reason is not None,
+        fallback_reason=fallback_reason
+    )
+
+
+def _cache(**config):
+    values = {"max_entries": 100, "ttl_seconds": 60, "shared_path": None}
+    values.update(config)
+    return SearchResponseCache(ResponseCacheConfig(**values))
+
+
+def test_key_normalizes_query_and_separates_scope():
+    """TC01: 공백/대소문자만 다른 쿼리는 같은 키, limit/권한 범위가 다르면 다른 키"""
+    cache = _cache()
+    user = UserContext("u1", 2, "Engineering")
+
+    key = cache.make_key("연차  사용 방법 ", 5, user)
+
+    assert cache.make_key("연차 사용 방법", 5, UserContext("u2", 2, "Engineering")) == key
+    assert cache.make_key("연차 사용 방법", 3, user) != key
+    assert cache.make_key("연차 사용 방법", 5, UserContext("u3", 2, "Sales")) != key
+    assert cache.make_key("연차 사용 방법", 5, None) != key
+
+
+def test_version_bump_invalidates_entries():
+    """TC02: 인덱싱/삭제 이벤트마다 컬렉션 버전이 올라 기존 항목 미스"""
+    cache = _cache()
+    bus = IndexEventBus()
+    bus.subscribe(cache.on_index_event)
+    key = cache.make_key("연차", 5, None)
+    cache.put(key, _response())
+
+    assert cache.get(key).answer == "휴가 규정에 따르면 가능합니다."
+
+    bus.publish(IndexEventType.INDEXED, ["doc_002"])
+    new_key = cache.make_key("연차", 5, None)
+
+    assert new_key != key
+    assert cache.get(new_key) is None
+    assert cache.stats()["version"] == 1
+
+
+def test_transient_fallback_not_cached():
+    """TC03: LLM 실패로 인한 Fallback 응답은 저장하지 않음"""
+    cache = _cache()
+
+    assert cache.put("k1", _response("실패", fallback_reason="no_source_citation")) is False
+    assert cache.put("k2", _response("없음", fallback_reason="low_confidence")) is True
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced():
+    """TC04: 동시에 들어온 같은 요청 N건은 계산 1회를 공유"""
+    cache = _cache()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return _response()
+
+    key = cache.make_key("연차", 5, None)
+    results = await asyncio.gather(*[cache.aget_or_compute(key, compute) for _ in range(5)])
+
+    assert calls == 1
+    assert [computed for _, computed in results].count(True) == 1
+    assert cache.stats()["coalesced"] == 4
+    assert cache.stats()["inflight"] == 0
+
+    # 이후 요청은 캐시 히트
+    response, computed = await cache.aget_or_compute(key, compute)
+    assert computed is False and calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_computation_is_shared_and_not_cached():
+    """TC05: 계산 실패는 대기 중인 요청에도 전달되고, 다음 요청은 다시 계산"""
+    cache = _cache()
+    attempts = 0
+
+    async def compute():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.02)
+        raise ValueError("milvus down")
+
+    results = await asyncio.gather(
+        cache.aget_or_compute("k", compute),
+        cache.aget_or_compute("k", compute),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert attempts == 1
+
+    with pytest.raises(ValueError):
+        await cache.aget_or_compute("k", compute)
+    assert attempts == 2
+
+
+def test_sqlite_backend_shares_entries_and_version(tmp_path):
+    """TC06: 같은 SQLite 파일을 쓰는 캐시(워커)끼리 항목과 버전 공유"""
+    path = str(tmp_path / "responses.db")
+    worker_a = _cache(shared_path=path)
+    worker_b = _cache(shared_path=path)
+    assert isinstance(worker_a.backend, SQLiteResponseCacheBackend)
+
+    key = worker_a.make_key("연차", 5, None)
+    worker_a.put(key, _response())
+    assert worker_b.get(key).answer == "휴가 규정에 따르면 가능합니다."
+
+    worker_b.invalidate()
+    assert worker_a.make_key("연차", 5, None) != key
+
+    worker_a.close()
+    worker_b.close()
+
+
+def test_sync_search_coalesces_across_threads():
+    """TC07: search()는 스레드 간 같은 요청도 합치고, 응답마다 새 query_id"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_search(query, top_k, user):
+        started.set()
+        release.wait(1)
+        return []
+
+    vector_search = MagicMock()
+    vector_search.search.side_effect = slow_search
+    rag_service = MagicMock(provider_type="ollama")
+    rag_service.generate_answer_with_fallback.return_value = {
+        "answer": "문서에 따르면 가능합니다.", "is_fallback": False, "fallback_reason": None
+    }
+    service = SearchService(
+        vector_search=vector_search,
+        rag_service=rag_service,
+        response_cache=_cache()
+    )
+
+    responses = []
+    threads = [
+        threading.Thread(target=lambda: responses.append(service.search("연차 사용 방법")))
+        for _ in range(3)
+    ]
+    threads[0].start()
+    started.wait(1)
+    for thread in threads[1:]:
+        thread.start()
+    while service.response_cache.stats()["coalesced"] < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert vector_search.search.call_count == 1
+    assert {response.answer for response in responses} == {"문서에 따르면 가능합니다."}
+    assert len({response.query_id for response in responses}) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_search_hit_skips_pipeline():
+    """TC08: asearch()는 같은 요청에 임베딩/검색/LLM 없이 캐시 응답 반환"""
+    vector_search = MagicMock()
+    vector_search.aembed_query = AsyncMock(return_value=[0.1] * 4)
+    vector_search.asearch_by_vector = AsyncMock(return_value=[])
+    rag_service = MagicMock(provider_type="ollama")
+    rag_service.agenerate_answer_with_fallback = AsyncMock(return_value={
+        "answer": "문서에 따르면 가능합니다.", "is_fallback": False, "fallback_reason": None
+    })
+    service = SearchService(
+        vector_search=vector_search,
+        rag_service=rag_service,
+        response_cache=_cache()
+    )
+
+    first = await service.asearch("연차 사용 방법")
+    second = await service.asearch("연차 사용 방법 ")
+
+    assert second.answer == first.answer
+    assert second.query == "연차 사용 방법 "
+    assert second.performance.llm_time_ms == 0
+    assert vector_search.aembed_query.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_leader_cancelled_while_storing_still_resolves_waiters():
+    """TC09: 계산 담당 요청이 저장 중 취소되어도 대기 중인 요청은 계산 결과를 받음"""
+    cache = _cache()
+    storing = threading.Event()
+    release = threading.Event()
+    original_set = cache.backend.set
+
+    def slow_set(key, value, ttl_seconds):
+        storing.set()
+        release.wait(2)
+        original_set(key, value, ttl_seconds)
+
+    cache.backend.set = slow_set
+
+    async def compute():
+        return _response()
+
+    leader = asyncio.create_task(cache.aget_or_compute("k", compute))
+    await asyncio.to_thread(storing.wait, 2)
+    follower = asyncio.create_task(cache.aget_or_compute("k", compute))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    release.set()
+
+    response, computed = await asyncio.wait_for(follower, 2)
+
+    assert computed is False
+    assert response.answer == "휴가 규정에 따르면 가능합니다."
+    assert cache.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_gives_up_on_stalled_leader():
+    """TC10: 계산 담당 요청이 멈추면 대기 요청은 wait_timeout_seconds 뒤 직접 계산"""
+    cache = _cache(wait_timeout_seconds=0.05)
+    stalled = asyncio.Event()
+
+    async def stall():
+        await stalled.wait()
+        return _response()
+
+    async def compute():
+        return _response("직접 계산")
+
+    leader = asyncio.create_task(cache.aget_or_compute("k", stall))
+    await asyncio.sleep(0)
+
+    response, computed = await asyncio.wait_for(cache.aget_or_compute("k", compute), 1)
+
+    assert computed is True
+    assert response.answer == "직접 계산"
+    stalled.set()
+    await leader
@@ -0,0 +1,107 @@
+"""
+검색 히스토리 조회 쿼리 테스트
+
+SearchRepository.get_user_history가 응답 JOIN 1회로 페이지를 조회하고,
+keyset 커서로 다음 페이지를 OFFSET 없이 가져오는지 검증합니다.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from sqlalchemy.dialects import postgresql
+from app.repositories.search_repository import (
+    SearchRepository,
+    decode_history_cursor,
+    encode_history_cursor
+)
+
+USER_ID = uuid4()
+
+
+def _rows(count):
+    return [
+        SimpleNamespace(
+            id=uuid4(),
+            query=f"질문 {i}",
+            timestamp=datetime(2026, 1, 1, 12, 0, 59 - i, tzinfo=timezone.utc),
+            answer=f"답변 {i}",
+            sources_count=i,
+            response_time_ms=1000 + i
+        )
+        for i in range(count)
+    ]
+
+
+def _db(rows, plan_rows=None):
+    result = MagicMock()
+    result.all.return_value = rows
+    result.scalar.return_value = [{"Plan": {"Plan Rows": plan_rows}}]
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+def _sql(db, call=0):
+    statement = db.execute.await_args_list[call].args[0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip():
+    """TC01: 커서는 (timestamp, id)를 보존하고, 잘못된 커서는 ValueError"""
+    timestamp = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    query_id = uuid4()
+
+    assert decode_history_cursor(encode_history_cursor(timestamp, query_id)) == (timestamp, query_id)
+    with pytest.raises(ValueError):
+        decode_history_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_page_is_single_joined_query():
+    """TC02: 응답 JOIN + SQL 출처 개수로 1회 조회, 초과 1건으로 next_cursor 생성"""
+    rows = _rows(4)
+    db = _db(rows)
+
+    result = await SearchRepository(db).get_user_history(USER_ID, page_size=3, total_mode="none")
+
+    assert db.execute.await_count == 1
+    sql = _sql(db)
+    assert "LEFT OUTER JOIN search_responses" in sql
+    assert "jsonb_array_length" in sql
+    assert "OFFSET" not in sql
+    assert [item["sources_count"] for item in result["items"]] == [0, 1, 2]
+    assert result["total"] is None and result["total_pages"] is None
+    assert decode_history_cursor(result["next_cursor"]) == (rows[2].timestamp, rows[2].id)
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_uses_keyset_predicate():
+    """TC03: 커서가 있으면 (timestamp, id) 비교로 조회하고 마지막 페이지는 next_cursor 없음"""
+    db = _db(_rows(2))
+    cursor = encode_history_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4())
+
+    result = await SearchRepository(db).get_user_history(
+        USER_ID, page_size=3, cursor=cursor, total_mode="none"
+    )
+
+    sql = _sql(db)
+    assert "(search_queries.timestamp, search_queries.id) <" in sql
+    assert "OFFSET" not in sql
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_approximate_total_uses_planner_estimate():
+    """TC04: total_mode=approximate는 COUNT 대신 실행 계획 예상 행 수 사용"""
+    db = _db(_rows(1), plan_rows=4200)
+
+    result = await SearchRepository(db).get_user_history(
+        USER_ID, page_size=20, total_mode="approximate"
+    )
+
+    assert db.execute.await_count == 2
+    assert "EXPLAIN" in str(db.execute.await_args_list[1].args[0])
+    assert result["total"] == 4200
+    assert result["total_pages"] == 210
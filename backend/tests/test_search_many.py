@@ -0,0 +1,127 @@
+"""
+일괄 검색 테스트
+
+VectorSearchService.search_many의 배치 임베딩, 권한 범위별 Milvus 검색 묶음,
+쿼리 순서 보존과 /search/batch 엔드포인트를 검증합니다.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi.testclient import TestClient
+from app.main import app
+from app.schemas.user import UserContext
+from app.services.embedding_service import OllamaEmbeddingService
+from app.services.service_container import get_service_container
+from app.services.vector_search import SearchResult, VectorSearchService
+
+
+def _hit(document_id):
+    entity = {
+        "document_id": document_id,
+        "chunk_index": 0,
+        "content": "본문",
+        "metadata": {"document_title": document_id},
+    }
+    return MagicMock(score=0.9, entity=entity)
+
+
+def _service(batch_size=64):
+    embedding_service = MagicMock()
+    embedding_service.embed_queries.side_effect = lambda queries: [
+        [0.0, 0.0] if "실패" in query else [1.0, float(len(query))] for query in queries
+    ]
+    service = VectorSearchService(embedding_service=embedding_service)
+    service.collection = MagicMock()
+    # 검색 벡터마다 "doc-<벡터 두 번째 값>" 결과 1건
+    service.collection.search.side_effect = lambda data, **kwargs: [
+        [_hit(f"doc-{int(vector[1])}")] for vector in data
+    ]
+    service.search_batch_size = batch_size
+    return service, embedding_service
+
+
+def test_groups_queries_by_scope_and_keeps_order():
+    """TC01: 같은 권한 범위 쿼리는 Milvus search 1회로 묶고 결과는 입력 순서로 반환"""
+    service, _ = _service()
+    engineering = UserContext("u1", 2, "Engineering")
+    queries = ["질문하나", "질문둘둘둘", "질문셋셋", "질문넷넷넷넷", "질문다섯다섯다"]
+    users = [None, engineering, None, UserContext("u2", 2, "Engineering"), UserContext("u3", 1, "Sales")]
+
+    results = service.search_many(queries, top_k=3, users=users)
+
+    assert [hits[0].document_id for hits in results] == [f"doc-{len(q)}" for q in queries]
+    calls = service.collection.search.call_args_list
+    assert len(calls) == 3
+    assert sorted(len(call.kwargs["data"]) for call in calls) == [1, 2, 2]
+    assert all(call.kwargs["limit"] == 3 for call in calls)
+    assert {call.kwargs["expr"] for call in calls} == {
+        None,
+        'metadata["access_level"] == 1',
+        '(metadata["access_level"] == 1) or '
+        '(metadata["access_level"] == 2 and metadata["department"] == "Engineering")',
+    }
+
+
+def test_embeds_in_batches_and_skips_failed_embeddings():
+    """TC02: search_batch_size 단위로 임베딩하고, 임베딩 실패(0 벡터) 쿼리는 빈 결과"""
+    service, embedding_service = _service(batch_size=2)
+
+    results = service.search_many(["질문하나", "실패한질문", "질문셋셋", "질문넷넷넷넷", "질문다섯다섯다"])
+
+    assert [len(call.args[0]) for call in embedding_service.embed_queries.call_args_list] == [2, 2, 1]
+    assert service.collection.search.call_count == 3
+    assert results[1] == []
+    assert all(results[i] for i in (0, 2, 3, 4))
+
+
+def test_users_length_must_match():
+    """TC03: users 길이가 queries와 다르면 ValueError"""
+    service, _ = _service()
+
+    with pytest.raises(ValueError):
+        service.search_many(["질문하나", "질문둘둘"], users=[None])
+
+
+def test_embed_queries_uses_query_cache():
+    """TC04: embed_queries는 캐시 미스만 배치 요청하고 결과를 캐시에 저장"""
+    cache = MagicMock()
+    cache.get.side_effect = lambda query, model: [9.0] if query == "캐시됨" else None
+    service = OllamaEmbeddingService.__new__(OllamaEmbeddingService)
+    service.query_cache = cache
+    service.config = MagicMock(model_name="nomic-embed-text")
+    service.embed_batch = MagicMock(return_value=[[1.0], [0.0]])
+
+    embeddings = service.embed_queries(["새 질문", "캐시됨", "실패 질문"])
+
+    assert embeddings == [[1.0], [9.0], [0.0]]
+    service.embed_batch.assert_called_once_with(["새 질문", "실패 질문"])
+    cache.put.assert_called_once_with("새 질문", "nomic-embed-text", [1.0])
+
+
+def test_batch_endpoint_returns_sources_per_query():
+    """TC05: /search/batch는 검색어별 출처를 요청 순서로 반환, 잘못된 검색어는 422"""
+    services = MagicMock()
+    services.vector_search.asearch_many = AsyncMock(return_value=[
+        [SearchResult("doc-1", 0, "연차 본문", 3, 0.9, {"document_title": "휴가 규정"})],
+        [],
+    ])
+    app.dependency_overrides[get_service_container] = lambda: services
+    try:
+        client = TestClient(app)
+        response = client.post(
+            "/api/v1/search/batch",
+            json={"queries": ["연차 사용 방법", "출장비 정산 절차"], "limit": 3}
+        )
+        invalid = client.post("/api/v1/search/batch", json={"queries": ["짧음"]})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["query"] for item in body["results"]] == ["연차 사용 방법", "출장비 정산 절차"]
+    assert body["results"][0]["sources"][0]["document_title"] == "휴가 규정"
+    assert body["results"][1]["sources"] == []
+    services.vector_search.asearch_many.assert_awaited_once_with(
+        ["연차 사용 방법", "출장비 정산 절차"], top_k=3, users=None
+    )
+    assert invalid.status_code == 422
@@ -0,0 +1,193 @@
+"""
+스트리밍 검색 테스트
+
+CitationTracker의 토큰 단위 출처 확인, RAGService.astream_answer의
+토큰/결과 이벤트, SearchService.astream_search의 이벤트 순서와
+/api/v1/search/stream SSE 응답을 검증합니다.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.rag_service import CitationTracker, RAGService
+from app.services.response_builder import ResponseBuilder
+from app.services.search_service import SearchService
+from app.services.service_container import get_service_container
+from app.services.vector_search import SearchResult
+from app.utils.sse import format_sse
+
+
+def _results(score: float = 0.9):
+    return [
+        SearchResult(
+            document_id="doc_001",
+            chunk_index=0,
+            content="연차는 입사일 기준 1년 후부터 사용 가능합니다.",
+            page_number=3,
+            relevance_score=score,
+            metadata={"document_title": "휴가 규정", "document_source": "vacation.pdf"}
+        )
+    ]
+
+
+def _rag_service(tokens):
+    """토큰 리스트를 스트리밍하는 Provider를 가진 RAGService"""
+    async def stream(prompt):
+        for token in tokens:
+            yield token
+
+    provider = MagicMock()
+    provider.agenerate_stream = stream
+    with patch("app.services.rag_service.OllamaProvider", return_value=provider):
+        return RAGService(provider_type="ollama")
+
+
+async def _collect(iterator):
+    return [event async for event in iterator]
+
+
+def _parse_sse(body: str):
+    """SSE 본문 → [(event, data)]"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_citation_tracker_across_token_boundary():
+    """TC01: 토큰 경계에 걸친 출처 패턴도 감지"""
+    tracker = CitationTracker()
+
+    assert tracker.feed("휴가 규정에 ") is True
+
+    tracker = CitationTracker()
+    assert tracker.feed("입사일 기준 [문") is False
+    assert tracker.feed("서 1] 참고") is True
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_tokens_and_result():
+    """TC02: 토큰을 그대로 내보내고, 출처 확인 시 citation 이벤트 1회"""
+    rag = _rag_service(["휴가 ", "규정", "에 따르면 ", "1년 후 ", "사용 가능합니다."])
+
+    events = await _collect(rag.astream_answer("연차 사용 방법", _results()))
+
+    tokens = [e["text"] for e in events if e["type"] == "token"]
+    assert "".join(tokens) == "휴가 규정에 따르면 1년 후 사용 가능합니다."
+    assert [e["type"] for e in events].count("citation") == 1
+    assert events[-1] == {
+        "type": "result",
+        "answer": "휴가 규정에 따르면 1년 후 사용 가능합니다.",
+        "is_fallback": False,
+        "fallback_reason": None
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_answer_without_citation_falls_back():
+    """TC03: 끝까지 출처가 없으면 result에서 Fallback으로 대체, 낮은 관련도는 LLM 호출 없음"""
+    rag = _rag_service(["1년 후 ", "사용 가능합니다."])
+
+    events = await _collect(rag.astream_answer("연차 사용 방법", _results()))
+    low = await _collect(rag.astream_answer("연차 사용 방법", _results(score=0.3)))
+
+    assert events[-1]["answer"] == RAGService.FALLBACK_NO_SOURCE
+    assert events[-1]["fallback_reason"] == "no_source_citation"
+    assert low == [{
+        "type": "result",
+        "answer": RAGService.FALLBACK_LOW_CONFIDENCE,
+        "is_fallback": True,
+        "fallback_reason": "low_confidence"
+    }]
+
+
+@pytest.mark.asyncio
+async def test_search_stream_event_order():
+    """TC04: 출처는 첫 토큰 전에, 타이밍은 각 단계 직후, done은 마지막"""
+    vector_search = MagicMock()
+    vector_search.aembed_query = AsyncMock(return_value=[0.1] * 768)
+    vector_search.asearch_by_vector = AsyncMock(return_value=_results())
+    service = SearchService(
+        vector_search=vector_search,
+        rag_service=_rag_service(["문서에 ", "따르면 가능합니다."])
+    )
+
+    events = await _collect(service.astream_search("연차 사용 방법"))
+    names = [
+        f"{name}:{data['phase']}" if name == "timing" else name
+        for name, data in events
+    ]
+
+    assert names == [
+        "timing:embedding", "timing:search", "sources",
+        "timing:first_token", "token", "citation", "token", "done"
+    ]
+    assert events[2][1]["sources"][0].document_title == "휴가 규정"
+    assert events[-1][1].answer == "문서에 따르면 가능합니다."
+
+
+def test_format_sse():
+    """TC05: SSE 메시지 형식 (한글 그대로, pydantic 모델 직렬화)"""
+    message = format_sse("token", {"text": "연차"})
+
+    assert message == 'event: token\ndata: {"text": "연차"}\n\n'
+
+
+def test_stream_endpoint_sse_response():
+    """TC06: /search/stream은 text/event-stream으로 이벤트 전송 후 응답 저장"""
+    async def astream_search(**kwargs):
+        yield "sources", {"sources": []}
+        yield "token", {"text": "문서에 따르면"}
+        yield "done", ResponseBuilder.build_search_response(
+            query="연차 사용 방법은 무엇인가요",
+            answer="문서에 따르면",
+            search_results=[],
+            performance={}
+        )
+
+    services = MagicMock()
+    services.search_service.astream_search = astream_search
+
+    app.dependency_overrides[get_service_container] = lambda: services
+    try:
+        with patch("app.routers.search.history_sink") as sink:
+            response = TestClient(app).post(
+                "/api/v1/search/stream",
+                json={"query": "연차 사용 방법은 무엇인가요"}
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert [name for name, _ in _parse_sse(response.text)] == ["sources", "token", "done"]
+    sink.record_query.assert_called_once()
+    sink.record_response.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stream_timeout_applies_per_token_not_consumer():
+    """TC07: 타임아웃은 토큰 대기 단계에만 적용 (느린 소비자는 타임아웃 아님, 멈춘 LLM은 Fallback)"""
+    rag = _rag_service(["휴가 ", "규정", "에 따르면 ", "가능합니다."])
+
+    async def stalled(prompt):
+        yield "휴가 규정에 "
+        await asyncio.sleep(10)
+        yield "따르면"
+
+    with patch.object(RAGService, "LLM_TIMEOUT_SECONDS", 0.05):
+        events = []
+        async for event in rag.astream_answer("연차 사용 방법", _results()):
+            events.append(event)
+            await asyncio.sleep(0.03)
+
+        rag.llm_provider.agenerate_stream = stalled
+        timed_out = await _collect(rag.astream_answer("연차 사용 방법", _results()))
+
+    assert events[-1]["answer"] == "휴가 규정에 따르면 가능합니다."
+    assert timed_out[0] == {"type": "token", "text": "휴가 규정에 "}
+    assert timed_out[-1]["answer"] == RAGService.FALLBACK_NO_SOURCE
@@ -0,0 +1,137 @@
+"""
+의미 기반 답변 캐시 테스트
+
+SemanticAnswerCache의 유사도 임계값, 접근 범위 분리, TTL/LRU 제거,
+인덱스 변경 이벤트에 의한 무효화와 SearchService 연동을 검증합니다.
+"""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.schemas.user import UserContext
+from app.services.index_events import IndexEventBus, IndexEventType
+from app.services.search_service import SearchService
+from app.services.semantic_cache import SemanticAnswerCache, SemanticCacheConfig, cache_scope
+from app.services.vector_search import SearchResult
+
+ANSWER = {"answer": "휴가 규정에 따르면 가능합니다.", "is_fallback": False, "fallback_reason": None}
+
+
+def _results(document_id="doc_001"):
+    return [
+        SearchResult(
+            document_id=document_id,
+            chunk_index=0,
+            content="연차는 입사일 기준 1년 후부터 사용 가능합니다.",
+            page_number=3,
+            relevance_score=0.9,
+            metadata={"document_title": "휴가 규정", "document_source": "vacation.pdf"}
+        )
+    ]
+
+
+def _cache(**config):
+    values = {"similarity_threshold": 0.95, "max_entries": 100, "ttl_seconds": 60}
+    values.update(config)
+    return SemanticAnswerCache(SemanticCacheConfig(**values))
+
+
+def test_similar_query_hits_within_threshold():
+    """TC01: 유사도 임계값 이상이면 히트, 미만이면 미스"""
+    cache = _cache()
+    cache.put("연차 사용 방법", [1.0, 0.0, 0.0], "*|limit=5", ANSWER, _results())
+
+    hit = cache.lookup([0.99, 0.05, 0.0], "*|limit=5")
+    miss = cache.lookup([0.7, 0.7, 0.0], "*|limit=5")
+
+    assert hit is not None
+    assert hit.query == "연차 사용 방법"
+    assert hit.rag_result["answer"] == ANSWER["answer"]
+    assert hit.search_results[0].document_id == "doc_001"
+    assert hit.similarity > 0.95
+    assert miss is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_scopes_are_isolated():
+    """TC02: 권한 범위가 다르면 같은 질문이어도 재사용하지 않음"""
+    cache = _cache()
+    engineering = UserContext("u1", 2, "Engineering")
+    sales = UserContext("u2", 2, "Sales")
+    cache.put("연차", [1.0, 0.0], cache_scope(engineering, 5), ANSWER, _results())
+
+    assert cache.lookup([1.0, 0.0], cache_scope(UserContext("u3", 2, "Engineering"), 5)) is not None
+    assert cache.lookup([1.0, 0.0], cache_scope(sales, 5)) is None
+    assert cache.lookup([1.0, 0.0], cache_scope(engineering, 3)) is None
+    assert cache.lookup([1.0, 0.0], cache_scope(None, 5)) is None
+
+
+def test_fallback_answers_are_not_cached():
+    """TC03: Fallback 답변/출처 없는 답변은 저장하지 않음"""
+    cache = _cache()
+    fallback = {"answer": "답변을 찾을 수 없습니다.", "is_fallback": True, "fallback_reason": "low_confidence"}
+
+    assert cache.put("연차", [1.0, 0.0], "*", fallback, _results()) is False
+    assert cache.put("연차", [1.0, 0.0], "*", ANSWER, []) is False
+    assert cache.stats()["size"] == 0
+
+
+def test_ttl_and_lru_eviction():
+    """TC04: 만료 항목은 조회 시 제거, 최대 항목 수 초과 시 오래된 항목 제거"""
+    cache = _cache(ttl_seconds=0.05, max_entries=2)
+    cache.put("a", [1.0, 0.0, 0.0], "*", ANSWER, _results())
+    time.sleep(0.06)
+    assert cache.lookup([1.0, 0.0, 0.0], "*") is None
+    assert cache.stats()["expirations"] == 1
+
+    cache = _cache(max_entries=2)
+    cache.put("a", [1.0, 0.0, 0.0], "*", ANSWER, _results())
+    cache.put("b", [0.0, 1.0, 0.0], "*", ANSWER, _results())
+    cache.lookup([1.0, 0.0, 0.0], "*")  # a를 최근 사용으로
+    cache.put("c", [0.0, 0.0, 1.0], "*", ANSWER, _results())
+
+    assert cache.lookup([0.0, 1.0, 0.0], "*") is None
+    assert cache.lookup([1.0, 0.0, 0.0], "*").query == "a"
+    assert cache.lookup([0.0, 0.0, 1.0], "*").query == "c"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_removed_documents_invalidate_entries():
+    """TC05: 출처 문서 삭제/교체 이벤트 시 해당 항목만 무효화"""
+    cache = _cache()
+    bus = IndexEventBus()
+    bus.subscribe(cache.on_index_event)
+    cache.put("연차", [1.0, 0.0], "*", ANSWER, _results("doc_001"))
+    cache.put("급여", [0.0, 1.0], "*", ANSWER, _results("doc_002"))
+
+    bus.publish(IndexEventType.INDEXED, ["doc_001"])
+    assert cache.lookup([1.0, 0.0], "*") is not None
+
+    bus.publish(IndexEventType.REMOVED, ["doc_001"])
+    assert cache.lookup([1.0, 0.0], "*") is None
+    assert cache.lookup([0.0, 1.0], "*").query == "급여"
+    assert cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_search_service_skips_search_and_llm_on_hit():
+    """TC06: 유사 질문은 Milvus 검색/LLM 호출 없이 캐시된 답변과 출처 반환"""
+    vector_search = MagicMock()
+    vector_search.aembed_query = AsyncMock(side_effect=[[1.0, 0.0], [0.99, 0.02]])
+    vector_search.asearch_by_vector = AsyncMock(return_value=_results())
+    rag_service = MagicMock(provider_type="ollama")
+    rag_service.agenerate_answer_with_fallback = AsyncMock(return_value=ANSWER)
+    service = SearchService(
+        vector_search=vector_search,
+        rag_service=rag_service,
+        answer_cache=_cache()
+    )
+
+    first = await service.asearch("연차 사용 방법")
+    second = await service.asearch("연차는 어떻게 쓰나요")
+
+    assert first.answer == second.answer == ANSWER["answer"]
+    assert second.sources[0].document_title == "휴가 규정"
+    assert vector_search.asearch_by_vector.await_count == 1
+    assert rag_service.agenerate_answer_with_fallback.await_count == 1
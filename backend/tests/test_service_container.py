@@ -0,0 +1,175 @@
+"""
+서비스 컨테이너 테스트
+
+ServiceContainer의 생성/재사용/리로드/종료 동작을 검증합니다.
+(Ollama/Milvus 없이 동작하도록 서비스 클래스를 Mock으로 대체)
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+from app.services.service_container import (
+    ServiceContainer,
+    ServiceContainerConfig,
+)
+
+
+@pytest.fixture
+def mock_services():
+    """서비스 클래스 Mock (네트워크 호출 차단)"""
+    with patch("app.services.service_container.OllamaEmbeddingService") as embedding, \
+            patch("app.services.service_container.AsyncOllamaEmbeddingService") as async_embedding, \
+            patch("app.services.service_container.VectorSearchService") as vector_search, \
+            patch("app.services.service_container.RAGService") as rag, \
+            patch("app.services.service_container.SearchService") as search:
+        embedding.side_effect = lambda *args, **kwargs: MagicMock()
+        async_embedding.side_effect = lambda *args, **kwargs: AsyncMock()
+        vector_search.side_effect = lambda *args, **kwargs: MagicMock()
+        rag.side_effect = lambda *args, **kwargs: MagicMock()
+        search.side_effect = lambda *args, **kwargs: MagicMock()
+        yield {
+            "embedding": embedding,
+            "vector_search": vector_search,
+            "rag": rag,
+            "search": search,
+        }
+
+
+def test_services_built_once(mock_services):
+    """TC01: 여러 번 요청해도 서비스는 한 번만 생성"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=False))
+
+    first = container.search_service
+    second = container.search_service
+
+    assert first is second
+    assert mock_services["embedding"].call_count == 1
+    assert mock_services["rag"].call_count == 1
+    assert container.generation == 1
+
+
+def test_startup_warms_up(mock_services):
+    """TC02: startup 시 워밍업 수행"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=True))
+
+    container.startup()
+
+    assert container.is_ready
+    container.vector_search.warm_up.assert_called_once()
+
+
+def test_startup_failure_does_not_raise(mock_services):
+    """TC03: Ollama 미기동 등 초기화 실패 시 서버 기동은 계속"""
+    mock_services["embedding"].side_effect = RuntimeError("connection refused")
+    container = ServiceContainer(ServiceContainerConfig(warmup=False))
+
+    container.startup()
+
+    assert not container.is_ready
+
+
+def test_warmup_failure_keeps_services(mock_services):
+    """TC04: 워밍업 실패는 치명적이지 않음"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=True))
+    with patch(
+        "app.services.service_container.ServiceBundle.warm_up",
+        side_effect=RuntimeError("milvus down")
+    ):
+        container.startup()
+
+    assert container.is_ready
+
+
+def test_reload_swaps_services(mock_services):
+    """TC05: 리로드 시 새 서비스로 교체 및 설정 반영"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=False))
+    old_service = container.search_service
+
+    generation = container.reload(
+        container.config.model_copy(update={"collection_name": "new_collection"})
+    )
+
+    assert generation == 2
+    assert container.search_service is not old_service
+    assert container.config.collection_name == "new_collection"
+    _, kwargs = mock_services["vector_search"].call_args
+    assert kwargs["collection_name"] == "new_collection"
+
+
+def test_reload_failure_keeps_old_services(mock_services):
+    """TC06: 리로드 실패 시 기존 서비스 유지"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=False))
+    old_service = container.search_service
+    mock_services["rag"].side_effect = ValueError("Unknown provider type")
+
+    with pytest.raises(ValueError):
+        container.reload()
+
+    assert container.search_service is old_service
+    assert container.generation == 1
+
+
+def test_shutdown_closes_resources(mock_services):
+    """TC07: 종료 시 연결 풀 정리"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=False))
+    embedding = container.embedding_service
+    async_embedding = container.async_embedding_service
+    rag = container.rag_service
+
+    asyncio.run(container.shutdown())
+
+    embedding.close.assert_called_once()
+    async_embedding.aclose.assert_awaited_once()
+    rag.close.assert_called_once()
+    assert not container.is_ready
+
+
+def test_reload_closes_previous_bundle_after_grace(mock_services):
+    """TC08: 리로드 후 유예 시간이 지나면 이전 서비스의 연결 풀 정리"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=False, retire_grace_seconds=0.05))
+    old_embedding = container.embedding_service
+    old_async_embedding = container.async_embedding_service
+
+    async def reload_in_loop():
+        container.reload()
+        old_embedding.close.assert_not_called()
+        await asyncio.sleep(0.2)
+
+    asyncio.run(reload_in_loop())
+
+    old_embedding.close.assert_called_once()
+    old_async_embedding.aclose.assert_awaited_once()
+    container.embedding_service.close.assert_not_called()
+
+
+def test_shutdown_closes_retired_bundle(mock_services):
+    """TC09: 유예 시간 전에 종료하면 이전 서비스도 즉시 한 번만 정리"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=False, retire_grace_seconds=60.0))
+    old_embedding = container.embedding_service
+    container.reload()
+    new_embedding = container.embedding_service
+
+    asyncio.run(container.shutdown())
+
+    old_embedding.close.assert_called_once()
+    new_embedding.close.assert_called_once()
+
+
+def test_reload_from_worker_thread_closes_on_caller_loop(mock_services):
+    """TC10: 워커 스레드에서 리로드해도 이전 서비스는 호출한 이벤트 루프에서 정리"""
+    container = ServiceContainer(ServiceContainerConfig(warmup=False, retire_grace_seconds=0.05))
+    old_embedding = container.embedding_service
+    old_async_embedding = container.async_embedding_service
+    closed_on = []
+    old_async_embedding.aclose.side_effect = lambda: closed_on.append(asyncio.get_running_loop())
+
+    async def reload_in_thread():
+        await asyncio.to_thread(container.reload, None, asyncio.get_running_loop())
+        old_embedding.close.assert_not_called()
+        await asyncio.sleep(0.2)
+        return asyncio.get_running_loop()
+
+    loop = asyncio.run(reload_in_thread())
+
+    old_embedding.close.assert_called_once()
+    assert closed_on == [loop]
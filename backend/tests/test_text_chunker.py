@@ -4,13 +4,14 @@
 DocumentChunker의 동작을 검증합니다.
 """
 
+import random
 import pytest
 from app.services.text_chunker import (
     DocumentChunker,
     TextChunk,
     ChunkerConfig,
 )
-from app.services.document_parser.base_parser import ParsedDocument
+from app.services.document_parser.base_parser import ParsedDocument, ParsedPage
 
 
 # ============================================================================
@@ -97,7 +98,8 @@ def test_metadata_preservation():
     for chunk in chunks:
         assert chunk.document_id == "/test/sample.txt"
         assert chunk.document_title == "Sample Document"
-        assert chunk.page_number == 2
+    assert chunks[0].page_number == 1
+    assert chunks[-1].page_number == 2
 
 
 def test_page_number_tracking():
@@ -124,6 +126,32 @@ def test_page_number_tracking():
 # Edge Case Tests (3)
 # ============================================================================
 
+def test_page_number_and_span_mapping():
+    """청크 시작 위치가 속한 페이지 번호와 문서 텍스트 기준 문자 범위"""
+    from app.services.document_parser.base_parser import ParsedPage
+
+    chunker = DocumentChunker(ChunkerConfig(chunk_size=200, chunk_overlap=20))
+    pages = [
+        ParsedPage(page_number=1, content="제1조 목적. " * 30),
+        ParsedPage(page_number=2, content="   "),  # 빈 페이지는 연결에서 제외
+        ParsedPage(page_number=3, content="제2조 휴가. " * 30),
+        ParsedPage(page_number=4, content="제3조 급여. " * 5),
+    ]
+    document = ParsedDocument(pages=pages, total_pages=4, total_characters=0)
+    full_text = "\n\n".join(page.content for page in pages if page.content.strip())
+
+    chunks = chunker.chunk_document(document)
+
+    for chunk in chunks:
+        assert full_text[chunk.start_char:chunk.end_char] == chunk.content
+        assert chunk.content.split(" ")[0] in pages[chunk.page_number - 1].content
+    assert [chunk.page_number for chunk in chunks][0] == 1
+    assert {chunk.page_number for chunk in chunks} == {1, 3, 4}
+
+    text_chunks = chunker.chunk_text(full_text)
+    assert [(c.start_char, c.end_char) for c in text_chunks] == [(c.start_char, c.end_char) for c in chunks]
+
+
 def test_empty_document_error():
     """빈 문서 처리 에러 검증"""
     chunker = DocumentChunker()
@@ -237,6 +265,103 @@ def test_empty_chunks_statistics():
     assert stats["total_characters"] == 0
 
 
+# ============================================================================
+# Streaming Tests (iter_chunks)
+# ============================================================================
+
+def _manual_pages(count=40):
+    """장/절 구조의 다중 페이지 문서"""
+    return [
+        ParsedPage(
+            page_number=number,
+            content="\n\n".join(
+                f"제{number}장 {section}절 연차 휴가는 입사일 기준으로 부여하며 "
+                f"미사용 휴가는 다음 해로 이월할 수 없다. " * (section % 3 + 1)
+                for section in range(1, 6)
+            )
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+def test_iter_chunks_matches_chunk_document():
+    """스트리밍 청킹 결과가 전체 문서 청킹과 같은 청크, 시작 페이지 번호 부여"""
+    chunker = DocumentChunker(ChunkerConfig(chunk_size=300, chunk_overlap=50))
+    pages = _manual_pages()
+    document = ParsedDocument(pages=pages, total_pages=len(pages), total_characters=0)
+
+    expected = chunker.chunk_document(document, document_id="manual.pdf")
+    chunks = list(chunker.iter_chunks(iter(pages), document_id="manual.pdf", document_title="규정집"))
+
+    assert [chunk.content for chunk in chunks] == [chunk.content for chunk in expected]
+    assert [chunk.page_number for chunk in chunks] == [chunk.page_number for chunk in expected]
+    assert [chunk.start_char for chunk in chunks] == [chunk.start_char for chunk in expected]
+    assert [chunk.chunk_index for chunk in chunks] == list(range(len(expected)))
+    assert chunks[0].page_number == 1 and chunks[-1].page_number == len(pages)
+    for chunk in chunks:
+        assert chunk.content[:4] in pages[chunk.page_number - 1].content
+        assert chunk.document_title == "규정집"
+
+
+def test_iter_chunks_consumes_pages_lazily():
+    """페이지를 모두 읽기 전에 청크를 반환 (메모리는 윈도우 크기로 제한)"""
+    chunker = DocumentChunker(ChunkerConfig(chunk_size=300, chunk_overlap=50))
+    consumed = []
+
+    def pages():
+        for page in _manual_pages():
+            consumed.append(page.page_number)
+            yield page
+
+    chunks = chunker.iter_chunks(pages())
+    first = next(chunks)
+
+    assert first.page_number == 1
+    assert len(consumed) < 10
+    assert list(chunker.iter_chunks(iter([ParsedPage(page_number=1, content="  ")]))) == []
+
+
+def test_iter_chunks_random_documents_match_chunk_document():
+    """무작위 문서/설정에서 스트리밍 청크가 전체 문서 청크와 같음 (중복 없음, 원문 순서)"""
+    rng = random.Random(22)
+    tokens = ["연차 휴가 규정", "word", " ", "  ", "\n", "\n\n", "\n\n\n", ". ", "가나다"]
+    separator_sets = [None, ["\n\n", "\n"], ["\n\n\n", "\n\n", " "], ["\n\n"]]
+
+    for _ in range(300):
+        separators = rng.choice(separator_sets)
+        config = ChunkerConfig(
+            chunk_size=rng.choice([100, 150, 200]),
+            chunk_overlap=rng.randint(0, 50),
+            **({"separators": separators} if separators else {})
+        )
+        chunker = DocumentChunker(config)
+        chunker.STREAM_WINDOW_CHUNKS = rng.choice([1, 2, 8])
+        long_token = "x" * rng.choice([40, 160, 450])
+        pages = [
+            ParsedPage(
+                page_number=number,
+                content="".join(
+                    rng.choice(tokens + [long_token]) for _ in range(rng.randint(0, 300))
+                )
+            )
+            for number in range(1, rng.randint(1, 12) + 1)
+        ]
+        document = ParsedDocument(pages=pages, total_pages=len(pages), total_characters=0)
+
+        try:
+            expected = chunker.chunk_document(document)
+        except ValueError:
+            expected = []
+        chunks = list(chunker.iter_chunks(iter(pages)))
+
+        def key(chunk):
+            return chunk.content, chunk.start_char, chunk.end_char, chunk.page_number
+
+        assert [key(chunk) for chunk in chunks] == [key(chunk) for chunk in expected]
+        spans = [(chunk.start_char, chunk.end_char) for chunk in chunks]
+        assert spans == sorted(set(spans))
+
+
 # ============================================================================
 # Integration Tests with Document Parsers
 # ============================================================================
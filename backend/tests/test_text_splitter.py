@@ -0,0 +1,96 @@
+"""
+오프셋 기반 텍스트 분할기 테스트
+
+RecursiveOffsetSplitter가 LangChain RecursiveCharacterTextSplitter와 같은 청크를
+만들고, 청크 위치가 원문과 일치하는지 검증합니다.
+"""
+
+import random
+import pytest
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from app.services.text_splitter import RecursiveOffsetSplitter
+
+DEFAULT_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+
+
+def _langchain(chunk_size, chunk_overlap, separators):
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=separators,
+        length_function=len,
+        is_separator_regex=False,
+    )
+
+
+def test_matches_langchain_on_document_text():
+    """TC01: 조문/문단/줄바꿈/긴 토큰이 섞인 문서에서 LangChain과 같은 청크"""
+    text = "\n\n".join(
+        f"제{article}조 (휴가)\n" + "\n".join(
+            "연차 휴가는 입사일 기준으로 부여한다. 미사용 휴가는 이월할 수 없다. " * (line % 4 + 1)
+            for line in range(article % 5 + 2)
+        ) + ("\nhttps://intranet.example.com/" + "x" * 700 if article % 7 == 0 else "")
+        for article in range(1, 40)
+    )
+
+    for chunk_size, chunk_overlap in [(100, 0), (300, 50), (500, 50), (1000, 200)]:
+        expected = _langchain(chunk_size, chunk_overlap, DEFAULT_SEPARATORS).split_text(text)
+        splitter = RecursiveOffsetSplitter(chunk_size, chunk_overlap, DEFAULT_SEPARATORS)
+
+        assert splitter.split_text(text) == expected
+
+
+def test_matches_langchain_on_random_text():
+    """TC02: 공백/겹치는 구분자("\\n\\n\\n")/사용자 구분자 조합에서 LangChain과 같은 청크"""
+    rng = random.Random(7)
+    tokens = ["가", "나", "a", " ", "  ", "\n", "\n\n", "\n\n\n", ". ", ".", "\t", "word"]
+    separator_sets = [DEFAULT_SEPARATORS, ["\n\n", "\n"], ["\n\n\n", "\n\n", " "], ["word", " "]]
+
+    for _ in range(500):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 300)))
+        chunk_size = rng.choice([5, 20, 50])
+        chunk_overlap = rng.randint(0, chunk_size)
+        separators = rng.choice(separator_sets)
+
+        expected = _langchain(chunk_size, chunk_overlap, separators).split_text(text)
+        splitter = RecursiveOffsetSplitter(chunk_size, chunk_overlap, separators)
+
+        assert splitter.split_text(text) == expected, (text, chunk_size, chunk_overlap, separators)
+
+
+def test_offsets_point_into_original_text():
+    """TC03: split_offsets는 원문 순서의 (시작, 끝) 위치, 겹침 구간은 chunk_overlap 이하"""
+    text = "Lorem ipsum dolor sit amet. " * 100
+    splitter = RecursiveOffsetSplitter(200, 30, DEFAULT_SEPARATORS)
+
+    spans = splitter.split_offsets(text)
+
+    assert [text[start:end] for start, end in spans] == splitter.split_text(text)
+    for (_, previous_end), (start, end) in zip(spans, spans[1:]):
+        assert previous_end - 30 <= start < previous_end < end
+    assert splitter.split_offsets("") == []
+    assert splitter.split_offsets("  \n\n ") == []
+
+
+def test_overlap_larger_than_chunk_size():
+    """TC04: chunk_overlap > chunk_size이면 ValueError"""
+    with pytest.raises(ValueError):
+        RecursiveOffsetSplitter(100, 150, DEFAULT_SEPARATORS)
+
+
+def test_split_complete_offsets_resumes_like_full_split():
+    """TC05: 확정 청크 + resume 위치부터 이어 분할한 결과가 전체 분할과 같음"""
+    rng = random.Random(5)
+    tokens = ["가", "word", " ", "\n", "\n\n", "\n\n\n", ". ", "x" * 30]
+
+    for _ in range(500):
+        text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 200)))
+        splitter = RecursiveOffsetSplitter(20, rng.randint(0, 10), DEFAULT_SEPARATORS)
+        cut = rng.randint(0, len(text))
+
+        spans, resume = splitter.split_complete_offsets(text[:cut])
+        rest = [(resume + start, resume + end) for start, end in splitter.split_offsets(text[resume:])]
+
+        assert resume <= cut
+        assert all(end <= cut for _, end in spans)
+        assert spans + rest == splitter.split_offsets(text), (text, cut)